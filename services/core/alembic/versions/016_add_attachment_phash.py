@@ -0,0 +1,26 @@
+"""Add perceptual hash column to attachments.
+
+Adds:
+- phash BIGINT NULL to attachments (64-bit dHash for near-duplicate images)
+
+Existing rows stay NULL until backfilled from stored files.
+
+Revision ID: 016
+Revises: 015
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("attachments", sa.Column("phash", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("attachments", "phash")
@@ -0,0 +1,37 @@
+"""Add index outbox table.
+
+Adds:
+- index_outbox (doc_type, entity_id, attempts, created_at)
+
+Rows are written alongside entity changes and drained in batches by the
+index outbox consumer, replacing one indexing task per entity.
+
+Revision ID: 017
+Revises: 016
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "index_outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("doc_type", sa.String(32), nullable=False),
+        sa.Column("entity_id", sa.BigInteger(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_index_outbox_entity", "index_outbox", ["doc_type", "entity_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_index_outbox_entity", table_name="index_outbox")
+    op.drop_table("index_outbox")
@@ -0,0 +1,30 @@
+"""Add cached provider profile to external accounts.
+
+Adds:
+- profile_json JSON NULL to external_accounts
+
+Holds the provider profile (bio, karma, account age) as of last_fetched_at,
+so a recently fetched author can be analyzed again without refetching.
+
+Revision ID: 018
+Revises: 017
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "external_accounts",
+        sa.Column("profile_json", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("external_accounts", "profile_json")
@@ -0,0 +1,30 @@
+"""Add a post high-water mark to scout watches.
+
+Adds:
+- last_post_created_at DATETIME NULL to scout_watches
+
+Newest-first watches only request and check posts created since the newest
+post they have already seen.
+
+Revision ID: 019
+Revises: 018
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scout_watches",
+        sa.Column("last_post_created_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scout_watches", "last_post_created_at")
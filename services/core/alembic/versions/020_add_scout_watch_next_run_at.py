@@ -0,0 +1,35 @@
+"""Add adaptive scheduling to scout watches.
+
+Adds:
+- next_run_at DATETIME NULL to scout_watches
+- idx_scout_watch_due (is_active, next_run_at)
+
+Each watch is dispatched when its next_run_at is due, instead of every watch
+running on every scheduler tick.
+
+Revision ID: 020
+Revises: 019
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scout_watches",
+        sa.Column("next_run_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "idx_scout_watch_due", "scout_watches", ["is_active", "next_run_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_scout_watch_due", table_name="scout_watches")
+    op.drop_column("scout_watches", "next_run_at")
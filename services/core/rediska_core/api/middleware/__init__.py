@@ -1,5 +1,6 @@
 """API middleware."""
 
+from rediska_core.api.middleware.metrics import RequestMetricsMiddleware
 from rediska_core.api.middleware.onboarding import OnboardingGateMiddleware
 
-__all__ = ["OnboardingGateMiddleware"]
+__all__ = ["OnboardingGateMiddleware", "RequestMetricsMiddleware"]
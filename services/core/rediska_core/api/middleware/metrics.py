@@ -0,0 +1,41 @@
+"""Request metrics middleware.
+
+Records the latency of every HTTP request in a bounded-memory histogram,
+labelled by method, route template and status code.
+"""
+
+import time
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from rediska_core.observability.metrics import get_collector
+
+
+REQUEST_DURATION_METRIC = "http_request_duration_seconds"
+
+
+class RequestMetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware that records request latency."""
+
+    async def dispatch(self, request: Request, call_next):
+        """Process the request."""
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            # Use the route template, not the raw path, to bound label cardinality
+            route = request.scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            get_collector().record_histogram(
+                REQUEST_DURATION_METRIC,
+                time.perf_counter() - start,
+                labels={
+                    "method": request.method,
+                    "route": path,
+                    "status": str(status_code),
+                },
+            )
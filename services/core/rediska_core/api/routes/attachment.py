@@ -4,6 +4,7 @@ Provides endpoints for:
 - POST /attachments/upload - Upload a new attachment (multipart)
 - GET /attachments/{id} - Download attachment content (streaming)
 - GET /attachments/{id}/meta - Get attachment metadata
+- DELETE /attachments/{id} - Delete an attachment
 """
 
 from typing import Annotated
@@ -65,15 +66,13 @@ async def upload_attachment(
     """
     from datetime import datetime, timezone
 
-    # Read file content
-    content = await file.read()
-
     # Validate content type
     content_type = file.content_type or "application/octet-stream"
 
     try:
-        result = attachment_service.upload(
-            file_data=content,
+        # Stream the spooled upload to storage without reading it into memory
+        result = attachment_service.upload_stream(
+            source=file.file,
             filename=file.filename or "upload",
             content_type=content_type,
         )
@@ -89,7 +88,7 @@ async def upload_attachment(
             request_json={
                 "filename": file.filename,
                 "content_type": content_type,
-                "size_bytes": len(content),
+                "size_bytes": result.size_bytes,
             },
             response_json={
                 "attachment_id": result.attachment_id,
@@ -193,3 +192,49 @@ async def get_attachment_metadata(
         )
 
     return AttachmentMetaResponse.from_model(attachment)
+
+
+@router.delete(
+    "/{attachment_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete attachment",
+    description="Soft-delete an attachment. The stored file is removed once no other "
+                "attachment shares its content.",
+)
+async def delete_attachment(
+    attachment_id: int,
+    current_user: CurrentUser,
+    attachment_service: AttachmentServiceDep,
+    db: DBSession,
+):
+    """Delete an attachment by ID.
+
+    The attachment row is kept with deleted_at set; the file on disk is
+    shared by attachments with the same content and only removed with the
+    last of them.
+    """
+    from datetime import datetime, timezone
+
+    attachment = attachment_service.get_by_id(attachment_id)
+
+    if not attachment or attachment.deleted_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Attachment {attachment_id} not found",
+        )
+
+    blob_removed = attachment_service.delete(attachment_id)
+
+    audit_entry = AuditLog(
+        ts=datetime.now(timezone.utc),
+        actor="user",
+        action_type="attachment.delete",
+        result="ok",
+        entity_type="attachment",
+        entity_id=attachment_id,
+        response_json={"blob_removed": blob_removed},
+    )
+    db.add(audit_entry)
+    db.commit()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -16,7 +16,7 @@ import json
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import and_, desc, or_
+from sqlalchemy import and_, desc, func, or_
 from sqlalchemy.orm import joinedload
 
 from rediska_core.api.deps import CurrentUser, DBSession, get_db
@@ -100,6 +100,49 @@ def decode_message_cursor(cursor: str) -> dict:
         )
 
 
+def _latest_messages_by_conversation(db, conversation_ids: list[int]) -> dict:
+    """Get the latest non-deleted message for each conversation.
+
+    Uses a ROW_NUMBER() window over messages partitioned by conversation so
+    a whole page of previews costs a single query.
+
+    Args:
+        db: Database session.
+        conversation_ids: Conversation IDs to look up.
+
+    Returns:
+        Dict mapping conversation_id to a row with sent_at and body_text.
+    """
+    if not conversation_ids:
+        return {}
+
+    ranked = (
+        db.query(
+            Message.conversation_id.label("conversation_id"),
+            Message.sent_at.label("sent_at"),
+            Message.body_text.label("body_text"),
+            func.row_number()
+            .over(
+                partition_by=Message.conversation_id,
+                order_by=(desc(Message.sent_at), desc(Message.id)),
+            )
+            .label("rn"),
+        )
+        .filter(
+            Message.conversation_id.in_(conversation_ids),
+            Message.deleted_at.is_(None),
+        )
+        .subquery()
+    )
+
+    rows = (
+        db.query(ranked.c.conversation_id, ranked.c.sent_at, ranked.c.body_text)
+        .filter(ranked.c.rn == 1)
+        .all()
+    )
+    return {row.conversation_id: row for row in rows}
+
+
 @router.get(
     "",
     response_model=ConversationListResponse,
@@ -246,16 +289,14 @@ async def list_conversations(
         )
         failed_conv_ids = {row[0] for row in failed_rows}
 
+    # Fetch the latest non-deleted message of every conversation in the page
+    # in one query instead of one query per row
+    latest_messages = _latest_messages_by_conversation(db, conv_ids)
+
     result = []
     for conv in conversations:
         # Get last message preview and actual timestamp
-        last_message = (
-            db.query(Message)
-            .filter_by(conversation_id=conv.id)
-            .filter(Message.deleted_at.is_(None))
-            .order_by(desc(Message.sent_at))
-            .first()
-        )
+        last_message = latest_messages.get(conv.id)
         preview = None
         # Use the actual last message timestamp
         last_message_time = last_message.sent_at if last_message else conv.last_activity_at
@@ -288,13 +329,7 @@ async def list_conversations(
     next_cursor = None
     if has_more and conversations:
         last = conversations[-1]
-        last_message = (
-            db.query(Message)
-            .filter_by(conversation_id=last.id)
-            .filter(Message.deleted_at.is_(None))
-            .order_by(desc(Message.sent_at))
-            .first()
-        )
+        last_message = latest_messages.get(last.id)
         last_message_time = last_message.sent_at if last_message else last.last_activity_at
         next_cursor = encode_cursor(
             last_message_time.isoformat() if last_message_time else "",
@@ -1142,15 +1177,13 @@ async def upload_conversation_attachment(
     settings = get_settings()
     attachment_service = AttachmentService(db=db, storage_path=settings.attachments_path)
 
-    # Read file content
-    content = await file.read()
-
     # Validate content type
     content_type = file.content_type or "application/octet-stream"
 
     try:
-        result = attachment_service.upload(
-            file_data=content,
+        # Stream the spooled upload to storage without reading it into memory
+        result = attachment_service.upload_stream(
+            source=file.file,
             filename=file.filename or "upload",
             content_type=content_type,
         )
@@ -1166,7 +1199,7 @@ async def upload_conversation_attachment(
             request_json={
                 "filename": file.filename,
                 "content_type": content_type,
-                "size_bytes": len(content),
+                "size_bytes": result.size_bytes,
                 "conversation_id": conversation_id,
             },
             response_json={
@@ -1180,7 +1213,7 @@ async def upload_conversation_attachment(
         return {
             "attachment_id": result.attachment_id,
             "sha256": result.sha256,
-            "size_bytes": len(content),
+            "size_bytes": result.size_bytes,
             "mime_type": content_type,
         }
 
@@ -253,13 +253,11 @@ async def get_counts(
     current_user: CurrentUser,
     db: Session = Depends(get_db),
     provider_id: Optional[str] = Query(default=None, description="Filter by provider"),
+    search: Optional[str] = Query(default=None, description="Search by username"),
 ):
-    """Get counts for all directories."""
+    """Get counts for all directories in a single aggregate query."""
     service = DirectoryService(db=db)
 
     return DirectoryCountsResponse(
-        analyzed=service.count_analyzed(provider_id=provider_id),
-        contacted=service.count_contacted(provider_id=provider_id),
-        engaged=service.count_engaged(provider_id=provider_id),
-        starred=service.count_starred(provider_id=provider_id),
+        **service.count_all(provider_id=provider_id, search=search)
     )
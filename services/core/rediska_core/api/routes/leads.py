@@ -6,6 +6,7 @@ Provides endpoints for:
 - GET /leads/{id} - Get lead by ID
 - PATCH /leads/{id}/status - Update lead status
 - POST /leads/{id}/analyze - Analyze a lead's author
+- POST /leads/{id}/draft-intro/stream - Stream an intro draft (SSE)
 """
 
 import json
@@ -14,6 +15,7 @@ from datetime import datetime, timezone
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from rediska_core.api.deps import CurrentUser, get_db
@@ -22,6 +24,7 @@ from rediska_core.domain.models import AuditLog, Identity, LeadPost
 from rediska_core.api.schemas.leads import (
     AnalyzeLeadResponse,
     AuthorInfo,
+    DraftIntroStreamRequest,
     LeadResponse,
     ListLeadsResponse,
     SaveLeadRequest,
@@ -35,12 +38,14 @@ from rediska_core.domain.schemas.multi_agent_analysis import (
 from rediska_core.domain.services.analysis import AnalysisError, AnalysisService
 from rediska_core.domain.services.agent_prompt import AgentPromptService
 from rediska_core.domain.services.credentials import CredentialsService
+from rediska_core.domain.services.draft_intro import DraftIntroResult, DraftIntroService
 from rediska_core.domain.services.leads import LeadsService, VALID_STATUSES
 from rediska_core.domain.services.multi_agent_analysis import (
     MultiAgentAnalysisService,
 )
-from rediska_core.domain.services.inference import InferenceClient, InferenceConfig
+from rediska_core.domain.services.inference import get_inference_client
 from rediska_core.infrastructure.crypto import CryptoService
+from rediska_core.infrastructure.rate_limiter import get_provider_rate_limiter
 from rediska_core.providers.base import ProviderAdapter
 from rediska_core.providers.reddit.adapter import RedditAdapter
 
@@ -104,6 +109,9 @@ def get_reddit_adapter(db: Session) -> Optional[RedditAdapter]:
             client_secret=settings.provider_reddit_client_secret,
             user_agent=settings.provider_reddit_user_agent,
             on_token_refresh=on_token_refresh,
+            http2=settings.provider_reddit_http2,
+            max_connections=settings.provider_reddit_max_connections,
+            rate_limiter=get_provider_rate_limiter("reddit", settings.provider_reddit_client_id),
         )
     except Exception as e:
         logger.error(f"Failed to create Reddit adapter: {e}")
@@ -603,6 +611,8 @@ async def analyze_lead(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Analysis failed: {e}",
         )
+    finally:
+        await provider_adapter.aclose()
 
 
 # =============================================================================
@@ -618,6 +628,10 @@ async def analyze_lead_multi(
         default=False,
         description="If true, regenerate user interest and character summaries even if they exist"
     ),
+    capture_prompts: bool = Query(
+        default=False,
+        description="If true, write every prompt and response of this analysis to the prompt log",
+    ),
     db: Session = Depends(get_db),
 ) -> MultiAgentAnalysisResponse:
     """
@@ -640,6 +654,7 @@ async def analyze_lead_multi(
         lead_id: ID of lead to analyze
         current_user: Current authenticated user
         regenerate_summaries: If true, regenerate summaries even if they exist
+        capture_prompts: If true, capture all prompts instead of a sample
         db: Database session
 
     Returns:
@@ -682,13 +697,7 @@ async def analyze_lead_multi(
                 detail="LLM inference service not configured (INFERENCE_URL not set)",
             )
 
-        inference_config = InferenceConfig(
-            base_url=settings.inference_url,
-            model_name=settings.inference_model or "default",
-            timeout=settings.inference_timeout,
-            api_key=settings.inference_api_key,
-        )
-        inference_client = InferenceClient(config=inference_config)
+        inference_client = get_inference_client()
 
         try:
             # Run multi-agent analysis
@@ -702,6 +711,7 @@ async def analyze_lead_multi(
             analysis = await analysis_service.analyze_lead(
                 lead_id,
                 regenerate_summaries=regenerate_summaries,
+                capture_prompts=capture_prompts,
             )
         finally:
             # Ensure HTTP client is properly closed
@@ -978,3 +988,86 @@ async def get_lead_analysis_by_id(
         )
 
     return _build_analysis_response(analysis)
+
+
+# =============================================================================
+# DRAFT INTRO
+# =============================================================================
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/{lead_id}/draft-intro/stream")
+async def stream_draft_intro(
+    lead_id: int,
+    request: DraftIntroStreamRequest,
+    current_user: CurrentUser,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream an intro message draft for a lead as server-sent events.
+
+    Emits a "delta" event for each chunk of generated text, so the draft
+    appears as it is written, then a single "draft" event with the
+    validated draft or an "error" event. The draft is never sent.
+
+    Args:
+        lead_id: ID of lead to draft for
+        request: Identity and custom instructions
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        StreamingResponse: text/event-stream of draft events
+    """
+    if not get_settings().inference_url:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM inference service not configured (INFERENCE_URL not set)",
+        )
+
+    identity_id = request.identity_id
+    if identity_id is None:
+        identity = (
+            db.query(Identity)
+            .filter(Identity.is_default == True, Identity.is_active == True)
+            .first()
+        )
+        if not identity:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No default identity configured",
+            )
+        identity_id = identity.id
+
+    inference_client = get_inference_client()
+    service = DraftIntroService(db=db, inference_client=inference_client)
+
+    # Load everything before streaming starts so errors become HTTP statuses
+    prepared = service.prepare_for_lead(
+        lead_id, identity_id, custom_instructions=request.custom_instructions
+    )
+    if isinstance(prepared, DraftIntroResult):
+        await inference_client.close()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=prepared.error,
+        )
+
+    agent, input_data = prepared
+
+    async def events():
+        try:
+            async for event in agent.draft_stream(input_data):
+                yield _sse_event(event.pop("type"), event)
+        finally:
+            await inference_client.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,16 +1,37 @@
 """Metrics API routes for observability."""
 
+import asyncio
+import hmac
+import logging
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
 
-from rediska_core.api.deps import get_current_user
+from rediska_core.api.deps import get_current_user, get_current_user_optional
+from rediska_core.config import get_settings
+from rediska_core.observability.aggregation import get_metrics_flusher, load_aggregated_metrics
 from rediska_core.observability.metrics import MetricsCollector, SystemMetrics, get_collector
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api", tags=["metrics"])
 
 
+def _render_prometheus() -> str:
+    """Render metrics from every process, or this process if not aggregating."""
+    flusher = get_metrics_flusher()
+    if flusher is not None:
+        try:
+            flusher.flush()
+            return load_aggregated_metrics(flusher.get_redis()).to_prometheus()
+        except Exception as e:
+            logger.warning(f"Falling back to local metrics: {e}")
+
+    return get_collector().to_prometheus()
+
+
 @router.get("/health")
 async def health_check() -> dict[str, Any]:
     """Health check endpoint (public, no auth required).
@@ -93,3 +114,35 @@ async def get_application_metrics(
     """
     collector = get_collector()
     return collector.get_all()
+
+
+@router.get("/metrics/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics(
+    user: Optional[Any] = Depends(get_current_user_optional),
+    authorization: Optional[str] = Header(default=None),
+) -> PlainTextResponse:
+    """Get application metrics in Prometheus text format.
+
+    Requires a session, or a bearer token matching METRICS_SCRAPE_TOKEN so
+    Prometheus can scrape without logging in. Histograms are exposed as
+    cumulative buckets with _sum and _count series. When metrics aggregation
+    is running, the output combines every API and worker process.
+    """
+    if user is None:
+        token = get_settings().metrics_scrape_token
+        scheme, _, credentials = (authorization or "").partition(" ")
+        if not (
+            token
+            and scheme.lower() == "bearer"
+            and hmac.compare_digest(credentials.encode(), token.encode())
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    return PlainTextResponse(
+        await asyncio.to_thread(_render_prometheus),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -4,6 +4,7 @@ Provides endpoints for:
 - POST /search - Hybrid search across indexed content
 """
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -31,6 +32,8 @@ def get_search_service(settings: Annotated[Settings, Depends(get_settings)]) ->
         embeddings_url=settings.embeddings_url,
         embeddings_model=settings.embeddings_model,
         embeddings_api_key=settings.embeddings_api_key,
+        batch_size=settings.embeddings_batch_size,
+        max_latency=settings.embeddings_batch_max_latency_ms / 1000,
     )
 
 
@@ -79,18 +82,21 @@ async def search(
         }
 
         if request.mode == "text":
-            result = search_service.text_search(
+            result = await asyncio.to_thread(
+                search_service.text_search,
                 **search_kwargs,
                 offset=request.offset,
                 limit=limit,
             )
         elif request.mode == "vector":
-            result = search_service.vector_search(
+            result = await asyncio.to_thread(
+                search_service.vector_search,
                 **search_kwargs,
                 k=limit,
             )
         else:  # hybrid (default)
-            result = search_service.hybrid_search(
+            result = await asyncio.to_thread(
+                search_service.hybrid_search,
                 **search_kwargs,
                 offset=request.offset,
                 limit=limit,
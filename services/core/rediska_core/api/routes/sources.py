@@ -20,6 +20,7 @@ from rediska_core.config import get_settings
 from rediska_core.domain.models import Identity, Provider
 from rediska_core.domain.services.credentials import CredentialsService
 from rediska_core.infrastructure.crypto import CryptoService
+from rediska_core.infrastructure.rate_limiter import get_provider_rate_limiter
 from rediska_core.providers.reddit.adapter import RedditAdapter
 
 router = APIRouter(prefix="/sources", tags=["sources"])
@@ -103,6 +104,7 @@ async def browse_posts(
             detail={"error": "No Reddit credentials found. Please connect your Reddit account."},
         )
 
+    adapter = None
     try:
         tokens = json.loads(credential)
 
@@ -124,6 +126,9 @@ async def browse_posts(
             client_secret=settings.provider_reddit_client_secret,
             user_agent=settings.provider_reddit_user_agent,
             on_token_refresh=on_token_refresh,
+            http2=settings.provider_reddit_http2,
+            max_connections=settings.provider_reddit_max_connections,
+            rate_limiter=get_provider_rate_limiter("reddit", settings.provider_reddit_client_id),
         )
 
         # Fetch posts from Reddit (browse or search)
@@ -170,3 +175,6 @@ async def browse_posts(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": f"Failed to browse location: {e}"},
         )
+    finally:
+        if adapter is not None:
+            await adapter.aclose()
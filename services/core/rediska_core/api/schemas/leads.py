@@ -122,3 +122,21 @@ class AnalyzeLeadResponse(BaseModel):
     embedded_count: int = Field(..., description="Number of embeddings generated")
     success: bool = Field(..., description="Whether analysis completed successfully")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+
+
+# =============================================================================
+# DRAFT INTRO SCHEMAS
+# =============================================================================
+
+
+class DraftIntroStreamRequest(BaseModel):
+    """Request schema for streaming an intro draft for a lead."""
+
+    identity_id: Optional[int] = Field(
+        default=None,
+        description="Identity whose voice to use (defaults to the default identity)",
+    )
+    custom_instructions: Optional[str] = Field(
+        default=None,
+        description="Additional drafting instructions",
+    )
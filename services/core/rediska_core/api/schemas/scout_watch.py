@@ -58,6 +58,7 @@ class ScoutWatchResponse(BaseModel):
     total_leads_created: int
     last_run_at: Optional[datetime]
     last_match_at: Optional[datetime]
+    next_run_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
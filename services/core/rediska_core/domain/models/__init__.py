@@ -351,6 +351,8 @@ class ExternalAccount(Base):
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     purged_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_fetched_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Provider profile (bio, karma, ...) as of last_fetched_at
+    profile_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
@@ -497,6 +499,9 @@ class Attachment(Base):
     mime_type: Mapped[str] = mapped_column(String(128), nullable=False)
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
+    # 64-bit perceptual hash (dHash), stored as signed BIGINT
+    phash: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
     width_px: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     height_px: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
@@ -826,6 +831,27 @@ class Job(Base):
     __table_args__ = (Index("idx_jobs_status", "status", "next_run_at"),)
 
 
+class IndexOutbox(Base):
+    """Pending search index updates, written in the same transaction as the entity.
+
+    Rows are drained in batches by the index outbox consumer and deleted
+    once the document has been indexed.
+    """
+
+    __tablename__ = "index_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    doc_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    __table_args__ = (Index("idx_index_outbox_entity", "doc_type", "entity_id"),)
+
+
 # =============================================================================
 # Multi-Agent Analysis Models
 # =============================================================================
@@ -1013,6 +1039,10 @@ class ScoutWatch(Base):
     # Timestamps
     last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_match_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # High-water mark for newest-first watches: created_at of the newest post seen
+    last_post_created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # When the scheduler next dispatches the watch (NULL = as soon as possible)
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
     )
@@ -1022,6 +1052,7 @@ class ScoutWatch(Base):
 
     __table_args__ = (
         Index("idx_scout_watch_active", "is_active", "last_run_at"),
+        Index("idx_scout_watch_due", "is_active", "next_run_at"),
         Index("idx_scout_watch_location", "provider_id", "source_location"),
     )
 
@@ -1170,6 +1201,7 @@ __all__ = [
     "DoNotContact",
     "AuditLog",
     "Job",
+    "IndexOutbox",
     "AgentPrompt",
     "LeadAnalysis",
     "AnalysisDimension",
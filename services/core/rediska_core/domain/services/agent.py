@@ -5,6 +5,10 @@ Provides:
 2. Structured outputs - validate outputs against Pydantic models
 3. Model info recording - capture model metadata for auditing
 4. Voice config injection - inject identity voice into system prompt
+5. Prompt cache hints - send the input ahead of the instructions so agents
+   sharing an input share a cacheable prompt prefix
+6. Early stop - stream structured outputs and stop generating once a
+   complete, schema-valid JSON object has been emitted
 
 Usage:
     config = AgentConfig(
@@ -121,6 +125,12 @@ class AgentConfig:
         temperature: Override inference temperature
         max_tokens: Override inference max_tokens
         chat_template: Chat template name for response parsing (llama3, qwen_thinking, etc.)
+        context_first: Send the user input before the instructions, as one
+            user message, so agents given the same input share a prompt prefix
+        cache_prompt: Ask the server to reuse the KV cache of a matching prefix
+        slot_id: Server slot to pin requests to
+        stream_json: Stream structured output and stop at the first
+            schema-valid JSON object (default: INFERENCE_STREAM_JSON setting)
     """
 
     name: str
@@ -131,6 +141,10 @@ class AgentConfig:
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
     chat_template: Optional[str] = None
+    context_first: bool = False
+    cache_prompt: Optional[bool] = None
+    slot_id: Optional[int] = None
+    stream_json: Optional[bool] = None
 
 
 @dataclass
@@ -444,6 +458,28 @@ class AgentHarness:
             logger.exception(f"[{self._chat_template.name}] Unexpected error parsing structured output: {e}")
             return False, None, f"Parse error: {e}"
 
+    def _stream_json(self) -> bool:
+        """Whether to stop generation early at a complete structured output."""
+        if not self.config.output_schema:
+            return False
+        if self.config.stream_json is not None:
+            return self.config.stream_json
+
+        from rediska_core.config import get_settings
+
+        return get_settings().inference_stream_json
+
+    def _is_complete_output(self, partial_output: str) -> bool:
+        """Whether the text so far contains a schema-valid JSON object."""
+        data = self._chat_template.find_json_object(partial_output)
+        if data is None:
+            return False
+        try:
+            self.config.output_schema.model_validate(data)
+        except ValidationError:
+            return False
+        return True
+
     async def run(self, user_input: str) -> AgentResult:
         """Run the agent with user input.
 
@@ -453,10 +489,27 @@ class AgentHarness:
         Returns:
             AgentResult with output and metadata
         """
-        messages = [
-            ChatMessage(role="system", content=self.build_system_prompt()),
-            ChatMessage(role="user", content=user_input),
-        ]
+        if self.config.context_first:
+            messages = [
+                ChatMessage(role="user", content=f"{user_input}\n\n{self.build_system_prompt()}"),
+            ]
+        else:
+            messages = [
+                ChatMessage(role="system", content=self.build_system_prompt()),
+                ChatMessage(role="user", content=user_input),
+            ]
+
+        # Only pass cache hints and early stop when set, so plain clients keep working
+        request_options = {
+            key: value
+            for key, value in (
+                ("cache_prompt", self.config.cache_prompt),
+                ("slot_id", self.config.slot_id),
+            )
+            if value is not None
+        }
+        if self._stream_json():
+            request_options["stop_when"] = self._is_complete_output
 
         tool_calls_made: list[ToolCall] = []
         turns = 0
@@ -470,6 +523,7 @@ class AgentHarness:
                 messages,
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
+                **request_options,
             )
 
             last_model_info = response.model_info
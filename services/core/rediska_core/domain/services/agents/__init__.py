@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 logger = logging.getLogger(__name__)
 
 from rediska_core.domain.models import AgentPrompt, AnalysisDimension
+from rediska_core.infrastructure.prompt_log import capture_scope
 
 # Import AgentConfig - will be available from domain.services.agent
 try:
@@ -31,6 +32,9 @@ class BaseAnalysisAgent(ABC):
         self,
         inference_client: Any,
         chat_template: str | None = None,
+        context_first: bool = False,
+        cache_prompt: bool | None = None,
+        slot_id: int | None = None,
     ) -> None:
         """
         Initialize agent.
@@ -38,9 +42,15 @@ class BaseAnalysisAgent(ABC):
         Args:
             inference_client: LLM inference client
             chat_template: Chat template name for response parsing (llama3, qwen_thinking, etc.)
+            context_first: Put the shared input ahead of the agent's instructions
+            cache_prompt: Ask the server to reuse the KV cache of a matching prefix
+            slot_id: Server slot to pin this agent's requests to
         """
         self.inference_client = inference_client
         self.chat_template = chat_template
+        self.context_first = context_first
+        self.cache_prompt = cache_prompt
+        self.slot_id = slot_id
 
     @abstractmethod
     async def analyze(
@@ -84,18 +94,26 @@ class BaseAnalysisAgent(ABC):
         # Inject chat_template from self if not set in config
         if self.chat_template and not config.chat_template:
             config.chat_template = self.chat_template
+        # Inject prompt cache hints the same way
+        config.context_first = config.context_first or self.context_first
+        if config.cache_prompt is None:
+            config.cache_prompt = self.cache_prompt
+        if config.slot_id is None:
+            config.slot_id = self.slot_id
 
         harness = AgentHarness(
             config=config,
             inference_client=self.inference_client,
         )
 
-        result = await harness.run(input_prompt)
+        # Raw prompts and outputs go to the prompt log, tagged with the agent
+        with capture_scope(agent=config.name):
+            result = await harness.run(input_prompt)
 
-        # Log full agent output for debugging
-        logger.info(f"Agent '{config.name}' raw output:\n{result.output[:2000]}...")
-        logger.info(f"Agent '{config.name}' success={result.success}, error={result.error}")
-        logger.info(f"Agent '{config.name}' parsed_output={result.parsed_output}")
+        logger.debug(
+            f"Agent '{config.name}' success={result.success}, "
+            f"output={len(result.output or '')} chars, error={result.error}"
+        )
 
         return {
             "success": result.success,
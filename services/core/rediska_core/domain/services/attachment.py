@@ -3,36 +3,54 @@
 This service handles:
 1. File uploads with validation (size, MIME type)
 2. SHA256 hash computation
-3. Image dimension extraction
-4. Storage key generation with date-based directory structure
+3. Image dimension and perceptual hash extraction
+4. Content-addressed blob storage shared by attachments with the same content
 5. File retrieval by ID or SHA256
 
+Files are stored once per content, under blobs/{sha[:2]}/{sha[2:4]}/{sha}.ext.
+Each upload still creates its own Attachment row (linked to its message),
+pointing at the shared blob; the blob is removed when the last live row
+referencing it is deleted.
+
+Uploads are streamed: data is written in chunks to a temporary file in the
+storage directory while it is hashed, then atomically renamed into place, so
+neither uploads nor downloads hold a whole file in memory.
+
 Usage:
     service = AttachmentService(db=session, storage_path="/var/lib/rediska/attachments")
 
-    # Upload a file
-    result = service.upload(
-        file_data=content_bytes,
+    # Upload a file object (or any iterable of byte chunks)
+    result = service.upload_stream(
+        source=upload_file.file,
         filename="document.pdf",
         content_type="application/pdf"
     )
     print(f"Uploaded: {result.attachment_id}, SHA256: {result.sha256}")
 
+    # Stream a download to a staged file, then store it
+    staged = await service.astage(response.aiter_bytes())
+    result = service.upload_staged(staged, filename="image.jpg", content_type="image/jpeg")
+
     # Retrieve attachment
     attachment = service.get_by_id(result.attachment_id)
     file_path = service.get_file_path(result.attachment_id)
 """
 
 import hashlib
-import uuid
+import os
+import tempfile
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterable, BinaryIO, Iterable, Iterator, Optional, Union
 
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from rediska_core.domain.models import Attachment
+from rediska_core.domain.services.perceptual_hash import compute_dhash, to_db_value
 
 
 # =============================================================================
@@ -63,6 +81,17 @@ class InvalidMimeTypeError(AttachmentError):
 # Maximum file size: 10MB
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024
 
+# Bytes read per chunk when streaming uploads
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+# Storage subdirectories for content-addressed blobs and in-progress uploads
+BLOB_DIR = "blobs"
+TEMP_DIR = ".tmp"
+
+# Named lock serializing blob writes and removals per content (MySQL only)
+CONTENT_LOCK_PREFIX = "rediska_blob:"
+CONTENT_LOCK_TIMEOUT_SECONDS = 10
+
 # Allowed MIME types
 ALLOWED_MIME_TYPES = {
     # Images
@@ -169,6 +198,71 @@ class AttachmentUploadResult:
     height_px: Optional[int] = None
 
 
+@dataclass
+class PerceptualHashBackfillResult:
+    """Progress of one perceptual hash backfill batch."""
+
+    scanned: int
+    updated: int
+    last_id: Optional[int] = None
+
+
+@dataclass
+class StagedFile:
+    """A file streamed to temporary storage and hashed as it was written."""
+
+    path: Path
+    sha256: str
+    size_bytes: int
+
+    def discard(self) -> None:
+        """Remove the temporary file (if it was not stored)."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _StagingWriter:
+    """Writes chunks to a temporary file, hashing and enforcing the size limit."""
+
+    def __init__(self, temp_dir: Path, max_size_bytes: int):
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=temp_dir, prefix="upload-")
+        self.path = Path(path)
+        self.file = os.fdopen(fd, "wb")
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.max_size_bytes = max_size_bytes
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_size_bytes:
+            self.abort()
+            raise FileTooLargeError(
+                f"File size exceeds maximum of {self.max_size_bytes} bytes "
+                f"({self.max_size_bytes // (1024 * 1024)}MB)"
+            )
+        self.hasher.update(chunk)
+        self.file.write(chunk)
+
+    def finish(self) -> StagedFile:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        if self.size == 0:
+            self.path.unlink()
+            raise ValueError("File cannot be empty")
+        return StagedFile(path=self.path, sha256=self.hasher.hexdigest(), size_bytes=self.size)
+
+    def abort(self) -> None:
+        self.file.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
 # =============================================================================
 # SERVICE
 # =============================================================================
@@ -203,16 +297,16 @@ class AttachmentService:
         filename: str,
         content_type: str,
         message_id: Optional[int] = None,
-        username: Optional[str] = None,
     ) -> AttachmentUploadResult:
-        """Upload a file and create an attachment record.
+        """Upload a file held in memory and create an attachment record.
+
+        Prefer upload_stream() for files that are not already in memory.
 
         Args:
             file_data: Raw file bytes.
             filename: Original filename.
             content_type: MIME type of the file.
             message_id: Optional message ID to link attachment to.
-            username: Optional username to organize files by (e.g., conversation counterpart).
 
         Returns:
             AttachmentUploadResult with attachment details.
@@ -233,56 +327,295 @@ class AttachmentService:
                 f"{self.max_size_bytes} bytes (10MB)"
             )
 
-        # Validate MIME type
-        if content_type in BLOCKED_MIME_TYPES:
-            raise InvalidMimeTypeError(
-                f"MIME type '{content_type}' is not allowed"
-            )
+        return self.upload_stream([file_data], filename, content_type, message_id)
 
-        if content_type not in ALLOWED_MIME_TYPES:
-            raise InvalidMimeTypeError(
-                f"MIME type '{content_type}' is not in the allowlist"
-            )
+    def upload_stream(
+        self,
+        source: Union[BinaryIO, Iterable[bytes]],
+        filename: str,
+        content_type: str,
+        message_id: Optional[int] = None,
+    ) -> AttachmentUploadResult:
+        """Upload a file from a stream and create an attachment record.
+
+        Args:
+            source: Readable binary file object or iterable of byte chunks.
+            filename: Original filename.
+            content_type: MIME type of the file.
+            message_id: Optional message ID to link attachment to.
 
-        # Compute SHA256 hash
-        sha256_hash = hashlib.sha256(file_data).hexdigest()
+        Returns:
+            AttachmentUploadResult with attachment details.
 
-        # Generate storage key (by username if provided, otherwise date-based)
-        storage_key = self._generate_storage_key(filename, content_type, username)
+        Raises:
+            FileTooLargeError: If file exceeds size limit.
+            InvalidMimeTypeError: If MIME type is not allowed.
+            ValueError: If file is empty.
+        """
+        # Validate before reading anything
+        self._validate_mime_type(content_type)
 
-        # Write file to disk
-        file_path = self.storage_path / storage_key
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(file_data)
+        staged = self.stage(source)
+        return self.upload_staged(staged, filename, content_type, message_id)
 
-        # Extract image dimensions if applicable
-        width_px, height_px = self._extract_image_dimensions(file_data, content_type)
+    def stage(self, source: Union[BinaryIO, Iterable[bytes]]) -> StagedFile:
+        """Stream data to a temporary file, hashing it as it is written.
 
-        # Create database record
-        attachment = Attachment(
-            message_id=message_id,
-            storage_backend="fs",
-            storage_key=storage_key,
-            sha256=sha256_hash,
-            mime_type=content_type,
-            size_bytes=len(file_data),
-            width_px=width_px,
-            height_px=height_px,
-            remote_visibility="visible",
+        Args:
+            source: Readable binary file object or iterable of byte chunks.
+
+        Returns:
+            StagedFile to pass to upload_staged() (or discard()).
+
+        Raises:
+            FileTooLargeError: If data exceeds size limit.
+            ValueError: If there is no data.
+        """
+        if hasattr(source, "read"):
+            chunks = iter(lambda: source.read(STREAM_CHUNK_BYTES), b"")
+        else:
+            chunks = source
+
+        writer = _StagingWriter(self.storage_path / TEMP_DIR, self.max_size_bytes)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except FileTooLargeError:
+            raise
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.finish()
+
+    async def astage(self, chunks: AsyncIterable[bytes]) -> StagedFile:
+        """Stream data from an async source (e.g. an HTTP download) to a temporary file.
+
+        Args:
+            chunks: Async iterable of byte chunks.
+
+        Returns:
+            StagedFile to pass to upload_staged() (or discard()).
+
+        Raises:
+            FileTooLargeError: If data exceeds size limit.
+            ValueError: If there is no data.
+        """
+        writer = _StagingWriter(self.storage_path / TEMP_DIR, self.max_size_bytes)
+        try:
+            async for chunk in chunks:
+                writer.write(chunk)
+        except FileTooLargeError:
+            raise
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.finish()
+
+    def upload_staged(
+        self,
+        staged: StagedFile,
+        filename: str,
+        content_type: str,
+        message_id: Optional[int] = None,
+    ) -> AttachmentUploadResult:
+        """Store a staged file as a shared blob and create an attachment record.
+
+        The staged file is renamed into the content-addressed blob path (or
+        discarded if validation fails). Image metadata is copied from an
+        existing attachment with the same content when there is one.
+
+        Args:
+            staged: File returned by stage() or astage().
+            filename: Original filename.
+            content_type: MIME type of the file.
+            message_id: Optional message ID to link attachment to.
+
+        Returns:
+            AttachmentUploadResult with attachment details.
+
+        Raises:
+            InvalidMimeTypeError: If MIME type is not allowed.
+        """
+        try:
+            self._validate_mime_type(content_type)
+        except InvalidMimeTypeError:
+            staged.discard()
+            raise
+
+        storage_key = self._blob_key(staged.sha256, filename, content_type)
+
+        width_px, height_px, phash = self._image_metadata(
+            staged.sha256, content_type, staged.path
         )
-        self.db.add(attachment)
-        self.db.flush()
+
+        file_path = self.storage_path / storage_key
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Rename and insert under the content lock, so a concurrent
+        # remove_unreferenced_blob() either finishes first or finds the
+        # new row. The lock is released before the caller commits.
+        with self._content_lock(staged.sha256):
+            # Atomic rename; replacing an existing blob is harmless (same content)
+            os.replace(staged.path, file_path)
+
+            # Create database record
+            attachment = Attachment(
+                message_id=message_id,
+                storage_backend="fs",
+                storage_key=storage_key,
+                sha256=staged.sha256,
+                mime_type=content_type,
+                size_bytes=staged.size_bytes,
+                width_px=width_px,
+                height_px=height_px,
+                phash=phash,
+                remote_visibility="visible",
+            )
+            self.db.add(attachment)
+            self.db.flush()
 
         return AttachmentUploadResult(
             attachment_id=attachment.id,
-            sha256=sha256_hash,
+            sha256=staged.sha256,
             storage_key=storage_key,
-            size_bytes=len(file_data),
+            size_bytes=staged.size_bytes,
             mime_type=content_type,
             width_px=width_px,
             height_px=height_px,
         )
 
+    def delete(self, attachment_id: int) -> bool:
+        """Soft-delete an attachment, removing its blob if no longer referenced.
+
+        Commits the soft delete before the blob is touched, so a failed
+        transaction never leaves a live row pointing at a removed file.
+
+        Args:
+            attachment_id: The attachment ID.
+
+        Returns:
+            True if the blob file was removed.
+        """
+        attachment = self.get_by_id(attachment_id)
+        if not attachment or attachment.deleted_at is not None:
+            return False
+
+        attachment.deleted_at = datetime.now(timezone.utc)
+        sha256, storage_key = attachment.sha256, attachment.storage_key
+        self.db.commit()
+
+        return self.remove_unreferenced_blob(sha256, storage_key)
+
+    def remove_unreferenced_blob(self, sha256: str, storage_key: str) -> bool:
+        """Remove a stored file if no live attachment references it.
+
+        Runs under the content lock upload_staged() takes around its rename
+        and insert, so the two cannot interleave. A row inserted by an
+        upload that has not committed yet is still locked; rather than wait
+        for it, the blob is kept. Commits when done.
+
+        Args:
+            sha256: Content hash of the file.
+            storage_key: The file's storage key.
+
+        Returns:
+            True if the blob file was removed.
+        """
+        removed = False
+        try:
+            with self._content_lock(sha256):
+                try:
+                    referenced = self.count_blob_references(sha256, storage_key, lock=True) > 0
+                except OperationalError:
+                    # A row for this blob is locked by an open transaction
+                    referenced = True
+
+                if not referenced:
+                    try:
+                        (self.storage_path / storage_key).unlink()
+                        removed = True
+                    except FileNotFoundError:
+                        pass
+        except AttachmentError:
+            # Lock timed out; leave the blob in place
+            pass
+        finally:
+            self.db.commit()
+
+        return removed
+
+    def count_blob_references(self, sha256: str, storage_key: str, lock: bool = False) -> int:
+        """Count live attachments sharing a stored file.
+
+        Args:
+            sha256: Content hash of the file (uses idx_attach_sha).
+            storage_key: The file's storage key.
+            lock: Lock the file's rows (deleted or not) until the transaction
+                ends, without waiting for rows held by other transactions.
+
+        Returns:
+            Number of attachments referencing the file and not deleted.
+
+        Raises:
+            OperationalError: If lock is set and another transaction holds
+                one of the rows, such as an upload that has not committed.
+        """
+        if lock:
+            rows = (
+                self.db.query(Attachment.deleted_at)
+                .filter(
+                    Attachment.sha256 == sha256,
+                    Attachment.storage_key == storage_key,
+                )
+                .with_for_update(nowait=True)
+            )
+            return sum(1 for (deleted_at,) in rows if deleted_at is None)
+
+        return (
+            self.db.query(Attachment)
+            .filter(
+                Attachment.sha256 == sha256,
+                Attachment.storage_key == storage_key,
+                Attachment.deleted_at.is_(None),
+            )
+            .count()
+        )
+
+    @contextmanager
+    def _content_lock(self, sha256: str) -> Iterator[None]:
+        """Hold the named lock for a content hash for the duration of a block.
+
+        Uses MySQL GET_LOCK, which belongs to the connection rather than the
+        transaction and takes no index locks, so it is released as soon as
+        the block exits. Other databases run the block unserialized.
+
+        Raises:
+            AttachmentError: If the lock is not acquired within
+                CONTENT_LOCK_TIMEOUT_SECONDS.
+        """
+        if self.db.get_bind().dialect.name != "mysql":
+            yield
+            return
+
+        # Lock names are limited to 64 characters
+        name = f"{CONTENT_LOCK_PREFIX}{sha256}"[:64]
+        conn = self.db.connection()
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": name, "timeout": CONTENT_LOCK_TIMEOUT_SECONDS},
+        ).scalar()
+        if acquired != 1:
+            raise AttachmentError(f"Timed out waiting for the lock on content {sha256}")
+
+        try:
+            yield
+        finally:
+            try:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+            except Exception:
+                # Closing the connection drops its named locks
+                conn.invalidate()
+
     def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
         """Get an attachment by its ID.
 
@@ -324,48 +657,68 @@ class AttachmentService:
 
         return str(file_path)
 
-    def _generate_storage_key(
-        self,
-        filename: str,
-        content_type: str,
-        username: Optional[str] = None,
-    ) -> str:
-        """Generate a unique storage key with directory structure.
+    def _validate_mime_type(self, content_type: str) -> None:
+        """Reject blocked and non-allowlisted MIME types."""
+        if content_type in BLOCKED_MIME_TYPES:
+            raise InvalidMimeTypeError(
+                f"MIME type '{content_type}' is not allowed"
+            )
 
-        Format:
-        - With username: users/{username}/{uuid}.ext
-        - Without username: YYYY/MM/DD/{uuid}.ext (fallback for non-conversation files)
+        if content_type not in ALLOWED_MIME_TYPES:
+            raise InvalidMimeTypeError(
+                f"MIME type '{content_type}' is not in the allowlist"
+            )
+
+    def _blob_key(self, sha256: str, filename: str, content_type: str) -> str:
+        """Generate the content-addressed storage key for a file.
+
+        Format: blobs/{sha[:2]}/{sha[2:4]}/{sha}.ext
 
         Args:
+            sha256: SHA256 hex digest of the content.
             filename: Original filename.
             content_type: MIME type.
-            username: Optional username to organize by.
 
         Returns:
             Storage key path.
         """
-        # Get extension from MIME type or filename
         extension = self._get_safe_extension(filename, content_type)
+        return f"{BLOB_DIR}/{sha256[:2]}/{sha256[2:4]}/{sha256}{extension}"
 
-        # Generate unique ID
-        unique_id = uuid.uuid4().hex[:16]
-
-        if username:
-            # Sanitize username for filesystem (remove dangerous chars)
-            safe_username = "".join(
-                c for c in username if c.isalnum() or c in "-_"
-            ).lower()
-            if not safe_username:
-                safe_username = "unknown"
+    def _image_metadata(
+        self,
+        sha256: str,
+        content_type: str,
+        file_path: Path,
+    ) -> tuple[Optional[int], Optional[int], Optional[int]]:
+        """Get (width, height, phash) for a staged or stored file.
 
-            # Build path: users/{username}/{uuid}.ext
-            storage_key = f"users/{safe_username}/{unique_id}{extension}"
-        else:
-            # Fallback: date-based path YYYY/MM/DD/uuid.ext
-            now = datetime.now()
-            storage_key = f"{now.year:04d}/{now.month:02d}/{now.day:02d}/{unique_id}{extension}"
+        Reuses the values of an existing attachment with the same content,
+        and only reads the file for images seen for the first time, or to
+        fill in a perceptual hash the existing rows lack.
+        """
+        if content_type not in IMAGE_MIME_TYPES:
+            return None, None, None
+
+        existing = (
+            self.db.query(Attachment)
+            .filter(
+                Attachment.sha256 == sha256,
+                Attachment.mime_type == content_type,
+                Attachment.width_px.isnot(None),
+            )
+            .order_by(Attachment.phash.is_(None))
+            .first()
+        )
+        if existing:
+            phash = existing.phash
+            if phash is None:
+                phash = self._compute_perceptual_hash(file_path.read_bytes(), content_type)
+            return existing.width_px, existing.height_px, phash
 
-        return storage_key
+        file_data = file_path.read_bytes()
+        width_px, height_px = self._extract_image_dimensions(file_data, content_type)
+        return width_px, height_px, self._compute_perceptual_hash(file_data, content_type)
 
     def _get_safe_extension(self, filename: str, content_type: str) -> str:
         """Get a safe file extension.
@@ -432,6 +785,75 @@ class AttachmentService:
             # Any error during image parsing
             return None, None
 
+    def _compute_perceptual_hash(
+        self,
+        file_data: bytes,
+        content_type: str,
+    ) -> Optional[int]:
+        """Compute the perceptual hash stored on image attachments.
+
+        Args:
+            file_data: Raw image bytes.
+            content_type: MIME type.
+
+        Returns:
+            Signed 64-bit hash for the phash column, or None if not an
+            image or the hash cannot be computed.
+        """
+        if content_type not in IMAGE_MIME_TYPES:
+            return None
+
+        value = compute_dhash(file_data)
+        return to_db_value(value) if value is not None else None
+
+    def backfill_perceptual_hashes(
+        self,
+        limit: int = 500,
+        after_id: int = 0,
+    ) -> PerceptualHashBackfillResult:
+        """Compute perceptual hashes for image attachments missing one.
+
+        Reads the stored files so the hash index can be rebuilt for rows
+        created before the phash column existed. Rows are walked by ID so
+        images that cannot be decoded are not rescanned in the same pass.
+
+        Args:
+            limit: Maximum number of attachments to process.
+            after_id: Only process attachments with a greater ID.
+
+        Returns:
+            PerceptualHashBackfillResult; pass last_id as after_id to continue.
+        """
+        attachments = (
+            self.db.query(Attachment)
+            .filter(
+                Attachment.id > after_id,
+                Attachment.phash.is_(None),
+                Attachment.mime_type.in_(sorted(IMAGE_MIME_TYPES)),
+                Attachment.deleted_at.is_(None),
+            )
+            .order_by(Attachment.id)
+            .limit(limit)
+            .all()
+        )
+
+        updated = 0
+        for attachment in attachments:
+            file_path = self.storage_path / attachment.storage_key
+            if not file_path.is_file():
+                continue
+            phash = self._compute_perceptual_hash(file_path.read_bytes(), attachment.mime_type)
+            if phash is not None:
+                attachment.phash = phash
+                updated += 1
+
+        self.db.flush()
+        return PerceptualHashBackfillResult(
+            scanned=len(attachments),
+            updated=updated,
+            last_id=attachments[-1].id if attachments else None,
+        )
+
     def _extract_dimensions_manual(
         self,
         file_data: bytes,
@@ -497,6 +919,7 @@ class AttachmentService:
 __all__ = [
     "AttachmentService",
     "AttachmentUploadResult",
+    "StagedFile",
     "AttachmentError",
     "FileTooLargeError",
     "InvalidMimeTypeError",
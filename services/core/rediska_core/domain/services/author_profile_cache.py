@@ -0,0 +1,285 @@
+"""Author profile cache backed by stored profile items.
+
+Scout watches see the same prolific posters across many watches and runs.
+Instead of refetching an author's profile and post/comment history for
+every post, AuthorProfileCache serves them from what is already stored:
+
+- the provider profile is kept in ExternalAccount.profile_json
+- posts and comments are the author's stored ProfileItem rows
+- ExternalAccount.last_fetched_at records when the history was complete
+
+Within the freshness window an author needs no provider calls at all.
+After it, only items newer than the author's high-water mark (the newest
+stored item_created_at, capped at last_fetched_at) are fetched and merged
+with the stored ones. Authors whose history was never fully fetched get a
+full fetch.
+
+Usage:
+    cache = AuthorProfileCache(db, max_age_seconds=settings.provider_profile_cache_seconds)
+    cached = cache.lookup("reddit", username, max_posts=20, max_comments=100)
+
+    if cached.is_fresh:
+        profile, posts = cached.profile, cached.posts
+    else:
+        profile = await adapter.fetch_profile(username)
+        new_posts = await adapter.fetch_user_posts(username, since=cached.posts_since)
+        posts = merge_items(new_posts, cached.posts, limit=20)
+        # ... store new items, then
+        cache.mark_fetched(account, profile)
+"""
+
+import logging
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from rediska_core.domain.models import ExternalAccount, ProfileItem
+from rediska_core.providers.base import (
+    ProfileItemType,
+    ProviderProfile,
+    ProviderProfileItem,
+    RemoteVisibility,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Default freshness window (6 hours)
+DEFAULT_MAX_AGE_SECONDS = 6 * 3600
+
+
+def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes (as stored by the database) as UTC."""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+# =============================================================================
+# CONVERSIONS
+# =============================================================================
+
+
+def profile_to_json(profile: ProviderProfile) -> dict:
+    """Serialize a provider profile for ExternalAccount.profile_json.
+
+    The raw provider payload is not kept.
+    """
+    data = {
+        f.name: getattr(profile, f.name) for f in fields(ProviderProfile) if f.name != "raw_data"
+    }
+    if profile.created_at is not None:
+        data["created_at"] = _as_utc(profile.created_at).isoformat()
+    return data
+
+
+def profile_from_json(data: dict) -> ProviderProfile:
+    """Rebuild a provider profile stored by profile_to_json()."""
+    data = dict(data)
+    if data.get("created_at"):
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    known = {f.name for f in fields(ProviderProfile)}
+    return ProviderProfile(**{k: v for k, v in data.items() if k in known})
+
+
+def item_from_profile_item(item: ProfileItem) -> ProviderProfileItem:
+    """Present a stored profile item like a freshly fetched one.
+
+    Posts are stored with title and body combined, so the combined text is
+    the body and the title is empty.
+    """
+    is_comment = item.item_type == "comment"
+    return ProviderProfileItem(
+        external_id=item.external_item_id,
+        item_type=ProfileItemType.COMMENT if is_comment else ProfileItemType.POST,
+        author_id="",
+        title=item.link_title if is_comment else None,
+        body_text=item.text_content,
+        created_at=_as_utc(item.item_created_at),
+        location=item.subreddit,
+        remote_visibility=RemoteVisibility.VISIBLE,
+        raw_data={"link_id": item.link_id} if is_comment and item.link_id else None,
+    )
+
+
+def merge_items(
+    new_items: list[ProviderProfileItem],
+    cached_items: list[ProviderProfileItem],
+    limit: int,
+) -> list[ProviderProfileItem]:
+    """Merge newly fetched items into cached ones, newest first.
+
+    Args:
+        new_items: Items just fetched (win over cached copies).
+        cached_items: Items served from storage.
+        limit: Maximum items returned.
+
+    Returns:
+        Up to limit distinct items, newest first (undated last).
+    """
+    merged: dict[str, ProviderProfileItem] = {}
+    for item in [*new_items, *cached_items]:
+        merged.setdefault(item.external_id, item)
+
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    ordered = sorted(
+        merged.values(),
+        key=lambda item: _as_utc(item.created_at) or oldest,
+        reverse=True,
+    )
+    return ordered[:limit]
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+@dataclass
+class CachedAuthor:
+    """What is stored for an author.
+
+    posts_since/comments_since are the high-water marks for an incremental
+    refresh; None means the history must be fetched in full.
+    """
+
+    account_id: Optional[int] = None
+    profile: Optional[ProviderProfile] = None
+    posts: list[ProviderProfileItem] = field(default_factory=list)
+    comments: list[ProviderProfileItem] = field(default_factory=list)
+    fetched_at: Optional[datetime] = None
+    is_fresh: bool = False
+    posts_since: Optional[datetime] = None
+    comments_since: Optional[datetime] = None
+
+
+class AuthorProfileCache:
+    """Serves author profiles and history from storage within a freshness window."""
+
+    def __init__(self, db: Session, max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS):
+        """Initialize the cache.
+
+        Args:
+            db: SQLAlchemy database session.
+            max_age_seconds: How long a fetch is reused without refreshing.
+        """
+        self.db = db
+        self.max_age = timedelta(seconds=max_age_seconds)
+
+    def lookup(
+        self,
+        provider_id: str,
+        username: str,
+        max_posts: int,
+        max_comments: int,
+        now: Optional[datetime] = None,
+    ) -> CachedAuthor:
+        """Load what is stored for an author.
+
+        Args:
+            provider_id: Provider of the account.
+            username: Author username.
+            max_posts: Newest posts to load.
+            max_comments: Newest comments to load.
+            now: Current time (defaults to now).
+
+        Returns:
+            CachedAuthor; empty and not fresh for unknown authors.
+        """
+        account = (
+            self.db.query(ExternalAccount)
+            .filter_by(provider_id=provider_id, external_username=username)
+            .first()
+        )
+        if not account:
+            return CachedAuthor()
+
+        now = now or datetime.now(timezone.utc)
+        fetched_at = _as_utc(account.last_fetched_at)
+        profile = profile_from_json(account.profile_json) if account.profile_json else None
+
+        posts = self._stored_items(account.id, "post", max_posts)
+        comments = self._stored_items(account.id, "comment", max_comments)
+
+        return CachedAuthor(
+            account_id=account.id,
+            profile=profile,
+            posts=posts,
+            comments=comments,
+            fetched_at=fetched_at,
+            is_fresh=(
+                fetched_at is not None
+                and profile is not None
+                and now - fetched_at < self.max_age
+            ),
+            posts_since=self._high_water(posts, fetched_at),
+            comments_since=self._high_water(comments, fetched_at),
+        )
+
+    def mark_fetched(
+        self,
+        account: ExternalAccount,
+        profile: Optional[ProviderProfile],
+        fetched_at: Optional[datetime] = None,
+    ) -> None:
+        """Record that an author's profile and history are now complete.
+
+        Call after the fetched items have been stored; the caller commits.
+
+        Args:
+            account: The author's account.
+            profile: The fetched profile (kept unchanged if None).
+            fetched_at: Fetch time (defaults to now).
+        """
+        account.last_fetched_at = fetched_at or datetime.now(timezone.utc)
+        if profile is not None:
+            account.profile_json = profile_to_json(profile)
+
+    def _stored_items(self, account_id: int, item_type: str, limit: int) -> list[ProviderProfileItem]:
+        rows = (
+            self.db.query(ProfileItem)
+            .filter(
+                ProfileItem.account_id == account_id,
+                ProfileItem.item_type == item_type,
+                ProfileItem.deleted_at.is_(None),
+                ProfileItem.remote_visibility.in_(("visible", "unknown")),
+            )
+            .order_by(ProfileItem.item_created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [item_from_profile_item(row) for row in rows]
+
+    @staticmethod
+    def _high_water(
+        items: list[ProviderProfileItem], fetched_at: Optional[datetime]
+    ) -> Optional[datetime]:
+        """Newest stored item time, capped at the last complete fetch.
+
+        Items stored after that fetch (e.g. a discovery post) say nothing
+        about what came between, so they cannot move the mark forward.
+        """
+        if fetched_at is None:
+            return None
+        dated = [item.created_at for item in items if item.created_at is not None]
+        if not dated:
+            return fetched_at
+        return min(max(dated), fetched_at)
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "AuthorProfileCache",
+    "CachedAuthor",
+    "DEFAULT_MAX_AGE_SECONDS",
+    "item_from_profile_item",
+    "merge_items",
+    "profile_from_json",
+    "profile_to_json",
+]
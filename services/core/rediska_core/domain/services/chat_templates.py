@@ -5,6 +5,7 @@ Each template knows how to:
 1. Parse responses to extract content (e.g., removing thinking tags)
 2. Provide recommended inference parameters
 3. Validate output format
+4. Detect the first complete JSON object in a partial (streaming) response
 
 Usage:
     from rediska_core.domain.services.chat_templates import get_chat_template
@@ -50,6 +51,39 @@ def _repair_json(json_str: str) -> str:
     return repaired
 
 
+def _find_object_end(text: str, start: int) -> Optional[int]:
+    """Find the brace closing the JSON object that opens at text[start].
+
+    Braces inside string literals are ignored.
+
+    Returns:
+        Index of the closing brace, or None if the object is not closed yet.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+
+    return None
+
+
 def _escape_string_value(match: re.Match) -> str:
     """Escape control characters in a JSON string value."""
     val = match.group(0)
@@ -157,6 +191,37 @@ class BaseChatTemplate(ABC):
         )
         return content.strip()
 
+    def find_json_object(self, partial_response: str) -> Optional[dict]:
+        """Get the first complete JSON object of a possibly unfinished response.
+
+        Used while streaming to tell when the answer is complete. Content the
+        template strips (e.g. an unclosed <think> block) is ignored, so JSON
+        inside reasoning does not count.
+
+        Args:
+            partial_response: The raw text generated so far
+
+        Returns:
+            The parsed object, or None if no complete object is present yet
+        """
+        content = self.extract_content(partial_response)
+        start = content.find("{")
+        if start == -1:
+            return None
+
+        end = _find_object_end(content, start)
+        if end is None:
+            return None
+
+        json_str = content[start:end + 1]
+        for candidate in (json_str, _repair_json(json_str)):
+            try:
+                data = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            return data if isinstance(data, dict) else None
+        return None
+
 
 class QwenThinkingTemplate(BaseChatTemplate):
     """Chat template for Qwen reasoning models with <think> tags.
@@ -223,6 +288,17 @@ class QwenThinkingTemplate(BaseChatTemplate):
 
         return content.strip()
 
+    def find_json_object(self, partial_response: str) -> Optional[dict]:
+        """Get the first complete JSON object after the reasoning block.
+
+        Returns None while the model is still inside <think>, without the
+        unclosed-tag warning extract_content logs for truncated responses.
+        """
+        lowered = partial_response.lower()
+        if lowered.rfind("<think>") > lowered.rfind("</think>"):
+            return None
+        return super().find_json_object(partial_response)
+
 
 class Llama3InstructTemplate(BaseChatTemplate):
     """Chat template for Llama 3 Instruct and compatible models.
@@ -0,0 +1,631 @@
+"""Token-budgeted context assembly for analysis agents.
+
+Heavy Reddit users can have hundreds of posts and comments - far more text
+than fits in the inference server's context window, and prompt processing
+dominates agent latency. Instead of joining every item, each agent gets a
+profile section sized to what is left of its context window after its
+system prompt, the lead post, and its reserved output tokens:
+
+1. Near-identical items (reposts, copy-pasted comments) are collapsed
+2. Items are ranked by recency, optionally blended with embedding
+   similarity to the agent's prompt; pinned items (the post that surfaced
+   the lead) always come first
+3. Items are taken in rank order until the budget is spent; the last item
+   is cut at a word boundary if enough room is left for it to be useful
+
+The same input always yields the same text, so repeated analyses of an
+unchanged profile send identical prompts.
+
+Token counts use the model's tokenizer when a tokenizer.json is configured
+and the optional `tokenizers` package is installed, and a conservative
+characters-per-token estimate otherwise.
+
+Usage:
+    builder = ContextBudgetBuilder.from_settings()
+
+    # Bounded profile text for the shared input context
+    texts = builder.profile_texts(input_context["items_by_type"])
+
+    # Per-agent context sized to the agent's prompt
+    agent_context = await builder.build_agent_context(input_context, prompt)
+"""
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from rediska_core.domain.models import AgentPrompt
+
+try:
+    from tokenizers import Tokenizer
+except ImportError:  # pragma: no cover - optional dependency
+    Tokenizer = None
+
+logger = logging.getLogger(__name__)
+
+
+# Conservative estimate for Llama-family tokenizers on English social text
+DEFAULT_CHARS_PER_TOKEN = 3.5
+
+# Default context window of one inference server slot
+DEFAULT_CONTEXT_WINDOW = 16384
+
+# Default cap on profile tokens per agent, even when more would fit
+DEFAULT_PROFILE_TOKENS = 6000
+
+# Tokens held back for chat template markup and estimate error
+PROMPT_OVERHEAD_TOKENS = 128
+
+# Smallest remainder worth filling with a truncated item
+MIN_TRUNCATED_TOKENS = 32
+
+# Word-shingle Jaccard similarity at which two items count as duplicates
+DEFAULT_DEDUPE_THRESHOLD = 0.9
+
+# Weight of prompt relevance against recency when both are used
+DEFAULT_RELEVANCE_WEIGHT = 0.5
+
+# Separator between items in the assembled text
+ITEM_SEPARATOR = "\n\n"
+
+TokenCounter = Callable[[str], int]
+RelevanceScorer = Callable[[str, list[str]], Awaitable[list[float]]]
+
+
+# =============================================================================
+# TOKEN COUNTING
+# =============================================================================
+
+
+def estimate_tokens(text: str, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN) -> int:
+    """Estimate the number of tokens in text.
+
+    Args:
+        text: Text to measure.
+        chars_per_token: Average characters per token.
+
+    Returns:
+        Estimated token count (0 for empty text).
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / chars_per_token)
+
+
+def load_token_counter(
+    tokenizer_file: Optional[str] = None,
+    chars_per_token: float = DEFAULT_CHARS_PER_TOKEN,
+) -> TokenCounter:
+    """Get a token counter, using the model's tokenizer when available.
+
+    Args:
+        tokenizer_file: Path to the model's tokenizer.json.
+        chars_per_token: Estimate used without a tokenizer.
+
+    Returns:
+        Function returning the token count of a text.
+    """
+    if tokenizer_file and Tokenizer is not None:
+        try:
+            tokenizer = Tokenizer.from_file(tokenizer_file)
+            return lambda text: len(tokenizer.encode(text, add_special_tokens=False).ids) if text else 0
+        except Exception as e:
+            logger.warning(f"Failed to load tokenizer {tokenizer_file}, estimating tokens: {e}")
+    elif tokenizer_file:
+        logger.warning("tokenizers package not installed, estimating tokens")
+
+    return lambda text: estimate_tokens(text, chars_per_token)
+
+
+# =============================================================================
+# ITEM SELECTION
+# =============================================================================
+
+
+@dataclass
+class ContextItem:
+    """A profile post or comment considered for an agent's context."""
+
+    text: str
+    created_at: Optional[datetime] = None
+    pinned: bool = False
+    position: int = 0
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an item's created_at (datetime or ISO string) as naive UTC."""
+    if isinstance(value, str) and value:
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def to_context_items(items: list[dict[str, Any]]) -> list[ContextItem]:
+    """Convert items_by_type entries to context items, skipping empty text."""
+    return [
+        ContextItem(
+            text=item["text"].strip(),
+            created_at=_parse_timestamp(item.get("created_at")),
+            pinned=bool(item.get("pinned")),
+            position=position,
+        )
+        for position, item in enumerate(items)
+        if item.get("text") and item["text"].strip()
+    ]
+
+
+def _shingles(text: str) -> set[str]:
+    """Word 3-shingles of normalized text."""
+    words = re.sub(r"[^\w\s]", " ", text.lower()).split()
+    if len(words) < 3:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def dedupe_items(
+    items: list[ContextItem],
+    threshold: float = DEFAULT_DEDUPE_THRESHOLD,
+) -> list[ContextItem]:
+    """Drop items nearly identical to an earlier item.
+
+    Items are compared by Jaccard similarity of their word 3-shingles, so
+    case, punctuation and whitespace differences are ignored. The first
+    occurrence (or a pinned one) is kept.
+
+    Args:
+        items: Items in their original order.
+        threshold: Similarity at or above which an item is a duplicate.
+
+    Returns:
+        Items without near-duplicates, in their original order.
+    """
+    kept: list[tuple[ContextItem, set[str]]] = []
+    seen_exact: set[frozenset[str]] = set()
+
+    for item in sorted(items, key=lambda i: (not i.pinned, i.position)):
+        shingles = _shingles(item.text)
+        key = frozenset(shingles)
+        if key in seen_exact:
+            continue
+
+        duplicate = False
+        for _, other in kept:
+            # Jaccard can't reach the threshold if the sizes differ too much
+            small, large = sorted((len(shingles), len(other)))
+            if not large or small / large < threshold:
+                continue
+            if len(shingles & other) / len(shingles | other) >= threshold:
+                duplicate = True
+                break
+
+        if not duplicate:
+            seen_exact.add(key)
+            kept.append((item, shingles))
+
+    return sorted((item for item, _ in kept), key=lambda i: i.position)
+
+
+def rank_items(
+    items: list[ContextItem],
+    relevance: Optional[list[float]] = None,
+    relevance_weight: float = DEFAULT_RELEVANCE_WEIGHT,
+) -> list[ContextItem]:
+    """Order items by how much they should be included.
+
+    Pinned items come first. The rest are ranked newest first, or by a
+    blend of recency rank and relevance when relevance scores are given.
+    Ties fall back to the original position, so the order is deterministic.
+
+    Args:
+        items: Items to rank.
+        relevance: Optional relevance score per item (higher is better).
+        relevance_weight: Weight of relevance against recency (0-1).
+
+    Returns:
+        Items in rank order.
+    """
+    dated = sorted(
+        (i for i in range(len(items)) if items[i].created_at is not None),
+        key=lambda i: (items[i].created_at, -items[i].position),
+        reverse=True,
+    )
+    by_recency = dated + [i for i in range(len(items)) if items[i].created_at is None]
+    count = max(len(items) - 1, 1)
+    recency = {index: 1 - rank / count for rank, index in enumerate(by_recency)}
+
+    def score(index: int) -> float:
+        if relevance is None:
+            return recency[index]
+        return (1 - relevance_weight) * recency[index] + relevance_weight * relevance[index]
+
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (not items[i].pinned, -score(i), items[i].position),
+    )
+    return [items[i] for i in order]
+
+
+def truncate_to_tokens(text: str, max_tokens: int, count_tokens: TokenCounter) -> str:
+    """Cut text to at most max_tokens, at a word boundary.
+
+    Args:
+        text: Text to cut.
+        max_tokens: Token limit.
+        count_tokens: Token counter.
+
+    Returns:
+        The longest word-aligned prefix within the limit, with an ellipsis
+        when cut ("" if not even one word fits).
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    words = text.split()
+    low, high = 0, len(words)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(" ".join(words[:middle]) + " …") <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+
+    return " ".join(words[:low]) + " …" if low else ""
+
+
+def split_budget(budget: int, needs: list[int]) -> list[int]:
+    """Share a token budget between sections.
+
+    Each section gets an equal share, and whatever a section does not need
+    is handed to the sections that need more.
+
+    Args:
+        budget: Total tokens available.
+        needs: Tokens each section would use without a limit.
+
+    Returns:
+        Tokens allotted to each section, in the same order.
+    """
+    allotted = [0] * len(needs)
+    pending = [i for i, need in enumerate(needs) if need > 0]
+    remaining = max(budget, 0)
+
+    while pending and remaining > 0:
+        share = remaining // len(pending)
+        if share == 0:
+            break
+        satisfied = [i for i in pending if needs[i] - allotted[i] <= share]
+        if not satisfied:
+            for i in pending:
+                allotted[i] += share
+            remaining -= share * len(pending)
+            break
+        for i in satisfied:
+            remaining -= needs[i] - allotted[i]
+            allotted[i] = needs[i]
+        pending = [i for i in pending if i not in satisfied]
+
+    return allotted
+
+
+# =============================================================================
+# BUILDER
+# =============================================================================
+
+
+class ContextBudgetBuilder:
+    """Builds profile context that fits each agent's token budget."""
+
+    def __init__(
+        self,
+        context_window: int = DEFAULT_CONTEXT_WINDOW,
+        max_profile_tokens: int = DEFAULT_PROFILE_TOKENS,
+        count_tokens: Optional[TokenCounter] = None,
+        relevance_scorer: Optional[RelevanceScorer] = None,
+        relevance_weight: float = DEFAULT_RELEVANCE_WEIGHT,
+        dedupe_threshold: float = DEFAULT_DEDUPE_THRESHOLD,
+    ):
+        """Initialize the builder.
+
+        Args:
+            context_window: Tokens per inference server slot.
+            max_profile_tokens: Cap on profile tokens per agent.
+            count_tokens: Token counter (defaults to an estimate).
+            relevance_scorer: Async function scoring texts against a query,
+                used to rank items by similarity to the agent's prompt.
+            relevance_weight: Weight of relevance against recency (0-1).
+            dedupe_threshold: Similarity at which items are duplicates.
+        """
+        self.context_window = context_window
+        self.max_profile_tokens = max_profile_tokens
+        self.count_tokens = count_tokens or estimate_tokens
+        self.relevance_scorer = relevance_scorer
+        self.relevance_weight = relevance_weight
+        self.dedupe_threshold = dedupe_threshold
+
+    @classmethod
+    def from_settings(cls) -> "ContextBudgetBuilder":
+        """Create a builder configured from settings."""
+        from rediska_core.config import get_settings
+
+        settings = get_settings()
+        relevance_scorer = None
+        if settings.analysis_context_relevance and settings.embeddings_url:
+            relevance_scorer = EmbeddingRelevanceScorer(
+                url=settings.embeddings_url,
+                model=settings.embeddings_model or "nomic-embed-text",
+                api_key=settings.embeddings_api_key,
+            )
+
+        return cls(
+            context_window=settings.inference_context_window,
+            max_profile_tokens=settings.analysis_profile_max_tokens,
+            count_tokens=load_token_counter(
+                settings.analysis_tokenizer_file, settings.analysis_chars_per_token
+            ),
+            relevance_scorer=relevance_scorer,
+        )
+
+    def select_text(
+        self,
+        items: list[ContextItem],
+        budget: int,
+        relevance: Optional[list[float]] = None,
+    ) -> str:
+        """Assemble the highest ranked items that fit a budget.
+
+        Args:
+            items: Deduplicated items.
+            budget: Tokens available.
+            relevance: Optional relevance score per item.
+
+        Returns:
+            Items joined in rank order.
+        """
+        separator_tokens = self.count_tokens(ITEM_SEPARATOR)
+        parts: list[str] = []
+        used = 0
+
+        for item in rank_items(items, relevance, self.relevance_weight):
+            cost = self.count_tokens(item.text) + (separator_tokens if parts else 0)
+            if used + cost <= budget:
+                parts.append(item.text)
+                used += cost
+                continue
+
+            room = budget - used - (separator_tokens if parts else 0)
+            if room >= MIN_TRUNCATED_TOKENS:
+                truncated = truncate_to_tokens(item.text, room, self.count_tokens)
+                if truncated:
+                    parts.append(truncated)
+            break
+
+        return ITEM_SEPARATOR.join(parts)
+
+    def _sections(self, items_by_type: dict[str, list[dict[str, Any]]]) -> dict[str, list[ContextItem]]:
+        """Deduplicated posts and comments."""
+        return {
+            "post": dedupe_items(to_context_items(items_by_type.get("post", [])), self.dedupe_threshold),
+            "comment": dedupe_items(to_context_items(items_by_type.get("comment", [])), self.dedupe_threshold),
+        }
+
+    def _fill(
+        self,
+        sections: dict[str, list[ContextItem]],
+        budget: int,
+        relevance: Optional[dict[str, list[float]]] = None,
+    ) -> dict[str, str]:
+        """Split a budget between posts and comments and assemble both."""
+        separator_tokens = self.count_tokens(ITEM_SEPARATOR)
+        needs = [
+            sum(self.count_tokens(item.text) + separator_tokens for item in sections[name])
+            for name in ("post", "comment")
+        ]
+        post_budget, comment_budget = split_budget(budget, needs)
+        relevance = relevance or {}
+        return {
+            "post_text": self.select_text(sections["post"], post_budget, relevance.get("post")),
+            "comment_text": self.select_text(
+                sections["comment"], comment_budget, relevance.get("comment")
+            ),
+        }
+
+    def profile_texts(
+        self,
+        items_by_type: dict[str, list[dict[str, Any]]],
+        budget: Optional[int] = None,
+    ) -> dict[str, str]:
+        """Build bounded post and comment text without a specific agent.
+
+        Args:
+            items_by_type: Items keyed by "post" and "comment", each a dict
+                with "text", optional "created_at" and optional "pinned".
+            budget: Tokens for both sections (defaults to max_profile_tokens).
+
+        Returns:
+            Dict with "post_text" and "comment_text".
+        """
+        limit = self.max_profile_tokens if budget is None else budget
+        return self._fill(self._sections(items_by_type), limit)
+
+    def agent_budget(self, input_context: dict[str, Any], prompt: AgentPrompt) -> int:
+        """Tokens left for profile items in an agent's context window.
+
+        Args:
+            input_context: Shared input context.
+            prompt: The agent's prompt.
+
+        Returns:
+            Profile token budget (never above max_profile_tokens).
+        """
+        lead = input_context.get("lead", {})
+        profile = input_context.get("profile", {})
+        fixed = sum(
+            self.count_tokens(text or "")
+            for text in (
+                prompt.system_prompt,
+                lead.get("title"),
+                lead.get("body"),
+                profile.get("summary"),
+            )
+        )
+        available = (
+            self.context_window - (prompt.max_tokens or 0) - fixed - PROMPT_OVERHEAD_TOKENS
+        )
+        return max(0, min(self.max_profile_tokens, available))
+
+    def build_shared_context(
+        self,
+        input_context: dict[str, Any],
+        prompts: list[AgentPrompt],
+    ) -> dict[str, Any]:
+        """Build one profile section that fits every agent's budget.
+
+        Used when agents share their input as a cached prompt prefix, which
+        only works if every agent gets exactly the same text.
+
+        Args:
+            input_context: Shared input context.
+            prompts: Prompts of all agents that will receive the context.
+
+        Returns:
+            Copy of the context with budgeted post_text and comment_text.
+        """
+        items_by_type = input_context.get("items_by_type")
+        if not items_by_type or not prompts:
+            return input_context
+
+        budget = min(self.agent_budget(input_context, prompt) for prompt in prompts)
+        texts = self._fill(self._sections(items_by_type), budget)
+        profile = {**input_context.get("profile", {}), **texts}
+        return {**input_context, "profile": profile}
+
+    async def build_agent_context(
+        self,
+        input_context: dict[str, Any],
+        prompt: AgentPrompt,
+    ) -> dict[str, Any]:
+        """Size the profile section of a context to one agent.
+
+        Contexts without items_by_type are returned unchanged.
+
+        Args:
+            input_context: Shared input context.
+            prompt: The agent's prompt.
+
+        Returns:
+            Copy of the context with budgeted post_text and comment_text.
+        """
+        items_by_type = input_context.get("items_by_type")
+        if not items_by_type:
+            return input_context
+
+        sections = self._sections(items_by_type)
+        budget = self.agent_budget(input_context, prompt)
+
+        relevance = None
+        if self.relevance_scorer is not None and prompt.system_prompt:
+            try:
+                relevance = {
+                    name: await self.relevance_scorer(
+                        prompt.system_prompt, [item.text for item in items]
+                    )
+                    if items
+                    else []
+                    for name, items in sections.items()
+                }
+            except Exception as e:
+                logger.warning(f"Relevance scoring failed, ranking by recency: {e}")
+
+        profile = {**input_context.get("profile", {}), **self._fill(sections, budget, relevance)}
+        return {**input_context, "profile": profile}
+
+
+# =============================================================================
+# RELEVANCE
+# =============================================================================
+
+
+class EmbeddingRelevanceScorer:
+    """Scores texts by embedding cosine similarity to a query.
+
+    Vectors are served from the embedding cache when possible, so an
+    agent prompt and unchanged profile items are embedded once.
+    """
+
+    def __init__(self, url: str, model: str, api_key: Optional[str] = None, cache: Any = None):
+        """Initialize the scorer.
+
+        Args:
+            url: Embeddings API base URL.
+            model: Embedding model name.
+            api_key: Optional API key.
+            cache: Embedding cache (defaults to the configured one).
+        """
+        self.url = url
+        self.model = model
+        self.api_key = api_key
+        self._cache = cache
+
+    @property
+    def cache(self):
+        """Get the embedding cache (lazy initialization)."""
+        if self._cache is None:
+            from rediska_core.infrastructure.embedding_cache import get_embedding_cache
+
+            self._cache = get_embedding_cache() or False
+        return self._cache or None
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, using the cache for known ones."""
+        from rediska_core.infrastructure.embeddings import get_async_embeddings_client
+
+        cache = self.cache
+        vectors = cache.get_many(self.model, texts) if cache else [None] * len(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            client = get_async_embeddings_client(self.url, self.model, self.api_key)
+            fresh = await client.embed_batch([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+            if cache:
+                cache.set_many(self.model, [texts[i] for i in missing], fresh)
+        return vectors
+
+    async def __call__(self, query: str, texts: list[str]) -> list[float]:
+        """Score each text by cosine similarity to the query (0-1)."""
+        query_vector, *vectors = await self._embed([query, *texts])
+        return [max(0.0, _cosine(query_vector, vector)) for vector in vectors]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    """Cosine similarity of two vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "ContextBudgetBuilder",
+    "ContextItem",
+    "EmbeddingRelevanceScorer",
+    "dedupe_items",
+    "estimate_tokens",
+    "load_token_counter",
+    "rank_items",
+    "split_budget",
+    "truncate_to_tokens",
+]
@@ -22,16 +22,19 @@ Usage:
 
     # Get counts
     count = service.count_analyzed()
+
+    # Get all tab counts in one query
+    counts = service.count_all()
 """
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import asc, desc, func
+from sqlalchemy import asc, case, desc, func
 from sqlalchemy.orm import Session
 
-from rediska_core.domain.models import ExternalAccount, ProfileSnapshot
+from rediska_core.domain.models import ExternalAccount, LeadPost, ProfileSnapshot
 
 
 # =============================================================================
@@ -144,7 +147,7 @@ class DirectoryService:
         query = query.offset(offset).limit(limit)
 
         accounts = query.all()
-        return [self._to_directory_entry(account) for account in accounts]
+        return self._to_directory_entries(accounts)
 
     def count_analyzed(self, provider_id: Optional[str] = None, search: Optional[str] = None) -> int:
         """Count accounts that have been analyzed."""
@@ -185,7 +188,7 @@ class DirectoryService:
         query = query.offset(offset).limit(limit)
 
         accounts = query.all()
-        return [self._to_directory_entry(account) for account in accounts]
+        return self._to_directory_entries(accounts)
 
     def count_contacted(self, provider_id: Optional[str] = None, search: Optional[str] = None) -> int:
         """Count accounts that have been contacted."""
@@ -226,7 +229,7 @@ class DirectoryService:
         query = query.offset(offset).limit(limit)
 
         accounts = query.all()
-        return [self._to_directory_entry(account) for account in accounts]
+        return self._to_directory_entries(accounts)
 
     def count_engaged(self, provider_id: Optional[str] = None, search: Optional[str] = None) -> int:
         """Count accounts that have engaged."""
@@ -267,7 +270,7 @@ class DirectoryService:
         query = query.offset(offset).limit(limit)
 
         accounts = query.all()
-        return [self._to_directory_entry(account) for account in accounts]
+        return self._to_directory_entries(accounts)
 
     def count_starred(self, provider_id: Optional[str] = None, search: Optional[str] = None) -> int:
         """Count starred accounts."""
@@ -315,33 +318,132 @@ class DirectoryService:
             "starred_at": starred_at.isoformat() if starred_at else None,
         }
 
+    # =========================================================================
+    # COMBINED COUNTS
+    # =========================================================================
+
+    def count_all(
+        self, provider_id: Optional[str] = None, search: Optional[str] = None
+    ) -> dict[str, int]:
+        """Count every directory tab in a single aggregate query.
+
+        Returns:
+            Dict with analyzed, contacted, engaged and starred counts.
+        """
+        def count_when(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        query = self.db.query(
+            count_when(ExternalAccount.analysis_state == "analyzed").label("analyzed"),
+            count_when(ExternalAccount.contact_state == "contacted").label("contacted"),
+            count_when(ExternalAccount.engagement_state == "engaged").label("engaged"),
+            count_when(ExternalAccount.is_starred == True).label("starred"),
+        ).filter(ExternalAccount.deleted_at.is_(None))
+
+        if provider_id:
+            query = query.filter(ExternalAccount.provider_id == provider_id)
+
+        query = self._apply_search(query, search)
+        row = query.one()
+        return {
+            "analyzed": int(row.analyzed),
+            "contacted": int(row.contacted),
+            "engaged": int(row.engaged),
+            "starred": int(row.starred),
+        }
+
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
 
-    def _to_directory_entry(self, account: ExternalAccount) -> DirectoryEntry:
-        """Convert an ExternalAccount to a DirectoryEntry.
+    def _latest_summaries(self, account_ids: list[int]) -> dict[int, Optional[str]]:
+        """Get the latest profile snapshot summary for each account.
 
         Args:
-            account: The external account.
+            account_ids: Accounts to look up.
 
         Returns:
-            DirectoryEntry with account data and related info.
+            Dict mapping account_id to the newest snapshot's summary_text.
         """
-        # Get latest profile snapshot summary
-        latest_summary = None
-        latest_snapshot = (
-            self.db.query(ProfileSnapshot)
-            .filter(ProfileSnapshot.account_id == account.id)
-            .order_by(desc(ProfileSnapshot.fetched_at))
-            .first()
+        if not account_ids:
+            return {}
+
+        ranked = (
+            self.db.query(
+                ProfileSnapshot.account_id.label("account_id"),
+                ProfileSnapshot.summary_text.label("summary_text"),
+                func.row_number()
+                .over(
+                    partition_by=ProfileSnapshot.account_id,
+                    order_by=(desc(ProfileSnapshot.fetched_at), desc(ProfileSnapshot.id)),
+                )
+                .label("rn"),
+            )
+            .filter(ProfileSnapshot.account_id.in_(account_ids))
+            .subquery()
+        )
+
+        rows = (
+            self.db.query(ranked.c.account_id, ranked.c.summary_text)
+            .filter(ranked.c.rn == 1)
+            .all()
         )
-        if latest_snapshot:
-            latest_summary = latest_snapshot.summary_text
+        return {row.account_id: row.summary_text for row in rows}
+
+    def _lead_counts(self, account_ids: list[int]) -> dict[int, int]:
+        """Count lead posts authored by each account in one grouped query."""
+        if not account_ids:
+            return {}
+
+        rows = (
+            self.db.query(LeadPost.author_account_id, func.count(LeadPost.id))
+            .filter(LeadPost.author_account_id.in_(account_ids))
+            .group_by(LeadPost.author_account_id)
+            .all()
+        )
+        return {account_id: count for account_id, count in rows}
+
+    def _to_directory_entries(self, accounts: list[ExternalAccount]) -> list[DirectoryEntry]:
+        """Convert a page of accounts to DirectoryEntries.
+
+        Latest snapshot summaries and lead counts are loaded for the whole
+        page with two queries rather than per account.
+
+        Args:
+            accounts: The external accounts in the page.
+
+        Returns:
+            DirectoryEntries in the same order as accounts.
+        """
+        account_ids = [account.id for account in accounts]
+        summaries = self._latest_summaries(account_ids)
+        lead_counts = self._lead_counts(account_ids)
+
+        return [
+            self._to_directory_entry(
+                account,
+                latest_summary=summaries.get(account.id),
+                lead_count=lead_counts.get(account.id, 0),
+            )
+            for account in accounts
+        ]
+
+    def _to_directory_entry(
+        self,
+        account: ExternalAccount,
+        latest_summary: Optional[str] = None,
+        lead_count: int = 0,
+    ) -> DirectoryEntry:
+        """Convert an ExternalAccount to a DirectoryEntry.
 
-        # Count lead posts
-        lead_count = len(account.lead_posts) if account.lead_posts else 0
+        Args:
+            account: The external account.
+            latest_summary: Summary from the account's latest profile snapshot.
+            lead_count: Number of lead posts authored by the account.
 
+        Returns:
+            DirectoryEntry with account data and related info.
+        """
         return DirectoryEntry(
             id=account.id,
             provider_id=account.provider_id,
@@ -24,11 +24,15 @@ Usage:
     if result.success:
         print(result.output.primary_draft.body)
         # User reviews and clicks "Send" button
+
+    # Or stream the draft as it is written
+    async for event in agent.draft_stream(input_data):
+        ...
 """
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -266,6 +270,30 @@ class DraftIntroAgent:
 
         return base_prompt
 
+    def _build_messages(self, input_data: DraftIntroInput) -> list[ChatMessage]:
+        """Build the chat messages for a draft request."""
+        return [
+            ChatMessage(role="system", content=self.get_system_prompt()),
+            ChatMessage(role="user", content=input_data.to_prompt()),
+        ]
+
+    @staticmethod
+    def _parse_output(raw_response: str) -> DraftIntroOutput:
+        """Parse and validate the model's JSON response.
+
+        Raises:
+            json.JSONDecodeError: If the response is not JSON
+            ValidationError: If the JSON does not match DraftIntroOutput
+        """
+        content = raw_response.strip()
+
+        # Handle potential markdown code blocks
+        if content.startswith("```"):
+            lines = content.split("\n")
+            content = "\n".join(lines[1:-1])
+
+        return DraftIntroOutput.model_validate(json.loads(content))
+
     async def draft(self, input_data: DraftIntroInput) -> DraftIntroResult:
         """Draft an intro message.
 
@@ -275,11 +303,7 @@ class DraftIntroAgent:
         Returns:
             DraftIntroResult with output or error
         """
-        # Build messages
-        messages = [
-            ChatMessage(role="system", content=self.get_system_prompt()),
-            ChatMessage(role="user", content=input_data.to_prompt()),
-        ]
+        messages = self._build_messages(input_data)
 
         # Make inference request
         try:
@@ -292,17 +316,7 @@ class DraftIntroAgent:
 
         # Parse response
         try:
-            content = response.content.strip()
-
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
-
-            data = json.loads(content)
-
-            # Validate against schema
-            output = DraftIntroOutput.model_validate(data)
+            output = self._parse_output(response.content)
 
             return DraftIntroResult(
                 success=True,
@@ -327,6 +341,36 @@ class DraftIntroAgent:
             )
 
 
+    async def draft_stream(self, input_data: DraftIntroInput) -> AsyncIterator[dict[str, Any]]:
+        """Draft an intro message, streaming the text as it is generated.
+
+        Args:
+            input_data: Draft intro input data
+
+        Yields:
+            {"type": "delta", "text": ...} for each generated chunk, then
+            {"type": "draft", "output": ...} with the validated draft or
+            {"type": "error", "error": ...}
+        """
+        parts: list[str] = []
+        try:
+            async for text in self.inference_client.stream_chat(self._build_messages(input_data)):
+                parts.append(text)
+                yield {"type": "delta", "text": text}
+        except Exception as e:
+            yield {"type": "error", "error": f"Inference error: {e}"}
+            return
+
+        try:
+            output = self._parse_output("".join(parts))
+        except json.JSONDecodeError as e:
+            yield {"type": "error", "error": f"Invalid JSON response: {e}"}
+        except ValidationError as e:
+            yield {"type": "error", "error": f"Validation error: {e}"}
+        else:
+            yield {"type": "draft", "output": output.model_dump()}
+
+
 # =============================================================================
 # DRAFT INTRO SERVICE
 # =============================================================================
@@ -371,6 +415,36 @@ class DraftIntroService:
         Returns:
             DraftIntroResult with the draft (NOT sent)
         """
+        prepared = self.prepare_for_lead(
+            lead_id, identity_id, custom_instructions, product_context
+        )
+        if isinstance(prepared, DraftIntroResult):
+            return prepared
+
+        agent, input_data = prepared
+        return await agent.draft(input_data)
+
+    def prepare_for_lead(
+        self,
+        lead_id: int,
+        identity_id: int,
+        custom_instructions: Optional[str] = None,
+        product_context: Optional[dict] = None,
+    ) -> "tuple[DraftIntroAgent, DraftIntroInput] | DraftIntroResult":
+        """Load everything needed to draft an intro for a lead.
+
+        All database access happens here, so the returned agent can be
+        streamed after the request's session is no longer in use.
+
+        Args:
+            lead_id: ID of the lead post
+            identity_id: ID of the identity to use for voice config
+            custom_instructions: Optional custom drafting instructions
+            product_context: Optional product/service context
+
+        Returns:
+            (agent, input_data), or a failed DraftIntroResult
+        """
         from rediska_core.domain.models import Identity, LeadPost, ProfileSnapshot
 
         # Load lead
@@ -435,7 +509,7 @@ class DraftIntroService:
             custom_instructions=custom_instructions,
         )
 
-        return await agent.draft(input_data)
+        return agent, input_data
 
     async def draft_for_account(
         self,
@@ -3,6 +3,7 @@
 Detects potential duplicates based on:
 1. Username similarity (exact, case-insensitive, variations, edit distance)
 2. Image hash overlap (shared profile images)
+3. Perceptual hash proximity (re-encoded or resized copies of an image)
 
 Usage:
     service = DuplicateDetectionService(db=session)
@@ -22,7 +23,17 @@ Usage:
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+from rediska_core.domain.services.perceptual_hash import (
+    DEFAULT_MAX_DISTANCE,
+    HASH_BITS,
+    PerceptualHashIndex,
+    bulk_hamming_distances,
+    hamming_distance,
+    hash_bit_length,
+    parse_hash,
+)
 
 
 # =============================================================================
@@ -88,6 +99,7 @@ class DuplicateCandidate:
     username: str
     provider_id: str
     image_hashes: list[str] = field(default_factory=list)
+    perceptual_hashes: list[int] = field(default_factory=list)
 
 
 @dataclass
@@ -103,6 +115,8 @@ class DuplicateDetectionConfig:
     max_candidates: int = 100
     enable_username_matching: bool = True
     enable_image_matching: bool = True
+    enable_perceptual_matching: bool = True
+    max_perceptual_distance: int = DEFAULT_MAX_DISTANCE
 
 
 # =============================================================================
@@ -152,6 +166,9 @@ class UsernameMatcher:
     # Patterns for number suffixes
     NUMBER_SUFFIX_PATTERN = re.compile(r"\d+$")
 
+    # Lowest edit-distance similarity accepted as a fuzzy match
+    FUZZY_MIN_SIMILARITY = 0.7
+
     def __init__(self, min_length_for_fuzzy: int = 4):
         """Initialize the username matcher.
 
@@ -211,18 +228,28 @@ class UsernameMatcher:
 
         return stripped
 
-    def levenshtein_distance(self, s1: str, s2: str) -> int:
+    def levenshtein_distance(
+        self, s1: str, s2: str, max_distance: Optional[int] = None
+    ) -> int:
         """Calculate Levenshtein edit distance between two strings.
 
+        When max_distance is given the computation stops as soon as every
+        cell of the current row exceeds it, and max_distance + 1 is
+        returned instead of the exact distance.
+
         Args:
             s1: First string
             s2: Second string
+            max_distance: Optional cutoff for early termination
 
         Returns:
             Edit distance (number of operations to transform s1 to s2)
         """
         if len(s1) < len(s2):
-            return self.levenshtein_distance(s2, s1)
+            return self.levenshtein_distance(s2, s1, max_distance)
+
+        if max_distance is not None and len(s1) - len(s2) > max_distance:
+            return max_distance + 1
 
         if len(s2) == 0:
             return len(s1)
@@ -236,10 +263,31 @@ class UsernameMatcher:
                 deletions = current_row[j] + 1
                 substitutions = previous_row[j] + (c1 != c2)
                 current_row.append(min(insertions, deletions, substitutions))
+            if max_distance is not None and min(current_row) > max_distance:
+                return max_distance + 1
             previous_row = current_row
 
+        if max_distance is not None and previous_row[-1] > max_distance:
+            return max_distance + 1
+
         return previous_row[-1]
 
+    def max_fuzzy_distance(self, length: int) -> int:
+        """Largest edit distance that can still produce a fuzzy match.
+
+        Args:
+            length: Length of the longer normalized username
+
+        Returns:
+            Maximum edit distance whose similarity reaches the fuzzy threshold
+        """
+        distance = int(length * (1 - self.FUZZY_MIN_SIMILARITY))
+        while distance < length and 1 - ((distance + 1) / length) >= self.FUZZY_MIN_SIMILARITY:
+            distance += 1
+        while distance > 0 and 1 - (distance / length) < self.FUZZY_MIN_SIMILARITY:
+            distance -= 1
+        return distance
+
     def compare(self, username_a: str, username_b: str) -> UsernameMatchResult:
         """Compare two usernames for similarity.
 
@@ -308,8 +356,10 @@ class UsernameMatcher:
 
         # Levenshtein distance for fuzzy matching
         if len(norm_a) >= self.min_length_for_fuzzy and len(norm_b) >= self.min_length_for_fuzzy:
-            distance = self.levenshtein_distance(norm_a, norm_b)
             max_len = max(len(norm_a), len(norm_b))
+            distance = self.levenshtein_distance(
+                norm_a, norm_b, max_distance=self.max_fuzzy_distance(max_len)
+            )
 
             # Calculate similarity ratio
             similarity = 1 - (distance / max_len)
@@ -321,7 +371,7 @@ class UsernameMatcher:
                     reason="fuzzy_match",
                 )
 
-            if similarity >= 0.7:
+            if similarity >= self.FUZZY_MIN_SIMILARITY:
                 return UsernameMatchResult(
                     is_match=True,
                     confidence=similarity * 0.75,
@@ -349,13 +399,16 @@ class ImageHashMatcher:
     - Perceptual hash similarity (optional)
     """
 
-    def __init__(self, perceptual_threshold: float = 0.9):
+    def __init__(self, perceptual_threshold: float = 0.9, hash_format: str = "bin"):
         """Initialize the image hash matcher.
 
         Args:
             perceptual_threshold: Similarity threshold for perceptual hashes
+            hash_format: Encoding of string perceptual hashes ("bin" or "hex");
+                integer hashes are always compared as HASH_BITS-bit values
         """
         self.perceptual_threshold = perceptual_threshold
+        self.hash_format = hash_format
 
     def compare(
         self, hashes_a: Optional[list[str]], hashes_b: Optional[list[str]]
@@ -420,7 +473,9 @@ class ImageHashMatcher:
         )
 
     def compare_perceptual(
-        self, hashes_a: Optional[list[str]], hashes_b: Optional[list[str]]
+        self,
+        hashes_a: Optional[list[Union[int, str]]],
+        hashes_b: Optional[list[Union[int, str]]],
     ) -> ImageMatchResult:
         """Compare using perceptual hash similarity.
 
@@ -441,12 +496,19 @@ class ImageHashMatcher:
                 matching_hashes=[],
             )
 
-        # For perceptual hashes, we need to compare each pair
+        # Compare each hash of A against all of B in one vectorized pass
         matching_pairs = []
-
-        for hash_a in hashes_a:
-            for hash_b in hashes_b:
-                similarity = self._perceptual_similarity(hash_a, hash_b)
+        parsed_b = self._parse_hashes(hashes_b)
+        values_b = [value for _, value, _ in parsed_b]
+
+        for hash_a, value_a, bits in self._parse_hashes(hashes_a):
+            if not bits:
+                continue
+            distances = bulk_hamming_distances(value_a, values_b)
+            for (hash_b, _, bits_b), distance in zip(parsed_b, distances):
+                if bits_b != bits:
+                    continue
+                similarity = 1 - (distance / bits)
                 if similarity >= self.perceptual_threshold:
                     matching_pairs.append((hash_a, hash_b, similarity))
 
@@ -467,31 +529,283 @@ class ImageHashMatcher:
             matching_hashes=matching_hashes,
         )
 
-    def _perceptual_similarity(self, hash_a: str, hash_b: str) -> float:
+    def _parse_hashes(
+        self, hashes: list[Union[int, str]]
+    ) -> list[tuple[Union[int, str], int, int]]:
+        """Parse hashes into (original, value, bits), skipping invalid ones."""
+        parsed = []
+        for value in hashes:
+            try:
+                parsed.append(
+                    (
+                        value,
+                        parse_hash(value, self.hash_format),
+                        hash_bit_length(value, self.hash_format),
+                    )
+                )
+            except ValueError:
+                continue
+        return parsed
+
+    def _perceptual_similarity(
+        self, hash_a: Union[int, str], hash_b: Union[int, str]
+    ) -> float:
         """Calculate similarity between two perceptual hashes.
 
-        Uses Hamming distance for binary hashes.
+        Uses popcount Hamming distance over the hash bits.
 
         Args:
-            hash_a: First perceptual hash
-            hash_b: Second perceptual hash
+            hash_a: First perceptual hash (int, or string in hash_format)
+            hash_b: Second perceptual hash (int, or string in hash_format)
 
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        if len(hash_a) != len(hash_b):
+        parsed = self._parse_hashes([hash_a, hash_b])
+        if len(parsed) != 2:
             return 0.0
 
-        if not hash_a or not hash_b:
+        (_, value_a, bits), (_, value_b, bits_b) = parsed
+        if not bits or bits != bits_b:
             return 0.0
 
-        # Count differing characters (Hamming distance)
-        differences = sum(c1 != c2 for c1, c2 in zip(hash_a, hash_b))
+        # Convert Hamming distance to similarity
+        distance = hamming_distance(value_a, value_b)
+        return 1 - (distance / bits)
+
+
+# =============================================================================
+# CANDIDATE BLOCKING
+# =============================================================================
+
+
+class DuplicateCandidateIndex:
+    """Generates candidate pairs without comparing every pair of accounts.
+
+    Only pairs that could pass UsernameMatcher.compare or
+    ImageHashMatcher.compare are emitted, so running compare_candidates on
+    the emitted pairs gives the same suggestions as an exhaustive scan.
+
+    Blocking keys:
+    - normalized username (exact and case-insensitive matches)
+    - stripped stem and separator-free form (variation matches)
+    - every prefix of at least min_length_for_fuzzy characters
+      (prefix/suffix matches)
+    - rarest bigrams of the normalized username, using q-gram prefix
+      filtering sized from the fuzzy edit-distance bound (fuzzy matches)
+    - sha256 of each attached image (image hash matches)
+    - BK-tree range search over perceptual hashes (near-duplicate images)
+    """
+
+    QGRAM_SIZE = 2
+
+    def __init__(
+        self,
+        username_matcher: Optional[UsernameMatcher] = None,
+        use_usernames: bool = True,
+        use_images: bool = True,
+        use_perceptual: bool = False,
+        max_perceptual_distance: int = DEFAULT_MAX_DISTANCE,
+    ):
+        """Initialize the candidate index.
+
+        Args:
+            username_matcher: Matcher whose normalization rules are mirrored
+            use_usernames: Generate pairs from username blocking keys
+            use_images: Generate pairs from shared image hashes
+            use_perceptual: Generate pairs from nearby perceptual hashes
+            max_perceptual_distance: Hamming radius for perceptual pairs
+        """
+        self.username_matcher = username_matcher or UsernameMatcher()
+        self.use_usernames = use_usernames
+        self.use_images = use_images
+        self.use_perceptual = use_perceptual
+        self.max_perceptual_distance = max_perceptual_distance
+        self._min_shared_qgrams: dict[int, int] = {}
+
+    def candidate_pairs(
+        self, candidates: list[DuplicateCandidate]
+    ) -> list[tuple[int, int]]:
+        """Find index pairs worth a full comparison.
+
+        Args:
+            candidates: Candidates to pair up
 
-        # Convert to similarity
-        similarity = 1 - (differences / len(hash_a))
+        Returns:
+            Sorted list of (i, j) index pairs with i < j and the same provider
+        """
+        by_provider: dict[str, list[int]] = {}
+        for idx, candidate in enumerate(candidates):
+            by_provider.setdefault(candidate.provider_id, []).append(idx)
+
+        pairs: set[tuple[int, int]] = set()
+        for indices in by_provider.values():
+            if self.use_usernames:
+                self._add_username_pairs(candidates, indices, pairs)
+            if self.use_images:
+                self._add_image_pairs(candidates, indices, pairs)
+            if self.use_perceptual:
+                self._add_perceptual_pairs(candidates, indices, pairs)
+
+        return sorted(pairs)
+
+    def _add_username_pairs(
+        self,
+        candidates: list[DuplicateCandidate],
+        indices: list[int],
+        pairs: set[tuple[int, int]],
+    ) -> None:
+        """Add pairs sharing a username blocking key."""
+        matcher = self.username_matcher
+        min_len = matcher.min_length_for_fuzzy
+
+        normalized = {idx: matcher.normalize(candidates[idx].username) for idx in indices}
+
+        # Exact keys: normalized form, stripped stem, separator-free form
+        exact_buckets: dict[tuple[str, str], list[int]] = {}
+        by_norm: dict[str, list[int]] = {}
+        for idx in indices:
+            norm = normalized[idx]
+            by_norm.setdefault(norm, []).append(idx)
+            exact_buckets.setdefault(("norm", norm), []).append(idx)
+
+            stripped = matcher.strip_decorations(norm)
+            if len(stripped) >= min_len:
+                exact_buckets.setdefault(("stem", stripped), []).append(idx)
+
+            no_sep = norm.replace("_", "")
+            if len(no_sep) >= min_len:
+                exact_buckets.setdefault(("nosep", no_sep), []).append(idx)
+
+        for bucket in exact_buckets.values():
+            _add_bucket_pairs(bucket, pairs)
+
+        # Prefix matches: look up each prefix of the name as a full name
+        for idx in indices:
+            norm = normalized[idx]
+            for end in range(min_len, len(norm)):
+                for other in by_norm.get(norm[:end], ()):
+                    _add_pair(idx, other, pairs)
+
+        self._add_fuzzy_pairs(
+            {idx: norm for idx, norm in normalized.items() if len(norm) >= min_len},
+            pairs,
+        )
+
+    def _add_fuzzy_pairs(
+        self, normalized: dict[int, str], pairs: set[tuple[int, int]]
+    ) -> None:
+        """Add pairs that may fall within the fuzzy edit-distance bound.
+
+        Two strings within edit distance k share at least
+        max_len - q + 1 - k*q q-grams. Ordering q-gram tokens by global
+        frequency and indexing only the leading tokens of each string
+        (prefix filtering) guarantees such pairs meet in some bucket.
+        """
+        tokens = {idx: self._qgram_tokens(norm) for idx, norm in normalized.items()}
+
+        frequency: dict[tuple[str, int], int] = {}
+        for token_list in tokens.values():
+            for token in token_list:
+                frequency[token] = frequency.get(token, 0) + 1
+
+        buckets: dict[tuple[str, int], list[int]] = {}
+        for idx, token_list in tokens.items():
+            token_list.sort(key=lambda t: (frequency[t], t))
+            shared = self._min_shared_qgrams_for(len(normalized[idx]))
+            prefix_len = max(1, len(token_list) - shared + 1)
+            for token in token_list[:prefix_len]:
+                buckets.setdefault(token, []).append(idx)
+
+        matcher = self.username_matcher
+        for bucket in buckets.values():
+            for pos, a in enumerate(bucket):
+                len_a = len(normalized[a])
+                for b in bucket[pos + 1 :]:
+                    len_b = len(normalized[b])
+                    if abs(len_a - len_b) <= matcher.max_fuzzy_distance(max(len_a, len_b)):
+                        _add_pair(a, b, pairs)
+
+    def _qgram_tokens(self, text: str) -> list[tuple[str, int]]:
+        """Split text into q-grams tagged with their occurrence number."""
+        seen: dict[str, int] = {}
+        tokens = []
+        for start in range(len(text) - self.QGRAM_SIZE + 1):
+            gram = text[start : start + self.QGRAM_SIZE]
+            seen[gram] = seen.get(gram, 0) + 1
+            tokens.append((gram, seen[gram]))
+        return tokens
+
+    def _min_shared_qgrams_for(self, length: int) -> int:
+        """Lower bound on shared q-grams for any fuzzy partner of a string.
+
+        The partner may be longer, so the bound is minimized over every
+        length the pair's longer string could have.
+        """
+        if length not in self._min_shared_qgrams:
+            matcher = self.username_matcher
+            q = self.QGRAM_SIZE
+            bound = None
+            longest = length
+            while longest - length <= matcher.max_fuzzy_distance(longest):
+                k = matcher.max_fuzzy_distance(longest)
+                shared = longest - q + 1 - k * q
+                bound = shared if bound is None else min(bound, shared)
+                longest += 1
+            self._min_shared_qgrams[length] = bound
+        return self._min_shared_qgrams[length]
+
+    def _add_image_pairs(
+        self,
+        candidates: list[DuplicateCandidate],
+        indices: list[int],
+        pairs: set[tuple[int, int]],
+    ) -> None:
+        """Add pairs that share at least one image hash."""
+        by_hash: dict[str, list[int]] = {}
+        for idx in indices:
+            for sha256 in set(candidates[idx].image_hashes):
+                by_hash.setdefault(sha256, []).append(idx)
+
+        for bucket in by_hash.values():
+            _add_bucket_pairs(bucket, pairs)
+
+    def _add_perceptual_pairs(
+        self,
+        candidates: list[DuplicateCandidate],
+        indices: list[int],
+        pairs: set[tuple[int, int]],
+    ) -> None:
+        """Add pairs with perceptual hashes within max_perceptual_distance."""
+        # Candidate positions stand in for account IDs in the index
+        index = PerceptualHashIndex(
+            (value, idx) for idx in indices for value in candidates[idx].perceptual_hashes
+        )
+        if not index:
+            return
+
+        for idx in indices:
+            for value in candidates[idx].perceptual_hashes:
+                found = index.find_accounts(
+                    value,
+                    max_distance=self.max_perceptual_distance,
+                    exclude_account_id=idx,
+                )
+                for other in found:
+                    _add_pair(idx, other, pairs)
 
-        return similarity
+
+def _add_pair(a: int, b: int, pairs: set[tuple[int, int]]) -> None:
+    """Add an unordered index pair."""
+    if a != b:
+        pairs.add((a, b) if a < b else (b, a))
+
+
+def _add_bucket_pairs(bucket: list[int], pairs: set[tuple[int, int]]) -> None:
+    """Add every pair within a blocking bucket."""
+    for pos, a in enumerate(bucket):
+        for b in bucket[pos + 1 :]:
+            _add_pair(a, b, pairs)
 
 
 # =============================================================================
@@ -520,7 +834,9 @@ class DuplicateDetectionService:
         self.db = db
         self.config = config or DuplicateDetectionConfig()
         self.username_matcher = UsernameMatcher()
-        self.image_matcher = ImageHashMatcher()
+        self.image_matcher = ImageHashMatcher(
+            perceptual_threshold=1 - self.config.max_perceptual_distance / HASH_BITS
+        )
 
     def build_candidate(
         self, account_data: dict, image_hashes: Optional[list[str]] = None
@@ -637,6 +953,33 @@ class DuplicateDetectionService:
                 )
                 confidences.append(image_result.confidence)
 
+        # Perceptual hash comparison (only when no exact image match)
+        if (
+            self.config.enable_perceptual_matching
+            and not any(reason.type == "image_hash" for reason in reasons)
+        ):
+            perceptual_result = self.image_matcher.compare_perceptual(
+                source.perceptual_hashes, candidate.perceptual_hashes
+            )
+
+            if (
+                perceptual_result.is_match
+                and perceptual_result.confidence >= self.config.min_image_confidence
+            ):
+                count = len(perceptual_result.matching_hashes)
+                reasons.append(
+                    MatchReason(
+                        type="perceptual_image",
+                        confidence=perceptual_result.confidence,
+                        description=f"{count} visually similar image(s)",
+                        evidence={
+                            "matching_hashes": perceptual_result.matching_hashes,
+                            "matching_count": count,
+                        },
+                    )
+                )
+                confidences.append(perceptual_result.confidence)
+
         # No matches found
         if not reasons:
             return None
@@ -675,12 +1018,19 @@ class DuplicateDetectionService:
 
         # Load image hashes for source account
         source_hashes = await self._get_account_image_hashes(account_id)
+        use_perceptual = self.config.enable_perceptual_matching
+        source_perceptual = (
+            self._load_perceptual_hashes(account_ids=[account_id]).get(account_id, [])
+            if use_perceptual
+            else []
+        )
 
         source_candidate = DuplicateCandidate(
             account_id=account.id,
             username=account.external_username,
             provider_id=account.provider_id,
             image_hashes=source_hashes,
+            perceptual_hashes=source_perceptual,
         )
 
         # Query potential candidates
@@ -695,17 +1045,35 @@ class DuplicateDetectionService:
         # Limit to max candidates
         candidates_data = query.limit(self.config.max_candidates).all()
 
+        # Accounts with a visually similar image are always compared, even
+        # when they fall outside the max_candidates window
+        if source_perceptual:
+            similar_ids = self.find_similar_image_accounts(
+                account_id,
+                max_distance=self.config.max_perceptual_distance,
+                provider_id=account.provider_id if same_provider_only else None,
+            )
+            loaded_ids = {c.id for c in candidates_data}
+            missing_ids = [i for i in similar_ids if i not in loaded_ids]
+            if missing_ids:
+                candidates_data += query.filter(ExternalAccount.id.in_(missing_ids)).all()
+
+        # Load image hashes for all candidates in one query
+        candidate_ids = [c.id for c in candidates_data]
+        hashes_by_account = self._load_image_hashes(account_ids=candidate_ids)
+        perceptual_by_account = (
+            self._load_perceptual_hashes(account_ids=candidate_ids) if source_perceptual else {}
+        )
+
         suggestions = []
 
         for candidate_account in candidates_data:
-            # Load image hashes for candidate
-            candidate_hashes = await self._get_account_image_hashes(candidate_account.id)
-
             candidate = DuplicateCandidate(
                 account_id=candidate_account.id,
                 username=candidate_account.external_username,
                 provider_id=candidate_account.provider_id,
-                image_hashes=candidate_hashes,
+                image_hashes=hashes_by_account.get(candidate_account.id, []),
+                perceptual_hashes=perceptual_by_account.get(candidate_account.id, []),
             )
 
             suggestion = self.compare_candidates(source_candidate, candidate)
@@ -726,42 +1094,150 @@ class DuplicateDetectionService:
         Returns:
             List of SHA256 hashes
         """
+        return self._load_image_hashes(account_ids=[account_id]).get(account_id, [])
+
+    def find_similar_image_accounts(
+        self,
+        account_id: int,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        index: Optional[PerceptualHashIndex] = None,
+        provider_id: Optional[str] = None,
+    ) -> dict[int, int]:
+        """Find accounts with an image perceptually close to this account's.
+
+        Args:
+            account_id: ID of the account to check
+            max_distance: Maximum Hamming distance between perceptual hashes
+            index: Prebuilt index to reuse across lookups (rebuilt if omitted)
+            provider_id: Limit a rebuilt index to accounts of this provider
+
+        Returns:
+            Dictionary mapping candidate account ID to its smallest distance
+        """
         from rediska_core.domain.models import Attachment, ProfileItem
 
-        # Query profile items with attachments
-        items_with_attachments = (
-            self.db.query(ProfileItem)
+        source_hashes = (
+            self.db.query(Attachment.phash)
+            .join(ProfileItem, ProfileItem.attachment_id == Attachment.id)
             .filter(
                 ProfileItem.account_id == account_id,
-                ProfileItem.attachment_id.isnot(None),
                 ProfileItem.deleted_at.is_(None),
+                Attachment.deleted_at.is_(None),
+                Attachment.phash.isnot(None),
             )
             .all()
         )
 
-        attachment_ids = [item.attachment_id for item in items_with_attachments]
+        if not source_hashes:
+            return {}
 
-        if not attachment_ids:
-            return []
+        if index is None:
+            index = PerceptualHashIndex.from_db(self.db, provider_id=provider_id)
+
+        matches: dict[int, int] = {}
+        for (phash,) in source_hashes:
+            found = index.find_accounts(
+                phash, max_distance=max_distance, exclude_account_id=account_id
+            )
+            for candidate_id, distance in found.items():
+                if candidate_id not in matches or distance < matches[candidate_id]:
+                    matches[candidate_id] = distance
+
+        return matches
 
-        # Get attachment hashes
-        attachments = (
-            self.db.query(Attachment)
+    def _load_image_hashes(
+        self,
+        account_ids: Optional[list[int]] = None,
+        provider_id: Optional[str] = None,
+    ) -> dict[int, list[str]]:
+        """Load image hashes for many accounts with a single join.
+
+        Args:
+            account_ids: Restrict to these accounts (None for all accounts)
+            provider_id: Restrict to accounts of this provider
+
+        Returns:
+            Dictionary mapping account ID to its list of SHA256 hashes
+        """
+        from rediska_core.domain.models import Attachment, ExternalAccount, ProfileItem
+
+        if account_ids is not None and not account_ids:
+            return {}
+
+        query = (
+            self.db.query(ProfileItem.account_id, Attachment.sha256)
+            .join(Attachment, Attachment.id == ProfileItem.attachment_id)
             .filter(
-                Attachment.id.in_(attachment_ids),
+                ProfileItem.deleted_at.is_(None),
                 Attachment.deleted_at.is_(None),
             )
-            .all()
         )
 
-        return [att.sha256 for att in attachments]
+        if account_ids is not None:
+            query = query.filter(ProfileItem.account_id.in_(account_ids))
+
+        if provider_id:
+            query = query.join(
+                ExternalAccount, ExternalAccount.id == ProfileItem.account_id
+            ).filter(ExternalAccount.provider_id == provider_id)
+
+        hashes: dict[int, list[str]] = {}
+        for account_id, sha256 in query.all():
+            hashes.setdefault(account_id, []).append(sha256)
+
+        return hashes
+
+    def _load_perceptual_hashes(
+        self,
+        account_ids: Optional[list[int]] = None,
+        provider_id: Optional[str] = None,
+    ) -> dict[int, list[int]]:
+        """Load perceptual hashes for many accounts with a single join.
+
+        Args:
+            account_ids: Restrict to these accounts (None for all accounts)
+            provider_id: Restrict to accounts of this provider
+
+        Returns:
+            Dictionary mapping account ID to its list of perceptual hashes
+        """
+        from rediska_core.domain.models import Attachment, ExternalAccount, ProfileItem
+
+        if account_ids is not None and not account_ids:
+            return {}
+
+        query = (
+            self.db.query(ProfileItem.account_id, Attachment.phash)
+            .join(Attachment, Attachment.id == ProfileItem.attachment_id)
+            .filter(
+                ProfileItem.deleted_at.is_(None),
+                Attachment.deleted_at.is_(None),
+                Attachment.phash.isnot(None),
+            )
+        )
+
+        if account_ids is not None:
+            query = query.filter(ProfileItem.account_id.in_(account_ids))
+
+        if provider_id:
+            query = query.join(
+                ExternalAccount, ExternalAccount.id == ProfileItem.account_id
+            ).filter(ExternalAccount.provider_id == provider_id)
+
+        hashes: dict[int, list[int]] = {}
+        for account_id, phash in query.all():
+            hashes.setdefault(account_id, []).append(phash)
+
+        return hashes
 
     async def scan_all_duplicates(
         self, provider_id: Optional[str] = None
     ) -> list[DuplicateSuggestion]:
         """Scan for all potential duplicates in the system.
 
-        This is a more expensive operation that compares all accounts.
+        Candidate pairs come from DuplicateCandidateIndex blocking keys
+        (including a BK-tree over perceptual hashes) rather than comparing
+        every pair of accounts.
 
         Args:
             provider_id: Optional provider to limit scan to
@@ -772,47 +1248,53 @@ class DuplicateDetectionService:
         from rediska_core.domain.models import ExternalAccount
 
         # Query all accounts
-        query = self.db.query(ExternalAccount).filter(
+        query = self.db.query(
+            ExternalAccount.id,
+            ExternalAccount.external_username,
+            ExternalAccount.provider_id,
+        ).filter(
             ExternalAccount.deleted_at.is_(None),
         )
 
         if provider_id:
             query = query.filter(ExternalAccount.provider_id == provider_id)
 
-        accounts = query.all()
+        accounts = query.order_by(ExternalAccount.id).all()
+
+        hashes_by_account: dict[int, list[str]] = {}
+        if self.config.enable_image_matching:
+            hashes_by_account = self._load_image_hashes(provider_id=provider_id)
+
+        perceptual_by_account: dict[int, list[int]] = {}
+        if self.config.enable_perceptual_matching:
+            perceptual_by_account = self._load_perceptual_hashes(provider_id=provider_id)
 
         # Build candidates
-        candidates = []
-        for account in accounts:
-            hashes = await self._get_account_image_hashes(account.id)
-            candidates.append(
-                DuplicateCandidate(
-                    account_id=account.id,
-                    username=account.external_username,
-                    provider_id=account.provider_id,
-                    image_hashes=hashes,
-                )
+        candidates = [
+            DuplicateCandidate(
+                account_id=account_id,
+                username=username,
+                provider_id=account_provider_id,
+                image_hashes=hashes_by_account.get(account_id, []),
+                perceptual_hashes=perceptual_by_account.get(account_id, []),
             )
+            for account_id, username, account_provider_id in accounts
+        ]
+
+        index = DuplicateCandidateIndex(
+            username_matcher=self.username_matcher,
+            use_usernames=self.config.enable_username_matching,
+            use_images=self.config.enable_image_matching,
+            use_perceptual=self.config.enable_perceptual_matching,
+            max_perceptual_distance=self.config.max_perceptual_distance,
+        )
 
-        # Compare all pairs
+        # Compare only blocked pairs
         suggestions = []
-        seen_pairs = set()
-
-        for i, source in enumerate(candidates):
-            for candidate in candidates[i + 1 :]:
-                # Skip if different providers
-                if source.provider_id != candidate.provider_id:
-                    continue
-
-                # Skip if already seen
-                pair_key = tuple(sorted([source.account_id, candidate.account_id]))
-                if pair_key in seen_pairs:
-                    continue
-                seen_pairs.add(pair_key)
-
-                suggestion = self.compare_candidates(source, candidate)
-                if suggestion:
-                    suggestions.append(suggestion)
+        for i, j in index.candidate_pairs(candidates):
+            suggestion = self.compare_candidates(candidates[i], candidates[j])
+            if suggestion:
+                suggestions.append(suggestion)
 
         # Sort by confidence descending
         suggestions.sort(key=lambda s: s.overall_confidence, reverse=True)
@@ -827,6 +1309,7 @@ class DuplicateDetectionService:
 
 __all__ = [
     "DuplicateCandidate",
+    "DuplicateCandidateIndex",
     "DuplicateDetectionConfig",
     "DuplicateDetectionService",
     "DuplicateSuggestion",
@@ -4,6 +4,7 @@ This service handles:
 1. Generating embeddings for text content
 2. Updating ES documents with embeddings
 3. Batch embedding generation
+4. Skipping the model for text found in the embedding cache
 
 Usage:
     service = EmbeddingService(
@@ -26,6 +27,9 @@ Usage:
         {"doc_type": "message", "entity_id": 2, "text": "Text 2"},
     ]
     result = service.generate_embeddings_batch(items)
+
+    # Same, with batch requests sent concurrently from an event loop
+    result = await service.generate_embeddings_batch_async(items)
 """
 
 from typing import Any, Optional
@@ -36,9 +40,14 @@ from rediska_core.infrastructure.elasticsearch import (
     CONTENT_DOCS_INDEX,
     ElasticsearchClient,
 )
+from rediska_core.infrastructure.embedding_cache import EmbeddingCache
 from rediska_core.infrastructure.embeddings import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncEmbeddingsClient,
     EmbeddingsClient,
     EmbeddingsError,
+    get_async_embeddings_client,
 )
 
 
@@ -71,6 +80,9 @@ class EmbeddingService:
         es_url: str,
         embeddings_api_key: Optional[str] = None,
         es_api_key: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: Optional[EmbeddingCache] = None,
     ):
         """Initialize the embedding service.
 
@@ -81,6 +93,9 @@ class EmbeddingService:
             es_url: Elasticsearch URL.
             embeddings_api_key: Optional API key for embeddings.
             es_api_key: Optional API key for ES.
+            batch_size: Maximum texts per embeddings request.
+            max_concurrency: Maximum embeddings requests in flight.
+            cache: Optional vector cache consulted before calling the model.
         """
         self.db = db
         self._embeddings_client: Optional[EmbeddingsClient] = None
@@ -91,6 +106,9 @@ class EmbeddingService:
         self._embeddings_api_key = embeddings_api_key
         self._es_url = es_url
         self._es_api_key = es_api_key
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+        self.cache = cache
 
     @property
     def embeddings_client(self) -> EmbeddingsClient:
@@ -100,9 +118,22 @@ class EmbeddingService:
                 url=self._embeddings_url,
                 model=self._embeddings_model,
                 api_key=self._embeddings_api_key,
+                batch_size=self._batch_size,
+                max_concurrency=self._max_concurrency,
             )
         return self._embeddings_client
 
+    @property
+    def async_embeddings_client(self) -> AsyncEmbeddingsClient:
+        """Get the process-wide async embeddings client."""
+        return get_async_embeddings_client(
+            url=self._embeddings_url,
+            model=self._embeddings_model,
+            api_key=self._embeddings_api_key,
+            batch_size=self._batch_size,
+            max_concurrency=self._max_concurrency,
+        )
+
     @property
     def es_client(self) -> ElasticsearchClient:
         """Get or create ES client (lazy initialization)."""
@@ -148,8 +179,14 @@ class EmbeddingService:
             if len(text) > MAX_TEXT_LENGTH:
                 text = self.embeddings_client.truncate_text(text, MAX_TEXT_LENGTH)
 
-            # Generate embedding
-            embedding = self.embeddings_client.embed(text)
+            # Generate embedding, unless this text was embedded before
+            embedding = None
+            if self.cache is not None:
+                embedding = self.cache.get_many(self._embeddings_model, [text])[0]
+            if embedding is None:
+                embedding = self.embeddings_client.embed(text)
+                if embedding is not None and self.cache is not None:
+                    self.cache.set_many(self._embeddings_model, [text], [embedding])
 
             if embedding is None:
                 return {
@@ -203,27 +240,50 @@ class EmbeddingService:
     # BATCH EMBEDDING
     # =========================================================================
 
-    def generate_embeddings_batch(
+    def embed_texts(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """Embed texts without writing to ES, using the cache where possible.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Vector per text, or None for empty text, in the same order.
+
+        Raises:
+            EmbeddingsError: If the embeddings API request fails.
+        """
+        positions = []
+        prepared = []
+        for position, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if len(text) > MAX_TEXT_LENGTH:
+                text = self.embeddings_client.truncate_text(text, MAX_TEXT_LENGTH)
+            positions.append(position)
+            prepared.append(text)
+
+        vectors: list[Optional[list[float]]] = [None] * len(texts)
+        if not prepared:
+            return vectors
+
+        cached, missing = self._lookup_cached(prepared)
+        new_embeddings = self.embeddings_client.embed_batch(missing) if missing else []
+        for position, vector in zip(positions, self._merge_cached(cached, missing, new_embeddings)):
+            vectors[position] = vector
+        return vectors
+
+    def _prepare_batch(
         self,
         items: list[dict[str, Any]],
-    ) -> dict[str, Any]:
-        """Generate embeddings for multiple documents.
+    ) -> tuple[list[dict[str, Any]], list[str], int]:
+        """Drop empty items and truncate long texts.
 
         Args:
             items: List of dicts with doc_type, entity_id, and text.
 
         Returns:
-            Dict with success status and processing counts.
+            Tuple of (items to embed, their texts, number skipped).
         """
-        if not items:
-            return {
-                "success": True,
-                "processed": 0,
-                "skipped": 0,
-                "errors": 0,
-            }
-
-        # Filter and prepare texts
         valid_items = []
         texts = []
         skipped = 0
@@ -241,6 +301,115 @@ class EmbeddingService:
             valid_items.append(item)
             texts.append(text)
 
+        return valid_items, texts, skipped
+
+    def _lookup_cached(
+        self,
+        texts: list[str],
+    ) -> tuple[list[Optional[list[float]]], list[str]]:
+        """Look up cached vectors for a batch.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Tuple of (vector or None per text, texts that still need embedding).
+        """
+        if self.cache is None:
+            return [None] * len(texts), list(texts)
+
+        cached = self.cache.get_many(self._embeddings_model, texts)
+        missing = [text for text, vector in zip(texts, cached) if vector is None]
+        return cached, missing
+
+    def _merge_cached(
+        self,
+        cached: list[Optional[list[float]]],
+        missing: list[str],
+        embeddings: list[list[float]],
+    ) -> list[list[float]]:
+        """Fill cache misses with new embeddings and store them.
+
+        Args:
+            cached: Vector or None per text, from _lookup_cached.
+            missing: Texts that were sent to the model.
+            embeddings: Model output for the missing texts.
+
+        Returns:
+            Vector per text, in the original order.
+
+        Raises:
+            EmbeddingsError: If the model returned the wrong number of vectors.
+        """
+        if len(embeddings) != len(missing):
+            raise EmbeddingsError("Embedding count mismatch")
+
+        if self.cache is not None and missing:
+            self.cache.set_many(self._embeddings_model, missing, embeddings)
+
+        fresh = iter(embeddings)
+        return [vector if vector is not None else next(fresh) for vector in cached]
+
+    def _store_batch(
+        self,
+        valid_items: list[dict[str, Any]],
+        embeddings: list[list[float]],
+        skipped: int,
+    ) -> dict[str, Any]:
+        """Write batch embeddings to ES in one bulk request.
+
+        Args:
+            valid_items: Items that were embedded.
+            embeddings: Embedding per item, in the same order.
+            skipped: Number of items skipped before embedding.
+
+        Returns:
+            Dict with success status and processing counts.
+        """
+        # Build bulk update documents
+        documents = []
+        for item, embedding in zip(valid_items, embeddings):
+            doc_id = f"{item['doc_type']}:{item['entity_id']}"
+            documents.append({
+                "_id": doc_id,
+                "embedding": embedding,
+            })
+
+        # Bulk update ES
+        result = self.es_client.bulk_index(
+            index=CONTENT_DOCS_INDEX,
+            documents=documents,
+        )
+
+        return {
+            "success": result.get("success", False),
+            "processed": result.get("indexed", 0),
+            "skipped": skipped,
+            "errors": result.get("error_count", 0),
+        }
+
+    def generate_embeddings_batch(
+        self,
+        items: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Generate embeddings for multiple documents.
+
+        Args:
+            items: List of dicts with doc_type, entity_id, and text.
+
+        Returns:
+            Dict with success status and processing counts.
+        """
+        if not items:
+            return {
+                "success": True,
+                "processed": 0,
+                "skipped": 0,
+                "errors": 0,
+            }
+
+        valid_items, texts, skipped = self._prepare_batch(items)
+
         if not texts:
             return {
                 "success": True,
@@ -250,40 +419,62 @@ class EmbeddingService:
             }
 
         try:
-            # Generate embeddings in batch
-            embeddings = self.embeddings_client.embed_batch(texts)
+            # Generate embeddings in batch for texts not already cached
+            cached, missing = self._lookup_cached(texts)
+            new_embeddings = self.embeddings_client.embed_batch(missing) if missing else []
+            embeddings = self._merge_cached(cached, missing, new_embeddings)
+            return self._store_batch(valid_items, embeddings, skipped)
 
-            if len(embeddings) != len(valid_items):
-                return {
-                    "success": False,
-                    "error": "Embedding count mismatch",
-                    "processed": 0,
-                    "skipped": skipped,
-                    "errors": len(valid_items),
-                }
+        except EmbeddingsError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "processed": 0,
+                "skipped": skipped,
+                "errors": len(valid_items),
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Unexpected error: {e}",
+                "processed": 0,
+                "skipped": skipped,
+                "errors": len(valid_items),
+            }
 
-            # Build bulk update documents
-            documents = []
-            for item, embedding in zip(valid_items, embeddings):
-                doc_id = f"{item['doc_type']}:{item['entity_id']}"
-                documents.append({
-                    "_id": doc_id,
-                    "embedding": embedding,
-                })
-
-            # Bulk update ES
-            result = self.es_client.bulk_index(
-                index=CONTENT_DOCS_INDEX,
-                documents=documents,
-            )
+    async def generate_embeddings_batch_async(
+        self,
+        items: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Generate embeddings for multiple documents from an event loop.
+
+        Uses the process-wide async client, so batch requests from this call
+        and any other running on the same loop are sent concurrently.
 
+        Args:
+            items: List of dicts with doc_type, entity_id, and text.
+
+        Returns:
+            Dict with success status and processing counts.
+        """
+        valid_items, texts, skipped = self._prepare_batch(items or [])
+
+        if not texts:
             return {
-                "success": result.get("success", False),
-                "processed": result.get("indexed", 0),
+                "success": True,
+                "processed": 0,
                 "skipped": skipped,
-                "errors": result.get("error_count", 0),
+                "errors": 0,
             }
 
+        try:
+            cached, missing = self._lookup_cached(texts)
+            new_embeddings = (
+                await self.async_embeddings_client.embed_batch(missing) if missing else []
+            )
+            embeddings = self._merge_cached(cached, missing, new_embeddings)
+            return self._store_batch(valid_items, embeddings, skipped)
+
         except EmbeddingsError as e:
             return {
                 "success": False,
@@ -0,0 +1,282 @@
+"""Transactional outbox for search index updates.
+
+Services that change indexed entities record the change in the index_outbox
+table in the same transaction as the change itself, so an update is never
+lost to a failed or dropped Celery task. A long-running consumer drains the
+outbox in windows:
+
+1. Claims the oldest pending rows (SKIP LOCKED, so several consumers can run)
+2. Collapses repeated updates to the same document into one
+3. Loads the current entities with one query per document type
+4. Sends the whole window as one streaming bulk request - documents whose
+   entity no longer exists are deleted from the index
+5. Deletes the rows that were indexed and keeps failed ones for a retry,
+   dropping them after max_attempts
+
+Usage:
+    # In a service, before the caller commits
+    enqueue_index_update(db, "message", message.id)
+
+    # In the consumer
+    consumer = IndexOutboxConsumer(db=session, es_url="http://localhost:9200")
+    result = consumer.drain(batch_size=500)
+"""
+
+import logging
+import time
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from rediska_core.domain.models import IndexOutbox
+from rediska_core.domain.services.indexing import SUPPORTED_DOC_TYPES, IndexingService
+from rediska_core.infrastructure.elasticsearch import CONTENT_DOCS_INDEX, ElasticsearchClient
+
+logger = logging.getLogger(__name__)
+
+
+# Default outbox rows claimed per window
+DEFAULT_OUTBOX_BATCH_SIZE = 500
+
+# Default attempts before a failing update is dropped
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Counts reported for each drained window
+RESULT_KEYS = ("claimed", "documents", "indexed", "deleted", "failed", "dropped")
+
+
+# =============================================================================
+# PRODUCERS
+# =============================================================================
+
+
+def enqueue_index_updates(db: Session, doc_type: str, entity_ids: Iterable[int]) -> None:
+    """Record that entities need to be (re)indexed.
+
+    The rows are inserted in one statement within the caller's transaction
+    and committed with it.
+
+    Args:
+        db: SQLAlchemy database session.
+        doc_type: Type of document.
+        entity_ids: IDs of the changed entities.
+
+    Raises:
+        ValueError: If doc_type is not supported.
+    """
+    if doc_type not in SUPPORTED_DOC_TYPES:
+        raise ValueError(f"Unknown doc_type: {doc_type}")
+
+    rows = [
+        {"doc_type": doc_type, "entity_id": entity_id}
+        for entity_id in dict.fromkeys(entity_ids)
+        if entity_id is not None
+    ]
+    if rows:
+        db.execute(insert(IndexOutbox), rows)
+
+
+def enqueue_index_update(db: Session, doc_type: str, entity_id: int) -> None:
+    """Record that an entity needs to be (re)indexed.
+
+    Args:
+        db: SQLAlchemy database session.
+        doc_type: Type of document.
+        entity_id: ID of the changed entity.
+
+    Raises:
+        ValueError: If doc_type is not supported.
+    """
+    enqueue_index_updates(db, doc_type, [entity_id])
+
+
+# =============================================================================
+# CONSUMER
+# =============================================================================
+
+
+class IndexOutboxConsumer:
+    """Drains the index outbox into Elasticsearch in bulk windows."""
+
+    def __init__(
+        self,
+        db: Session,
+        es_url: Optional[str] = None,
+        es_api_key: Optional[str] = None,
+        index: str = CONTENT_DOCS_INDEX,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """Initialize the consumer.
+
+        Args:
+            db: SQLAlchemy database session.
+            es_url: Elasticsearch URL (defaults to localhost:9200).
+            es_api_key: Optional API key for ES.
+            index: Index or alias documents are written to.
+            max_attempts: Failed attempts before an update is dropped.
+        """
+        self.db = db
+        self.es_url = es_url or "http://localhost:9200"
+        self.es_api_key = es_api_key
+        self.index = index
+        self.max_attempts = max_attempts
+        self.indexing = IndexingService(db=db, es_url=self.es_url)
+        self._es_client: Optional[ElasticsearchClient] = None
+
+    @property
+    def es_client(self) -> ElasticsearchClient:
+        """Get or create ES client (lazy initialization)."""
+        if self._es_client is None:
+            self._es_client = ElasticsearchClient(url=self.es_url, api_key=self.es_api_key)
+        return self._es_client
+
+    def _claim(self, batch_size: int) -> list[IndexOutbox]:
+        """Lock the oldest pending rows, skipping rows held by other consumers."""
+        return (
+            self.db.query(IndexOutbox)
+            .order_by(IndexOutbox.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def _actions(self, keys: set[tuple[str, int]]) -> list[dict[str, Any]]:
+        """Build an index or delete action for the current state of each document."""
+        ids_by_type: dict[str, list[int]] = {}
+        for doc_type, entity_id in sorted(keys):
+            ids_by_type.setdefault(doc_type, []).append(entity_id)
+
+        actions: list[dict[str, Any]] = []
+        for doc_type, entity_ids in ids_by_type.items():
+            documents = self.indexing.load_documents(doc_type, entity_ids)
+            for entity_id in entity_ids:
+                doc_id = f"{doc_type}:{entity_id}"
+                document = documents.get(entity_id)
+                if document is None:
+                    actions.append({"_op_type": "delete", "_index": self.index, "_id": doc_id})
+                else:
+                    actions.append({"_index": self.index, "_id": doc_id, "_source": document})
+        return actions
+
+    def drain_batch(self, batch_size: int = DEFAULT_OUTBOX_BATCH_SIZE) -> dict[str, Any]:
+        """Index one window of pending updates.
+
+        Args:
+            batch_size: Maximum outbox rows claimed.
+
+        Returns:
+            Dict with "claimed" rows, "documents" after deduplication,
+            "indexed", "deleted", "failed" and "dropped" counts.
+        """
+        rows = self._claim(batch_size)
+        if not rows:
+            self.db.commit()
+            return dict.fromkeys(RESULT_KEYS, 0)
+
+        claimed = len(rows)
+        done_ids: list[int] = []
+        for row in rows:
+            if row.doc_type not in SUPPORTED_DOC_TYPES:
+                logger.warning(f"Dropping index update for unknown doc_type {row.doc_type}")
+                done_ids.append(row.id)
+        rows = [row for row in rows if row.doc_type in SUPPORTED_DOC_TYPES]
+
+        keys = {(row.doc_type, row.entity_id) for row in rows}
+        actions = self._actions(keys)
+        result = self.es_client.stream_bulk(
+            actions,
+            chunk_size=max(len(actions), 1),
+            max_reported_errors=len(actions),
+        )
+
+        errors = result["errors"]
+        if any(error.get("id") is None for error in errors):
+            # The request itself failed, so nothing in the window is known to be indexed
+            failed_ids = {f"{doc_type}:{entity_id}" for doc_type, entity_id in keys}
+        else:
+            failed_ids = {error["id"] for error in errors}
+
+        dropped = 0
+        for row in rows:
+            if f"{row.doc_type}:{row.entity_id}" not in failed_ids:
+                done_ids.append(row.id)
+                continue
+            if row.attempts + 1 >= self.max_attempts:
+                logger.warning(
+                    f"Dropping index update {row.doc_type}:{row.entity_id} "
+                    f"after {row.attempts + 1} attempts"
+                )
+                done_ids.append(row.id)
+                dropped += 1
+            else:
+                row.attempts += 1
+
+        if done_ids:
+            self.db.query(IndexOutbox).filter(IndexOutbox.id.in_(done_ids)).delete(
+                synchronize_session=False
+            )
+        self.db.commit()
+
+        deleted_ids = {a["_id"] for a in actions if a.get("_op_type") == "delete"}
+        indexed_ids = {a["_id"] for a in actions} - deleted_ids
+        return {
+            "claimed": claimed,
+            "documents": len(keys),
+            "indexed": len(indexed_ids - failed_ids),
+            "deleted": len(deleted_ids - failed_ids),
+            "failed": len(failed_ids),
+            "dropped": dropped,
+        }
+
+    def drain(
+        self,
+        batch_size: int = DEFAULT_OUTBOX_BATCH_SIZE,
+        max_seconds: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Index windows of pending updates until the outbox is empty.
+
+        Stops early when a window fails entirely (e.g. Elasticsearch is
+        down), leaving the rows for the next run.
+
+        Args:
+            batch_size: Maximum outbox rows claimed per window.
+            max_seconds: Stop starting new windows after this long.
+
+        Returns:
+            Dict with "batches" and the summed counts of every window.
+        """
+        started = time.monotonic()
+        totals: dict[str, Any] = dict.fromkeys(("batches", *RESULT_KEYS), 0)
+
+        while True:
+            result = self.drain_batch(batch_size)
+            if not result["claimed"]:
+                break
+
+            totals["batches"] += 1
+            for key, value in result.items():
+                totals[key] += value
+
+            if result["failed"] and result["failed"] == result["documents"]:
+                break
+            if result["claimed"] < batch_size:
+                break
+            if max_seconds is not None and time.monotonic() - started >= max_seconds:
+                break
+
+        return totals
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "DEFAULT_MAX_ATTEMPTS",
+    "DEFAULT_OUTBOX_BATCH_SIZE",
+    "IndexOutboxConsumer",
+    "enqueue_index_update",
+    "enqueue_index_updates",
+]
@@ -5,6 +5,8 @@ This service handles:
 2. Upserting content to the search index
 3. Deleting content from the search index
 4. Bulk indexing operations
+5. Streaming every document of a type for full reindexes
+6. Building documents for a batch of entities
 
 Usage:
     service = IndexingService(db=session, es_url="http://localhost:9200")
@@ -20,9 +22,9 @@ Usage:
 """
 
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from rediska_core.domain.models import (
     Conversation,
@@ -50,6 +52,18 @@ SUPPORTED_DOC_TYPES = {
     "profile_snapshot",
 }
 
+# Model backing each document type
+DOC_TYPE_MODELS = {
+    "message": Message,
+    "conversation": Conversation,
+    "lead_post": LeadPost,
+    "profile_item": ProfileItem,
+    "profile_snapshot": ProfileSnapshot,
+}
+
+# Rows fetched per round trip when streaming documents
+DEFAULT_STREAM_BATCH_SIZE = 500
+
 
 # =============================================================================
 # SERVICE
@@ -220,6 +234,25 @@ class IndexingService:
             },
         }
 
+    def entity_to_document(self, doc_type: str, entity: Any) -> dict[str, Any]:
+        """Convert an entity of any supported type to an ES document.
+
+        Args:
+            doc_type: Type of document.
+            entity: Entity of the model for doc_type.
+
+        Returns:
+            Dictionary suitable for ES indexing.
+        """
+        converters = {
+            "message": self.message_to_document,
+            "conversation": self.conversation_to_document,
+            "lead_post": self.lead_post_to_document,
+            "profile_item": self.profile_item_to_document,
+            "profile_snapshot": self.profile_snapshot_to_document,
+        }
+        return converters[doc_type](entity)
+
     # =========================================================================
     # UPSERT OPERATIONS
     # =========================================================================
@@ -246,40 +279,11 @@ class IndexingService:
         if doc_type not in SUPPORTED_DOC_TYPES:
             raise ValueError(f"Unknown doc_type: {doc_type}")
 
-        # Fetch entity and convert to document
-        if doc_type == "message":
-            entity = self.db.query(Message).filter(Message.id == entity_id).first()
-            if not entity:
-                return False
-            document = self.message_to_document(entity)
-
-        elif doc_type == "conversation":
-            entity = self.db.query(Conversation).filter(Conversation.id == entity_id).first()
-            if not entity:
-                return False
-            document = self.conversation_to_document(entity)
-
-        elif doc_type == "lead_post":
-            entity = self.db.query(LeadPost).filter(LeadPost.id == entity_id).first()
-            if not entity:
-                return False
-            document = self.lead_post_to_document(entity)
-
-        elif doc_type == "profile_item":
-            entity = self.db.query(ProfileItem).filter(ProfileItem.id == entity_id).first()
-            if not entity:
-                return False
-            document = self.profile_item_to_document(entity)
-
-        elif doc_type == "profile_snapshot":
-            entity = self.db.query(ProfileSnapshot).filter(ProfileSnapshot.id == entity_id).first()
-            if not entity:
-                return False
-            document = self.profile_snapshot_to_document(entity)
-
-        else:
-            # Unknown type
+        model = DOC_TYPE_MODELS[doc_type]
+        entity = self.db.query(model).filter(model.id == entity_id).first()
+        if not entity:
             return False
+        document = self.entity_to_document(doc_type, entity)
 
         # Index the document
         doc_id = f"{doc_type}:{entity_id}"
@@ -377,8 +381,6 @@ class IndexingService:
         if not message_ids:
             return {"success": True, "indexed": 0}
 
-        from sqlalchemy.orm import joinedload
-
         # Fetch messages with conversation and counterpart for username
         messages = (
             self.db.query(Message)
@@ -406,12 +408,88 @@ class IndexingService:
         )
 
 
+    # =========================================================================
+    # STREAMING
+    # =========================================================================
+
+    def iter_documents(
+        self,
+        doc_type: str,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Stream every entity of a type as an ES document.
+
+        Rows are read through a server-side cursor batch_size at a time,
+        with the relationships the converters need loaded in the same query,
+        so memory use does not grow with the table.
+
+        Args:
+            doc_type: Type of document.
+            batch_size: Rows fetched per round trip.
+
+        Yields:
+            (doc_id, document) tuples in entity ID order.
+
+        Raises:
+            ValueError: If doc_type is not supported.
+        """
+        if doc_type not in SUPPORTED_DOC_TYPES:
+            raise ValueError(f"Unknown doc_type: {doc_type}")
+
+        model = DOC_TYPE_MODELS[doc_type]
+        query = self._document_query(doc_type)
+        for entity in query.order_by(model.id).yield_per(batch_size):
+            yield f"{doc_type}:{entity.id}", self.entity_to_document(doc_type, entity)
+
+    def load_documents(
+        self,
+        doc_type: str,
+        entity_ids: list[int],
+    ) -> dict[int, dict[str, Any]]:
+        """Build ES documents for specific entities in one query.
+
+        Args:
+            doc_type: Type of document.
+            entity_ids: IDs of the entities to convert.
+
+        Returns:
+            Mapping of entity ID to document. Entities that no longer exist
+            are omitted.
+
+        Raises:
+            ValueError: If doc_type is not supported.
+        """
+        if doc_type not in SUPPORTED_DOC_TYPES:
+            raise ValueError(f"Unknown doc_type: {doc_type}")
+        if not entity_ids:
+            return {}
+
+        model = DOC_TYPE_MODELS[doc_type]
+        entities = self._document_query(doc_type).filter(model.id.in_(entity_ids)).all()
+        return {entity.id: self.entity_to_document(doc_type, entity) for entity in entities}
+
+    def _document_query(self, doc_type: str):
+        """Query for a document type with the relationships its converter reads."""
+        model = DOC_TYPE_MODELS[doc_type]
+        query = self.db.query(model)
+
+        if doc_type == "message":
+            query = query.options(
+                joinedload(Message.conversation).joinedload(Conversation.counterpart_account)
+            )
+        elif doc_type in ("profile_item", "profile_snapshot"):
+            query = query.options(joinedload(model.account))
+
+        return query
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
 
 
 __all__ = [
+    "DOC_TYPE_MODELS",
     "IndexingService",
     "SUPPORTED_DOC_TYPES",
 ]
@@ -3,6 +3,27 @@
 Provides a wrapper for llama.cpp or compatible inference servers.
 Supports both chat and completion modes.
 
+Requests can carry llama.cpp prompt cache hints: cache_prompt asks the
+server to reuse the KV cache of the longest matching prompt prefix, and
+slot_id pins the request to one server slot so related requests land where
+their shared prefix is already cached.
+
+Chat responses can also be streamed: stream_chat() yields text as it is
+generated, and chat(stop_when=...) streams internally and stops generation
+as soon as the text so far satisfies a predicate (e.g. a complete JSON
+object has been emitted).
+
+Clients created by get_inference_client() go through a process-wide
+InferenceScheduler, which caps in-flight requests per backend, serves
+interactive requests ahead of queued background work, and balances over
+one or more backend URLs by least outstanding requests, ejecting backends
+that keep failing.
+
+Prompts and responses are not written to the application log. Each
+exchange is handed to the process-wide PromptLog, which samples it and
+writes it, redacted and compressed, from a background thread (see
+rediska_core.infrastructure.prompt_log).
+
 Usage:
     config = InferenceConfig(base_url="http://localhost:8080")
     client = InferenceClient(config=config)
@@ -15,16 +36,33 @@ Usage:
     response = await client.chat(messages)
     print(response.content)
     print(response.model_info.to_dict())
+
+    # Reuse the cached prefix on server slot 2
+    response = await client.chat(messages, cache_prompt=True, slot_id=2)
+
+    # Scheduled client for background work
+    client = get_inference_client(priority="background")
+
+    # Stream text as it is generated
+    async for text in client.stream_chat(messages):
+        print(text, end="")
 """
 
 import asyncio
+import heapq
+import itertools
+import json
 import logging
+import os
 import time
+from contextlib import aclosing, asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 import httpx
 
+from rediska_core.infrastructure.prompt_log import PromptLog, get_prompt_log
+
 logger = logging.getLogger(__name__)
 
 
@@ -143,6 +181,296 @@ class ChatResponse:
     parsed_output: Optional[dict] = None
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _server_options(cache_prompt: Optional[bool], slot_id: Optional[int]) -> dict[str, Any]:
+    """Build llama.cpp specific request fields, omitting unset ones."""
+    options: dict[str, Any] = {}
+    if cache_prompt is not None:
+        options["cache_prompt"] = cache_prompt
+    if slot_id is not None:
+        options["id_slot"] = slot_id
+    return options
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+
+# Request priority classes; lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "background": PRIORITY_BACKGROUND,
+}
+
+
+def _is_backend_failure(error: BaseException) -> bool:
+    """Whether an error means the backend itself is unhealthy."""
+    for e in (error, error.__cause__):
+        if isinstance(e, (httpx.TransportError, ConnectionInferenceError, TimeoutInferenceError)):
+            return True
+        if isinstance(e, httpx.HTTPStatusError):
+            return e.response.status_code >= 500
+    return False
+
+
+@dataclass
+class _Backend:
+    """State of one inference backend."""
+
+    url: str
+    outstanding: int = 0
+    failures: int = 0
+    ejected_until: float = 0.0
+
+
+class InferenceScheduler:
+    """Client-side scheduler for requests to a pool of inference backends.
+
+    - At most max_concurrency requests are in flight per backend, matching
+      its server slots; the rest wait in a queue.
+    - Waiting requests are served by priority, then in arrival order, so
+      interactive requests skip ahead of queued background work.
+    - Background requests leave interactive_reserve slots of each backend
+      free, so API requests from other processes are not stuck behind them.
+    - Each request goes to the healthy backend with the fewest outstanding
+      requests, or to its affinity backend when that one has room.
+    - A backend failing eject_after times in a row (connection errors,
+      timeouts, 5xx) is skipped for eject_seconds.
+
+    The scheduler is not thread-safe; each process uses one from its event
+    loop(s).
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_concurrency: int = 4,
+        interactive_reserve: int = 0,
+        eject_after: int = 3,
+        eject_seconds: float = 30.0,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            urls: Backend base URLs.
+            max_concurrency: In-flight requests allowed per backend.
+            interactive_reserve: Slots per backend background requests leave free.
+            eject_after: Consecutive failures before a backend is ejected.
+            eject_seconds: How long an ejected backend is skipped.
+
+        Raises:
+            ValueError: If no URLs are given.
+        """
+        if not urls:
+            raise ValueError("At least one inference backend URL is required")
+
+        self.backends = [_Backend(url=url.rstrip("/")) for url in dict.fromkeys(urls)]
+        self.max_concurrency = max(1, max_concurrency)
+        self.interactive_reserve = min(max(0, interactive_reserve), self.max_concurrency - 1)
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self._waiters: list[tuple[int, int, Optional[int], asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def _pick(self, priority: int, affinity: Optional[int]) -> Optional[_Backend]:
+        """Choose a backend with room for a request, or None if all are full."""
+        now = time.monotonic()
+        limit = self.max_concurrency
+        if priority > PRIORITY_INTERACTIVE:
+            limit -= self.interactive_reserve
+
+        candidates = [b for b in self.backends if b.outstanding < limit]
+        if any(b.ejected_until <= now for b in self.backends):
+            candidates = [b for b in candidates if b.ejected_until <= now]
+        # Otherwise every backend is ejected: keep trying them rather than failing
+        if not candidates:
+            return None
+
+        if affinity is not None:
+            preferred = self.backends[affinity % len(self.backends)]
+            if preferred in candidates:
+                return preferred
+        return min(candidates, key=lambda b: b.outstanding)
+
+    def _queued_ahead(self, priority: int) -> bool:
+        """Whether live requests of the same or higher priority are waiting."""
+        return any(
+            waiter_priority <= priority and not future.done()
+            for waiter_priority, _, _, future in self._waiters
+        )
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting requests in priority order."""
+        while self._waiters:
+            priority, _, affinity, future = self._waiters[0]
+            if future.done() or future.get_loop().is_closed():
+                heapq.heappop(self._waiters)
+                continue
+
+            backend = self._pick(priority, affinity)
+            if backend is None:
+                break
+
+            heapq.heappop(self._waiters)
+            backend.outstanding += 1
+            future.set_result(backend.url)
+
+    async def acquire(
+        self,
+        priority: int = PRIORITY_INTERACTIVE,
+        affinity: Optional[int] = None,
+    ) -> str:
+        """Wait for a free slot on a backend.
+
+        Args:
+            priority: Priority class (PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND).
+            affinity: Optional key preferring one backend (e.g. a server slot
+                ID), so related requests share that backend's prompt cache.
+
+        Returns:
+            Base URL of the backend to send the request to. Must be passed
+            to release() when the request finishes.
+        """
+        from rediska_core.observability.metrics import get_collector
+
+        started = time.monotonic()
+        backend = None if self._queued_ahead(priority) else self._pick(priority, affinity)
+        if backend is not None:
+            backend.outstanding += 1
+            url = backend.url
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), affinity, future))
+            try:
+                url = await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release(future.result())
+                raise
+
+        labels = {"priority": "interactive" if priority == PRIORITY_INTERACTIVE else "background"}
+        get_collector().record_histogram(
+            "inference_queue_wait_seconds", time.monotonic() - started, labels
+        )
+        return url
+
+    def release(self, url: str) -> None:
+        """Free the slot taken by acquire().
+
+        Args:
+            url: Backend URL returned by acquire().
+        """
+        for backend in self.backends:
+            if backend.url == url:
+                backend.outstanding = max(0, backend.outstanding - 1)
+                break
+        self._dispatch()
+
+    def report(self, url: str, ok: bool) -> None:
+        """Record the outcome of a request for health tracking.
+
+        Args:
+            url: Backend URL the request went to.
+            ok: False if the backend failed the request.
+        """
+        for backend in self.backends:
+            if backend.url != url:
+                continue
+            if ok:
+                backend.failures = 0
+            else:
+                backend.failures += 1
+                if backend.failures >= self.eject_after:
+                    logger.warning(
+                        f"Ejecting inference backend {url} for {self.eject_seconds}s "
+                        f"after {backend.failures} consecutive failures"
+                    )
+                    backend.ejected_until = time.monotonic() + self.eject_seconds
+                    backend.failures = 0
+            break
+
+    @asynccontextmanager
+    async def request(
+        self,
+        priority: int = PRIORITY_INTERACTIVE,
+        affinity: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Hold a backend slot for the duration of a request.
+
+        Args:
+            priority: Priority class.
+            affinity: Optional backend affinity key.
+
+        Yields:
+            Base URL of the chosen backend.
+        """
+        url = await self.acquire(priority, affinity)
+        try:
+            yield url
+        except Exception as e:
+            self.report(url, ok=not _is_backend_failure(e))
+            raise
+        else:
+            self.report(url, ok=True)
+        finally:
+            self.release(url)
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Get the load and health of each backend."""
+        now = time.monotonic()
+        return [
+            {
+                "url": backend.url,
+                "outstanding": backend.outstanding,
+                "healthy": backend.ejected_until <= now,
+            }
+            for backend in self.backends
+        ]
+
+
+_schedulers: dict[int, InferenceScheduler] = {}
+
+
+def get_inference_scheduler() -> Optional[InferenceScheduler]:
+    """Get the process-wide scheduler for the configured inference backends.
+
+    Backends are INFERENCE_URL plus any INFERENCE_URLS, each allowed
+    INFERENCE_BACKEND_CONCURRENCY in-flight requests.
+
+    Returns:
+        Shared InferenceScheduler, or None if INFERENCE_URL is not configured.
+    """
+    from rediska_core.config import get_settings
+
+    settings = get_settings()
+    if not settings.inference_url:
+        return None
+
+    pid = os.getpid()
+    scheduler = _schedulers.get(pid)
+    if scheduler is None:
+        extra_urls = [u.strip() for u in (settings.inference_urls or "").split(",") if u.strip()]
+        scheduler = InferenceScheduler(
+            urls=[settings.inference_url, *extra_urls],
+            max_concurrency=settings.inference_backend_concurrency,
+            interactive_reserve=settings.inference_interactive_reserve,
+            eject_after=settings.inference_eject_after,
+            eject_seconds=settings.inference_eject_seconds,
+        )
+        # A forked worker must not inherit its parent's in-flight counts
+        _schedulers.clear()
+        _schedulers[pid] = scheduler
+    return scheduler
+
+
 # =============================================================================
 # INFERENCE CLIENT
 # =============================================================================
@@ -155,13 +483,27 @@ class InferenceClient:
     Supports both chat and completion modes.
     """
 
-    def __init__(self, config: InferenceConfig):
+    def __init__(
+        self,
+        config: InferenceConfig,
+        scheduler: Optional[InferenceScheduler] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+        prompt_log: Optional[PromptLog] = None,
+    ):
         """Initialize the inference client.
 
         Args:
             config: Inference configuration.
+            scheduler: Scheduler choosing the backend for each request
+                (requests go straight to config.base_url if None).
+            priority: Priority class of this client's requests.
+            prompt_log: Where exchanges are captured (the process-wide
+                prompt log from settings if None).
         """
         self.config = config
+        self.scheduler = scheduler
+        self.priority = priority
+        self.prompt_log = prompt_log
         self._http_client: Optional[httpx.AsyncClient] = None
 
     async def _get_http_client(self) -> httpx.AsyncClient:
@@ -183,11 +525,22 @@ class InferenceClient:
             await self._http_client.aclose()
             self._http_client = None
 
+    @asynccontextmanager
+    async def _endpoint(self, path: str, affinity: Optional[int]) -> AsyncIterator[str]:
+        """Get the URL to send a request to, holding a scheduler slot if scheduled."""
+        if self.scheduler is None:
+            yield path
+            return
+
+        async with self.scheduler.request(self.priority, affinity) as base_url:
+            yield f"{base_url}{path}"
+
     async def _make_request(
         self,
         messages: list[dict],
         temperature: float,
         max_tokens: int,
+        server_options: Optional[dict[str, Any]] = None,
     ) -> dict:
         """Make a chat completion request to the server.
 
@@ -195,6 +548,7 @@ class InferenceClient:
             messages: List of message dicts with role and content
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            server_options: Extra llama.cpp request fields
 
         Returns:
             Response dict from the server
@@ -209,28 +563,21 @@ class InferenceClient:
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
+            **(server_options or {}),
         }
 
-        # Log full prompts for debugging
-        logger.info(f"=== LLM REQUEST to {self.config.base_url} ===")
-        logger.info(f"Model: {self.config.model_name}, temp: {temperature}, max_tokens: {max_tokens}")
-        logger.info(f"Messages count: {len(messages)}")
-        for i, msg in enumerate(messages):
-            role = msg.get('role', 'unknown') if isinstance(msg, dict) else getattr(msg, 'role', 'unknown')
-            content = msg.get('content', '') if isinstance(msg, dict) else getattr(msg, 'content', '')
-            logger.info(f"--- MESSAGE {i} ({role.upper()}) ---")
-            # Log content in chunks to avoid truncation
-            if content:
-                for j in range(0, len(content), 2000):
-                    logger.info(content[j:j+2000])
-            else:
-                logger.info("(empty content)")
-        logger.info("=== END LLM REQUEST ===")
+        logger.debug(
+            f"LLM request: {len(messages)} messages, "
+            f"{sum(len(m.get('content') or '') for m in messages)} chars, "
+            f"temp={temperature}, max_tokens={max_tokens}"
+        )
 
         try:
-            response = await client.post("/v1/chat/completions", json=payload)
-            response.raise_for_status()
-            return response.json()
+            affinity = payload.get("id_slot")
+            async with self._endpoint("/v1/chat/completions", affinity) as url:
+                response = await client.post(url, json=payload)
+                response.raise_for_status()
+                return response.json()
         except httpx.ConnectError as e:
             raise ConnectionInferenceError(f"Connection error: {e}") from e
         except httpx.TimeoutException as e:
@@ -243,6 +590,7 @@ class InferenceClient:
         prompt: str,
         temperature: float,
         max_tokens: int,
+        server_options: Optional[dict[str, Any]] = None,
     ) -> dict:
         """Make a completion request to the server.
 
@@ -250,6 +598,7 @@ class InferenceClient:
             prompt: The prompt text
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            server_options: Extra llama.cpp request fields
 
         Returns:
             Response dict from the server
@@ -261,12 +610,79 @@ class InferenceClient:
             "prompt": prompt,
             "temperature": temperature,
             "max_tokens": max_tokens,
+            **(server_options or {}),
+        }
+
+        try:
+            affinity = payload.get("id_slot")
+            async with self._endpoint("/v1/completions", affinity) as url:
+                response = await client.post(url, json=payload)
+                response.raise_for_status()
+                return response.json()
+        except httpx.ConnectError as e:
+            raise ConnectionInferenceError(f"Connection error: {e}") from e
+        except httpx.TimeoutException as e:
+            raise TimeoutInferenceError(f"Timeout error: {e}") from e
+        except httpx.HTTPStatusError as e:
+            raise InferenceError(f"HTTP error: {e}") from e
+
+    async def _stream_request(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        server_options: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[dict]:
+        """Make a streaming chat completion request to the server.
+
+        Closing the iterator early closes the connection, which makes the
+        server stop generating.
+
+        Args:
+            messages: List of message dicts with role and content
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            server_options: Extra llama.cpp request fields
+
+        Yields:
+            Each server-sent event as a dict
+
+        Raises:
+            InferenceError: On connection, timeout, or response errors
+        """
+        client = await self._get_http_client()
+
+        payload = {
+            "model": self.config.model_name,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            **(server_options or {}),
         }
 
         try:
-            response = await client.post("/v1/completions", json=payload)
-            response.raise_for_status()
-            return response.json()
+            async with self._endpoint("/v1/chat/completions", payload.get("id_slot")) as url:
+                async with client.stream("POST", url, json=payload) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            return
+
+                        try:
+                            event = json.loads(data)
+                        except json.JSONDecodeError as e:
+                            raise ResponseInferenceError(f"Invalid stream event: {data[:200]}") from e
+                        if "error" in event:
+                            error_info = event["error"]
+                            if isinstance(error_info, dict):
+                                error_info = error_info.get("message", error_info)
+                            raise ResponseInferenceError(f"LLM server error: {error_info}")
+                        yield event
         except httpx.ConnectError as e:
             raise ConnectionInferenceError(f"Connection error: {e}") from e
         except httpx.TimeoutException as e:
@@ -274,11 +690,141 @@ class InferenceClient:
         except httpx.HTTPStatusError as e:
             raise InferenceError(f"HTTP error: {e}") from e
 
+    def _capture(
+        self,
+        kind: str,
+        response: Optional[ChatResponse | str] = None,
+        error: Optional[str] = None,
+        **request: Any,
+    ) -> None:
+        """Hand an exchange to the prompt log, which samples and writes it off the hot path."""
+        prompt_log = self.prompt_log or get_prompt_log()
+        if not prompt_log.enabled:
+            return
+
+        fields: dict[str, Any] = dict(request)
+        if isinstance(response, str):
+            fields["response"] = response
+        elif response is not None:
+            fields["response"] = response.content
+            fields["finish_reason"] = response.finish_reason
+            fields["model_info"] = response.model_info.to_dict()
+        if error is not None:
+            fields["error"] = error
+        prompt_log.record(kind, **fields)
+
+    async def stream_chat(
+        self,
+        messages: list[ChatMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache_prompt: Optional[bool] = None,
+        slot_id: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a chat response from the LLM as it is generated.
+
+        Args:
+            messages: List of ChatMessage objects
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            cache_prompt: Ask the server to reuse the KV cache of a matching
+                prompt prefix (server default if None)
+            slot_id: Server slot to run the request on (any if None)
+
+        Yields:
+            Generated text chunks
+
+        Raises:
+            InferenceError: On errors during inference
+        """
+        temp = temperature if temperature is not None else self.config.temperature
+        tokens = max_tokens if max_tokens is not None else self.config.max_tokens
+        message_dicts = [{"role": m.role, "content": m.content} for m in messages]
+
+        parts: list[str] = []
+        events = self._stream_request(
+            message_dicts, temp, tokens, _server_options(cache_prompt, slot_id)
+        )
+        try:
+            async with aclosing(events):
+                async for event in events:
+                    for choice in event.get("choices") or []:
+                        text = (choice.get("delta") or {}).get("content")
+                        if text:
+                            parts.append(text)
+                            yield text
+        except InferenceError as e:
+            self._capture("chat_stream", messages=message_dicts, error=str(e))
+            raise
+
+        self._capture("chat_stream", "".join(parts), messages=message_dicts)
+
+    async def _chat_streamed(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        server_options: dict[str, Any],
+        stop_when: Callable[[str], bool],
+    ) -> ChatResponse:
+        """Stream a chat request, stopping once stop_when accepts the text so far."""
+        start_time = time.monotonic()
+        content = ""
+        chunks = 0
+        finish_reason = "unknown"
+        usage: dict = {}
+        stopped_early = False
+
+        events = self._stream_request(messages, temperature, max_tokens, server_options)
+        async with aclosing(events):
+            async for event in events:
+                usage = event.get("usage") or usage
+                choices = event.get("choices") or []
+                if not choices:
+                    continue
+
+                choice = choices[0]
+                text = (choice.get("delta") or {}).get("content") or ""
+                finish_reason = choice.get("finish_reason") or finish_reason
+                if not text:
+                    continue
+
+                content += text
+                chunks += 1
+                # Only a chunk closing a brace can complete a JSON object
+                if "}" in text and stop_when(content):
+                    stopped_early = True
+                    finish_reason = "stop"
+                    break
+
+        if stopped_early:
+            logger.info(f"Stopped generation early after {chunks} chunks")
+
+        model_info = ModelInfo(
+            model_name=self.config.model_name,
+            provider="llama.cpp",
+            temperature=temperature,
+            max_tokens=max_tokens,
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", chunks),
+            latency_ms=int((time.monotonic() - start_time) * 1000),
+            extra={"streamed": True, "stopped_early": stopped_early},
+        )
+
+        return ChatResponse(
+            content=content,
+            model_info=model_info,
+            finish_reason=finish_reason,
+        )
+
     async def chat(
         self,
         messages: list[ChatMessage],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_prompt: Optional[bool] = None,
+        slot_id: Optional[int] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
     ) -> ChatResponse:
         """Send a chat request to the LLM.
 
@@ -286,6 +832,13 @@ class InferenceClient:
             messages: List of ChatMessage objects
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            cache_prompt: Ask the server to reuse the KV cache of a matching
+                prompt prefix (server default if None)
+            slot_id: Server slot to run the request on (any if None)
+            stop_when: Stream the response and stop generating once this
+                returns True for the text so far. It is checked after each
+                chunk containing a closing brace, as it is meant for
+                detecting complete JSON objects.
 
         Returns:
             ChatResponse with content and model info
@@ -295,10 +848,34 @@ class InferenceClient:
         """
         temp = temperature if temperature is not None else self.config.temperature
         tokens = max_tokens if max_tokens is not None else self.config.max_tokens
+        server_options = _server_options(cache_prompt, slot_id)
+        request_options = {"server_options": server_options} if server_options else {}
 
         # Convert messages to dict format
         message_dicts = [{"role": m.role, "content": m.content} for m in messages]
 
+        try:
+            if stop_when is not None:
+                response = await self._chat_streamed(
+                    message_dicts, temp, tokens, server_options, stop_when
+                )
+            else:
+                response = await self._chat_once(message_dicts, temp, tokens, request_options)
+        except InferenceError as e:
+            self._capture("chat", messages=message_dicts, error=str(e))
+            raise
+
+        self._capture("chat", response, messages=message_dicts)
+        return response
+
+    async def _chat_once(
+        self,
+        message_dicts: list[dict],
+        temp: float,
+        tokens: int,
+        request_options: dict[str, Any],
+    ) -> ChatResponse:
+        """Send a non-streamed chat request and parse the response."""
         # Track timing
         start_time = time.monotonic()
 
@@ -307,6 +884,7 @@ class InferenceClient:
                 messages=message_dicts,
                 temperature=temp,
                 max_tokens=tokens,
+                **request_options,
             )
         except ConnectionError as e:
             raise ConnectionInferenceError(f"Connection error: {e}") from e
@@ -365,6 +943,8 @@ class InferenceClient:
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_prompt: Optional[bool] = None,
+        slot_id: Optional[int] = None,
     ) -> ChatResponse:
         """Send a completion request to the LLM.
 
@@ -372,6 +952,9 @@ class InferenceClient:
             prompt: The prompt text
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            cache_prompt: Ask the server to reuse the KV cache of a matching
+                prompt prefix (server default if None)
+            slot_id: Server slot to run the request on (any if None)
 
         Returns:
             ChatResponse with content and model info
@@ -381,7 +964,26 @@ class InferenceClient:
         """
         temp = temperature if temperature is not None else self.config.temperature
         tokens = max_tokens if max_tokens is not None else self.config.max_tokens
+        server_options = _server_options(cache_prompt, slot_id)
+        request_options = {"server_options": server_options} if server_options else {}
+
+        try:
+            response = await self._complete_once(prompt, temp, tokens, request_options)
+        except InferenceError as e:
+            self._capture("completion", prompt=prompt, error=str(e))
+            raise
+
+        self._capture("completion", response, prompt=prompt)
+        return response
 
+    async def _complete_once(
+        self,
+        prompt: str,
+        temp: float,
+        tokens: int,
+        request_options: dict[str, Any],
+    ) -> ChatResponse:
+        """Send a completion request and parse the response."""
         start_time = time.monotonic()
 
         try:
@@ -389,6 +991,7 @@ class InferenceClient:
                 prompt=prompt,
                 temperature=temp,
                 max_tokens=tokens,
+                **request_options,
             )
         except ConnectionError as e:
             raise ConnectionInferenceError(f"Connection error: {e}") from e
@@ -447,12 +1050,16 @@ class InferenceClient:
 # =============================================================================
 
 
-def get_inference_client() -> InferenceClient:
+def get_inference_client(priority: str = "interactive") -> InferenceClient:
     """Create a properly configured InferenceClient from settings.
 
     This is the recommended way to get an InferenceClient instance.
     It ensures all parts of the system use the same configuration
-    and API credentials.
+    and API credentials, and share the process-wide scheduler.
+
+    Args:
+        priority: "interactive" for user-facing requests, "background" for
+            batch work that should yield to them.
 
     Returns:
         InferenceClient: Configured client ready for LLM requests.
@@ -478,7 +1085,11 @@ def get_inference_client() -> InferenceClient:
         api_key=settings.inference_api_key,
     )
 
-    return InferenceClient(config=config)
+    return InferenceClient(
+        config=config,
+        scheduler=get_inference_scheduler(),
+        priority=PRIORITIES[priority],
+    )
 
 
 # =============================================================================
@@ -489,6 +1100,9 @@ def get_inference_client() -> InferenceClient:
 __all__ = [
     "InferenceClient",
     "InferenceConfig",
+    "InferenceScheduler",
+    "PRIORITY_BACKGROUND",
+    "PRIORITY_INTERACTIVE",
     "ChatMessage",
     "ChatResponse",
     "ModelInfo",
@@ -497,4 +1111,5 @@ __all__ = [
     "TimeoutInferenceError",
     "ResponseInferenceError",
     "get_inference_client",
+    "get_inference_scheduler",
 ]
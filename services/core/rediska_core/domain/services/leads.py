@@ -33,6 +33,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from rediska_core.domain.models import ExternalAccount, LeadPost
+from rediska_core.domain.services.index_outbox import enqueue_index_update
 from rediska_core.domain.services.profile_item_utils import upsert_profile_item_from_post
 
 
@@ -148,6 +149,7 @@ class LeadsService:
             )
             self.db.add(lead)
             self.db.flush()
+        enqueue_index_update(self.db, "lead_post", lead.id)
 
         # Also save the post as a profile_item for the author so that
         # analysis always has at least this post even when the provider
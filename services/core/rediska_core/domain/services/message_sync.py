@@ -8,10 +8,12 @@ import json
 import logging
 import re
 import httpx
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
 
+from sqlalchemy import insert, or_, select
 from sqlalchemy.orm import Session
 
 from rediska_core.config import get_settings
@@ -23,11 +25,19 @@ from rediska_core.domain.models import (
     Message,
 )
 from rediska_core.domain.services.credentials import CredentialsService
+from rediska_core.domain.services.index_outbox import enqueue_index_updates
 from rediska_core.infrastructure.crypto import CryptoService
+from rediska_core.infrastructure.rate_limiter import get_provider_rate_limiter
 from rediska_core.providers.reddit.adapter import RedditAdapter
 
+if TYPE_CHECKING:
+    from rediska_core.domain.services.attachment import AttachmentService, StagedFile
+
 logger = logging.getLogger(__name__)
 
+# Early exit threshold: stop after this many consecutive existing messages
+EARLY_EXIT_THRESHOLD = 10
+
 
 class SyncError(Exception):
     """Raised when sync fails."""
@@ -53,6 +63,19 @@ class MessageSyncResult:
         self.errors = errors or []
 
 
+@dataclass
+class InboxEntry:
+    """A Reddit message from an inbox/sent page, resolved to its conversation."""
+
+    msg_id: str
+    direction: str
+    counterpart_username: str
+    conv_id: str
+    sent_at: datetime
+    body_text: str
+    msg_data: dict
+
+
 class MessageSyncService:
     """Service for syncing messages from providers."""
 
@@ -162,28 +185,33 @@ class MessageSyncService:
 
         return unique_urls[:5]  # Limit to 5 images per message
 
-    async def _download_image(self, url: str) -> tuple[bytes, str] | None:
-        """Download an image from URL. Returns (data, content_type) or None on failure."""
+    async def _download_image(
+        self, url: str, attachment_service: "AttachmentService"
+    ) -> tuple["StagedFile", str] | None:
+        """Stream an image from URL to a staged file.
+
+        The body is written to disk while it is hashed, never held in memory;
+        downloads over the attachment size limit (10MB) are abandoned.
+
+        Returns:
+            (staged file, content_type), or None on failure.
+        """
         try:
             async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                response = await client.get(
+                async with client.stream(
+                    "GET",
                     url,
-                    headers={'User-Agent': self.settings.provider_reddit_user_agent}
-                )
-
-                if response.status_code != 200:
-                    return None
+                    headers={'User-Agent': self.settings.provider_reddit_user_agent},
+                ) as response:
+                    if response.status_code != 200:
+                        return None
 
-                content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
-                if content_type not in self.ALLOWED_IMAGE_TYPES:
-                    return None
+                    content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+                    if content_type not in self.ALLOWED_IMAGE_TYPES:
+                        return None
 
-                # Limit to 10MB
-                content = response.content
-                if len(content) > 10 * 1024 * 1024:
-                    return None
-
-                return content, content_type
+                    staged = await attachment_service.astage(response.aiter_bytes())
+                    return staged, content_type
 
         except Exception:
             return None
@@ -192,7 +220,6 @@ class MessageSyncService:
         self,
         message_id: int,
         image_urls: list[str],
-        username: Optional[str] = None,
     ) -> int:
         """Download images and create attachments. Returns count of images saved.
 
@@ -201,7 +228,6 @@ class MessageSyncService:
         Args:
             message_id: ID of the message to link attachments to.
             image_urls: List of image URLs to download.
-            username: Optional username to organize files by (counterpart username).
         """
         if not image_urls:
             return 0
@@ -216,9 +242,9 @@ class MessageSyncService:
         # Download all images in parallel (max 5 concurrent to avoid overwhelming network)
         semaphore = asyncio.Semaphore(5)
 
-        async def download_with_limit(url: str) -> tuple[str, tuple[bytes, str] | None]:
+        async def download_with_limit(url: str) -> tuple[str, tuple["StagedFile", str] | None]:
             async with semaphore:
-                result = await self._download_image(url)
+                result = await self._download_image(url, attachment_service)
                 return url, result
 
         # Download all images concurrently
@@ -238,7 +264,7 @@ class MessageSyncService:
                 continue
 
             try:
-                data, content_type = download_data
+                staged, content_type = download_data
 
                 # Generate a filename from URL
                 url_path = url.split('?')[0].split('/')[-1]
@@ -246,12 +272,11 @@ class MessageSyncService:
                     ext = content_type.split('/')[-1]
                     url_path = f"image.{ext}"
 
-                upload_result = attachment_service.upload(
-                    file_data=data,
+                upload_result = attachment_service.upload_staged(
+                    staged,
                     filename=url_path,
                     content_type=content_type,
                     message_id=message_id,
-                    username=username,
                 )
                 count += 1
                 logger.debug(f"Stored image attachment {upload_result.attachment_id} for message {message_id}")
@@ -294,192 +319,411 @@ class MessageSyncService:
             client_secret=self.settings.provider_reddit_client_secret,
             user_agent=self.settings.provider_reddit_user_agent,
             on_token_refresh=on_token_refresh,
+            http2=self.settings.provider_reddit_http2,
+            max_connections=self.settings.provider_reddit_max_connections,
+            rate_limiter=get_provider_rate_limiter("reddit", self.settings.provider_reddit_client_id),
         )
 
-    def _get_or_create_external_account(
+    def _parse_inbox_page(
         self,
-        username: str,
-        user_id: Optional[str] = None,
-    ) -> ExternalAccount:
-        """Get or create an external account for a Reddit user."""
-        account = (
-            self.db.query(ExternalAccount)
-            .filter_by(provider_id="reddit", external_username=username)
-            .first()
-        )
+        items: list[dict],
+        my_username: str,
+        processed_message_ids: set[str],
+    ) -> list[InboxEntry]:
+        """Turn a page of raw Reddit messages into entries, in Reddit order."""
+        entries = []
+
+        for msg_data in items:
+            author = msg_data.get("author", "")
+            dest = msg_data.get("dest", "")
+            msg_id = msg_data.get("id", "")
+            first_message_name = msg_data.get("first_message_name") or msg_data.get("name", "")
+
+            # Skip if missing data or already processed
+            if not author or not dest or not msg_id:
+                continue
+            if msg_id in processed_message_ids:
+                continue
+            processed_message_ids.add(msg_id)
+
+            # Determine counterpart (the other person)
+            if author.lower() == my_username:
+                counterpart_username = dest
+                direction = "out"
+            else:
+                counterpart_username = author
+                direction = "in"
+
+            # Skip messages to/from ourselves (edge case)
+            if counterpart_username.lower() == my_username:
+                continue
 
-        if account:
-            # Update user_id if we have it now
-            if user_id and not account.external_user_id:
-                account.external_user_id = user_id
-                self.db.flush()
-            return account
+            # Create canonical conversation ID
+            # For [deleted] users, use thread ID to keep conversations separate
+            if counterpart_username.lower() == "[deleted]" and first_message_name:
+                conv_id = f"reddit:thread:{first_message_name}"
+            else:
+                # Normal users: group by user pair
+                user_pair = tuple(sorted([my_username, counterpart_username.lower()]))
+                conv_id = f"reddit:pair:{user_pair[0]}:{user_pair[1]}"
+
+            entries.append(
+                InboxEntry(
+                    msg_id=msg_id,
+                    direction=direction,
+                    counterpart_username=counterpart_username,
+                    conv_id=conv_id,
+                    sent_at=self._parse_reddit_timestamp(msg_data.get("created_utc")),
+                    body_text=msg_data.get("body", ""),
+                    msg_data=msg_data,
+                )
+            )
 
-        account = ExternalAccount(
-            provider_id="reddit",
-            external_username=username,
-            external_user_id=user_id,
-            remote_status="active",
-        )
-        self.db.add(account)
-        self.db.flush()
-        return account
+        return entries
 
-    def _get_or_create_conversation(
+    def _store_inbox_page(
         self,
-        identity: Identity,
-        external_conversation_id: str,
-        counterpart_account: ExternalAccount,
-    ) -> tuple[Conversation, bool]:
-        """Get or create a conversation. Returns (conversation, is_new)."""
-        conversation = (
-            self.db.query(Conversation)
-            .filter_by(
-                provider_id="reddit",
-                external_conversation_id=external_conversation_id,
+        identity_id: int,
+        entries: list[InboxEntry],
+        seen_conversations: set[str],
+        result: MessageSyncResult,
+        consecutive_existing: int = 0,
+    ) -> tuple[int, bool, list[tuple[InboxEntry, Message]], int]:
+        """Store one page of entries with batched lookups and a multi-row insert.
+
+        Existing messages, conversations and pending outgoing messages are
+        prefetched with IN queries. Entries are then walked in Reddit order
+        (newest first) until EARLY_EXIT_THRESHOLD consecutive known messages.
+
+        Args:
+            consecutive_existing: Run of known messages at the end of the
+                previous page, so a run spanning pages still exits early.
+
+        Returns:
+            Tuple of (entries processed, early exit reached, new messages,
+            consecutive known messages at the end of this page).
+        """
+        if not entries:
+            return 0, False, [], consecutive_existing
+
+        existing_ids = set(
+            self.db.scalars(
+                select(Message.external_message_id).where(
+                    Message.provider_id == "reddit",
+                    Message.external_message_id.in_([e.msg_id for e in entries]),
+                )
             )
-            .first()
         )
 
-        if conversation:
-            return conversation, False
+        conversations = self._load_conversations({e.conv_id for e in entries})
+        pending_by_conversation = self._load_pending_outgoing(
+            [
+                conversations[e.conv_id].id
+                for e in entries
+                if e.direction == "out"
+                and e.msg_id not in existing_ids
+                and e.conv_id in conversations
+            ]
+        )
 
-        conversation = Conversation(
-            provider_id="reddit",
-            external_conversation_id=external_conversation_id,
-            counterpart_account_id=counterpart_account.id,
-            identity_id=identity.id,
+        # Decide what happens to each entry before touching the database
+        new_entries: list[InboxEntry] = []
+        pending_matches: list[tuple[InboxEntry, Message]] = []
+        processed = 0
+        early_exit = False
+
+        for entry in entries:
+            is_existing = entry.msg_id in existing_ids
+
+            # For outgoing messages, match a local message that was sent before
+            # sync got the external_id from Reddit (pending, or sent without an ID)
+            if not is_existing and entry.direction == "out" and entry.conv_id in conversations:
+                pending = pending_by_conversation.get(conversations[entry.conv_id].id)
+                if pending and (pending[0].body_text or "").strip() == (entry.body_text or "").strip():
+                    pending_matches.append((entry, pending.pop(0)))
+                    is_existing = True
+
+            if is_existing:
+                consecutive_existing += 1
+                # Reddit returns newest first, so many existing messages in a row
+                # means all remaining messages are older and already synced
+                if consecutive_existing >= EARLY_EXIT_THRESHOLD:
+                    early_exit = True
+                    break
+            else:
+                consecutive_existing = 0
+                new_entries.append(entry)
+
+            processed += 1
+
+        touched = entries[: processed + (1 if early_exit else 0)]
+        self._create_missing_conversations(identity_id, touched, conversations, result)
+        for entry in touched:
+            if entry.conv_id not in seen_conversations:
+                seen_conversations.add(entry.conv_id)
+                result.conversations_synced += 1
+
+        for entry, pending_message in pending_matches:
+            logger.info(
+                f"Found pending message {pending_message.id} matching synced message {entry.msg_id}, "
+                f"updating instead of creating duplicate"
+            )
+            pending_message.external_message_id = entry.msg_id
+            pending_message.remote_visibility = "visible"
+            # Use Reddit's timestamp for consistency across Reddit apps
+            pending_message.sent_at = entry.sent_at
+
+        if pending_matches:
+            enqueue_index_updates(
+                self.db, "message", [message.id for _, message in pending_matches]
+            )
+
+        if not new_entries:
+            self.db.flush()
+            return processed, early_exit, [], consecutive_existing
+
+        self._insert_ignoring_duplicates(
+            Message,
+            [
+                {
+                    "provider_id": "reddit",
+                    "external_message_id": entry.msg_id,
+                    "conversation_id": conversations[entry.conv_id].id,
+                    # Incoming messages don't have our identity
+                    "identity_id": identity_id if entry.direction == "out" else None,
+                    "direction": entry.direction,
+                    "sent_at": entry.sent_at,
+                    "body_text": entry.body_text,
+                    "remote_visibility": "visible",
+                }
+                for entry in new_entries
+            ],
         )
-        self.db.add(conversation)
+
+        messages_by_ext_id = {
+            m.external_message_id: m
+            for m in self.db.query(Message).filter(
+                Message.provider_id == "reddit",
+                Message.external_message_id.in_([e.msg_id for e in new_entries]),
+            )
+        }
+
+        self._apply_new_message_side_effects(new_entries, conversations)
         self.db.flush()
-        return conversation, True
 
-    def _create_message_if_not_exists(
-        self,
-        conversation: Conversation,
-        identity: Identity,
-        external_message_id: str,
-        direction: str,
-        body_text: str,
-        sent_at: datetime,
-        sender_username: Optional[str] = None,
-    ) -> tuple[Message | None, bool]:
-        """Create a message if it doesn't exist. Returns (message, is_new).
-
-        For outgoing messages, also checks for pending messages that were created
-        locally but haven't been synced yet (to avoid duplicates when sync runs
-        before the send worker completes).
+        new_messages = [
+            (entry, messages_by_ext_id[entry.msg_id])
+            for entry in new_entries
+            if entry.msg_id in messages_by_ext_id
+        ]
+        enqueue_index_updates(self.db, "message", [message.id for _, message in new_messages])
+        return processed, early_exit, new_messages, consecutive_existing
+
+    def _load_conversations(self, conv_ids: set[str]) -> dict[str, Conversation]:
+        """Load Reddit conversations by external conversation ID."""
+        if not conv_ids:
+            return {}
+
+        return {
+            c.external_conversation_id: c
+            for c in self.db.query(Conversation).filter(
+                Conversation.provider_id == "reddit",
+                Conversation.external_conversation_id.in_(conv_ids),
+            )
+        }
+
+    def _load_pending_outgoing(self, conversation_ids: list[int]) -> dict[int, list[Message]]:
+        """Load unsynced outgoing messages per conversation, newest first.
+
+        Two cases lack an external_message_id:
+        1. remote_visibility == "unknown" — pending send (not yet confirmed)
+        2. remote_visibility == "visible" — sent but Reddit didn't return an ID
         """
-        # Check if message already exists by external_message_id
-        existing = (
+        if not conversation_ids:
+            return {}
+
+        pending_messages = (
             self.db.query(Message)
-            .filter_by(
-                provider_id="reddit",
-                external_message_id=external_message_id,
+            .filter(
+                Message.provider_id == "reddit",
+                Message.conversation_id.in_(set(conversation_ids)),
+                Message.direction == "out",
+                Message.remote_visibility.in_(["unknown", "visible"]),
+                # Not yet synced (NULL or empty string)
+                or_(
+                    Message.external_message_id.is_(None),
+                    Message.external_message_id == "",
+                ),
+                Message.deleted_at.is_(None),
             )
-            .first()
+            .order_by(Message.sent_at.desc())
+            .all()
         )
 
-        if existing:
-            return existing, False
-
-        # For outgoing messages, check if there's a pending or sent-without-id local message
-        # that matches (created before sync got the external_id from Reddit)
-        if direction == "out":
-            from sqlalchemy import or_
-            # Look for outgoing messages in the same conversation that lack an external_message_id.
-            # Two cases:
-            # 1. remote_visibility == "unknown" — pending send (not yet confirmed)
-            # 2. remote_visibility == "visible" AND external_message_id is NULL/empty
-            #    — confirmed sent but Reddit didn't return an ID
-            pending_message = (
-                self.db.query(Message)
-                .filter(
-                    Message.provider_id == "reddit",
-                    Message.conversation_id == conversation.id,
-                    Message.direction == "out",
-                    or_(
-                        Message.remote_visibility == "unknown",  # Pending send
-                        # Sent but missing external ID (Reddit often returns empty string)
-                        Message.remote_visibility == "visible",
-                    ),
-                    # Not yet synced (NULL or empty string)
-                    or_(
-                        Message.external_message_id.is_(None),
-                        Message.external_message_id == "",
-                    ),
-                    Message.deleted_at.is_(None),  # Not deleted
-                )
-                .order_by(Message.sent_at.desc())
-                .first()
+        by_conversation: dict[int, list[Message]] = {}
+        for message in pending_messages:
+            by_conversation.setdefault(message.conversation_id, []).append(message)
+        return by_conversation
+
+    def _create_missing_conversations(
+        self,
+        identity_id: int,
+        entries: list[InboxEntry],
+        conversations: dict[str, Conversation],
+        result: MessageSyncResult,
+    ) -> None:
+        """Create conversations (and counterpart accounts) not yet stored."""
+        missing: dict[str, str] = {}
+        for entry in entries:
+            if entry.conv_id not in conversations:
+                missing.setdefault(entry.conv_id, entry.counterpart_username)
+
+        if not missing:
+            return
+
+        usernames = set(missing.values())
+        accounts = (
+            self.db.query(ExternalAccount)
+            .filter(
+                ExternalAccount.provider_id == "reddit",
+                ExternalAccount.external_username.in_(usernames),
+            )
+            .all()
+        )
+        # MySQL collations compare usernames case-insensitively
+        by_username = {a.external_username: a for a in accounts}
+        by_lower = {a.external_username.lower(): a for a in accounts}
+
+        new_accounts = []
+        for username in usernames:
+            if username in by_username or username.lower() in by_lower:
+                continue
+            account = ExternalAccount(
+                provider_id="reddit",
+                external_username=username,
+                external_user_id=None,
+                remote_status="active",
             )
+            by_username[username] = account
+            by_lower[username.lower()] = account
+            new_accounts.append(account)
 
-            if pending_message:
-                # Normalize body text for comparison (strip whitespace)
-                pending_body = (pending_message.body_text or "").strip()
-                sync_body = (body_text or "").strip()
+        if new_accounts:
+            self.db.add_all(new_accounts)
+            self.db.flush()
 
-                # Check if body text matches (exact match after stripping)
-                if pending_body == sync_body:
-                    # Found matching pending message - update it instead of creating duplicate
-                    logger.info(
-                        f"Found pending message {pending_message.id} matching synced message {external_message_id}, "
-                        f"updating instead of creating duplicate"
-                    )
-                    pending_message.external_message_id = external_message_id
-                    pending_message.remote_visibility = "visible"
-                    # Use Reddit's timestamp for consistency across Reddit apps
-                    pending_message.sent_at = sent_at
-                    self.db.flush()
-                    return pending_message, False  # Not a new message
-
-        # Determine direction based on sender
-        if direction == "in":
-            identity_id = None  # Incoming messages don't have our identity
-        else:
-            identity_id = identity.id
+        new_conversations = []
+        for conv_id, username in missing.items():
+            account = by_username.get(username) or by_lower[username.lower()]
+            conversation = Conversation(
+                provider_id="reddit",
+                external_conversation_id=conv_id,
+                counterpart_account_id=account.id,
+                identity_id=identity_id,
+            )
+            conversations[conv_id] = conversation
+            new_conversations.append(conversation)
 
-        message = Message(
-            provider_id="reddit",
-            external_message_id=external_message_id,
-            conversation_id=conversation.id,
-            identity_id=identity_id,
-            direction=direction,
-            sent_at=sent_at,
-            body_text=body_text,
-            remote_visibility="visible",
-        )
-        self.db.add(message)
+        self.db.add_all(new_conversations)
         self.db.flush()
+        enqueue_index_updates(self.db, "conversation", [c.id for c in new_conversations])
+        result.new_conversations += len(new_conversations)
+
+    def _insert_ignoring_duplicates(self, model, rows: list[dict]) -> None:
+        """Insert rows in one statement, skipping rows that hit a unique key."""
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            stmt = mysql_insert(model).values(rows)
+            stmt = stmt.on_duplicate_key_update(
+                external_message_id=stmt.inserted.external_message_id
+            )
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            stmt = sqlite_insert(model).values(rows).on_conflict_do_nothing()
+        else:
+            stmt = insert(model).values(rows)
+
+        self.db.execute(stmt)
 
+    def _apply_new_message_side_effects(
+        self,
+        new_entries: list[InboxEntry],
+        conversations: dict[str, Conversation],
+    ) -> None:
+        """Update engagement state and last activity for newly stored messages."""
         # Update engagement_state when receiving a new incoming message
         # from a contacted account
-        if direction == "in":
-            account = (
-                self.db.query(ExternalAccount)
-                .filter(ExternalAccount.id == conversation.counterpart_account_id)
-                .first()
+        incoming_account_ids = {
+            conversations[e.conv_id].counterpart_account_id
+            for e in new_entries
+            if e.direction == "in"
+        }
+        contacted_accounts = {}
+        if incoming_account_ids:
+            contacted_accounts = {
+                a.id: a
+                for a in self.db.query(ExternalAccount).filter(
+                    ExternalAccount.id.in_(incoming_account_ids),
+                    ExternalAccount.contact_state == "contacted",
+                    ExternalAccount.engagement_state == "not_engaged",
+                )
+            }
+
+        for entry in new_entries:
+            conversation = conversations[entry.conv_id]
+
+            if entry.direction == "in":
+                account = contacted_accounts.pop(conversation.counterpart_account_id, None)
+                if account:
+                    account.engagement_state = "engaged"
+                    account.first_inbound_after_contact_at = entry.sent_at
+
+            # Update conversation last_activity_at
+            # Compare as naive datetimes since MySQL DATETIME columns don't store timezone
+            sent_at_naive = (
+                entry.sent_at.replace(tzinfo=None) if entry.sent_at.tzinfo else entry.sent_at
             )
-            if (
-                account
-                and account.contact_state == "contacted"
-                and account.engagement_state == "not_engaged"
-            ):
-                account.engagement_state = "engaged"
-                account.first_inbound_after_contact_at = sent_at
-                self.db.flush()
-
-        # Update conversation last_activity_at
-        # Compare as naive datetimes since MySQL DATETIME columns don't store timezone
-        sent_at_naive = sent_at.replace(tzinfo=None) if sent_at.tzinfo else sent_at
-        last_activity = conversation.last_activity_at
-        if last_activity is not None and last_activity.tzinfo:
-            last_activity = last_activity.replace(tzinfo=None)
-        if last_activity is None or sent_at_naive > last_activity:
-            conversation.last_activity_at = sent_at_naive
-            self.db.flush()
+            last_activity = conversation.last_activity_at
+            if last_activity is not None and last_activity.tzinfo:
+                last_activity = last_activity.replace(tzinfo=None)
+            if last_activity is None or sent_at_naive > last_activity:
+                conversation.last_activity_at = sent_at_naive
+
+    async def _download_message_images(
+        self,
+        entry: InboxEntry,
+        message: Message,
+        result: MessageSyncResult,
+    ) -> None:
+        """Download images referenced by a newly synced message."""
+        msg_id = entry.msg_id
+        try:
+            # Extract media attachments from Reddit message metadata
+            media_attachments = self._extract_media_attachments_from_reddit(entry.msg_data)
 
-        return message, True
+            # Extract image URLs from message body text
+            image_urls = self._extract_image_urls(entry.body_text)
+
+            # Combine both sources
+            all_urls = media_attachments + image_urls
+            all_urls = list(dict.fromkeys(all_urls))  # Deduplicate while preserving order
+
+            if all_urls:
+                logger.debug(f"Found {len(all_urls)} media attachments in message {msg_id}: {len(media_attachments)} from metadata, {len(image_urls)} from body text")
+                images_saved = await self._download_and_store_images(
+                    message_id=message.id,
+                    image_urls=all_urls,
+                )
+                logger.info(f"Message {msg_id}: extracted {len(all_urls)} URLs, saved {images_saved} images")
+            else:
+                logger.debug(f"No images found in message {msg_id}")
+        except Exception as img_err:
+            logger.error(f"Failed to download images for message {msg_id}: {img_err}", exc_info=True)
+            result.errors.append(f"Failed to download images for message {msg_id}: {img_err}")
 
     async def backfill_attachments_for_existing_messages(
         self,
@@ -530,6 +774,19 @@ class MessageSyncService:
             result["errors"].append(str(e))
             return result
 
+        try:
+            return await self._backfill_from_endpoints(adapter, identity, result, limit)
+        finally:
+            await adapter.aclose()
+
+    async def _backfill_from_endpoints(
+        self,
+        adapter: RedditAdapter,
+        identity: Identity,
+        result: dict,
+        limit: int,
+    ) -> dict:
+        """Re-read inbox and sent pages and store attachments missing locally."""
         my_username = identity.external_username.lower()
         my_attachment_count = 0
 
@@ -583,17 +840,11 @@ class MessageSyncService:
                             all_urls = media_attachments + image_urls
                             all_urls = list(dict.fromkeys(all_urls))
 
-                            # Download - get username for storage organization
-                            counterpart_username = None
-                            if message.conversation and message.conversation.counterpart_account:
-                                counterpart_username = message.conversation.counterpart_account.external_username
-
                             if all_urls:
                                 logger.debug(f"Backfilling attachments for message {msg_id}: {len(all_urls)} URLs")
                                 images_saved = await self._download_and_store_images(
                                     message_id=message.id,
                                     image_urls=all_urls,
-                                    username=counterpart_username,
                                 )
                                 if images_saved > 0:
                                     my_attachment_count += images_saved
@@ -704,11 +955,6 @@ class MessageSyncService:
 
                 result["urls_found"] += len(image_urls)
 
-                # Get counterpart username for storage organization
-                counterpart_username = None
-                if message.conversation and message.conversation.counterpart_account:
-                    counterpart_username = message.conversation.counterpart_account.external_username
-
                 # Get existing attachment SHA256s for this message
                 existing_sha256s = set()
                 for att in message.attachments:
@@ -721,19 +967,19 @@ class MessageSyncService:
                         break
 
                     try:
-                        download_result = await self._download_image(url)
+                        download_result = await self._download_image(url, attachment_service)
                         if download_result is None:
                             logger.warning(f"Failed to download image from {url}")
                             result["download_failed"] += 1
                             continue
 
-                        data, content_type = download_result
+                        staged, content_type = download_result
 
                         # Check if we already have this image (by SHA256)
-                        import hashlib
-                        sha256_hash = hashlib.sha256(data).hexdigest()
+                        sha256_hash = staged.sha256
 
                         if sha256_hash in existing_sha256s:
+                            staged.discard()
                             result["already_exists"] += 1
                             continue
 
@@ -747,6 +993,7 @@ class MessageSyncService:
                             .first()
                         )
                         if existing_att:
+                            staged.discard()
                             existing_sha256s.add(sha256_hash)
                             result["already_exists"] += 1
                             continue
@@ -757,12 +1004,11 @@ class MessageSyncService:
                             ext = content_type.split('/')[-1]
                             url_path = f"image.{ext}"
 
-                        upload_result = attachment_service.upload(
-                            file_data=data,
+                        upload_result = attachment_service.upload_staged(
+                            staged,
                             filename=url_path,
                             content_type=content_type,
                             message_id=message.id,
-                            username=counterpart_username,
                         )
 
                         existing_sha256s.add(sha256_hash)
@@ -807,9 +1053,6 @@ class MessageSyncService:
         Returns:
             MessageSyncResult with counts of synced items.
         """
-        # Early exit threshold: stop after this many consecutive existing messages
-        EARLY_EXIT_THRESHOLD = 10
-
         result = MessageSyncResult()
 
         # Get identity
@@ -842,10 +1085,26 @@ class MessageSyncService:
             result.errors.append(str(e))
             return result
 
+        try:
+            return await self._sync_endpoints(adapter, identity, result, inbox_only)
+        finally:
+            await adapter.aclose()
+
+    async def _sync_endpoints(
+        self,
+        adapter: RedditAdapter,
+        identity: Identity,
+        result: MessageSyncResult,
+        inbox_only: bool,
+    ) -> MessageSyncResult:
+        """Page through the inbox (and optionally sent) endpoints and store messages.
+
+        Each page is stored with batched queries and committed on its own.
+        """
         my_username = identity.external_username.lower()
+        identity_id = identity.id
 
-        # Fetch messages from inbox (and optionally sent)
-        conversation_cache: dict[str, tuple] = {}  # conv_id -> (Conversation, counterpart)
+        seen_conversations: set[str] = set()
         processed_message_ids: set[str] = set()
 
         # Choose endpoints based on inbox_only flag
@@ -858,8 +1117,7 @@ class MessageSyncService:
             cursor = None
             pages_fetched = 0
             endpoint_messages = 0
-            consecutive_existing = 0  # Track consecutive existing messages for early exit
-            early_exit = False
+            consecutive_existing = 0
             logger.info(f"Starting to fetch messages from {endpoint}")
 
             while True:  # Continue until Reddit returns no more data or early exit
@@ -876,126 +1134,42 @@ class MessageSyncService:
                 if not messages_page.items:
                     break
 
-                for msg_data in messages_page.items:
-                    try:
-                        author = msg_data.get("author", "")
-                        dest = msg_data.get("dest", "")
-                        msg_id = msg_data.get("id", "")
-                        first_message_name = msg_data.get("first_message_name") or msg_data.get("name", "")
-
-                        # Skip if missing data or already processed
-                        if not author or not dest or not msg_id:
-                            continue
-                        if msg_id in processed_message_ids:
-                            continue
-                        processed_message_ids.add(msg_id)
-
-                        # Determine counterpart (the other person)
-                        if author.lower() == my_username:
-                            counterpart_username = dest
-                            direction = "out"
-                        else:
-                            counterpart_username = author
-                            direction = "in"
-
-                        # Skip messages to/from ourselves (edge case)
-                        if counterpart_username.lower() == my_username:
-                            continue
+                entries = self._parse_inbox_page(
+                    messages_page.items, my_username, processed_message_ids
+                )
 
-                        # Create canonical conversation ID
-                        # For [deleted] users, use thread ID to keep conversations separate
-                        if counterpart_username.lower() == "[deleted]" and first_message_name:
-                            # Use thread ID for deleted users to keep them separate
-                            conv_id = f"reddit:thread:{first_message_name}"
-                        else:
-                            # Normal users: group by user pair
-                            user_pair = tuple(sorted([my_username, counterpart_username.lower()]))
-                            conv_id = f"reddit:pair:{user_pair[0]}:{user_pair[1]}"
-
-                        # Get or create conversation (cached)
-                        if conv_id not in conversation_cache:
-                            counterpart_account = self._get_or_create_external_account(
-                                username=counterpart_username,
-                                user_id=None,
-                            )
-                            conversation, is_new_conv = self._get_or_create_conversation(
-                                identity=identity,
-                                external_conversation_id=conv_id,
-                                counterpart_account=counterpart_account,
-                            )
-                            conversation_cache[conv_id] = (conversation, counterpart_username)
-                            if is_new_conv:
-                                result.new_conversations += 1
-                            result.conversations_synced += 1
-                        else:
-                            conversation, _ = conversation_cache[conv_id]
-
-                        # Create message
-                        sent_at = self._parse_reddit_timestamp(msg_data.get("created_utc"))
-                        body_text = msg_data.get("body", "")
-                        message, is_new_msg = self._create_message_if_not_exists(
-                            conversation=conversation,
-                            identity=identity,
-                            external_message_id=msg_id,
-                            direction=direction,
-                            body_text=body_text,
-                            sent_at=sent_at,
-                            sender_username=author,
+                try:
+                    processed, early_exit, new_messages, consecutive_existing = (
+                        self._store_inbox_page(
+                            identity_id,
+                            entries,
+                            seen_conversations,
+                            result,
+                            consecutive_existing,
                         )
+                    )
+                except Exception as e:
+                    self.db.rollback()
+                    result.errors.append(
+                        f"Failed to process page {pages_fetched} from {endpoint}: {e}"
+                    )
+                    processed, early_exit, new_messages, consecutive_existing = 0, False, [], 0
 
-                        if is_new_msg:
-                            consecutive_existing = 0  # Reset counter on new message
-                            result.new_messages += 1
-
-                            # Download images for new messages
-                            if message:
-                                try:
-                                    # Extract media attachments from Reddit message metadata
-                                    media_attachments = self._extract_media_attachments_from_reddit(msg_data)
-
-                                    # Extract image URLs from message body text
-                                    image_urls = self._extract_image_urls(body_text)
-
-                                    # Combine both sources
-                                    all_urls = media_attachments + image_urls
-                                    all_urls = list(dict.fromkeys(all_urls))  # Deduplicate while preserving order
-
-                                    if all_urls:
-                                        logger.debug(f"Found {len(all_urls)} media attachments in message {msg_id}: {len(media_attachments)} from metadata, {len(image_urls)} from body text")
-                                        images_saved = await self._download_and_store_images(
-                                            message_id=message.id,
-                                            image_urls=all_urls,
-                                            username=counterpart_username,
-                                        )
-                                        logger.info(f"Message {msg_id}: extracted {len(all_urls)} URLs, saved {images_saved} images")
-                                    else:
-                                        logger.debug(f"No images found in message {msg_id}")
-                                except Exception as img_err:
-                                    logger.error(f"Failed to download images for message {msg_id}: {img_err}", exc_info=True)
-                                    result.errors.append(f"Failed to download images for message {msg_id}: {img_err}")
-                        else:
-                            # Message already exists - increment consecutive counter
-                            consecutive_existing += 1
-
-                            # Early exit if we've seen enough consecutive existing messages
-                            # Reddit returns newest first, so if we hit many existing messages
-                            # in a row, all remaining messages are older and already synced
-                            if consecutive_existing >= EARLY_EXIT_THRESHOLD:
-                                logger.info(
-                                    f"{endpoint}: Early exit after {EARLY_EXIT_THRESHOLD} consecutive "
-                                    f"existing messages (page {pages_fetched}, {endpoint_messages} processed)"
-                                )
-                                early_exit = True
-                                break
+                # Download images for new messages
+                for entry, message in new_messages:
+                    await self._download_message_images(entry, message, result)
 
-                        result.messages_synced += 1
-                        endpoint_messages += 1
+                self.db.commit()
 
-                    except Exception as e:
-                        result.errors.append(f"Failed to process message: {e}")
+                result.messages_synced += processed
+                result.new_messages += len(new_messages)
+                endpoint_messages += processed
 
-                # Check if early exit was triggered
                 if early_exit:
+                    logger.info(
+                        f"{endpoint}: Early exit after {EARLY_EXIT_THRESHOLD} consecutive "
+                        f"existing messages (page {pages_fetched}, {endpoint_messages} processed)"
+                    )
                     break
 
                 # Log progress every 10 pages
@@ -1015,9 +1189,6 @@ class MessageSyncService:
                     )
                     break
 
-        # Commit all changes
-        self.db.commit()
-
         return result
 
     async def sync_inbox_only(
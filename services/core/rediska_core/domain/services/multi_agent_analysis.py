@@ -7,6 +7,7 @@ into a final suitability recommendation.
 import asyncio
 import json
 import logging
+import zlib
 from datetime import datetime
 from typing import Any
 
@@ -26,6 +27,8 @@ from rediska_core.domain.models import (
     ProfileSnapshot,
 )
 from rediska_core.domain.services.agent_prompt import AgentPromptService
+from rediska_core.domain.services.context_budget import ContextBudgetBuilder
+from rediska_core.infrastructure.prompt_log import add_capture_tags, capture_scope
 
 
 class MultiAgentAnalysisService:
@@ -48,6 +51,9 @@ class MultiAgentAnalysisService:
         inference_client: Any,  # InferenceClient
         prompt_service: AgentPromptService | None = None,
         chat_template: str | None = None,
+        context_builder: ContextBudgetBuilder | None = None,
+        prompt_cache: bool | None = None,
+        inference_slots: int | None = None,
     ) -> None:
         """
         Initialize analysis service.
@@ -57,6 +63,11 @@ class MultiAgentAnalysisService:
             inference_client: LLM inference client
             prompt_service: Agent prompt service (creates if None)
             chat_template: Chat template override (default: from settings)
+            context_builder: Token budgeting for agent inputs (default: from settings)
+            prompt_cache: Share one cacheable prompt prefix across dimension
+                agents (default: from settings)
+            inference_slots: Server slots to pin each lead's agents to, 0 to
+                let the server choose (default: from settings)
         """
         self.db = db
         self.inference_client = inference_client
@@ -64,6 +75,13 @@ class MultiAgentAnalysisService:
         # Get chat template from settings if not provided
         settings = get_settings()
         self.chat_template = chat_template or settings.inference_chat_template
+        self.context_builder = context_builder or ContextBudgetBuilder.from_settings()
+        self.prompt_cache = (
+            settings.inference_prompt_cache if prompt_cache is None else prompt_cache
+        )
+        self.inference_slots = (
+            settings.inference_slots if inference_slots is None else inference_slots
+        )
 
     def _normalize_meta_output(self, meta_output: dict[str, Any]) -> dict[str, Any]:
         """Normalize meta-analysis output to expected schema fields.
@@ -192,6 +210,7 @@ class MultiAgentAnalysisService:
         lead_id: int,
         include_dimensions: list[str] | None = None,
         regenerate_summaries: bool = False,
+        capture_prompts: bool = False,
     ) -> LeadAnalysis:
         """
         Run full multi-agent analysis on a lead.
@@ -210,6 +229,8 @@ class MultiAgentAnalysisService:
             include_dimensions: Specific dimensions to analyze (defaults to all)
             regenerate_summaries: If True, regenerate user interest/character summaries
                                   even if they already exist on the lead. Default False.
+            capture_prompts: If True, write every prompt and response of this
+                             analysis to the prompt log instead of a sample.
 
         Returns:
             LeadAnalysis: Completed analysis with results
@@ -217,6 +238,16 @@ class MultiAgentAnalysisService:
         Raises:
             ValueError: If lead or profile data not found
         """
+        with capture_scope(force=capture_prompts, lead_id=lead_id):
+            return await self._analyze_lead(lead_id, include_dimensions, regenerate_summaries)
+
+    async def _analyze_lead(
+        self,
+        lead_id: int,
+        include_dimensions: list[str] | None,
+        regenerate_summaries: bool,
+    ) -> LeadAnalysis:
+        """Run the analysis pipeline; see analyze_lead()."""
         # Fetch lead
         lead = self.db.query(LeadPost).filter(LeadPost.id == lead_id).first()
         if not lead:
@@ -297,6 +328,7 @@ class MultiAgentAnalysisService:
         )
         self.db.add(analysis)
         self.db.flush()
+        add_capture_tags(analysis_id=analysis.id)
 
         try:
             # Build input context
@@ -389,6 +421,15 @@ class MultiAgentAnalysisService:
         """
         Run all dimension agents in parallel.
 
+        Each agent gets profile text sized to its own prompt and output
+        budget, so no request overflows the inference context window.
+
+        With prompt caching enabled, every agent instead gets the same
+        profile text placed ahead of its instructions, pinned to one server
+        slot per lead. The first agent runs alone to fill the KV cache and
+        the rest reuse the shared prefix, so only their instructions need
+        prefilling.
+
         Args:
             analysis_id: ID of parent analysis
             input_context: Input data for agents
@@ -416,42 +457,113 @@ class MultiAgentAnalysisService:
             "sexual_preferences": SexualPreferencesAgent,
         }
 
-        tasks = {}
-        for dimension in dimensions:
-            if dimension in agent_classes:
-                agent_class = agent_classes[dimension]
-                agent = agent_class(
-                    self.inference_client,
-                    chat_template=self.chat_template,
-                )
-                prompt = self.prompt_service.get_active_prompt(dimension)
-
-                task = agent.analyze(
-                    dimension=dimension,
-                    input_context=input_context,
-                    prompt=prompt,
-                    analysis_id=analysis_id,
-                    db=self.db,
-                )
-                tasks[dimension] = task
+        prompts = {
+            dimension: self.prompt_service.get_active_prompt(dimension)
+            for dimension in dimensions
+            if dimension in agent_classes
+        }
 
-        # Execute all agents in parallel
-        results = {}
-        if tasks:
-            task_results = await asyncio.gather(
-                *tasks.values(), return_exceptions=True
+        cache_options: dict[str, Any] = {}
+        shared_context = None
+        if self.prompt_cache and prompts:
+            cache_options = {
+                "context_first": True,
+                "cache_prompt": True,
+                "slot_id": self._slot_for(input_context),
+            }
+            shared_context = self.context_builder.build_shared_context(
+                input_context, list(prompts.values())
+            )
+
+        def run(dimension: str):
+            agent = agent_classes[dimension](
+                self.inference_client,
+                chat_template=self.chat_template,
+                **cache_options,
+            )
+            return self._run_agent(
+                agent, dimension, input_context, prompts[dimension], analysis_id,
+                agent_context=shared_context,
             )
-            for dimension, result in zip(tasks.keys(), task_results):
-                if isinstance(result, Exception):
-                    results[dimension] = {
-                        "success": False,
-                        "error": str(result),
-                        "output": None,
-                    }
-                else:
-                    results[dimension] = result
 
-        return results
+        pending = list(prompts)
+        results = {}
+        if shared_context is not None and len(pending) > 1:
+            # Warm the KV cache with the shared prefix before fanning out
+            first = pending.pop(0)
+            [results[first]] = await self._gather_results([run(first)])
+
+        # Execute remaining agents in parallel
+        if pending:
+            task_results = await self._gather_results([run(d) for d in pending])
+            results.update(zip(pending, task_results))
+
+        return {dimension: results[dimension] for dimension in prompts}
+
+    @staticmethod
+    async def _gather_results(tasks: list[Any]) -> list[dict[str, Any]]:
+        """Run agent coroutines in parallel, turning exceptions into failed results."""
+        task_results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            {"success": False, "error": str(result), "output": None}
+            if isinstance(result, Exception)
+            else result
+            for result in task_results
+        ]
+
+    def _slot_for(self, input_context: dict[str, Any]) -> int | None:
+        """
+        Pick the server slot for a lead's agent requests.
+
+        The slot is a stable hash of the lead, so re-analyses of the same
+        lead also land on the slot that may still hold its prefix.
+
+        Args:
+            input_context: Input data for agents
+
+        Returns:
+            int | None: Slot ID, or None when slots are not pinned
+        """
+        if self.inference_slots <= 0:
+            return None
+        lead = input_context.get("lead", {})
+        key = lead.get("id") or lead.get("url") or lead.get("title") or ""
+        return zlib.crc32(str(key).encode()) % self.inference_slots
+
+    async def _run_agent(
+        self,
+        agent: Any,
+        dimension: str,
+        input_context: dict[str, Any],
+        prompt: AgentPrompt,
+        analysis_id: int,
+        agent_context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run one dimension agent on a context budgeted for its prompt.
+
+        Args:
+            agent: Dimension agent instance
+            dimension: Agent dimension
+            input_context: Shared input data for agents
+            prompt: Active prompt for the dimension
+            analysis_id: ID of parent analysis
+            agent_context: Prebuilt context to use as-is (budgeted per agent if None)
+
+        Returns:
+            dict: Agent result
+        """
+        if agent_context is None:
+            agent_context = await self.context_builder.build_agent_context(
+                input_context, prompt
+            )
+        return await agent.analyze(
+            dimension=dimension,
+            input_context=agent_context,
+            prompt=prompt,
+            analysis_id=analysis_id,
+            db=self.db,
+        )
 
     async def _run_meta_analysis(
         self,
@@ -529,6 +641,9 @@ class MultiAgentAnalysisService:
                 if item.item_type == item_type and item.text_content
             ]
 
+        # Bounded default text; each agent gets its own budget at run time
+        profile_texts = self.context_builder.profile_texts(items_by_type)
+
         # Build context
         context = {
             "lead": {
@@ -541,20 +656,7 @@ class MultiAgentAnalysisService:
                 else None,
             },
             "profile": {
-                "post_text": " ".join(
-                    [
-                        item.get("text", "")
-                        for item in items_by_type.get("post", [])
-                        if item.get("text")
-                    ]
-                ),
-                "comment_text": " ".join(
-                    [
-                        item.get("text", "")
-                        for item in items_by_type.get("comment", [])
-                        if item.get("text")
-                    ]
-                ),
+                **profile_texts,
                 "summary": profile_snapshot.summary_text or "",
             },
             "summaries": {
@@ -0,0 +1,346 @@
+"""Perceptual image hashes and near-duplicate lookup.
+
+Perceptual hashes are 64-bit integers (dHash) whose Hamming distance is
+small for visually similar images. This module provides:
+1. Hash computation from image bytes (requires Pillow)
+2. Popcount-based Hamming distance
+3. A BK-tree for sub-linear "within distance k" lookups
+4. A vectorized NumPy path for comparing one hash against many
+5. An account-level index rebuilt from Attachment rows
+
+Usage:
+    index = PerceptualHashIndex.from_db(session)
+
+    # Accounts with an image within 6 bits of this hash
+    matches = index.find_accounts(phash, max_distance=6)
+    for account_id, distance in matches.items():
+        print(f"Account {account_id}: distance {distance}")
+"""
+
+import io
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+# Default distance for "same image, re-encoded or resized"
+DEFAULT_MAX_DISTANCE = 6
+
+
+# =============================================================================
+# HASH HELPERS
+# =============================================================================
+
+
+def compute_dhash(file_data: bytes) -> Optional[int]:
+    """Compute a 64-bit difference hash for an image.
+
+    Args:
+        file_data: Raw image bytes.
+
+    Returns:
+        Unsigned 64-bit hash, or None if Pillow is unavailable or the
+        image cannot be decoded.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        image = Image.open(io.BytesIO(file_data))
+        pixels = image.convert("L").resize((9, 8)).tobytes()
+    except Exception:
+        return None
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+
+    return value
+
+
+def parse_hash(value: Union[int, str], hash_format: Optional[str] = None) -> int:
+    """Convert a stored or serialized hash to an unsigned integer.
+
+    Integers (including signed values read from a BIGINT column) need no
+    format. Strings must name their encoding, since a hex hash made only of
+    the digits 0 and 1 cannot be told apart from a bit string.
+
+    Args:
+        value: Hash as int, or as a string in hash_format.
+        hash_format: "bin" for "0101..." bit strings, "hex" for hex strings.
+
+    Returns:
+        Unsigned integer hash.
+
+    Raises:
+        ValueError: If a string hash has no valid format, or the hash is
+            wider than HASH_BITS.
+    """
+    if isinstance(value, int):
+        if not -(1 << (HASH_BITS - 1)) <= value <= HASH_MASK:
+            raise ValueError(f"Hash does not fit in {HASH_BITS} bits")
+        return value & HASH_MASK
+
+    if hash_bit_length(value, hash_format) > HASH_BITS:
+        raise ValueError(f"Hash does not fit in {HASH_BITS} bits")
+    if not value:
+        return 0
+
+    return int(value, 2 if hash_format == "bin" else 16)
+
+
+def hash_bit_length(value: Union[int, str], hash_format: Optional[str] = None) -> int:
+    """Number of bits represented by a hash value.
+
+    Args:
+        value: Hash as int, or as a string in hash_format.
+        hash_format: "bin" or "hex"; required for string hashes.
+
+    Returns:
+        Bit length used to normalize distances.
+
+    Raises:
+        ValueError: If a string hash has no valid format.
+    """
+    if isinstance(value, int):
+        return HASH_BITS
+
+    if hash_format == "bin":
+        return len(value)
+    if hash_format == "hex":
+        return len(value) * 4
+
+    raise ValueError(f"String hashes need hash_format 'bin' or 'hex', got {hash_format!r}")
+
+
+def to_db_value(value: int) -> int:
+    """Convert an unsigned 64-bit hash to a signed BIGINT value."""
+    value &= HASH_MASK
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def hamming_distance(hash_a: int, hash_b: int) -> int:
+    """Count differing bits between two integer hashes."""
+    return (hash_a ^ hash_b).bit_count()
+
+
+def bulk_hamming_distances(query: int, hashes: list[int]) -> list[int]:
+    """Compute distances from one hash to many.
+
+    Uses NumPy when available, otherwise a popcount loop. The NumPy path
+    works on uint64 lanes, so values outside the unsigned HASH_BITS range
+    are compared with the popcount loop instead.
+
+    Args:
+        query: Unsigned hash to compare against.
+        hashes: Unsigned hashes to compare.
+
+    Returns:
+        Distances in the same order as hashes.
+    """
+    if np is None or not hashes or not _fits_uint64(query, hashes):
+        return [hamming_distance(query, h) for h in hashes]
+
+    values = np.array(hashes, dtype=np.uint64)
+    xor = np.bitwise_xor(values, np.uint64(query))
+    bits = np.unpackbits(xor.view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1).tolist()
+
+
+def _fits_uint64(query: int, hashes: list[int]) -> bool:
+    """Check that every value is an unsigned HASH_BITS-wide integer."""
+    return 0 <= query <= HASH_MASK and 0 <= min(hashes) and max(hashes) <= HASH_MASK
+
+
+# =============================================================================
+# BK-TREE
+# =============================================================================
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes with Hamming distance.
+
+    Each node stores a hash and the items sharing it; children are keyed by
+    their distance to the node. A range search only descends into children
+    whose key lies within [d - k, d + k] of the query distance d.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty tree."""
+        self._root: Optional[list[Any]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of items in the tree."""
+        return self._size
+
+    def add(self, value: int, item: Any) -> None:
+        """Add an item under a hash.
+
+        Args:
+            value: Unsigned hash.
+            item: Payload returned by searches.
+        """
+        self._size += 1
+
+        # Node layout: [hash, items, children]
+        if self._root is None:
+            self._root = [value, [item], {}]
+            return
+
+        node = self._root
+        while True:
+            distance = hamming_distance(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> list[tuple[int, Any]]:
+        """Find items whose hash is within max_distance of value.
+
+        Args:
+            value: Unsigned hash to search for.
+            max_distance: Maximum Hamming distance (inclusive).
+
+        Returns:
+            List of (distance, item) tuples.
+        """
+        results: list[tuple[int, Any]] = []
+        if self._root is None:
+            return results
+
+        stack = [self._root]
+        while stack:
+            node_hash, items, children = stack.pop()
+            distance = hamming_distance(value, node_hash)
+            if distance <= max_distance:
+                results.extend((distance, item) for item in items)
+
+            low = distance - max_distance
+            high = distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+
+        return results
+
+
+# =============================================================================
+# ACCOUNT INDEX
+# =============================================================================
+
+
+class PerceptualHashIndex:
+    """Maps perceptual hashes to the accounts whose profile images have them."""
+
+    def __init__(self, entries: Optional[Iterable[tuple[int, int]]] = None):
+        """Initialize the index.
+
+        Args:
+            entries: Optional (hash, account_id) pairs to load.
+        """
+        self.tree = BKTree()
+        for value, account_id in entries or ():
+            self.add(value, account_id)
+
+    def __len__(self) -> int:
+        """Number of indexed (hash, account) entries."""
+        return len(self.tree)
+
+    def add(self, value: int, account_id: int) -> None:
+        """Index an account image hash.
+
+        Args:
+            value: Perceptual hash (unsigned or signed BIGINT value).
+            account_id: Account owning the image.
+        """
+        self.tree.add(parse_hash(value), account_id)
+
+    def find_accounts(
+        self,
+        value: int,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        exclude_account_id: Optional[int] = None,
+    ) -> dict[int, int]:
+        """Find accounts with an image near the given hash.
+
+        Args:
+            value: Perceptual hash to search for.
+            max_distance: Maximum Hamming distance (inclusive).
+            exclude_account_id: Account to leave out of the results.
+
+        Returns:
+            Dictionary mapping account ID to its smallest distance.
+        """
+        matches: dict[int, int] = {}
+        for distance, account_id in self.tree.search(parse_hash(value), max_distance):
+            if account_id == exclude_account_id:
+                continue
+            if account_id not in matches or distance < matches[account_id]:
+                matches[account_id] = distance
+        return matches
+
+    @classmethod
+    def from_db(cls, db, provider_id: Optional[str] = None) -> "PerceptualHashIndex":
+        """Rebuild the index from Attachment rows linked to profile items.
+
+        Args:
+            db: Database session.
+            provider_id: Optional provider to limit the index to.
+
+        Returns:
+            Populated PerceptualHashIndex.
+        """
+        from rediska_core.domain.models import Attachment, ExternalAccount, ProfileItem
+
+        query = (
+            db.query(Attachment.phash, ProfileItem.account_id)
+            .join(ProfileItem, ProfileItem.attachment_id == Attachment.id)
+            .filter(
+                Attachment.phash.isnot(None),
+                Attachment.deleted_at.is_(None),
+                ProfileItem.deleted_at.is_(None),
+            )
+        )
+
+        if provider_id:
+            query = query.join(
+                ExternalAccount, ExternalAccount.id == ProfileItem.account_id
+            ).filter(ExternalAccount.provider_id == provider_id)
+
+        return cls(query.all())
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "BKTree",
+    "DEFAULT_MAX_DISTANCE",
+    "HASH_BITS",
+    "PerceptualHashIndex",
+    "bulk_hamming_distances",
+    "compute_dhash",
+    "hamming_distance",
+    "hash_bit_length",
+    "parse_hash",
+    "to_db_value",
+]
@@ -3,15 +3,32 @@
 Used by LeadsService (save_lead) and ScoutWatchService (record_post)
 to persist browse/scout post content as profile_items, ensuring
 analysis always has at least the post that surfaced the user.
+
+upsert_profile_items() stores a fetched post/comment history in one
+set-based statement keyed on the uq_item unique constraint, for the
+profile fetch paths in the worker.
 """
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from rediska_core.domain.models import ProfileItem
+from rediska_core.domain.services.index_outbox import enqueue_index_update
+from rediska_core.providers.base import ProfileItemType, ProviderProfileItem
+
+# Columns refreshed when an upserted item already exists
+UPSERT_UPDATE_COLUMNS = (
+    "item_created_at",
+    "text_content",
+    "subreddit",
+    "link_title",
+    "link_id",
+    "remote_visibility",
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +98,7 @@ def upsert_profile_item_from_post(
         # Mark visible since we just saw it in search results
         existing.remote_visibility = "visible"
         db.flush()
+        enqueue_index_update(db, "profile_item", existing.id)
         logger.debug(
             "Updated profile_item %d for account %d, post %s",
             existing.id, account_id, external_post_id,
@@ -99,8 +117,140 @@ def upsert_profile_item_from_post(
     )
     db.add(item)
     db.flush()
+    enqueue_index_update(db, "profile_item", item.id)
     logger.debug(
         "Created profile_item %d for account %d, post %s",
         item.id, account_id, external_post_id,
     )
     return item.id
+
+
+def profile_item_values(item: ProviderProfileItem) -> dict[str, Any]:
+    """Build profile_items column values for a fetched post or comment.
+
+    Posts combine title and body into text_content; comments keep the
+    parent post's title as link_title.
+
+    Args:
+        item: Post or comment fetched from the provider.
+
+    Returns:
+        Column values, without account_id.
+    """
+    if item.item_type == ProfileItemType.COMMENT:
+        return {
+            "item_type": "comment",
+            "external_item_id": item.external_id,
+            "item_created_at": item.created_at,
+            "text_content": item.body_text,
+            "subreddit": item.location,
+            "link_title": item.title[:512] if item.title else None,
+            "link_id": item.raw_data.get("link_id") if item.raw_data else None,
+            "remote_visibility": "visible",
+        }
+
+    return {
+        "item_type": "post",
+        "external_item_id": item.external_id,
+        "item_created_at": item.created_at,
+        "text_content": f"{item.title or ''}\n\n{item.body_text or ''}".strip() or None,
+        "subreddit": item.location,
+        "link_title": None,
+        "link_id": None,
+        "remote_visibility": "visible",
+    }
+
+
+def upsert_profile_items(db: Session, account_id: int, rows: list[dict[str, Any]]) -> list[int]:
+    """Insert or refresh many profile items for one account.
+
+    Existing items (matched on uq_item) get their content refreshed and are
+    marked visible; a row without item_created_at keeps the stored value. Runs three statements regardless of the number of rows:
+    read the existing items, upsert all rows, read the new items' IDs.
+
+    Args:
+        db: SQLAlchemy session.
+        account_id: The ExternalAccount ID the items belong to.
+        rows: Column values as built by profile_item_values(); rows without
+            an external_item_id are skipped, and the first row for a key wins.
+
+    Returns:
+        IDs of items that were created or whose text changed, i.e. the
+        items that need (re)indexing.
+    """
+    by_key: dict[tuple[str, str], dict[str, Any]] = {}
+    for row in rows:
+        if row.get("external_item_id"):
+            by_key.setdefault(
+                (row["item_type"], row["external_item_id"]),
+                {**row, "account_id": account_id},
+            )
+    if not by_key:
+        return []
+
+    key_columns = tuple_(ProfileItem.item_type, ProfileItem.external_item_id)
+    existing = {
+        (item_type, external_id): (item_id, text)
+        for item_id, item_type, external_id, text in db.execute(
+            select(
+                ProfileItem.id,
+                ProfileItem.item_type,
+                ProfileItem.external_item_id,
+                ProfileItem.text_content,
+            ).where(ProfileItem.account_id == account_id, key_columns.in_(list(by_key)))
+        )
+    }
+
+    db.execute(_upsert_statement(db, list(by_key.values())))
+
+    changed = [
+        item_id
+        for key, (item_id, text) in existing.items()
+        if by_key[key].get("text_content") != text
+    ]
+    new_keys = [key for key in by_key if key not in existing]
+    if new_keys:
+        changed.extend(
+            db.scalars(
+                select(ProfileItem.id).where(
+                    ProfileItem.account_id == account_id, key_columns.in_(new_keys)
+                )
+            )
+        )
+
+    logger.debug(
+        "Upserted %d profile_items for account %d (%d new, %d changed)",
+        len(by_key), account_id, len(new_keys), len(changed) - len(new_keys),
+    )
+    return changed
+
+
+def _upsert_statement(db: Session, rows: list[dict[str, Any]]):
+    """INSERT ... ON DUPLICATE KEY UPDATE (or the dialect's equivalent)."""
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(ProfileItem).values(rows)
+        return stmt.on_duplicate_key_update(
+            _update_values(stmt.inserted, ProfileItem.__table__.c)
+        )
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        stmt = sqlite_insert(ProfileItem).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=["account_id", "item_type", "external_item_id"],
+            set_=_update_values(stmt.excluded, ProfileItem.__table__.c),
+        )
+    return insert(ProfileItem).values(rows)
+
+
+def _update_values(incoming, current) -> dict[str, Any]:
+    """SET clause for an upsert; a missing creation time keeps the stored one."""
+    values = {column: incoming[column] for column in UPSERT_UPDATE_COLUMNS}
+    values["item_created_at"] = func.coalesce(
+        incoming["item_created_at"], current["item_created_at"]
+    )
+    return values
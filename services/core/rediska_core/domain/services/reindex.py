@@ -0,0 +1,449 @@
+"""Streaming reindex of content documents with a zero-downtime alias swap.
+
+A full reindex:
+1. Creates the next versioned index (rediska_content_docs_vN) with the
+   current mapping and embedding dimensions, and refreshes disabled
+2. Streams every supported document type from the database through a
+   server-side cursor into size-capped bulk requests
+3. Optionally attaches embeddings in batches (served from the embedding
+   cache for unchanged text)
+4. Replays documents the live index received while the load ran
+5. Re-enables refreshes, refreshes once, and atomically moves the
+   rediska_content_docs alias to the new index
+6. Replays once more for writes that raced the swap, then deletes the
+   previous indices
+
+Searches keep hitting the old index until the alias moves, so mapping
+changes - including a new embedding size - need no downtime. Updates written
+through the alias while the load runs land in the old index. Every document
+carries an indexed_at timestamp, so the replay finds the documents the old
+index received since the load started and rebuilds them from the database
+into the new index. Documents removed from the old index during the load
+cannot be found this way; they are dropped from the next full reindex.
+
+Usage:
+    service = ReindexService(db=session, es_url="http://localhost:9200")
+
+    # Rebuild everything into a new index and swap the alias
+    result = service.reindex()
+
+    # Stream one document type into the live alias without a swap
+    result = service.load(CONTENT_DOCS_INDEX, ["message"])
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from rediska_core.domain.services.embedding import EmbeddingService
+from rediska_core.domain.services.indexing import (
+    DEFAULT_STREAM_BATCH_SIZE,
+    SUPPORTED_DOC_TYPES,
+    IndexingService,
+)
+from rediska_core.infrastructure.elasticsearch import (
+    CONTENT_DOCS_ALIAS,
+    CONTENT_DOCS_INDEX_PREFIX,
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_MAX_CHUNK_BYTES,
+    DEFAULT_EMBEDDING_DIMS,
+    ElasticsearchClient,
+    build_content_docs_mapping,
+    content_docs_index_name,
+    parse_index_version,
+)
+from rediska_core.infrastructure.embeddings import EmbeddingsError
+
+logger = logging.getLogger(__name__)
+
+
+# Stable order so a reindex streams document types predictably
+REINDEX_DOC_TYPES = (
+    "conversation",
+    "message",
+    "lead_post",
+    "profile_item",
+    "profile_snapshot",
+)
+
+
+# Subtracted from replay cutoffs to absorb clock differences between the
+# reindex host and the workers that stamp indexed_at
+REPLAY_CLOCK_SKEW = timedelta(seconds=60)
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield consecutive lists of at most size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# =============================================================================
+# SERVICE
+# =============================================================================
+
+
+class ReindexService:
+    """Builds versioned content indices from the database."""
+
+    def __init__(
+        self,
+        db: Session,
+        es_url: Optional[str] = None,
+        es_api_key: Optional[str] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        embedding_dims: int = DEFAULT_EMBEDDING_DIMS,
+        alias: str = CONTENT_DOCS_ALIAS,
+    ):
+        """Initialize the reindex service.
+
+        Args:
+            db: SQLAlchemy database session.
+            es_url: Elasticsearch URL (defaults to localhost:9200).
+            es_api_key: Optional API key for ES.
+            embedding_service: Attach embeddings to documents when set.
+            embedding_dims: Embedding dimensions of the new index mapping.
+            alias: Alias moved to the new index.
+        """
+        self.db = db
+        self.es_url = es_url or "http://localhost:9200"
+        self.es_api_key = es_api_key
+        self.embedding_service = embedding_service
+        self.embedding_dims = embedding_dims
+        self.alias = alias
+        self.indexing = IndexingService(db=db, es_url=self.es_url)
+        self._es_client: Optional[ElasticsearchClient] = None
+
+    @property
+    def es_client(self) -> ElasticsearchClient:
+        """Get or create ES client (lazy initialization)."""
+        if self._es_client is None:
+            self._es_client = ElasticsearchClient(url=self.es_url, api_key=self.es_api_key)
+        return self._es_client
+
+    # =========================================================================
+    # LOADING
+    # =========================================================================
+
+    def _actions(
+        self,
+        index: str,
+        doc_types: Iterable[str],
+        counts: dict[str, int],
+        row_batch_size: int,
+        embed_batch_size: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Generate bulk actions for every document of the given types.
+
+        Args:
+            index: Target index.
+            doc_types: Document types to stream.
+            counts: Updated with documents generated per type and
+                "embedding_errors".
+            row_batch_size: Rows fetched per database round trip.
+            embed_batch_size: Documents embedded per request.
+
+        Yields:
+            Bulk index actions.
+        """
+        for doc_type in doc_types:
+            counts.setdefault(doc_type, 0)
+            documents = self.indexing.iter_documents(doc_type, batch_size=row_batch_size)
+            for batch in _batched(documents, embed_batch_size):
+                if self.embedding_service is not None:
+                    self._attach_embeddings(batch, counts)
+                for doc_id, document in batch:
+                    counts[doc_type] += 1
+                    yield {"_index": index, "_id": doc_id, "_source": document}
+
+    def _attach_embeddings(
+        self,
+        batch: list[tuple[str, dict[str, Any]]],
+        counts: dict[str, int],
+    ) -> None:
+        """Add embedding vectors to a batch of documents in place.
+
+        Documents whose embedding fails are still indexed, without a vector.
+        """
+        texts = [document.get("content") or "" for _, document in batch]
+        try:
+            vectors = self.embedding_service.embed_texts(texts)
+        except EmbeddingsError as e:
+            counts["embedding_errors"] = counts.get("embedding_errors", 0) + len(batch)
+            logger.warning(f"Reindex embedding batch failed: {e}")
+            return
+
+        for (_, document), vector in zip(batch, vectors):
+            if vector is not None:
+                document["embedding"] = vector
+
+    def load(
+        self,
+        index: str,
+        doc_types: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
+        thread_count: int = 1,
+        row_batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        """Stream documents from the database into an index or alias.
+
+        Args:
+            index: Target index or alias.
+            doc_types: Document types to load (defaults to all supported).
+            chunk_size: Maximum documents per bulk request.
+            max_chunk_bytes: Maximum bytes per bulk request.
+            thread_count: Parallel bulk requests in flight.
+            row_batch_size: Rows fetched per database round trip.
+
+        Returns:
+            Dict with "success", "indexed", "error_count", "errors" and
+            "documents" (count per type).
+
+        Raises:
+            ValueError: If a doc_type is not supported.
+        """
+        doc_types = list(doc_types or REINDEX_DOC_TYPES)
+        unknown = [doc_type for doc_type in doc_types if doc_type not in SUPPORTED_DOC_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown doc_type: {', '.join(unknown)}")
+
+        counts: dict[str, int] = {}
+        result = self.es_client.stream_bulk(
+            self._actions(index, doc_types, counts, row_batch_size, chunk_size),
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            thread_count=thread_count,
+        )
+        result["embedding_errors"] = counts.pop("embedding_errors", 0)
+        result["documents"] = counts
+        return result
+
+    # =========================================================================
+    # FULL REINDEX
+    # =========================================================================
+
+    def next_index_name(self, live_indices: Iterable[str] = ()) -> str:
+        """Name of the next unused versioned index.
+
+        Args:
+            live_indices: Indices the alias currently points to. Their
+                versions count as used even if listing indices fails.
+        """
+        names = [*self.es_client.list_indices(f"{CONTENT_DOCS_INDEX_PREFIX}*"), *live_indices]
+        versions = [parse_index_version(name) for name in names]
+        return content_docs_index_name(max([v for v in versions if v] or [0]) + 1)
+
+    def _discard_index(self, index: str, previous: list[str]) -> None:
+        """Delete a partially built index, never one the alias still serves."""
+        if index in previous:
+            logger.error(f"Refusing to delete {index}: alias {self.alias} still points to it")
+            return
+        self.es_client.delete_index(index)
+
+    def replay(
+        self,
+        source_indices: list[str],
+        target_index: str,
+        since: datetime,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> Optional[dict[str, Any]]:
+        """Copy documents written to the source indices since a time into the target.
+
+        Documents are rebuilt from the current database rows rather than
+        copied, so the target gets the latest state; entities that no longer
+        exist are deleted from the target.
+
+        Args:
+            source_indices: Indices that received writes through the alias.
+            target_index: Index being built.
+            since: Replay documents with indexed_at at or after this time.
+            chunk_size: Maximum documents per bulk request.
+
+        Returns:
+            Dict with "replayed", "indexed", "error_count" and "errors", or
+            None if the source indices could not be scanned.
+        """
+        es = self.es_client
+        if not source_indices:
+            return {"replayed": 0, "indexed": 0, "error_count": 0, "errors": []}
+
+        for index in source_indices:
+            es.refresh_index(index)
+
+        cutoff = (since - REPLAY_CLOCK_SKEW).isoformat()
+        doc_ids = es.scan_ids(",".join(source_indices), {"range": {"indexed_at": {"gte": cutoff}}})
+        if doc_ids is None:
+            return None
+
+        ids_by_type: dict[str, set[int]] = {}
+        for doc_id in doc_ids:
+            doc_type, _, entity_id = doc_id.partition(":")
+            if doc_type in SUPPORTED_DOC_TYPES and entity_id.isdigit():
+                ids_by_type.setdefault(doc_type, set()).add(int(entity_id))
+
+        actions: list[dict[str, Any]] = []
+        for doc_type, entity_ids in ids_by_type.items():
+            for batch in _batched(sorted(entity_ids), chunk_size):
+                actions.extend(self._current_actions(target_index, doc_type, batch))
+
+        if not actions:
+            return {"replayed": 0, "indexed": 0, "error_count": 0, "errors": []}
+
+        result = es.stream_bulk(actions, chunk_size=chunk_size)
+        return {
+            "replayed": len(actions),
+            "indexed": result["indexed"],
+            "error_count": result["error_count"],
+            "errors": result["errors"],
+        }
+
+    def _current_actions(
+        self,
+        index: str,
+        doc_type: str,
+        entity_ids: list[int],
+    ) -> list[dict[str, Any]]:
+        """Build an index or delete action for the current state of each entity."""
+        documents = self.indexing.load_documents(doc_type, entity_ids)
+        if self.embedding_service is not None and documents:
+            self._attach_embeddings(
+                [(f"{doc_type}:{entity_id}", doc) for entity_id, doc in documents.items()], {}
+            )
+
+        actions: list[dict[str, Any]] = []
+        for entity_id in entity_ids:
+            doc_id = f"{doc_type}:{entity_id}"
+            document = documents.get(entity_id)
+            if document is None:
+                actions.append({"_op_type": "delete", "_index": index, "_id": doc_id})
+            else:
+                actions.append({"_index": index, "_id": doc_id, "_source": document})
+        return actions
+
+    def reindex(
+        self,
+        doc_types: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
+        thread_count: int = 2,
+        max_errors: int = 0,
+        delete_old: bool = True,
+    ) -> dict[str, Any]:
+        """Rebuild the content index and swap the alias to it.
+
+        The alias is only moved if the load and the replay finished with at
+        most max_errors failed documents; otherwise the new index is deleted
+        and searches keep using the current one. Indices the alias points to
+        are never reused or deleted on failure.
+
+        Args:
+            doc_types: Document types to load (defaults to all supported).
+            chunk_size: Maximum documents per bulk request.
+            max_chunk_bytes: Maximum bytes per bulk request.
+            thread_count: Parallel bulk requests in flight.
+            max_errors: Failed documents tolerated before aborting the swap.
+            delete_old: Delete the previous indices after the swap.
+
+        Returns:
+            Dict with "status", "index", "previous_indices", "replayed" and
+            load results.
+        """
+        es = self.es_client
+        previous = es.get_alias_indices(self.alias)
+        new_index = self.next_index_name(previous)
+
+        if new_index in previous:
+            return {
+                "status": "error",
+                "index": new_index,
+                "error": f"Refusing to rebuild {new_index}: alias {self.alias} points to it",
+            }
+
+        mapping = build_content_docs_mapping(self.embedding_dims, refresh_interval="-1")
+        if not es.create_index(new_index, mapping, exist_ok=False):
+            return {
+                "status": "error",
+                "index": new_index,
+                "error": f"Failed to create index {new_index} (it may already exist)",
+            }
+
+        logger.info(f"Reindexing into {new_index} (alias {self.alias} -> {previous})")
+        load_started = datetime.now(timezone.utc)
+
+        try:
+            result = self.load(
+                new_index,
+                doc_types,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                thread_count=thread_count,
+            )
+            replay_started = datetime.now(timezone.utc)
+            replayed = self.replay(previous, new_index, load_started, chunk_size=chunk_size)
+        except Exception as e:
+            self._discard_index(new_index, previous)
+            return {"status": "error", "index": new_index, "error": str(e)}
+
+        summary = {
+            "index": new_index,
+            "previous_indices": previous,
+            "indexed": result["indexed"],
+            "error_count": result["error_count"],
+            "errors": result["errors"],
+            "embedding_errors": result["embedding_errors"],
+            "documents": result["documents"],
+        }
+
+        if replayed is None:
+            self._discard_index(new_index, previous)
+            return {**summary, "status": "error", "error": "Failed to scan updates made during load"}
+
+        summary["replayed"] = replayed["replayed"]
+        summary["error_count"] += replayed["error_count"]
+        summary["errors"] += replayed["errors"]
+
+        # Restore the default refresh interval and make everything searchable
+        es.update_index_settings(new_index, {"refresh_interval": None})
+        es.refresh_index(new_index)
+
+        if summary["error_count"] > max_errors:
+            self._discard_index(new_index, previous)
+            return {**summary, "status": "aborted"}
+
+        if not es.swap_alias(self.alias, new_index):
+            self._discard_index(new_index, previous)
+            return {**summary, "status": "error", "error": "Alias swap failed"}
+
+        # Writes that resolved the alias before the swap may still have
+        # landed in the old index after the first replay scanned it
+        final = self.replay(previous, new_index, replay_started, chunk_size=chunk_size)
+        if final is None or final["error_count"]:
+            # The new index is live; keep the old ones so nothing is lost
+            logger.error(f"Final replay into {new_index} failed; keeping {previous}")
+            return {**summary, "status": "success", "replay_error": True}
+        summary["replayed"] += final["replayed"]
+
+        if delete_old:
+            for old_index in previous:
+                if old_index != new_index:
+                    es.delete_index(old_index)
+
+        logger.info(f"Reindex complete: {result['indexed']} documents in {new_index}")
+        return {**summary, "status": "success"}
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "REINDEX_DOC_TYPES",
+    "REPLAY_CLOCK_SKEW",
+    "ReindexService",
+]
@@ -6,6 +6,11 @@ This service provides:
 3. Run history tracking
 4. Stats aggregation
 
+Watches are scheduled adaptively: after each run, a watch's next run is
+placed where about target_posts_per_run new posts are expected at its
+observed new-post rate, bounded by WatchSchedule's min/max interval.
+Watches reading the same listing are scheduled and claimed together.
+
 Usage:
     service = ScoutWatchService(db=session)
 
@@ -19,8 +24,10 @@ Usage:
     run = await service.run_watch(watch.id)
 """
 
+import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
@@ -33,6 +40,7 @@ from rediska_core.domain.models import (
     ScoutWatchPost,
     ScoutWatchRun,
 )
+from rediska_core.domain.services.index_outbox import enqueue_index_update
 from rediska_core.domain.services.profile_item_utils import upsert_profile_item_from_post
 
 
@@ -63,6 +71,104 @@ VALID_TIME_FILTERS = {"hour", "day", "week", "month", "year", "all"}
 DEFAULT_LOOKBACK_MINUTES = 30
 MAX_POSTS_PER_RUN = 100
 
+# A dispatched watch is not dispatched again for this long unless its run
+# completes first (covers queue delays and crashed runs)
+DISPATCH_LEASE_SECONDS = 900
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    """Convert to naive UTC, as DATETIME columns are stored."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+# =============================================================================
+# SCHEDULING
+# =============================================================================
+
+
+@dataclass
+class WatchSchedule:
+    """Bounds for adaptive watch run intervals.
+
+    Attributes:
+        min_interval: Shortest time between runs (seconds).
+        max_interval: Longest time between runs (seconds).
+        default_interval: Interval without enough run history (seconds).
+        target_posts_per_run: New posts a run should expect at the observed rate.
+        jitter: Random +/- fraction applied to each interval.
+        rate_window_hours: Run history used to estimate the post rate.
+    """
+
+    min_interval: float = 60
+    max_interval: float = 3600
+    default_interval: float = 300
+    target_posts_per_run: float = 5.0
+    jitter: float = 0.1
+    rate_window_hours: int = 24
+
+    @classmethod
+    def from_settings(cls) -> "WatchSchedule":
+        """Create a schedule configured from settings."""
+        from rediska_core.config import get_settings
+
+        settings = get_settings()
+        return cls(
+            min_interval=settings.scout_min_interval_seconds,
+            max_interval=settings.scout_max_interval_seconds,
+            default_interval=settings.scout_default_interval_seconds,
+            target_posts_per_run=settings.scout_target_posts_per_run,
+            jitter=settings.scout_interval_jitter,
+            rate_window_hours=settings.scout_rate_window_hours,
+        )
+
+    def interval_for_rate(self, rate: Optional[float]) -> float:
+        """Seconds until the next run for a new-post rate.
+
+        Args:
+            rate: New posts per second, or None without enough history.
+
+        Returns:
+            Interval within the min/max bounds, before jitter.
+        """
+        if rate is None:
+            interval = self.default_interval
+        elif rate <= 0:
+            interval = self.max_interval
+        else:
+            interval = self.target_posts_per_run / rate
+        return min(max(interval, self.min_interval), self.max_interval)
+
+
+# =============================================================================
+# LISTINGS
+# =============================================================================
+
+
+def watch_listing_key(watch: ScoutWatch) -> tuple:
+    """Identify the provider listing a watch reads.
+
+    Watches with the same key see the same posts, so one fetch can serve
+    all of them.
+
+    Args:
+        watch: The watch.
+
+    Returns:
+        (provider_id, location, sort_by, search_query, time_filter).
+    """
+    location = watch.source_location.strip().lower()
+    if location.startswith("r/"):
+        location = location[2:]
+    query = (watch.search_query or "").strip() or None
+    return (watch.provider_id, location, watch.sort_by, query, watch.time_filter)
+
+
+def uses_high_water_mark(watch: ScoutWatch) -> bool:
+    """Whether a watch's listing is newest first, so a high-water mark applies."""
+    return watch.sort_by == "new"
+
 
 # =============================================================================
 # SERVICE
@@ -76,13 +182,22 @@ class ScoutWatchService:
     subreddit monitoring.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, schedule: Optional[WatchSchedule] = None):
         """Initialize the scout watch service.
 
         Args:
             db: SQLAlchemy database session.
+            schedule: Run interval bounds (defaults to settings).
         """
         self.db = db
+        self._schedule = schedule
+
+    @property
+    def schedule(self) -> WatchSchedule:
+        """Run interval bounds for adaptive scheduling."""
+        if self._schedule is None:
+            self._schedule = WatchSchedule.from_settings()
+        return self._schedule
 
     # =========================================================================
     # CREATE WATCH
@@ -258,6 +373,7 @@ class ScoutWatchService:
             ScoutWatchError: If validation fails.
         """
         watch = self.get_watch_or_raise(watch_id)
+        listing_key = watch_listing_key(watch)
 
         if sort_by is not None:
             if sort_by not in VALID_SORTS:
@@ -287,6 +403,11 @@ class ScoutWatchService:
         if min_confidence is not None:
             watch.min_confidence = min_confidence
 
+        # A different listing starts without a high-water mark or rate history
+        if watch_listing_key(watch) != listing_key:
+            watch.last_post_created_at = None
+            watch.next_run_at = None
+
         self.db.flush()
         return watch
 
@@ -386,6 +507,7 @@ class ScoutWatchService:
             watch.last_match_at = run.completed_at
 
         self.db.flush()
+        self.schedule_next_run(watch, now=run.completed_at)
         return run
 
     def get_run_history(
@@ -520,6 +642,155 @@ class ScoutWatchService:
         self.db.flush()
         return deleted
 
+    # =========================================================================
+    # SCHEDULING
+    # =========================================================================
+
+    def claim_due_watches(self, now: Optional[datetime] = None) -> list[ScoutWatch]:
+        """Find active watches due to run and hold them for dispatch.
+
+        Works per listing: when any watch on a listing is due, every active
+        watch on that listing due within min_interval (or not yet scheduled)
+        is claimed with it, so the listing is fetched once for all of them.
+        Unscheduled watches on a listing with nothing due are given a first
+        run at a random point in the default interval (or alongside the
+        listing's next scheduled watch) instead of all firing on one tick.
+
+        Claimed watches get a provisional next_run_at DISPATCH_LEASE_SECONDS
+        ahead, so later scheduler ticks skip them while their run is queued;
+        completing the run replaces it. The caller commits.
+
+        Args:
+            now: Current time (defaults to now).
+
+        Returns:
+            Claimed watches, most overdue listing first.
+        """
+        now = _naive_utc(now or datetime.now(timezone.utc))
+        horizon = now + timedelta(seconds=self.schedule.min_interval)
+        candidates = (
+            self.db.query(ScoutWatch)
+            .filter(
+                ScoutWatch.is_active == True,
+                (ScoutWatch.next_run_at.is_(None)) | (ScoutWatch.next_run_at <= horizon),
+            )
+            .all()
+        )
+
+        listings: dict[tuple, list[ScoutWatch]] = {}
+        for watch in candidates:
+            listings.setdefault(watch_listing_key(watch), []).append(watch)
+
+        claimed: list[tuple[datetime, list[ScoutWatch]]] = []
+        lease_until = now + timedelta(seconds=DISPATCH_LEASE_SECONDS)
+        for watches in listings.values():
+            scheduled = [w.next_run_at for w in watches if w.next_run_at is not None]
+            if scheduled and min(scheduled) <= now:
+                for watch in watches:
+                    watch.next_run_at = lease_until
+                claimed.append((min(scheduled), watches))
+                continue
+
+            first_run = min(scheduled) if scheduled else now + timedelta(
+                seconds=random.uniform(0, self.schedule.default_interval)
+            )
+            for watch in watches:
+                if watch.next_run_at is None:
+                    watch.next_run_at = first_run
+
+        self.db.flush()
+        claimed.sort(key=lambda item: item[0])
+        return [watch for _, watches in claimed for watch in watches]
+
+    def estimate_post_rate(self, watch_id: int, now: Optional[datetime] = None) -> Optional[float]:
+        """Estimate a watch's new-post rate from its recent completed runs.
+
+        Each run's posts_new covers the time since the previous run, so the
+        oldest run in the window only marks where the measured span starts.
+
+        Args:
+            watch_id: The watch ID.
+            now: Current time (defaults to now).
+
+        Returns:
+            New posts per second, or None with fewer than two runs.
+        """
+        now = _naive_utc(now or datetime.now(timezone.utc))
+        since = now - timedelta(hours=self.schedule.rate_window_hours)
+        runs = (
+            self.db.query(ScoutWatchRun.completed_at, ScoutWatchRun.posts_new)
+            .filter(
+                ScoutWatchRun.watch_id == watch_id,
+                ScoutWatchRun.status == "completed",
+                ScoutWatchRun.completed_at >= since,
+            )
+            .order_by(ScoutWatchRun.completed_at)
+            .all()
+        )
+        if len(runs) < 2:
+            return None
+
+        span = (_naive_utc(runs[-1][0]) - _naive_utc(runs[0][0])).total_seconds()
+        if span <= 0:
+            return None
+        return sum(posts_new or 0 for _, posts_new in runs[1:]) / span
+
+    def schedule_next_run(self, watch: ScoutWatch, now: Optional[datetime] = None) -> datetime:
+        """Set a watch's next run from its observed new-post rate.
+
+        Args:
+            watch: The watch.
+            now: Time the interval starts from (defaults to now).
+
+        Returns:
+            The new next_run_at.
+        """
+        now = _naive_utc(now or datetime.now(timezone.utc))
+        schedule = self.schedule
+        interval = schedule.interval_for_rate(self.estimate_post_rate(watch.id, now))
+        if schedule.jitter:
+            interval *= random.uniform(1 - schedule.jitter, 1 + schedule.jitter)
+
+        watch.next_run_at = now + timedelta(seconds=interval)
+        self.db.flush()
+        return watch.next_run_at
+
+    def schedule_listing(
+        self,
+        watches: list[ScoutWatch],
+        now: Optional[datetime] = None,
+    ) -> Optional[datetime]:
+        """Give watches that read one listing a shared next run.
+
+        Uses the shortest interval any of them needs, so the listing keeps
+        being fetched once for all of them instead of each watch drifting
+        onto its own jittered schedule.
+
+        Args:
+            watches: Watches sharing a listing key.
+            now: Time the interval starts from (defaults to now).
+
+        Returns:
+            The shared next_run_at, or None without watches.
+        """
+        if not watches:
+            return None
+
+        now = _naive_utc(now or datetime.now(timezone.utc))
+        schedule = self.schedule
+        interval = min(
+            schedule.interval_for_rate(self.estimate_post_rate(watch.id, now))
+            for watch in watches
+        )
+        if schedule.jitter:
+            interval *= random.uniform(1 - schedule.jitter, 1 + schedule.jitter)
+
+        next_run_at = now + timedelta(seconds=interval)
+        for watch in watches:
+            watch.next_run_at = next_run_at
+        self.db.flush()
+        return next_run_at
+
     # =========================================================================
     # POST TRACKING (DEDUPLICATION)
     # =========================================================================
@@ -544,6 +815,55 @@ class ScoutWatchService:
         )
         return existing is not None
 
+    def seen_post_ids(self, watch_id: int, external_post_ids: Iterable[str]) -> set[str]:
+        """Find which of a batch of posts this watch has already seen.
+
+        Args:
+            watch_id: The watch ID.
+            external_post_ids: External post IDs from a listing.
+
+        Returns:
+            The subset of external_post_ids already recorded for the watch.
+        """
+        ids = list({post_id for post_id in external_post_ids if post_id})
+        if not ids:
+            return set()
+
+        rows = (
+            self.db.query(ScoutWatchPost.external_post_id)
+            .filter(
+                ScoutWatchPost.watch_id == watch_id,
+                ScoutWatchPost.external_post_id.in_(ids),
+            )
+            .all()
+        )
+        return {row[0] for row in rows}
+
+    def advance_high_water_mark(self, watch: ScoutWatch, posts: Iterable[Any]) -> None:
+        """Move a newest-first watch's mark to the newest post it has seen.
+
+        Args:
+            watch: The watch.
+            posts: Posts from the listing (anything with created_at).
+        """
+        if not uses_high_water_mark(watch):
+            return
+
+        newest = max(
+            (
+                post.created_at.astimezone(timezone.utc).replace(tzinfo=None)
+                if post.created_at.tzinfo else post.created_at
+                for post in posts
+                if post.created_at is not None
+            ),
+            default=None,
+        )
+        if newest is not None and (
+            watch.last_post_created_at is None or newest > watch.last_post_created_at
+        ):
+            watch.last_post_created_at = newest
+            self.db.flush()
+
     def record_post(
         self,
         watch_id: int,
@@ -731,6 +1051,7 @@ class ScoutWatchService:
 
         self.db.add(lead)
         self.db.flush()
+        enqueue_index_update(self.db, "lead_post", lead.id)
         return lead
 
 
@@ -747,4 +1068,8 @@ __all__ = [
     "VALID_TIME_FILTERS",
     "DEFAULT_LOOKBACK_MINUTES",
     "MAX_POSTS_PER_RUN",
+    "DISPATCH_LEASE_SECONDS",
+    "WatchSchedule",
+    "uses_high_water_mark",
+    "watch_listing_key",
 ]
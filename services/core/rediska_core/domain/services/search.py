@@ -31,8 +31,11 @@ from rediska_core.infrastructure.elasticsearch import (
     ElasticsearchClient,
 )
 from rediska_core.infrastructure.embeddings import (
-    EmbeddingsClient,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_LATENCY,
+    EmbeddingBatcher,
     EmbeddingsError,
+    get_embedding_batcher,
 )
 
 
@@ -81,6 +84,8 @@ class SearchService:
         embeddings_model: Optional[str] = None,
         embeddings_api_key: Optional[str] = None,
         es_api_key: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
     ):
         """Initialize the search service.
 
@@ -90,6 +95,8 @@ class SearchService:
             embeddings_model: Optional embeddings model name.
             embeddings_api_key: Optional API key for embeddings.
             es_api_key: Optional API key for ES.
+            batch_size: Maximum query texts per embeddings request.
+            max_latency: Seconds a query embed waits for others to batch with.
         """
         self._es_url = es_url
         self._es_api_key = es_api_key
@@ -97,8 +104,10 @@ class SearchService:
         self._embeddings_model = embeddings_model
         self._embeddings_api_key = embeddings_api_key
 
+        self._batch_size = batch_size
+        self._max_latency = max_latency
+
         self._es_client: Optional[ElasticsearchClient] = None
-        self._embeddings_client: Optional[EmbeddingsClient] = None
 
     @property
     def es_client(self) -> ElasticsearchClient:
@@ -111,16 +120,20 @@ class SearchService:
         return self._es_client
 
     @property
-    def embeddings_client(self) -> Optional[EmbeddingsClient]:
-        """Get or create embeddings client (lazy initialization)."""
+    def embedding_batcher(self) -> Optional[EmbeddingBatcher]:
+        """Get the process-wide batcher for query embeddings.
+
+        Concurrent searches share it, so their query embeds go out as one
+        batched request instead of one request per search.
+        """
         if self._embeddings_url and self._embeddings_model:
-            if self._embeddings_client is None:
-                self._embeddings_client = EmbeddingsClient(
-                    url=self._embeddings_url,
-                    model=self._embeddings_model,
-                    api_key=self._embeddings_api_key,
-                )
-            return self._embeddings_client
+            return get_embedding_batcher(
+                url=self._embeddings_url,
+                model=self._embeddings_model,
+                api_key=self._embeddings_api_key,
+                max_batch_size=self._batch_size,
+                max_latency=self._max_latency,
+            )
         return None
 
     def _build_filters(
@@ -267,7 +280,8 @@ class SearchService:
             Dict with total, hits, and max_score.
         """
         # Check if embeddings configured
-        if not self.embeddings_client:
+        batcher = self.embedding_batcher
+        if not batcher:
             return {"total": 0, "hits": [], "max_score": None}
 
         # Handle empty query
@@ -276,7 +290,7 @@ class SearchService:
 
         try:
             # Generate query embedding
-            query_vector = self.embeddings_client.embed(query)
+            query_vector = batcher.embed(query)
 
             if query_vector is None:
                 return {"total": 0, "hits": [], "max_score": None}
@@ -358,7 +372,7 @@ class SearchService:
 
         # Try to get kNN results
         knn_results = {"hits": []}
-        if self.embeddings_client:
+        if self.embedding_batcher:
             try:
                 knn_results = self.vector_search(
                     query=query,
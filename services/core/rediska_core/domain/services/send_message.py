@@ -36,6 +36,7 @@ from rediska_core.domain.models import (
     Message,
     ProviderCredential,
 )
+from rediska_core.domain.services.index_outbox import enqueue_index_update
 from rediska_core.domain.services.jobs import JobService
 
 
@@ -275,6 +276,7 @@ class SendMessageService:
         )
         self.db.add(message)
         self.db.flush()
+        enqueue_index_update(self.db, "message", message.id)
 
         # Create job to send the message
         # We set max_attempts > 1 to allow retries for clear failures (rate limit).
@@ -328,6 +330,7 @@ class SendMessageService:
             update_values,
             synchronize_session=False,
         )
+        enqueue_index_update(self.db, "message", message_id)
 
         # Update contact_state on the counterpart ExternalAccount
         message = self.db.query(Message).filter(Message.id == message_id).first()
@@ -394,6 +397,7 @@ class SendMessageService:
                 },
                 synchronize_session=False,
             )
+            enqueue_index_update(self.db, "message", message_id)
             self.db.flush()
 
     def handle_send_failure(
@@ -484,6 +488,7 @@ class SendMessageService:
         # Reset to unknown for retry
         message.remote_visibility = "unknown"
         message.send_error = None
+        enqueue_index_update(self.db, "message", message.id)
         self.db.flush()
 
         # Get conversation for identity info
@@ -615,6 +620,7 @@ class SendMessageService:
 
         # Perform soft delete
         message.deleted_at = datetime.now(timezone.utc)
+        enqueue_index_update(self.db, "message", message.id)
         self.db.flush()
 
         # Try to cancel associated job
@@ -702,6 +708,7 @@ class SendMessageService:
                 # If message exists and is not deleted, delete it
                 if message and message.deleted_at is None:
                     message.deleted_at = datetime.now(timezone.utc)
+                    enqueue_index_update(self.db, "message", message.id)
                     self.db.flush()
                     results["fixed_messages"] += 1
                     results["messages_fixed"].append(message_id)
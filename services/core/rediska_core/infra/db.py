@@ -3,22 +3,83 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from rediska_core.config import get_settings
 
 
+def _pool_kwargs(url: str) -> dict:
+    """Build connection pool arguments from settings.
+
+    SQLite uses a single-connection pool that rejects sizing arguments,
+    so only pre-ping is applied there.
+    """
+    settings = get_settings()
+    kwargs: dict = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if not url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return kwargs
+
+
+def instrument_pool(engine: Engine, pool_name: str = "sync") -> None:
+    """Record connection pool checkout/overflow metrics for an engine.
+
+    Metrics are written to the process-wide collector:
+    - db_pool_connects: new DBAPI connections opened
+    - db_pool_checkouts: connections handed out from the pool
+    - db_pool_checked_out: connections currently in use (gauge)
+    - db_pool_overflow: connections open beyond pool_size (gauge)
+
+    Args:
+        engine: Engine whose pool should be instrumented.
+        pool_name: Label value distinguishing multiple pools.
+    """
+    from rediska_core.observability.metrics import get_collector
+
+    collector = get_collector()
+    labels = {"pool": pool_name}
+    pool = engine.pool
+
+    def _record_usage() -> None:
+        checkedout = getattr(pool, "checkedout", None)
+        overflow = getattr(pool, "overflow", None)
+        if checkedout is not None:
+            collector.set_gauge("db_pool_checked_out", checkedout(), labels)
+        if overflow is not None:
+            collector.set_gauge("db_pool_overflow", max(overflow(), 0), labels)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        collector.increment("db_pool_connects", labels=labels)
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, connection_record, connection_proxy):
+        collector.increment("db_pool_checkouts", labels=labels)
+        _record_usage()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, connection_record):
+        _record_usage()
+
+
 def get_sync_engine():
     """Get synchronous database engine."""
     settings = get_settings()
-    return create_engine(
+    engine = create_engine(
         settings.mysql_url,
-        pool_pre_ping=True,
-        pool_recycle=3600,
         echo=False,
+        **_pool_kwargs(settings.mysql_url),
     )
+    instrument_pool(engine)
+    return engine
 
 
 def get_async_engine():
@@ -54,6 +115,24 @@ def get_sync_session_factory() -> sessionmaker[Session]:
     return _sync_session_factory
 
 
+def dispose_sync_engine(close: bool = True) -> None:
+    """Dispose the synchronous engine and drop the cached session factory.
+
+    Call with close=False in forked child processes (e.g. Celery prefork
+    workers) so pooled connections inherited from the parent are forgotten
+    without closing the parent's sockets. The next call to
+    get_sync_session_factory() builds a fresh engine.
+
+    Args:
+        close: Whether to close pooled connections (False after fork).
+    """
+    global _sync_engine, _sync_session_factory
+    if _sync_engine is not None:
+        _sync_engine.dispose(close=close)
+    _sync_engine = None
+    _sync_session_factory = None
+
+
 def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get async session factory (singleton)."""
     global _async_engine, _async_session_factory
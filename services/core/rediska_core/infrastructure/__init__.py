@@ -16,6 +16,7 @@ from rediska_core.infrastructure.rate_limiter import (
     RateLimiter,
     RateLimitConfig,
     RateLimitExceeded,
+    get_provider_rate_limiter,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "RateLimiter",
     "RateLimitConfig",
     "RateLimitExceeded",
+    "get_provider_rate_limiter",
 ]
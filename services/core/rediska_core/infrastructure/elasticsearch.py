@@ -2,36 +2,44 @@
 
 This module provides a high-level Elasticsearch client with:
 - Index creation and management
+- Versioned content indices behind an alias
 - Document CRUD operations
-- Bulk indexing
+- Bulk indexing, including streaming bulk loads
 - Search with filters
 
+Content documents are read and written through the CONTENT_DOCS_INDEX alias,
+which points at one versioned index (rediska_content_docs_v1, _v2, ...). A
+reindex builds the next version and moves the alias in one atomic update.
+
 Usage:
     from rediska_core.infrastructure.elasticsearch import ElasticsearchClient
 
     client = ElasticsearchClient(url="http://localhost:9200")
 
-    # Create index
-    client.create_index("rediska_content_docs_v1")
+    # Create the first versioned index and its alias
+    client.ensure_index()
 
     # Index document
     client.index_document(
-        index="rediska_content_docs_v1",
+        index=CONTENT_DOCS_INDEX,
         doc_id="message:123",
         document={"doc_type": "message", "content": "Hello world"}
     )
 
     # Search
     results = client.search(
-        index="rediska_content_docs_v1",
+        index=CONTENT_DOCS_INDEX,
         query={"match": {"content": "hello"}},
         filters={"provider_id": "reddit"}
     )
 """
 
-from typing import Any, Optional
+import copy
+import re
+from typing import Any, Iterable, Optional
 
 from elasticsearch import Elasticsearch, NotFoundError
+from elasticsearch.helpers import parallel_bulk, scan, streaming_bulk
 
 
 # =============================================================================
@@ -151,8 +159,68 @@ CONTENT_DOCS_MAPPING = {
 }
 
 
-# Index name constant
-CONTENT_DOCS_INDEX = "rediska_content_docs_v1"
+# Alias used for all content doc reads and writes
+CONTENT_DOCS_ALIAS = "rediska_content_docs"
+CONTENT_DOCS_INDEX = CONTENT_DOCS_ALIAS
+
+# Versioned indices behind the alias: rediska_content_docs_v1, _v2, ...
+CONTENT_DOCS_INDEX_PREFIX = "rediska_content_docs_v"
+
+# Embedding dimensions of the default mapping (nomic-embed-text)
+DEFAULT_EMBEDDING_DIMS = 768
+
+# Bulk load defaults
+DEFAULT_BULK_CHUNK_SIZE = 500
+DEFAULT_BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
+# Maximum per-document errors kept in bulk results
+MAX_REPORTED_ERRORS = 100
+
+
+def content_docs_index_name(version: int) -> str:
+    """Name of a versioned content docs index.
+
+    Args:
+        version: Index version (1, 2, ...).
+
+    Returns:
+        Concrete index name.
+    """
+    return f"{CONTENT_DOCS_INDEX_PREFIX}{version}"
+
+
+def parse_index_version(index: str) -> Optional[int]:
+    """Extract the version from a content docs index name.
+
+    Args:
+        index: Concrete index name.
+
+    Returns:
+        Version number, or None if the name is not a versioned index.
+    """
+    match = re.fullmatch(re.escape(CONTENT_DOCS_INDEX_PREFIX) + r"(\d+)", index)
+    return int(match.group(1)) if match else None
+
+
+def build_content_docs_mapping(
+    embedding_dims: int = DEFAULT_EMBEDDING_DIMS,
+    refresh_interval: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build the content docs mapping for an embedding size.
+
+    Args:
+        embedding_dims: Dimensions of the embedding vector field.
+        refresh_interval: Optional index refresh interval (e.g. "-1" to
+            disable refreshes during a bulk load).
+
+    Returns:
+        Index settings and mappings.
+    """
+    mapping = copy.deepcopy(CONTENT_DOCS_MAPPING)
+    mapping["mappings"]["properties"]["embedding"]["dims"] = embedding_dims
+    if refresh_interval is not None:
+        mapping["settings"]["refresh_interval"] = refresh_interval
+    return mapping
 
 
 # =============================================================================
@@ -229,18 +297,21 @@ class ElasticsearchClient:
         self,
         index: str,
         mapping: Optional[dict] = None,
+        exist_ok: bool = True,
     ) -> bool:
         """Create an index with mapping.
 
         Args:
             index: Index name.
             mapping: Optional custom mapping (defaults to CONTENT_DOCS_MAPPING).
+            exist_ok: Treat an existing index as success. When False, an
+                existing index is reported as a failure and left untouched.
 
         Returns:
-            True if created or already exists, False on error.
+            True if created (or already exists and exist_ok), False otherwise.
         """
         if self.index_exists(index):
-            return True
+            return exist_ok
 
         try:
             body = mapping or CONTENT_DOCS_MAPPING
@@ -266,18 +337,123 @@ class ElasticsearchClient:
         except Exception:
             return False
 
-    def ensure_index(self, index: str = CONTENT_DOCS_INDEX) -> bool:
+    def ensure_index(
+        self,
+        index: str = CONTENT_DOCS_INDEX,
+        embedding_dims: int = DEFAULT_EMBEDDING_DIMS,
+    ) -> bool:
         """Ensure the content docs index exists.
 
-        Creates the index with default mapping if it doesn't exist.
+        For the content docs alias, creates the first versioned index behind
+        it, or adopts an existing rediska_content_docs_v1 index that predates
+        the alias. Other names are created with the default mapping.
 
         Args:
-            index: Index name (defaults to CONTENT_DOCS_INDEX).
+            index: Index or alias name (defaults to CONTENT_DOCS_INDEX).
+            embedding_dims: Embedding dimensions for a newly created index.
 
         Returns:
             True if index exists or was created.
         """
-        return self.create_index(index, CONTENT_DOCS_MAPPING)
+        mapping = build_content_docs_mapping(embedding_dims)
+        if index != CONTENT_DOCS_ALIAS:
+            return self.create_index(index, mapping)
+
+        if self.index_exists(CONTENT_DOCS_ALIAS):
+            return True
+
+        first = content_docs_index_name(1)
+        if self.index_exists(first):
+            return self.swap_alias(CONTENT_DOCS_ALIAS, first)
+
+        mapping["aliases"] = {CONTENT_DOCS_ALIAS: {"is_write_index": True}}
+        return self.create_index(first, mapping)
+
+    def list_indices(self, pattern: str) -> list[str]:
+        """List concrete indices matching a pattern.
+
+        Args:
+            pattern: Index name or wildcard pattern.
+
+        Returns:
+            Sorted index names (empty on error).
+        """
+        try:
+            return sorted(self._client.indices.get(index=pattern).keys())
+        except NotFoundError:
+            return []
+        except Exception:
+            return []
+
+    def get_alias_indices(self, alias: str) -> list[str]:
+        """Get the concrete indices an alias points to.
+
+        Args:
+            alias: Alias name.
+
+        Returns:
+            Sorted index names (empty if the alias does not exist).
+        """
+        try:
+            return sorted(self._client.indices.get_alias(name=alias).keys())
+        except NotFoundError:
+            return []
+        except Exception:
+            return []
+
+    def swap_alias(self, alias: str, index: str) -> bool:
+        """Point an alias at a single index in one atomic update.
+
+        Args:
+            alias: Alias name.
+            index: Index that should receive all reads and writes.
+
+        Returns:
+            True if the alias was updated.
+        """
+        actions: list[dict[str, Any]] = [
+            {"remove": {"index": old, "alias": alias}}
+            for old in self.get_alias_indices(alias)
+            if old != index
+        ]
+        actions.append({"add": {"index": index, "alias": alias, "is_write_index": True}})
+
+        try:
+            self._client.indices.update_aliases(actions=actions)
+            return True
+        except Exception:
+            return False
+
+    def update_index_settings(self, index: str, settings: dict[str, Any]) -> bool:
+        """Update dynamic index settings.
+
+        Args:
+            index: Index name.
+            settings: Settings to apply, e.g. {"refresh_interval": "-1"}.
+
+        Returns:
+            True if applied.
+        """
+        try:
+            self._client.indices.put_settings(index=index, settings=settings)
+            return True
+        except Exception:
+            return False
+
+    def refresh_index(self, index: str) -> bool:
+        """Make all indexed documents visible to search.
+
+        Args:
+            index: Index name.
+
+        Returns:
+            True if refreshed.
+        """
+        try:
+            self._client.indices.refresh(index=index)
+            return True
+        except Exception:
+            return False
 
     # =========================================================================
     # DOCUMENT OPERATIONS
@@ -452,6 +628,118 @@ class ElasticsearchClient:
                 "errors": [{"error": str(e)}],
             }
 
+    def stream_bulk(
+        self,
+        actions: Iterable[dict[str, Any]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
+        thread_count: int = 1,
+        queue_size: int = 4,
+        max_reported_errors: int = MAX_REPORTED_ERRORS,
+    ) -> dict[str, Any]:
+        """Index a stream of bulk actions without holding them in memory.
+
+        Actions are consumed lazily and sent in chunks capped by both
+        document count and request size. With thread_count > 1, chunks are
+        sent in parallel through a bounded queue, so a slow cluster slows
+        down the producer instead of letting chunks pile up.
+
+        Deleting a document that does not exist counts as a success.
+
+        Args:
+            actions: Bulk actions ({"_index", "_id", "_source"} dicts, or
+                {"_op_type": "delete", "_index", "_id"}).
+            chunk_size: Maximum documents per bulk request.
+            max_chunk_bytes: Maximum bytes per bulk request.
+            thread_count: Parallel bulk requests in flight.
+            queue_size: Chunks buffered ahead of the senders.
+            max_reported_errors: Maximum failures listed in "errors".
+
+        Returns:
+            Dict with "success", "indexed", "error_count", and "errors".
+        """
+        indexed = 0
+        error_count = 0
+        errors: list[dict[str, Any]] = []
+
+        try:
+            if thread_count > 1:
+                results = parallel_bulk(
+                    self._client,
+                    actions,
+                    thread_count=thread_count,
+                    queue_size=queue_size,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=max_chunk_bytes,
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                )
+            else:
+                results = streaming_bulk(
+                    self._client,
+                    actions,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=max_chunk_bytes,
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                    max_retries=3,
+                )
+
+            for ok, item in results:
+                op_type, info = next(iter(item.items()), (None, {})) if item else (None, {})
+                if ok or (op_type == "delete" and info.get("status") == 404):
+                    indexed += 1
+                    continue
+                error_count += 1
+                if len(errors) < max_reported_errors:
+                    errors.append({"id": info.get("_id"), "error": info.get("error")})
+
+        except Exception as e:
+            return {
+                "success": False,
+                "indexed": indexed,
+                "error_count": error_count + 1,
+                "errors": errors + [{"error": str(e)}],
+            }
+
+        return {
+            "success": error_count == 0,
+            "indexed": indexed,
+            "error_count": error_count,
+            "errors": errors,
+        }
+
+    def scan_ids(
+        self,
+        index: str,
+        query: dict[str, Any],
+        batch_size: int = 1000,
+    ) -> Optional[list[str]]:
+        """Collect the IDs of every document matching a query.
+
+        Pages through all matches with a scroll, without fetching sources.
+
+        Args:
+            index: Index, alias or comma-separated list of indices.
+            query: Elasticsearch query.
+            batch_size: Documents fetched per scroll page.
+
+        Returns:
+            Matching document IDs, or None on error.
+        """
+        try:
+            hits = scan(
+                self._client,
+                index=index,
+                query={"query": query, "_source": False},
+                size=batch_size,
+            )
+            return [hit["_id"] for hit in hits]
+        except NotFoundError:
+            return []
+        except Exception:
+            return None
+
     # =========================================================================
     # SEARCH
     # =========================================================================
@@ -610,7 +898,13 @@ class ElasticsearchClient:
 
 __all__ = [
     "ElasticsearchClient",
-    "CONTENT_DOCS_MAPPING",
+    "CONTENT_DOCS_ALIAS",
     "CONTENT_DOCS_INDEX",
+    "CONTENT_DOCS_INDEX_PREFIX",
+    "CONTENT_DOCS_MAPPING",
+    "DEFAULT_EMBEDDING_DIMS",
     "NotFoundError",
+    "build_content_docs_mapping",
+    "content_docs_index_name",
+    "parse_index_version",
 ]
@@ -0,0 +1,318 @@
+"""Content-addressed cache for embedding vectors.
+
+Vectors are keyed by (model, sha256 of the normalized text), so re-embedding
+text that has not changed - on reindex after a visibility flip, or during a
+full bulk reindex - is served from the cache instead of the embedding server.
+
+Two backends are provided:
+- RedisEmbeddingCache: shared by every API and worker process, with a TTL
+- LocalEmbeddingCache: in-process LRU with a TTL, for single-process use
+
+Vectors are stored as packed float32, the precision Elasticsearch keeps for
+dense_vector fields. Cache failures are logged and treated as misses, so an
+unavailable cache never blocks embedding.
+
+Usage:
+    cache = get_embedding_cache()
+
+    vectors = cache.get_many(model, texts)   # None for each miss
+    cache.set_many(model, missed_texts, missed_vectors)
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+EMBEDDING_CACHE_PREFIX = "rediska:embedding"
+
+# Default entry lifetime (30 days)
+DEFAULT_CACHE_TTL = 30 * 24 * 3600
+
+# Default entry limit for the local LRU backend
+DEFAULT_LOCAL_MAX_ENTRIES = 10_000
+
+
+# =============================================================================
+# KEYS AND ENCODING
+# =============================================================================
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different copies share a cache entry.
+
+    Applies Unicode NFC normalization and collapses runs of whitespace.
+
+    Args:
+        text: Text as sent to the embedding model.
+
+    Returns:
+        Normalized text.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def content_hash(model: str, text: str) -> str:
+    """Hash a (model, text) pair for use as a cache key.
+
+    Args:
+        model: Embedding model name.
+        text: Text to embed.
+
+    Returns:
+        Cache key of the form "{model}:{sha256 hex digest}".
+    """
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+def encode_vector(vector: list[float]) -> bytes:
+    """Pack a vector as float32 bytes."""
+    return array("f", vector).tobytes()
+
+
+def decode_vector(data: bytes) -> list[float]:
+    """Unpack float32 bytes into a vector."""
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+def _record(hits: int, misses: int) -> None:
+    """Record cache hit and miss counters."""
+    from rediska_core.observability.metrics import get_collector
+
+    collector = get_collector()
+    if hits:
+        collector.increment("embedding_cache_hits", hits)
+    if misses:
+        collector.increment("embedding_cache_misses", misses)
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+
+class EmbeddingCache(ABC):
+    """Base class for embedding caches.
+
+    Subclasses implement _get and _set over content hashes; this class
+    handles hashing, encoding and hit/miss metrics.
+    """
+
+    def get_many(self, model: str, texts: list[str]) -> list[Optional[list[float]]]:
+        """Look up cached vectors.
+
+        Args:
+            model: Embedding model name.
+            texts: Texts to look up.
+
+        Returns:
+            Vector or None for each text, in order.
+        """
+        if not texts:
+            return []
+
+        keys = [content_hash(model, text) for text in texts]
+        try:
+            raw = self._get(keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            raw = [None] * len(keys)
+
+        vectors = [decode_vector(data) if data else None for data in raw]
+        hits = sum(1 for vector in vectors if vector is not None)
+        _record(hits, len(vectors) - hits)
+        return vectors
+
+    def set_many(self, model: str, texts: list[str], vectors: list[list[float]]) -> None:
+        """Store vectors for texts.
+
+        Args:
+            model: Embedding model name.
+            texts: Texts that were embedded.
+            vectors: Vector per text, in the same order.
+        """
+        entries = {
+            content_hash(model, text): encode_vector(vector)
+            for text, vector in zip(texts, vectors)
+            if vector
+        }
+        if not entries:
+            return
+
+        try:
+            self._set(entries)
+        except Exception as e:
+            logger.warning(f"Embedding cache store failed: {e}")
+
+    @abstractmethod
+    def _get(self, keys: list[str]) -> list[Optional[bytes]]:
+        """Fetch packed vectors for content hashes (None for misses)."""
+        ...
+
+    @abstractmethod
+    def _set(self, entries: dict[str, bytes]) -> None:
+        """Store packed vectors by content hash."""
+        ...
+
+
+class RedisEmbeddingCache(EmbeddingCache):
+    """Embedding cache shared through Redis."""
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = DEFAULT_CACHE_TTL,
+        prefix: str = EMBEDDING_CACHE_PREFIX,
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis_client: Redis client (created from redis_url if omitted)
+            redis_url: Redis URL (defaults to settings.redis_url)
+            ttl_seconds: Entry lifetime; 0 keeps entries until evicted
+            prefix: Redis key prefix
+        """
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._redis = redis_client
+        self._redis_url = redis_url
+
+    def get_redis(self):
+        """Get Redis client (lazy initialization)."""
+        if self._redis is None:
+            import redis
+
+            if self._redis_url is None:
+                from rediska_core.config import get_settings
+
+                self._redis_url = get_settings().redis_url
+            self._redis = redis.from_url(
+                self._redis_url, socket_connect_timeout=2, socket_timeout=2
+            )
+        return self._redis
+
+    def _get(self, keys: list[str]) -> list[Optional[bytes]]:
+        return self.get_redis().mget([f"{self.prefix}:{key}" for key in keys])
+
+    def _set(self, entries: dict[str, bytes]) -> None:
+        pipe = self.get_redis().pipeline(transaction=False)
+        for key, data in entries.items():
+            pipe.set(f"{self.prefix}:{key}", data, ex=self.ttl_seconds or None)
+        pipe.execute()
+
+
+class LocalEmbeddingCache(EmbeddingCache):
+    """In-process LRU embedding cache with a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_CACHE_TTL,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Entry lifetime; 0 keeps entries until evicted
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def _get(self, keys: list[str]) -> list[Optional[bytes]]:
+        now = time.monotonic()
+        results: list[Optional[bytes]] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    results.append(None)
+                elif entry[0] and entry[0] <= now:
+                    del self._entries[key]
+                    results.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    results.append(entry[1])
+        return results
+
+    def _set(self, entries: dict[str, bytes]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            for key, data in entries.items():
+                self._entries[key] = (expires_at, data)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# =============================================================================
+# PROCESS-WIDE CACHE
+# =============================================================================
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the embedding cache configured in settings.
+
+    Returns:
+        Shared cache, or None when settings.embeddings_cache_backend is "none"
+    """
+    global _cache
+
+    from rediska_core.config import get_settings
+
+    settings = get_settings()
+    backend = settings.embeddings_cache_backend
+    if backend == "none":
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            if backend == "local":
+                _cache = LocalEmbeddingCache(
+                    max_entries=settings.embeddings_cache_max_entries,
+                    ttl_seconds=settings.embeddings_cache_ttl_seconds,
+                )
+            else:
+                _cache = RedisEmbeddingCache(
+                    redis_url=settings.redis_url,
+                    ttl_seconds=settings.embeddings_cache_ttl_seconds,
+                )
+        return _cache
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "DEFAULT_CACHE_TTL",
+    "EMBEDDING_CACHE_PREFIX",
+    "EmbeddingCache",
+    "LocalEmbeddingCache",
+    "RedisEmbeddingCache",
+    "content_hash",
+    "get_embedding_cache",
+    "normalize_text",
+]
@@ -16,13 +16,52 @@ Usage:
 
     # Batch embeddings
     embeddings = client.embed_batch(["Hello", "World"])
+
+    # Coalesce embed() calls from many threads into batched requests
+    batcher = EmbeddingBatcher(client, max_batch_size=32, max_latency=0.01)
+    embedding = batcher.embed("Hello world")
+
+    # Or share one batcher per process and endpoint
+    batcher = get_embedding_batcher(url="http://localhost:8080", model="nomic-embed-text")
+    embedding = batcher.embed("Hello world")
+
+    # Async variant: batches are sent concurrently over a pooled connection
+    async_client = AsyncEmbeddingsClient(url="http://localhost:8080", model="nomic-embed-text")
+    embeddings = await async_client.embed_batch(["Hello", "World"])
 """
 
-from typing import Optional
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, Union
 
 import httpx
 
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+# Default request timeout in seconds
+DEFAULT_TIMEOUT = 60
+
+# Maximum texts sent in one /v1/embeddings request
+DEFAULT_BATCH_SIZE = 32
+
+# Seconds a micro-batcher waits for more texts before sending a batch
+DEFAULT_MAX_LATENCY = 0.01
+
+# Maximum batch requests in flight at once per client
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Pooled connections per process
+DEFAULT_MAX_CONNECTIONS = 8
+
+
 # =============================================================================
 # EXCEPTIONS
 # =============================================================================
@@ -34,6 +73,105 @@ class EmbeddingsError(Exception):
     pass
 
 
+def _wrap_error(error: Exception) -> EmbeddingsError:
+    """Convert a transport or parsing error to an EmbeddingsError."""
+    if isinstance(error, EmbeddingsError):
+        return error
+    if isinstance(error, httpx.TimeoutException):
+        return EmbeddingsError(f"Request timeout: {error}")
+    if isinstance(error, (httpx.ConnectError, ConnectionError)):
+        return EmbeddingsError(f"Connection error: {error}")
+    return EmbeddingsError(f"Unexpected error: {error}")
+
+
+def _parse_embeddings(response: Any, expected: int) -> list[list[float]]:
+    """Extract embedding vectors from a /v1/embeddings response.
+
+    Args:
+        response: HTTP response.
+        expected: Number of inputs sent.
+
+    Returns:
+        Embedding vectors in input order.
+
+    Raises:
+        EmbeddingsError: If the response is an error or malformed.
+    """
+    if response.status_code != 200:
+        raise EmbeddingsError(f"API error: {response.status_code} - {response.text}")
+
+    data = response.json()
+    if "data" not in data or not data["data"]:
+        raise EmbeddingsError("Invalid response format: missing 'data' field")
+
+    # OpenAI-compatible servers tag each item with its input index
+    items = sorted(data["data"], key=lambda item: item.get("index", 0))
+
+    embeddings = []
+    for item in items:
+        embedding = item.get("embedding")
+        if embedding is None:
+            raise EmbeddingsError("Invalid response format: missing 'embedding' field")
+        embeddings.append(embedding)
+
+    if len(embeddings) != expected:
+        raise EmbeddingsError(
+            f"Invalid response format: expected {expected} embeddings, got {len(embeddings)}"
+        )
+
+    return embeddings
+
+
+def _chunk(texts: list[str], size: int) -> list[list[str]]:
+    """Split texts into consecutive chunks of at most size items."""
+    size = max(1, size)
+    return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+
+_http_clients: dict[tuple, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _get_http_client(timeout: float, max_connections: int) -> httpx.Client:
+    """Get the process-wide pooled HTTP client for these settings.
+
+    Clients are keyed by process ID so a forked worker child opens its own
+    connections instead of sharing sockets with its parent.
+    """
+    key = (os.getpid(), timeout, max_connections)
+    with _http_clients_lock:
+        client = _http_clients.get(key)
+        if client is None:
+            client = httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            )
+            _http_clients[key] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """Close the pooled HTTP clients created by this process."""
+    pid = os.getpid()
+    with _http_clients_lock:
+        owned = [client for key, client in _http_clients.items() if key[0] == pid]
+        _http_clients.clear()
+
+    for client in owned:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
 # =============================================================================
 # CLIENT
 # =============================================================================
@@ -43,6 +181,8 @@ class EmbeddingsClient:
     """Client for generating embeddings via llama.cpp API.
 
     Uses the OpenAI-compatible /v1/embeddings endpoint that llama.cpp provides.
+    All clients in a process share one keep-alive connection pool, so
+    creating a client per task or request is cheap.
     """
 
     def __init__(
@@ -50,7 +190,10 @@ class EmbeddingsClient:
         url: str,
         model: str,
         api_key: Optional[str] = None,
-        timeout: int = 60,
+        timeout: int = DEFAULT_TIMEOUT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         """Initialize the embeddings client.
 
@@ -59,11 +202,17 @@ class EmbeddingsClient:
             model: Model name to use for embeddings.
             api_key: Optional API key for authentication.
             timeout: Request timeout in seconds.
+            batch_size: Maximum texts per request in embed_batch().
+            max_concurrency: Maximum requests in flight in embed_batch().
+            max_connections: Size of the shared connection pool.
         """
         self.url = url.rstrip("/")
         self.model = model
         self.api_key = api_key
         self.timeout = timeout
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
         self._cached_dimensions: Optional[int] = None
 
     def _get_headers(self) -> dict[str, str]:
@@ -75,6 +224,43 @@ class EmbeddingsClient:
             headers["Authorization"] = f"Bearer {self.api_key}"
         return headers
 
+    @property
+    def http_client(self) -> httpx.Client:
+        """Pooled HTTP client shared by every client in this process."""
+        return _get_http_client(self.timeout, self.max_connections)
+
+    def _request(self, texts: Union[str, list[str]]) -> list[list[float]]:
+        """Send one /v1/embeddings request.
+
+        Args:
+            texts: A single text or a list of texts.
+
+        Returns:
+            Embedding vectors in input order.
+
+        Raises:
+            EmbeddingsError: If the API request fails.
+        """
+        expected = 1 if isinstance(texts, str) else len(texts)
+        try:
+            response = self.http_client.post(
+                f"{self.url}/v1/embeddings",
+                headers=self._get_headers(),
+                json={
+                    "input": texts,
+                    "model": self.model,
+                },
+            )
+            embeddings = _parse_embeddings(response, expected)
+        except Exception as e:
+            raise _wrap_error(e) from e
+
+        # Cache dimensions for later use
+        if self._cached_dimensions is None:
+            self._cached_dimensions = len(embeddings[0])
+
+        return embeddings
+
     def embed(self, text: str) -> Optional[list[float]]:
         """Generate embedding for a single text.
 
@@ -92,56 +278,14 @@ class EmbeddingsClient:
         if not text or not text.strip():
             return None
 
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{self.url}/v1/embeddings",
-                    headers=self._get_headers(),
-                    json={
-                        "input": text,
-                        "model": self.model,
-                    },
-                )
-
-                if response.status_code != 200:
-                    raise EmbeddingsError(
-                        f"API error: {response.status_code} - {response.text}"
-                    )
-
-                data = response.json()
-
-                # Validate response format
-                if "data" not in data or not data["data"]:
-                    raise EmbeddingsError(
-                        f"Invalid response format: missing 'data' field"
-                    )
-
-                embedding = data["data"][0].get("embedding")
-                if embedding is None:
-                    raise EmbeddingsError(
-                        f"Invalid response format: missing 'embedding' field"
-                    )
-
-                # Cache dimensions for later use
-                if self._cached_dimensions is None:
-                    self._cached_dimensions = len(embedding)
-
-                return embedding
-
-        except httpx.TimeoutException as e:
-            raise EmbeddingsError(f"Request timeout: {e}")
-        except httpx.ConnectError as e:
-            raise EmbeddingsError(f"Connection error: {e}")
-        except ConnectionError as e:
-            raise EmbeddingsError(f"Connection error: {e}")
-        except EmbeddingsError:
-            raise
-        except Exception as e:
-            raise EmbeddingsError(f"Unexpected error: {e}")
+        return self._request(text)[0]
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
+        Texts are sent in requests of at most batch_size items, with up to
+        max_concurrency requests in flight.
+
         Args:
             texts: List of texts to embed.
 
@@ -161,54 +305,17 @@ class EmbeddingsClient:
         if not valid_texts:
             return []
 
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{self.url}/v1/embeddings",
-                    headers=self._get_headers(),
-                    json={
-                        "input": valid_texts,
-                        "model": self.model,
-                    },
-                )
+        chunks = _chunk(valid_texts, self.batch_size)
+        if len(chunks) == 1 or self.max_concurrency <= 1:
+            results = [self._request(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(chunks)),
+                thread_name_prefix="embeddings",
+            ) as pool:
+                results = list(pool.map(self._request, chunks))
 
-                if response.status_code != 200:
-                    raise EmbeddingsError(
-                        f"API error: {response.status_code} - {response.text}"
-                    )
-
-                data = response.json()
-
-                if "data" not in data:
-                    raise EmbeddingsError(
-                        f"Invalid response format: missing 'data' field"
-                    )
-
-                embeddings = []
-                for item in data["data"]:
-                    embedding = item.get("embedding")
-                    if embedding is None:
-                        raise EmbeddingsError(
-                            f"Invalid response format: missing 'embedding' field"
-                        )
-                    embeddings.append(embedding)
-
-                # Cache dimensions
-                if embeddings and self._cached_dimensions is None:
-                    self._cached_dimensions = len(embeddings[0])
-
-                return embeddings
-
-        except httpx.TimeoutException as e:
-            raise EmbeddingsError(f"Request timeout: {e}")
-        except httpx.ConnectError as e:
-            raise EmbeddingsError(f"Connection error: {e}")
-        except ConnectionError as e:
-            raise EmbeddingsError(f"Connection error: {e}")
-        except EmbeddingsError:
-            raise
-        except Exception as e:
-            raise EmbeddingsError(f"Unexpected error: {e}")
+        return [embedding for chunk in results for embedding in chunk]
 
     def get_dimensions(self) -> int:
         """Get the embedding dimension for the configured model.
@@ -270,12 +377,353 @@ class EmbeddingsClient:
         return truncated
 
 
+# =============================================================================
+# MICRO-BATCHER
+# =============================================================================
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embed() calls from many threads into batches.
+
+    Each call queues its text and blocks on a future. A background thread
+    sends whatever has queued once max_batch_size texts are waiting or
+    max_latency seconds have passed since the first one arrived.
+    """
+
+    def __init__(
+        self,
+        client: EmbeddingsClient,
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            client: Client used to send batches.
+            max_batch_size: Maximum texts per batch.
+            max_latency: Seconds to wait for a batch to fill.
+        """
+        self.client = client
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_latency = max_latency
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, text: str) -> Future:
+        """Queue a text for embedding.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Future resolving to the embedding vector, or None for empty text.
+
+        Raises:
+            EmbeddingsError: If the batcher has been closed.
+        """
+        future: Future = Future()
+        if not text or not text.strip():
+            future.set_result(None)
+            return future
+
+        with self._lock:
+            if self._closed:
+                raise EmbeddingsError("Embedding batcher is closed")
+            # Threads do not survive fork, so a child restarts its own
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((text, future))
+
+        return future
+
+    def embed(self, text: str, timeout: Optional[float] = None) -> Optional[list[float]]:
+        """Embed a text as part of the next batch.
+
+        Args:
+            text: Text to embed.
+            timeout: Seconds to wait for the result.
+
+        Returns:
+            Embedding vector, or None for empty text.
+
+        Raises:
+            EmbeddingsError: If the batch request fails.
+        """
+        return self.submit(text).result(timeout)
+
+    def _run(self) -> None:
+        """Collect queued texts into batches until closed."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._send(batch)
+            if stop:
+                return
+
+    def _send(self, batch: list[tuple[str, Future]]) -> None:
+        """Embed a batch and resolve its futures."""
+        try:
+            embeddings = self.client.embed_batch([text for text, _ in batch])
+        except Exception as e:
+            error = _wrap_error(e)
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            future.set_result(embedding)
+
+    def close(self) -> None:
+        """Send any queued texts and stop the background thread."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+
+
+_batchers: dict[tuple, EmbeddingBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_embedding_batcher(
+    url: str,
+    model: str,
+    api_key: Optional[str] = None,
+    max_batch_size: int = DEFAULT_BATCH_SIZE,
+    max_latency: float = DEFAULT_MAX_LATENCY,
+    **client_options: Any,
+) -> EmbeddingBatcher:
+    """Get the process-wide batcher for an embeddings endpoint.
+
+    Callers on separate threads share it, so their single-text embeds are
+    sent together instead of as one request each.
+
+    Args:
+        url: Base URL for the embeddings API.
+        model: Model name to use for embeddings.
+        api_key: Optional API key for authentication.
+        max_batch_size: Maximum texts per batch, used only on creation.
+        max_latency: Seconds to wait for a batch to fill, used only on creation.
+        **client_options: Extra EmbeddingsClient arguments, used only when
+            the batcher is first created.
+
+    Returns:
+        Shared EmbeddingBatcher.
+    """
+    key = (os.getpid(), url, model, api_key)
+    with _batchers_lock:
+        batcher = _batchers.get(key)
+        if batcher is None:
+            client = EmbeddingsClient(url=url, model=model, api_key=api_key, **client_options)
+            batcher = EmbeddingBatcher(
+                client, max_batch_size=max_batch_size, max_latency=max_latency
+            )
+            _batchers[key] = batcher
+    return batcher
+
+
+# =============================================================================
+# ASYNC CLIENT
+# =============================================================================
+
+
+class AsyncEmbeddingsClient:
+    """Asyncio client for the /v1/embeddings endpoint.
+
+    embed_batch() splits its texts into batches of at most batch_size and
+    keeps up to max_concurrency batch requests in flight, so a single
+    worker process can keep the embedding server busy.
+
+    The underlying connection pool is bound to the event loop that first
+    used it and is replaced if the client is used from another loop.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        """Initialize the async embeddings client.
+
+        Args:
+            url: Base URL for the embeddings API.
+            model: Model name to use for embeddings.
+            api_key: Optional API key for authentication.
+            timeout: Request timeout in seconds.
+            batch_size: Maximum texts per request.
+            max_concurrency: Maximum requests in flight.
+            max_connections: Size of the connection pool.
+        """
+        self.url = url.rstrip("/")
+        self.model = model
+        self.api_key = api_key
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_connections = max_connections
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get request headers including auth if configured."""
+        headers = {
+            "Content-Type": "application/json",
+        }
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def _request(self, texts: list[str]) -> list[list[float]]:
+        """Send one /v1/embeddings request, bounded by max_concurrency.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Embedding vectors in input order.
+
+        Raises:
+            EmbeddingsError: If the API request fails.
+        """
+        client = self._get_client()
+        async with self._semaphore:
+            try:
+                response = await client.post(
+                    f"{self.url}/v1/embeddings",
+                    headers=self._get_headers(),
+                    json={
+                        "input": texts,
+                        "model": self.model,
+                    },
+                )
+                return _parse_embeddings(response, len(texts))
+            except Exception as e:
+                raise _wrap_error(e) from e
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple texts.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embedding vectors. Empty texts are filtered out.
+
+        Raises:
+            EmbeddingsError: If any batch request fails.
+        """
+        valid_texts = [t for t in texts if t and t.strip()]
+        if not valid_texts:
+            return []
+
+        results = await asyncio.gather(
+            *(self._request(chunk) for chunk in _chunk(valid_texts, self.batch_size))
+        )
+        return [embedding for chunk in results for embedding in chunk]
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+_async_clients: dict[tuple, AsyncEmbeddingsClient] = {}
+
+
+def get_async_embeddings_client(
+    url: str,
+    model: str,
+    api_key: Optional[str] = None,
+    **options: Any,
+) -> AsyncEmbeddingsClient:
+    """Get the process-wide async client for an embeddings endpoint.
+
+    Sharing one client per process lets batches from separate tasks reuse
+    connections and share the concurrency limit.
+
+    Args:
+        url: Base URL for the embeddings API.
+        model: Model name to use for embeddings.
+        api_key: Optional API key for authentication.
+        **options: Extra AsyncEmbeddingsClient arguments, used only when
+            the client is first created.
+
+    Returns:
+        Shared AsyncEmbeddingsClient.
+    """
+    key = (os.getpid(), url, model, api_key)
+    client = _async_clients.get(key)
+    if client is None:
+        client = AsyncEmbeddingsClient(url=url, model=model, api_key=api_key, **options)
+        _async_clients[key] = client
+    return client
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
 
 
 __all__ = [
+    "AsyncEmbeddingsClient",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_MAX_CONCURRENCY",
+    "DEFAULT_MAX_LATENCY",
+    "EmbeddingBatcher",
     "EmbeddingsClient",
     "EmbeddingsError",
+    "close_http_clients",
+    "get_async_embeddings_client",
+    "get_embedding_batcher",
 ]
@@ -0,0 +1,409 @@
+"""Sampled, asynchronous capture of LLM prompts and responses.
+
+Logging every prompt through the application logger puts megabytes of
+synchronous I/O on the request path of each analysis. Instead, the
+inference client hands each exchange to a PromptLog, which:
+
+- samples: only PROMPT_LOG_SAMPLE_RATE of exchanges are kept, unless
+  capture is forced for the current task with capture_scope(force=True)
+- writes off the hot path: records go onto a bounded queue drained by a
+  daemon thread. When the queue is full, records are dropped and counted
+  (prompt_log_dropped) rather than blocking the caller.
+- redacts: emails, phone numbers, credentials in URLs and key/token/password
+  values are masked in the writer thread before anything reaches disk
+- compresses and rotates: records are written as gzip-compressed JSON lines,
+  one file per process at a time, rotated by size and pruned to
+  PROMPT_LOG_BACKUP_COUNT files
+
+Scopes are context variables, so tags and forced capture set around an
+analysis follow it into every agent run with asyncio.gather.
+
+Usage:
+    with capture_scope(force=True, lead_id=lead_id):
+        await service.analyze_lead(lead_id)   # every exchange captured, tagged
+
+    # Read captures back
+    with gzip.open(path, "rt") as f:
+        records = [json.loads(line) for line in f]
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+PROMPT_LOG_PREFIX = "prompts"
+
+# Default uncompressed size of one log file before rotating (50 MB)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Default number of log files kept
+DEFAULT_BACKUP_COUNT = 20
+
+# Default number of records buffered for the writer thread
+DEFAULT_QUEUE_SIZE = 1000
+
+
+# =============================================================================
+# SCOPES
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _CaptureScope:
+    """Capture settings for the current task."""
+
+    force: bool = False
+    tags: dict[str, Any] = field(default_factory=dict)
+
+
+_scope: ContextVar[_CaptureScope] = ContextVar("prompt_capture_scope", default=_CaptureScope())
+
+
+@contextmanager
+def capture_scope(force: bool = False, **tags: Any) -> Iterator[None]:
+    """Tag, and optionally force capture of, exchanges made inside the block.
+
+    Scopes nest: tags accumulate and forcing is inherited.
+
+    Args:
+        force: Capture every exchange instead of a sample
+        **tags: Fields added to each captured record (lead_id, agent, ...)
+    """
+    parent = _scope.get()
+    token = _scope.set(
+        _CaptureScope(force=force or parent.force, tags={**parent.tags, **tags})
+    )
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def add_capture_tags(**tags: Any) -> None:
+    """Add tags to the current scope, e.g. an ID only known part way through.
+
+    Args:
+        **tags: Fields added to each captured record
+    """
+    scope = _scope.get()
+    _scope.set(replace(scope, tags={**scope.tags, **tags}))
+
+
+# =============================================================================
+# REDACTION
+# =============================================================================
+
+
+_REDACTIONS = [
+    # Credentials embedded in URLs
+    (re.compile(r"://[^/\s:@]+:[^/\s@]+@"), "://[redacted]@"),
+    # key=value / key: value secrets and bearer tokens
+    (
+        re.compile(r"(?i)\b(api[_-]?key|access[_-]?token|token|secret|password)(\s*[:=]\s*)[^\s,;\"']+"),
+        r"\1\2[redacted]",
+    ),
+    (re.compile(r"(?i)\b(bearer\s+)[\w.~+/=-]+"), r"\1[redacted]"),
+    (re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"), "[email]"),
+    (re.compile(r"(?<![\w+])(?:\+?\d{1,3}[\s.-])?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}(?!\w)"), "[phone]"),
+]
+
+
+def redact_text(text: str) -> str:
+    """Mask emails, phone numbers and secrets in text.
+
+    Args:
+        text: Text to redact.
+
+    Returns:
+        Text with sensitive values replaced by placeholders.
+    """
+    for pattern, replacement in _REDACTIONS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _redact(value: Any) -> Any:
+    """Redact every string in a JSON-like value."""
+    if isinstance(value, str):
+        return redact_text(value)
+    if isinstance(value, dict):
+        return {k: _redact(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_redact(v) for v in value]
+    return value
+
+
+# =============================================================================
+# FILES
+# =============================================================================
+
+
+class RotatingGzipWriter:
+    """Appends lines to gzip files, rotating by uncompressed size.
+
+    File names embed the creation time and process ID, so processes sharing
+    a directory never write to the same file. Pruning keeps the newest
+    backup_count files across all processes.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
+        """Initialize the writer.
+
+        Args:
+            directory: Directory for log files (created if missing)
+            max_bytes: Uncompressed bytes per file before rotating
+            backup_count: Files kept in the directory
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file: Optional[gzip.GzipFile] = None
+        self._written = 0
+        self._sequence = 0
+
+    def write(self, line: str) -> None:
+        """Append one line, rotating first if the current file is full."""
+        if self._file is None or self._written >= self.max_bytes:
+            self._rotate()
+        data = (line + "\n").encode("utf-8")
+        self._file.write(data)
+        self._written += len(data)
+
+    def flush(self) -> None:
+        """Flush compressed data so completed records are readable."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the current file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self) -> None:
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        self._sequence += 1
+        name = f"{PROMPT_LOG_PREFIX}-{stamp}-{os.getpid()}-{self._sequence:04d}.jsonl.gz"
+        self._file = gzip.open(self.directory / name, "wb")
+        self._written = 0
+        self._prune()
+
+    def _prune(self) -> None:
+        files = sorted(self.directory.glob(f"{PROMPT_LOG_PREFIX}-*.jsonl.gz"))
+        for old in files[: max(0, len(files) - self.backup_count)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+# =============================================================================
+# PROMPT LOG
+# =============================================================================
+
+
+class PromptLog:
+    """Samples LLM exchanges and writes them from a background thread."""
+
+    def __init__(
+        self,
+        directory: Optional[str],
+        sample_rate: float = 0.0,
+        redact: bool = True,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """Initialize the prompt log.
+
+        Args:
+            directory: Directory for log files; None disables capture
+            sample_rate: Fraction of exchanges captured outside forced scopes
+            redact: Mask sensitive values before writing
+            max_bytes: Uncompressed bytes per file before rotating
+            backup_count: Files kept in the directory
+            queue_size: Records buffered before new ones are dropped
+        """
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.redact = redact
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any exchange can be captured."""
+        return bool(self.directory)
+
+    def should_capture(self) -> bool:
+        """Decide whether to capture the current exchange."""
+        if not self.directory:
+            return False
+        if _scope.get().force:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def record(self, kind: str, **fields: Any) -> bool:
+        """Capture an exchange if sampled, without blocking.
+
+        Args:
+            kind: Exchange type ("chat", "completion")
+            **fields: JSON-serializable record fields (messages, response, ...)
+
+        Returns:
+            True if the record was queued for writing
+        """
+        if not self.should_capture():
+            return False
+
+        entry = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "kind": kind,
+            **_scope.get().tags,
+            **fields,
+        }
+
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            from rediska_core.observability.metrics import get_collector
+
+            self.dropped += 1
+            get_collector().increment("prompt_log_dropped")
+            return False
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued record has been written.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the queue drained in time
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write queued records and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def _ensure_writer(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="prompt-log-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        writer = RotatingGzipWriter(self.directory, self.max_bytes, self.backup_count)
+        try:
+            while True:
+                try:
+                    entry = self._queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+
+                if entry is None:
+                    self._queue.task_done()
+                    return
+
+                try:
+                    if self.redact:
+                        entry = _redact(entry)
+                    writer.write(json.dumps(entry, default=str))
+                    if self._queue.empty():
+                        writer.flush()
+                except Exception as e:
+                    logger.warning(f"Failed to write prompt log record: {e}")
+                finally:
+                    self._queue.task_done()
+        finally:
+            writer.close()
+
+
+# Prompt logs by process ID; the writer thread does not survive a fork
+_prompt_logs: dict[int, PromptLog] = {}
+
+
+def get_prompt_log() -> PromptLog:
+    """Get the process-wide prompt log configured in settings.
+
+    Returns:
+        Shared PromptLog (disabled when PROMPT_LOG_DIR is not set)
+    """
+    pid = os.getpid()
+    prompt_log = _prompt_logs.get(pid)
+    if prompt_log is None:
+        from rediska_core.config import get_settings
+
+        settings = get_settings()
+        prompt_log = PromptLog(
+            directory=settings.prompt_log_dir,
+            sample_rate=settings.prompt_log_sample_rate,
+            redact=settings.prompt_log_redact,
+            max_bytes=settings.prompt_log_max_bytes,
+            backup_count=settings.prompt_log_backup_count,
+            queue_size=settings.prompt_log_queue_size,
+        )
+        _prompt_logs.clear()
+        _prompt_logs[pid] = prompt_log
+    return prompt_log
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "PROMPT_LOG_PREFIX",
+    "PromptLog",
+    "RotatingGzipWriter",
+    "add_capture_tags",
+    "capture_scope",
+    "get_prompt_log",
+    "redact_text",
+]
@@ -2,9 +2,14 @@
 
 Implements:
 - Token bucket algorithm for rate limiting (requests per minute)
-- Inflight concurrency limiting (max concurrent requests)
+- Inflight concurrency limiting with per-holder leases
+- Refill adaptation from provider rate limit headers
 - Exponential backoff strategy for 429/5xx errors
 
+Token and lease checks run in a single Lua script, so concurrent API and
+worker processes sharing a bucket cannot oversubscribe it. Leases expire on
+their own, so a crashed process cannot leak concurrency slots.
+
 Usage:
     config = RateLimitConfig(provider_id="reddit", requests_per_minute=60)
     limiter = RateLimiter(redis_client, config)
@@ -12,25 +17,32 @@ Usage:
     async with limiter:
         # Make API call
         response = await provider.api_call()
+
+    # Shared, per-process limiter for a provider client ID
+    limiter = get_provider_rate_limiter("reddit", client_id)
 """
 
 import asyncio
+import logging
 import random
 import time
+import uuid
+import weakref
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Optional, Protocol
+from typing import Any, Optional, Protocol
+
+logger = logging.getLogger(__name__)
 
 
 class AsyncRedisProtocol(Protocol):
     """Protocol for async Redis client."""
 
-    async def get(self, key: str) -> Optional[bytes]: ...
-    async def set(self, key: str, value: str) -> Any: ...
-    async def incr(self, key: str) -> int: ...
-    async def decr(self, key: str) -> int: ...
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> Any: ...
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any: ...
+    async def hmget(self, key: str, *fields: str) -> list[Optional[bytes]]: ...
+    async def zcount(self, key: str, min: Any, max: Any) -> int: ...
+    async def zrem(self, key: str, *members: str) -> int: ...
     async def delete(self, *keys: str) -> int: ...
-    async def expire(self, key: str, seconds: int) -> bool: ...
-    def pipeline(self) -> Any: ...
 
 
 class RateLimitExceeded(Exception):
@@ -39,21 +51,121 @@ class RateLimitExceeded(Exception):
     pass
 
 
+# =============================================================================
+# LUA SCRIPTS
+# =============================================================================
+
+# Take a token and/or a concurrency lease in one atomic step.
+#
+# KEYS[1]: bucket hash (tokens, ts, rate, rate_until)
+# KEYS[2]: lease sorted set (member = holder, score = expiry ms)
+# ARGV: now_ms, rate_per_sec, capacity, max_concurrent, lease_ttl_ms,
+#       holder, take_token (0/1), take_lease (0/1)
+#
+# Returns {1, 0} on success, or {0, retry_after_ms} when the bucket is
+# empty or every lease is held.
+ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local max_concurrent = tonumber(ARGV[4])
+local lease_ttl = tonumber(ARGV[5])
+local holder = ARGV[6]
+local take_token = ARGV[7] == '1'
+local take_lease = ARGV[8] == '1'
+
+if take_lease then
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+    if redis.call('ZCARD', KEYS[2]) >= max_concurrent then
+        return {0, 50}
+    end
+end
+
+if take_token then
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'rate', 'rate_until')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    local override_until = tonumber(state[4]) or 0
+    if override_until > now and state[3] then
+        rate = math.min(rate, tonumber(state[3]))
+    end
+
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+    if tokens < 1 then
+        redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+        if rate <= 0 then
+            return {0, math.max(override_until - now, 100)}
+        end
+        return {0, math.ceil((1 - tokens) * 1000 / rate)}
+    end
+
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - 1), 'ts', tostring(now))
+    redis.call('PEXPIRE', KEYS[1], 3600000)
+end
+
+if take_lease then
+    redis.call('ZADD', KEYS[2], now + lease_ttl, holder)
+    redis.call('PEXPIRE', KEYS[2], lease_ttl * 2)
+end
+
+return {1, 0}
+"""
+
+# Slow the bucket down to the budget reported by the provider.
+#
+# KEYS[1]: bucket hash
+# ARGV: now_ms, remaining requests, reset_ms until the window resets
+ADAPT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local remaining = tonumber(ARGV[2])
+local reset_ms = tonumber(ARGV[3])
+
+local rate = 0
+if reset_ms > 0 then
+    rate = remaining * 1000 / reset_ms
+end
+
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens == nil or tokens > remaining then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(remaining), 'ts', tostring(now))
+end
+
+redis.call('HSET', KEYS[1], 'rate', tostring(rate), 'rate_until', tostring(now + reset_ms))
+redis.call('PEXPIRE', KEYS[1], 3600000)
+return 1
+"""
+
+
+def _script_sha(script: str) -> str:
+    """SHA1 digest Redis uses to identify a cached script."""
+    import hashlib
+
+    return hashlib.sha1(script.encode()).hexdigest()
+
+
+ACQUIRE_SHA = _script_sha(ACQUIRE_SCRIPT)
+ADAPT_SHA = _script_sha(ADAPT_SCRIPT)
+
+
 @dataclass
 class RateLimitConfig:
     """Configuration for rate limiting a provider.
 
     Attributes:
-        provider_id: Unique identifier for the provider (e.g., "reddit").
+        provider_id: Unique identifier for the bucket (e.g., "reddit" or
+            "reddit:{client_id}").
         requests_per_minute: Maximum requests per minute (token refill rate).
         max_concurrent: Maximum concurrent requests allowed.
         bucket_size: Maximum tokens in bucket (burst capacity).
+        lease_ttl_seconds: How long a concurrency lease lives if its holder
+            never releases it.
     """
 
     provider_id: str
     requests_per_minute: int = 60
     max_concurrent: int = 10
     bucket_size: int = 0  # 0 means same as requests_per_minute
+    lease_ttl_seconds: float = 60.0
 
     def __post_init__(self):
         if self.bucket_size == 0:
@@ -169,68 +281,143 @@ class RateLimiter:
     """Redis-backed rate limiter combining token bucket and concurrency limiting.
 
     Uses Redis keys:
-    - rate:{provider_id}:tokens - Current token count
-    - rate:{provider_id}:last_refill - Timestamp of last refill
-    - rate:{provider_id}:inflight - Current inflight request count
+    - rate:{provider_id}:bucket - Hash of tokens, last refill time and any
+      header-derived refill rate override
+    - rate:{provider_id}:leases - Sorted set of concurrency lease holders
+      scored by expiry time
+
+    Every acquire is one EVALSHA round trip.
     """
 
-    def __init__(self, redis: AsyncRedisProtocol, config: RateLimitConfig):
+    def __init__(
+        self,
+        redis: Optional[AsyncRedisProtocol],
+        config: RateLimitConfig,
+        redis_url: Optional[str] = None,
+    ):
         """Initialize the rate limiter.
 
         Args:
-            redis: Async Redis client.
+            redis: Async Redis client. If None, a client is created from
+                redis_url for each event loop the limiter is used on.
             config: Rate limit configuration.
+            redis_url: Redis URL used when no client is given.
         """
         self.redis = redis
         self.config = config
+        self._redis_url = redis_url
+        # Keyed by the loop object (not id(), which is reused after a loop is
+        # garbage collected), so a client is never handed to a new loop
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         # Redis key names
-        self._tokens_key = f"rate:{config.provider_id}:tokens"
-        self._refill_key = f"rate:{config.provider_id}:last_refill"
-        self._inflight_key = f"rate:{config.provider_id}:inflight"
+        self._bucket_key = f"rate:{config.provider_id}:bucket"
+        self._leases_key = f"rate:{config.provider_id}:leases"
 
         # Calculate refill rate (tokens per second)
         self._refill_rate = config.requests_per_minute / 60.0
 
+        # Leases taken through acquire() and released by release()
+        self._holders: list[str] = []
+
+    def _get_redis(self) -> Any:
+        """Get the Redis client for the running event loop."""
+        if self.redis is not None:
+            return self.redis
+
+        # redis.asyncio connections are bound to the loop that opened them
+        loop = asyncio.get_running_loop()
+        client = self._loop_clients.get(loop)
+        if client is None:
+            import redis.asyncio as aioredis
+
+            self._evict_clients(keep=loop)
+
+            url = self._redis_url
+            if url is None:
+                from rediska_core.config import get_settings
+
+                url = get_settings().redis_url
+            client = aioredis.from_url(url, socket_connect_timeout=2, socket_timeout=2)
+            self._loop_clients[loop] = client
+        return client
+
+    def _evict_clients(self, keep: asyncio.AbstractEventLoop) -> None:
+        """Close and forget the clients of every loop except keep.
+
+        A client whose loop is still running elsewhere is closed on that
+        loop; one whose loop has stopped cannot be closed cleanly and is
+        dropped (its sockets close when it is collected).
+        """
+        for loop, client in list(self._loop_clients.items()):
+            if loop is keep:
+                continue
+            del self._loop_clients[loop]
+            if not loop.is_closed() and loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                logger.debug(
+                    f"Discarding Redis client for {self.config.provider_id} "
+                    f"rate limiter from a stopped event loop"
+                )
+
+    async def aclose(self) -> None:
+        """Close the Redis client opened for the running event loop."""
+        if self.redis is not None:
+            return
+        client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def _run_script(self, script: str, sha: str, keys: list[str], args: list[Any]) -> Any:
+        """Run a cached Lua script, loading it on first use."""
+        client = self._get_redis()
+        try:
+            return await client.evalsha(sha, len(keys), *keys, *args)
+        except Exception as e:
+            if "NOSCRIPT" not in str(e):
+                raise
+            return await client.eval(script, len(keys), *keys, *args)
+
+    async def _try_acquire(
+        self,
+        take_token: bool,
+        take_lease: bool,
+        holder: str = "",
+    ) -> tuple[bool, float]:
+        """Run the acquire script once.
+
+        Returns:
+            Tuple of (acquired, seconds to wait before retrying).
+        """
+        result = await self._run_script(
+            ACQUIRE_SCRIPT,
+            ACQUIRE_SHA,
+            [self._bucket_key, self._leases_key],
+            [
+                int(time.time() * 1000),
+                self._refill_rate,
+                self.config.bucket_size,
+                self.config.max_concurrent,
+                int(self.config.lease_ttl_seconds * 1000),
+                holder,
+                1 if take_token else 0,
+                1 if take_lease else 0,
+            ],
+        )
+        acquired, retry_after_ms = int(result[0]), int(result[1])
+        return acquired == 1, retry_after_ms / 1000.0
+
     async def acquire_token(self) -> bool:
         """Attempt to acquire a token from the bucket.
 
         Returns:
             True if token acquired, False if bucket empty.
         """
-        # Get current state
-        tokens_raw = await self.redis.get(self._tokens_key)
-        last_refill_raw = await self.redis.get(self._refill_key)
-
-        now = time.time()
-
-        # Parse current values
-        if tokens_raw is None:
-            # Initialize bucket to full
-            tokens = float(self.config.bucket_size)
-            last_refill = now
-        else:
-            tokens = float(tokens_raw)
-            last_refill = float(last_refill_raw) if last_refill_raw else now
-
-        # Calculate tokens to add based on elapsed time
-        elapsed = now - last_refill
-        tokens_to_add = elapsed * self._refill_rate
-        tokens = min(tokens + tokens_to_add, self.config.bucket_size)
-
-        # Try to consume a token
-        if tokens >= 1:
-            tokens -= 1
-            # Update Redis
-            pipe = self.redis.pipeline()
-            pipe.set(self._tokens_key, str(tokens))
-            pipe.set(self._refill_key, str(now))
-            pipe.expire(self._tokens_key, 3600)  # 1 hour TTL
-            pipe.expire(self._refill_key, 3600)
-            await pipe.execute()
-            return True
-
-        return False
+        acquired, _ = await self._try_acquire(take_token=True, take_lease=False)
+        return acquired
 
     async def release_token(self) -> None:
         """Release a token (no-op for token bucket).
@@ -246,66 +433,102 @@ class RateLimiter:
         Returns:
             True if slot acquired, False if at limit.
         """
-        # Atomically increment inflight counter
-        count = await self.redis.incr(self._inflight_key)
-
-        # Set expiry to prevent leaks from crashed processes
-        await self.redis.expire(self._inflight_key, 300)  # 5 minute TTL
-
-        if count > self.config.max_concurrent:
-            # Over limit, decrement and fail
-            await self.redis.decr(self._inflight_key)
-            return False
-
-        return True
+        holder = uuid.uuid4().hex
+        acquired, _ = await self._try_acquire(take_token=False, take_lease=True, holder=holder)
+        if acquired:
+            self._holders.append(holder)
+        return acquired
 
     async def release_slot(self) -> None:
-        """Release a concurrency slot."""
-        await self.redis.decr(self._inflight_key)
+        """Release a concurrency slot taken by this limiter."""
+        if self._holders:
+            await self.release_lease(self._holders.pop())
 
-    async def acquire(self, wait: bool = False, timeout: float = 30.0) -> bool:
-        """Acquire both token and slot.
+    async def acquire_lease(self, wait: bool = False, timeout: float = 30.0) -> Optional[str]:
+        """Acquire a token and a concurrency lease together.
 
         Args:
             wait: Whether to wait for availability.
             timeout: Maximum time to wait in seconds.
 
         Returns:
-            True if acquired, False if not available (and not waiting).
+            Lease holder ID to pass to release_lease, or None if not
+            available (and not waiting, or the wait timed out).
         """
-        start_time = time.time()
-        attempt = 0
-        backoff = BackoffStrategy(base_delay=0.1, max_delay=5.0)
+        from rediska_core.observability.metrics import get_collector
+
+        started = time.monotonic()
+        deadline = started + timeout
+        holder = uuid.uuid4().hex
+        # Bucket IDs may embed the OAuth client ID; label by provider only
+        labels = {"provider": self.config.provider_id.split(":", 1)[0]}
 
         while True:
-            attempt += 1
-
-            # Try to acquire slot first (faster to check)
-            slot_acquired = await self.acquire_slot()
-            if not slot_acquired:
-                if not wait or (time.time() - start_time) >= timeout:
-                    return False
-                await asyncio.sleep(backoff.get_delay(attempt))
-                continue
+            acquired, retry_after = await self._try_acquire(
+                take_token=True, take_lease=True, holder=holder
+            )
+            if acquired:
+                if wait:
+                    get_collector().record_histogram(
+                        "provider_rate_limit_wait_seconds", time.monotonic() - started, labels
+                    )
+                return holder
+
+            remaining = deadline - time.monotonic()
+            if not wait or remaining <= 0:
+                get_collector().increment("provider_rate_limit_rejections", labels=labels)
+                return None
+
+            # Jitter so waiting processes do not retry in lockstep
+            delay = retry_after * random.uniform(1.0, 1.25)
+            await asyncio.sleep(min(max(delay, 0.01), remaining))
+
+    async def release_lease(self, holder: str) -> None:
+        """Release a concurrency lease.
 
-            # Try to acquire token
-            token_acquired = await self.acquire_token()
-            if token_acquired:
-                return True
+        Args:
+            holder: Holder ID returned by acquire_lease.
+        """
+        await self._get_redis().zrem(self._leases_key, holder)
 
-            # Release slot since we couldn't get token
-            await self.release_slot()
+    async def acquire(self, wait: bool = False, timeout: float = 30.0) -> bool:
+        """Acquire both token and slot.
 
-            if not wait or (time.time() - start_time) >= timeout:
-                return False
+        Args:
+            wait: Whether to wait for availability.
+            timeout: Maximum time to wait in seconds.
 
-            await asyncio.sleep(backoff.get_delay(attempt))
+        Returns:
+            True if acquired, False if not available (and not waiting).
+        """
+        holder = await self.acquire_lease(wait=wait, timeout=timeout)
+        if holder is None:
+            return False
+        self._holders.append(holder)
+        return True
 
     async def release(self) -> None:
         """Release acquired resources."""
         await self.release_slot()
         # Token doesn't need explicit release
 
+    async def update_from_headers(self, remaining: float, reset_seconds: float) -> None:
+        """Adapt the refill rate to the provider's reported budget.
+
+        Spreads the remaining requests evenly over the time left in the
+        provider's window. The configured rate is never exceeded.
+
+        Args:
+            remaining: Requests left in the current window.
+            reset_seconds: Seconds until the window resets.
+        """
+        await self._run_script(
+            ADAPT_SCRIPT,
+            ADAPT_SHA,
+            [self._bucket_key],
+            [int(time.time() * 1000), max(remaining, 0), int(max(reset_seconds, 0) * 1000)],
+        )
+
     async def __aenter__(self) -> "RateLimiter":
         """Async context manager entry."""
         acquired = await self.acquire()
@@ -325,25 +548,75 @@ class RateLimiter:
         Returns:
             Dictionary with current state.
         """
-        tokens_raw = await self.redis.get(self._tokens_key)
-        inflight_raw = await self.redis.get(self._inflight_key)
+        client = self._get_redis()
+        tokens_raw, rate_raw, rate_until_raw = await client.hmget(
+            self._bucket_key, "tokens", "rate", "rate_until"
+        )
+        now_ms = int(time.time() * 1000)
+        inflight = await client.zcount(self._leases_key, now_ms, "+inf")
 
         tokens = int(float(tokens_raw)) if tokens_raw else self.config.bucket_size
-        inflight = int(inflight_raw) if inflight_raw else 0
+        rate_override = None
+        if rate_raw and rate_until_raw and float(rate_until_raw) > now_ms:
+            rate_override = float(rate_raw) * 60
 
         return {
             "provider_id": self.config.provider_id,
             "tokens_available": tokens,
             "bucket_size": self.config.bucket_size,
-            "inflight_count": inflight,
+            "inflight_count": int(inflight or 0),
             "max_concurrent": self.config.max_concurrent,
             "requests_per_minute": self.config.requests_per_minute,
+            "adapted_requests_per_minute": rate_override,
         }
 
     async def reset(self) -> None:
         """Reset rate limiter state to initial values."""
-        pipe = self.redis.pipeline()
-        pipe.set(self._tokens_key, str(self.config.bucket_size))
-        pipe.set(self._refill_key, str(time.time()))
-        pipe.delete(self._inflight_key)
-        await pipe.execute()
+        await self._get_redis().delete(self._bucket_key, self._leases_key)
+        self._holders.clear()
+
+
+# =============================================================================
+# SHARED PROVIDER LIMITERS
+# =============================================================================
+
+
+_provider_limiters: dict[str, RateLimiter] = {}
+
+
+def get_provider_rate_limiter(provider_id: str, client_id: Optional[str] = None) -> RateLimiter:
+    """Get the process-wide limiter for a provider application.
+
+    All API routes and worker tasks calling the provider with the same
+    client ID share one Redis bucket, sized from the provider rate settings
+    (PROVIDER_RATE_QPM_DEFAULT, PROVIDER_RATE_CONCURRENCY_DEFAULT and
+    PROVIDER_RATE_BURST_FACTOR).
+
+    Args:
+        provider_id: Provider identifier (e.g., "reddit").
+        client_id: Provider OAuth client ID the budget belongs to.
+
+    Returns:
+        Shared RateLimiter instance.
+    """
+    bucket_id = f"{provider_id}:{client_id}" if client_id else provider_id
+
+    limiter = _provider_limiters.get(bucket_id)
+    if limiter is None:
+        from rediska_core.config import get_settings
+
+        settings = get_settings()
+        qpm = settings.provider_rate_qpm_default
+        limiter = RateLimiter(
+            None,
+            RateLimitConfig(
+                provider_id=bucket_id,
+                requests_per_minute=qpm,
+                max_concurrent=settings.provider_rate_concurrency_default,
+                bucket_size=max(1, int(qpm * settings.provider_rate_burst_factor)),
+            ),
+            redis_url=settings.redis_url,
+        )
+        _provider_limiters[bucket_id] = limiter
+
+    return limiter
@@ -20,6 +20,7 @@ logging.getLogger("rediska_core").setLevel(logging.DEBUG)
 logging.getLogger("httpx").setLevel(logging.INFO)  # Reduce httpx noise
 logging.getLogger("uvicorn").setLevel(logging.INFO)
 
+from rediska_core.api.middleware.metrics import RequestMetricsMiddleware
 from rediska_core.api.middleware.onboarding import OnboardingGateMiddleware
 from rediska_core.api.routes import accounts as accounts_routes
 from rediska_core.api.routes import agent_prompts as agent_prompts_routes
@@ -39,6 +40,7 @@ from rediska_core.api.routes import search as search_routes
 from rediska_core.api.routes import setup as setup_routes
 from rediska_core.api.routes import sources as sources_routes
 from rediska_core.config import get_settings
+from rediska_core.observability.aggregation import start_metrics_flusher, stop_metrics_flusher
 
 
 @asynccontextmanager
@@ -47,8 +49,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     settings = get_settings()
     app.state.settings = settings
+    # Share this process's metrics with the other API and worker processes
+    start_metrics_flusher()
     yield
     # Shutdown
+    stop_metrics_flusher()
 
 
 app = FastAPI(
@@ -70,6 +75,9 @@ app.add_middleware(
 # Onboarding gate middleware (blocks access until identity is created)
 app.add_middleware(OnboardingGateMiddleware)
 
+# Request latency histograms (outermost, so gated requests are measured too)
+app.add_middleware(RequestMetricsMiddleware)
+
 # Include API routers
 app.include_router(accounts_routes.router)
 app.include_router(agent_prompts_routes.router)
@@ -8,6 +8,7 @@ from rediska_core.observability.logging import (
     configure_logging,
 )
 from rediska_core.observability.metrics import (
+    Histogram,
     MetricsCollector,
     MetricType,
     Metric,
@@ -20,6 +21,7 @@ __all__ = [
     "RequestContext",
     "get_logger",
     "configure_logging",
+    "Histogram",
     "MetricsCollector",
     "MetricType",
     "Metric",
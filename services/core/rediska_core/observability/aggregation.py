@@ -0,0 +1,416 @@
+"""Cross-process metrics aggregation through Redis.
+
+Every API and Celery worker process records into its own in-memory
+MetricsCollector. A RedisMetricsFlusher in each process periodically pushes
+the changes since its last flush to shared Redis hashes in a single
+pipelined round trip, so recording a metric never touches the network.
+
+Redis layout (prefix "rediska:metrics"):
+- {prefix}:series           hash of series key -> JSON [name, labels]
+- {prefix}:counters         hash of series key -> summed counter value
+- {prefix}:histograms       set of histogram series keys
+- {prefix}:histogram:{key}  hash of count, sum, bucket and sketch bin counts
+- {prefix}:gauges:{process} hash of series key -> gauge value, expiring
+                            when the process stops flushing
+
+Counters and histograms are additive, so flushing deltas (HINCRBY) from any
+number of processes yields the same totals as a single process would have
+recorded. Gauges are point-in-time values per process and are exposed with a
+"process" label instead of being summed.
+
+Usage:
+    flusher = start_metrics_flusher()   # at process start
+    ...
+    stop_metrics_flusher()              # at process exit (final flush)
+
+    # Build one collector holding every process's metrics
+    collector = load_aggregated_metrics(redis_client)
+    text = collector.to_prometheus()
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+from typing import Any, Optional
+
+from rediska_core.observability.metrics import Histogram, MetricsCollector, get_collector
+
+logger = logging.getLogger(__name__)
+
+
+METRICS_KEY_PREFIX = "rediska:metrics"
+
+# Default seconds between flushes
+DEFAULT_FLUSH_INTERVAL = 10.0
+
+# Per-process gauges expire after this many missed flush intervals
+GAUGE_TTL_INTERVALS = 3
+
+
+# =============================================================================
+# HISTOGRAM FIELDS
+# =============================================================================
+
+
+def _histogram_fields(data: dict[str, Any]) -> dict[str, int]:
+    """Flatten a serialized histogram into additive integer fields.
+
+    Args:
+        data: Output of Histogram.to_dict()
+
+    Returns:
+        Mapping of Redis hash field to count
+    """
+    fields = {"count": data["count"], "zero": data["zero_count"]}
+    for index, bucket_count in enumerate(data["bucket_counts"]):
+        fields[f"b:{index}"] = bucket_count
+    for key, bin_count in data["positive"].items():
+        fields[f"p:{key}"] = bin_count
+    for key, bin_count in data["negative"].items():
+        fields[f"n:{key}"] = bin_count
+    return fields
+
+
+def _histogram_from_fields(fields: dict[str, str]) -> Optional[Histogram]:
+    """Rebuild a histogram from its Redis hash.
+
+    Min and max are not stored in Redis; they are estimated from the
+    sketch bins.
+
+    Args:
+        fields: Decoded HGETALL result
+
+    Returns:
+        Histogram, or None if the hash is missing its configuration
+    """
+    if "config" not in fields:
+        return None
+
+    config = json.loads(fields["config"])
+    buckets = config["buckets"]
+    data = {
+        "buckets": buckets,
+        "relative_accuracy": config["relative_accuracy"],
+        "bucket_counts": [int(fields.get(f"b:{i}", 0)) for i in range(len(buckets) + 1)],
+        "positive": {},
+        "negative": {},
+        "zero_count": int(fields.get("zero", 0)),
+        "count": int(fields.get("count", 0)),
+        "sum": float(fields.get("sum", 0)),
+        "min": None,
+        "max": None,
+    }
+    for field, value in fields.items():
+        if field.startswith("p:") and int(value):
+            data["positive"][field[2:]] = int(value)
+        elif field.startswith("n:") and int(value):
+            data["negative"][field[2:]] = int(value)
+
+    return Histogram.from_dict(data)
+
+
+def _text(value: Any) -> str:
+    """Decode a Redis reply that may be bytes."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# =============================================================================
+# FLUSHER
+# =============================================================================
+
+
+class RedisMetricsFlusher:
+    """Periodically pushes a collector's changes to Redis.
+
+    Only changes made after the flusher is created are shared, so a forked
+    worker child does not re-send metrics inherited from its parent.
+    """
+
+    def __init__(
+        self,
+        collector: Optional[MetricsCollector] = None,
+        redis_client: Any = None,
+        redis_url: Optional[str] = None,
+        interval: float = DEFAULT_FLUSH_INTERVAL,
+        process_id: Optional[str] = None,
+        prefix: str = METRICS_KEY_PREFIX,
+    ):
+        """Initialize the flusher.
+
+        Args:
+            collector: Collector to export (defaults to the global one)
+            redis_client: Redis client (created from redis_url if omitted)
+            redis_url: Redis URL (defaults to settings.redis_url)
+            interval: Seconds between background flushes
+            process_id: Identifier used for per-process gauges
+            prefix: Redis key prefix
+        """
+        self.collector = collector or get_collector()
+        self.interval = interval
+        self.process_id = process_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.prefix = prefix
+        self._redis = redis_client
+        self._redis_url = redis_url
+
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._known_series: set[str] = set()
+
+        baseline = self.collector.snapshot()
+        self._last_counters: dict[str, float] = baseline["counters"]
+        self._last_histograms: dict[str, dict[str, int]] = {
+            key: _histogram_fields(data) for key, data in baseline["histograms"].items()
+        }
+        self._last_sums: dict[str, float] = {
+            key: data["sum"] for key, data in baseline["histograms"].items()
+        }
+
+    def get_redis(self):
+        """Get Redis client (lazy initialization)."""
+        if self._redis is None:
+            import redis
+
+            if self._redis_url is None:
+                from rediska_core.config import get_settings
+
+                self._redis_url = get_settings().redis_url
+            self._redis = redis.from_url(
+                self._redis_url, socket_connect_timeout=2, socket_timeout=2
+            )
+        return self._redis
+
+    def flush(self) -> bool:
+        """Push changes since the last flush in one pipeline.
+
+        Returns:
+            True if the flush succeeded (or there was nothing to send)
+        """
+        with self._flush_lock:
+            snapshot = self.collector.snapshot()
+            pipe = self.get_redis().pipeline(transaction=False)
+            commands = 0
+
+            new_series = {
+                key: json.dumps(series)
+                for key, series in snapshot["series"].items()
+                if key not in self._known_series
+            }
+            if new_series:
+                pipe.hset(f"{self.prefix}:series", mapping=new_series)
+                commands += 1
+
+            for key, value in snapshot["counters"].items():
+                delta = value - self._last_counters.get(key, 0)
+                if delta:
+                    pipe.hincrbyfloat(f"{self.prefix}:counters", key, delta)
+                    commands += 1
+
+            histogram_fields: dict[str, dict[str, int]] = {}
+            for key, data in snapshot["histograms"].items():
+                fields = _histogram_fields(data)
+                histogram_fields[key] = fields
+                last = self._last_histograms.get(key, {})
+                deltas = {f: n - last.get(f, 0) for f, n in fields.items()}
+                deltas.update({f: -n for f, n in last.items() if f not in fields})
+                deltas = {f: n for f, n in deltas.items() if n}
+                if not deltas:
+                    continue
+
+                hash_key = f"{self.prefix}:histogram:{key}"
+                config = {
+                    "buckets": data["buckets"],
+                    "relative_accuracy": data["relative_accuracy"],
+                }
+                pipe.hsetnx(hash_key, "config", json.dumps(config))
+                for field, delta in deltas.items():
+                    pipe.hincrby(hash_key, field, delta)
+                pipe.hincrbyfloat(hash_key, "sum", data["sum"] - self._last_sums.get(key, 0.0))
+                pipe.sadd(f"{self.prefix}:histograms", key)
+                commands += len(deltas) + 3
+
+            if snapshot["gauges"]:
+                gauge_key = f"{self.prefix}:gauges:{self.process_id}"
+                pipe.hset(gauge_key, mapping=snapshot["gauges"])
+                pipe.expire(gauge_key, max(int(self.interval * GAUGE_TTL_INTERVALS), 60))
+                commands += 2
+
+            if not commands:
+                return True
+
+            try:
+                pipe.execute()
+            except Exception as e:
+                # Keep the old baseline so the changes are retried next flush
+                logger.warning(f"Failed to flush metrics to Redis: {e}")
+                return False
+
+            self._known_series.update(new_series)
+            self._last_counters = snapshot["counters"]
+            self._last_histograms = histogram_fields
+            self._last_sums = {key: data["sum"] for key, data in snapshot["histograms"].items()}
+            return True
+
+    def _run(self) -> None:
+        """Background loop flushing every interval."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Metrics flush failed: {e}")
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the background thread.
+
+        Args:
+            flush: Send any remaining changes before returning
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+
+        if flush:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Final metrics flush failed: {e}")
+
+
+# =============================================================================
+# AGGREGATED READS
+# =============================================================================
+
+
+def load_aggregated_metrics(
+    redis_client: Any,
+    prefix: str = METRICS_KEY_PREFIX,
+) -> MetricsCollector:
+    """Build a collector holding the metrics flushed by every process.
+
+    Args:
+        redis_client: Redis client
+        prefix: Redis key prefix
+
+    Returns:
+        MetricsCollector with the combined counters, gauges and histograms
+    """
+    collector = MetricsCollector()
+
+    series = {
+        _text(key): json.loads(_text(value))
+        for key, value in redis_client.hgetall(f"{prefix}:series").items()
+    }
+
+    for key, value in redis_client.hgetall(f"{prefix}:counters").items():
+        key = _text(key)
+        if key in series:
+            name, labels = series[key]
+            collector.increment(name, float(_text(value)), labels)
+
+    histogram_keys = sorted(_text(k) for k in redis_client.smembers(f"{prefix}:histograms"))
+    pipe = redis_client.pipeline(transaction=False)
+    for key in histogram_keys:
+        pipe.hgetall(f"{prefix}:histogram:{key}")
+    for key, raw_fields in zip(histogram_keys, pipe.execute() if histogram_keys else []):
+        if key not in series:
+            continue
+        histogram = _histogram_from_fields(
+            {_text(f): _text(v) for f, v in raw_fields.items()}
+        )
+        if histogram is not None:
+            name, labels = series[key]
+            collector.merge_histogram(name, histogram, labels)
+
+    gauge_prefix = f"{prefix}:gauges:"
+    for gauge_key in redis_client.scan_iter(match=f"{gauge_prefix}*"):
+        gauge_key = _text(gauge_key)
+        process_id = gauge_key[len(gauge_prefix):]
+        for key, value in redis_client.hgetall(gauge_key).items():
+            key = _text(key)
+            if key in series:
+                name, labels = series[key]
+                collector.set_gauge(name, float(_text(value)), {**labels, "process": process_id})
+
+    return collector
+
+
+# =============================================================================
+# PROCESS-WIDE FLUSHER
+# =============================================================================
+
+
+_flusher: Optional[RedisMetricsFlusher] = None
+
+
+def start_metrics_flusher(interval: Optional[float] = None) -> Optional[RedisMetricsFlusher]:
+    """Start flushing the global collector to Redis from this process.
+
+    Does nothing when settings.metrics_aggregation_enabled is false.
+
+    Args:
+        interval: Seconds between flushes (defaults to settings)
+
+    Returns:
+        The running flusher, or None if aggregation is disabled
+    """
+    global _flusher
+
+    from rediska_core.config import get_settings
+
+    settings = get_settings()
+    if not settings.metrics_aggregation_enabled:
+        return None
+
+    if _flusher is not None:
+        _flusher.stop(flush=False)
+
+    _flusher = RedisMetricsFlusher(
+        redis_url=settings.redis_url,
+        interval=interval or settings.metrics_flush_interval_seconds,
+    )
+    _flusher.start()
+    return _flusher
+
+
+def stop_metrics_flusher() -> None:
+    """Stop this process's flusher after a final flush."""
+    global _flusher
+
+    if _flusher is not None:
+        _flusher.stop(flush=True)
+        _flusher = None
+
+
+def get_metrics_flusher() -> Optional[RedisMetricsFlusher]:
+    """Get this process's flusher, if one is running."""
+    return _flusher
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "DEFAULT_FLUSH_INTERVAL",
+    "METRICS_KEY_PREFIX",
+    "RedisMetricsFlusher",
+    "get_metrics_flusher",
+    "load_aggregated_metrics",
+    "start_metrics_flusher",
+    "stop_metrics_flusher",
+]
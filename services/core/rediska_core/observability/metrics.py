@@ -3,11 +3,20 @@
 Provides simple metrics collection for monitoring:
 - Counters: Monotonically increasing values
 - Gauges: Point-in-time values
-- Histograms: Distribution of values
+- Histograms: Distribution of values, kept in bounded memory
+
+Histograms never store raw observations. Each one keeps fixed
+Prometheus-style buckets for exposition plus a log-bucketed quantile
+sketch (DDSketch) whose percentile estimates are within a configurable
+relative error. Both are mergeable, so histograms recorded in different
+processes can be combined without losing accuracy.
 """
 
+import math
 import os
+import re
 import threading
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -60,18 +69,287 @@ class Metric:
         }
 
 
+# Upper bounds (seconds) for Prometheus histogram buckets
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+# Percentiles reported by get_histogram_stats
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+# Relative error of sketch percentile estimates
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Maximum sketch bins per sign before the lowest bins are collapsed
+DEFAULT_MAX_BINS = 2048
+
+# Magnitudes below this are counted as zero by the sketch
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class Histogram:
+    """Bounded-memory histogram with mergeable quantile estimates.
+
+    Recording a value updates a fixed bucket count, a DDSketch bin and the
+    exact count/sum/min/max, so memory does not grow with the number of
+    observations. Quantiles are accurate to within relative_accuracy of the
+    true value.
+
+    Attributes:
+        buckets: Sorted upper bounds of the fixed buckets
+        bucket_counts: Per-bucket counts (last entry is the +Inf bucket)
+        relative_accuracy: Relative error of quantile estimates
+        count: Number of recorded values
+        sum: Sum of recorded values
+        min: Smallest recorded value
+        max: Largest recorded value
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+    ):
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Upper bounds for the fixed buckets
+            relative_accuracy: Relative error of quantile estimates (0 < a < 1)
+            max_bins: Maximum sketch bins per sign
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        """Sketch bin index for a positive magnitude."""
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _bin_value(self, key: int) -> float:
+        """Representative value of a sketch bin."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        """Fold the lowest bins together until the store fits max_bins."""
+        while len(store) > self.max_bins:
+            lowest, second = sorted(store)[:2]
+            store[second] += store.pop(lowest)
+
+    def record(self, value: float) -> None:
+        """Record a single observation.
+
+        Args:
+            value: Value to record
+        """
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+
+        if value > MIN_INDEXABLE_VALUE:
+            store = self._positive
+            key = self._key(value)
+        elif value < -MIN_INDEXABLE_VALUE:
+            store = self._negative
+            key = self._key(-value)
+        else:
+            self._zero_count += 1
+            return
+
+        store[key] = store.get(key, 0) + 1
+        if len(store) > self.max_bins:
+            self._collapse(store)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or 0 if the histogram is empty
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Negative values in ascending order are the largest magnitudes first
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return max(-self._bin_value(key), self.min)
+
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return min(self._bin_value(key), self.max)
+
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's observations to this one.
+
+        Args:
+            other: Histogram with the same buckets and relative accuracy
+
+        Raises:
+            ValueError: If the histograms are not compatible
+        """
+        if other.buckets != self.buckets or other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different buckets or accuracy")
+
+        if other.count == 0:
+            return
+
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._zero_count += other._zero_count
+
+        for i, bucket_count in enumerate(other.bucket_counts):
+            self.bucket_counts[i] += bucket_count
+
+        for store, other_store in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for key, bin_count in other_store.items():
+                store[key] = store.get(key, 0) + bin_count
+            self._collapse(store)
+
+    def summary(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        """Summarize the histogram.
+
+        Args:
+            percentiles: Quantiles to report, as fractions (0.95 -> "p95")
+
+        Returns:
+            Dictionary with count, min, max, avg and the requested percentiles
+        """
+        if self.count == 0:
+            return {"count": 0, "min": 0, "max": 0, "avg": 0}
+
+        stats = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / self.count,
+        }
+        for q in percentiles:
+            stats[f"p{q * 100:g}"] = self.quantile(q)
+        return stats
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the histogram for transport between processes.
+
+        Returns:
+            JSON-compatible dictionary
+        """
+        return {
+            "buckets": list(self.buckets),
+            "bucket_counts": list(self.bucket_counts),
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): v for k, v in self._positive.items()},
+            "negative": {str(k): v for k, v in self._negative.items()},
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Histogram":
+        """Rebuild a histogram serialized with to_dict.
+
+        Args:
+            data: Dictionary from to_dict
+
+        Returns:
+            Histogram instance
+        """
+        histogram = cls(
+            buckets=tuple(data["buckets"]),
+            relative_accuracy=data["relative_accuracy"],
+        )
+        histogram.bucket_counts = list(data["bucket_counts"])
+        histogram._positive = {int(k): v for k, v in data["positive"].items()}
+        histogram._negative = {int(k): v for k, v in data["negative"].items()}
+        histogram._zero_count = data["zero_count"]
+        histogram.count = data["count"]
+        histogram.sum = data["sum"]
+        if data["count"]:
+            if data.get("min") is None or data.get("max") is None:
+                histogram.min, histogram.max = histogram._sketch_bounds()
+            else:
+                histogram.min = data["min"]
+                histogram.max = data["max"]
+        return histogram
+
+    def _sketch_bounds(self) -> tuple[float, float]:
+        """Estimate min and max from the sketch when exact values are unknown."""
+        values = [-self._bin_value(key) for key in self._negative]
+        values += [self._bin_value(key) for key in self._positive]
+        if self._zero_count:
+            values.append(0.0)
+        return (min(values), max(values)) if values else (0.0, 0.0)
+
+
 class MetricsCollector:
     """Thread-safe metrics collector.
 
     Collects and stores metrics in memory for later retrieval.
     """
 
-    def __init__(self):
-        """Initialize metrics collector."""
+    def __init__(
+        self,
+        percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """Initialize metrics collector.
+
+        Args:
+            percentiles: Default percentiles reported for histograms
+            buckets: Default upper bounds for histogram buckets
+            relative_accuracy: Relative error of histogram percentiles
+        """
         self._lock = threading.RLock()  # Use RLock to allow reentrant locking
         self._counters: dict[str, float] = {}
         self._gauges: dict[str, float] = {}
-        self._histograms: dict[str, list[float]] = {}
+        self._histograms: dict[str, Histogram] = {}
+        # Metric name and labels per key, for exposition
+        self._series: dict[str, tuple[str, dict[str, str]]] = {}
+        self.percentiles = tuple(percentiles)
+        self.buckets = tuple(buckets)
+        self.relative_accuracy = relative_accuracy
 
     def _make_key(self, name: str, labels: Optional[dict[str, str]] = None) -> str:
         """Create a unique key for a metric with labels.
@@ -106,6 +384,8 @@ class MetricsCollector:
         key = self._make_key(name, labels)
         with self._lock:
             self._counters[key] = self._counters.get(key, 0) + value
+            if key not in self._series:
+                self._series[key] = (name, dict(labels or {}))
 
     def set_gauge(
         self,
@@ -123,12 +403,15 @@ class MetricsCollector:
         key = self._make_key(name, labels)
         with self._lock:
             self._gauges[key] = value
+            if key not in self._series:
+                self._series[key] = (name, dict(labels or {}))
 
     def record_histogram(
         self,
         name: str,
         value: float,
         labels: Optional[dict[str, str]] = None,
+        buckets: Optional[tuple[float, ...]] = None,
     ) -> None:
         """Record a value in a histogram.
 
@@ -136,12 +419,44 @@ class MetricsCollector:
             name: Histogram name
             value: Value to record
             labels: Optional labels
+            buckets: Bucket upper bounds, used when the histogram is created
         """
         key = self._make_key(name, labels)
         with self._lock:
-            if key not in self._histograms:
-                self._histograms[key] = []
-            self._histograms[key].append(value)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(
+                    buckets=buckets or self.buckets,
+                    relative_accuracy=self.relative_accuracy,
+                )
+                self._histograms[key] = histogram
+                self._series[key] = (name, dict(labels or {}))
+            histogram.record(value)
+
+    def merge_histogram(
+        self,
+        name: str,
+        histogram: Histogram,
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Merge a histogram recorded elsewhere (e.g. another process).
+
+        Args:
+            name: Histogram name
+            histogram: Histogram to merge in
+            labels: Optional labels
+        """
+        key = self._make_key(name, labels)
+        with self._lock:
+            existing = self._histograms.get(key)
+            if existing is None:
+                existing = Histogram(
+                    buckets=histogram.buckets,
+                    relative_accuracy=histogram.relative_accuracy,
+                )
+                self._histograms[key] = existing
+                self._series[key] = (name, dict(labels or {}))
+            existing.merge(histogram)
 
     def get(
         self,
@@ -169,35 +484,40 @@ class MetricsCollector:
         self,
         name: str,
         labels: Optional[dict[str, str]] = None,
+        percentiles: Optional[tuple[float, ...]] = None,
     ) -> dict[str, float]:
         """Get histogram statistics.
 
         Args:
             name: Histogram name
             labels: Optional labels
+            percentiles: Quantiles to report (defaults to the collector's)
 
         Returns:
-            Dictionary with count, min, max, avg, p50, p95, p99
+            Dictionary with count, min, max, avg and percentiles (p50, p95, p99
+            by default)
         """
         key = self._make_key(name, labels)
         with self._lock:
-            values = self._histograms.get(key, [])
-
-        if not values:
-            return {"count": 0, "min": 0, "max": 0, "avg": 0}
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                return {"count": 0, "min": 0, "max": 0, "avg": 0}
+            return histogram.summary(percentiles or self.percentiles)
 
-        sorted_values = sorted(values)
-        count = len(values)
+    def snapshot(self) -> dict[str, Any]:
+        """Copy the raw metric state for export to another process.
 
-        return {
-            "count": count,
-            "min": sorted_values[0],
-            "max": sorted_values[-1],
-            "avg": sum(values) / count,
-            "p50": sorted_values[int(count * 0.5)],
-            "p95": sorted_values[min(int(count * 0.95), count - 1)],
-            "p99": sorted_values[min(int(count * 0.99), count - 1)],
-        }
+        Returns:
+            Dictionary with counters, gauges, serialized histograms and the
+            (name, labels) of every series, all keyed by series key
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "histograms": {k: h.to_dict() for k, h in self._histograms.items()},
+                "series": {k: (name, dict(labels)) for k, (name, labels) in self._series.items()},
+            }
 
     def get_all(self) -> dict[str, Any]:
         """Get all metrics as a dictionary.
@@ -210,18 +530,93 @@ class MetricsCollector:
                 "counters": dict(self._counters),
                 "gauges": dict(self._gauges),
                 "histograms": {
-                    k: self.get_histogram_stats(k)
-                    for k in self._histograms.keys()
+                    k: histogram.summary(self.percentiles)
+                    for k, histogram in self._histograms.items()
                 },
             }
         return result
 
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text (version 0.0.4)
+        """
+        families: dict[str, tuple[str, list[str]]] = {}
+
+        def family(name: str, metric_type: str) -> list[str]:
+            metric_name = _prometheus_name(name)
+            if metric_name not in families:
+                families[metric_name] = (metric_type, [])
+            return families[metric_name][1]
+
+        with self._lock:
+            for store, metric_type in ((self._counters, "counter"), (self._gauges, "gauge")):
+                for key, value in store.items():
+                    name, labels = self._series[key]
+                    family(name, metric_type).append(
+                        f"{_prometheus_name(name)}{_prometheus_labels(labels)} "
+                        f"{_prometheus_value(value)}"
+                    )
+
+            for key, histogram in self._histograms.items():
+                name, labels = self._series[key]
+                metric_name = _prometheus_name(name)
+                lines = family(name, "histogram")
+
+                cumulative = 0
+                bounds = [_prometheus_value(b) for b in histogram.buckets] + ["+Inf"]
+                for bound, bucket_count in zip(bounds, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    bucket_labels = _prometheus_labels({**labels, "le": bound})
+                    lines.append(f"{metric_name}_bucket{bucket_labels} {cumulative}")
+
+                label_str = _prometheus_labels(labels)
+                lines.append(f"{metric_name}_sum{label_str} {_prometheus_value(histogram.sum)}")
+                lines.append(f"{metric_name}_count{label_str} {histogram.count}")
+
+        output = []
+        for metric_name in sorted(families):
+            metric_type, lines = families[metric_name]
+            output.append(f"# TYPE {metric_name} {metric_type}")
+            output.extend(lines)
+        return "\n".join(output) + "\n" if output else ""
+
     def reset(self) -> None:
         """Reset all metrics to zero."""
         with self._lock:
             self._counters.clear()
             self._gauges.clear()
             self._histograms.clear()
+            self._series.clear()
+
+
+def _prometheus_name(name: str) -> str:
+    """Replace characters not allowed in Prometheus metric names."""
+    name = re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _prometheus_labels(labels: dict[str, str]) -> str:
+    """Format labels as a Prometheus label set."""
+    if not labels:
+        return ""
+
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{_prometheus_name(key)}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _prometheus_value(value: float) -> str:
+    """Format a sample value."""
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
 
 
 class SystemMetrics:
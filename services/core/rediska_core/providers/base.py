@@ -359,3 +359,11 @@ class ProviderAdapter(ABC):
             - On ambiguous failure (timeout, etc.), return success=False, is_ambiguous=True
         """
         ...
+
+    async def aclose(self) -> None:
+        """Release any network resources held by the adapter.
+
+        Adapters that keep persistent connections should override this.
+        The default implementation does nothing.
+        """
+        return None
@@ -15,8 +15,19 @@ Usage:
     conversations = await adapter.list_conversations()
     messages = await adapter.list_messages(conversation_id)
     posts = await adapter.browse_location("r/programming")
+
+    # Connections are pooled per adapter (per identity) and per event loop;
+    # release them when done:
+    await adapter.aclose()
+
+    # Share one request budget across every process using this client ID:
+    adapter = RedditAdapter(
+        ...,
+        rate_limiter=get_provider_rate_limiter("reddit", client_id),
+    )
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
@@ -25,6 +36,7 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+from rediska_core.infrastructure.rate_limiter import RateLimiter
 from rediska_core.providers.base import (
     MessageDirection,
     PaginatedResult,
@@ -48,6 +60,24 @@ from rediska_core.providers.base import (
 MAX_PROFILE_POSTS = 20
 MAX_PROFILE_COMMENTS = 100
 
+# HTTP connection pool defaults
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 5
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 30.0
+
+# Longest time a request waits for the shared rate limit budget
+DEFAULT_RATE_LIMIT_WAIT = 120.0
+
+
+def _h2_available() -> bool:
+    """Check whether the optional h2 package (httpx[http2]) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 class RedditAPIError(Exception):
     """Raised when Reddit API call fails."""
@@ -76,6 +106,13 @@ class RedditAdapter(ProviderAdapter):
         client_secret: str,
         user_agent: str,
         on_token_refresh: Optional[Callable[[str], None]] = None,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: float = DEFAULT_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_wait: float = DEFAULT_RATE_LIMIT_WAIT,
     ):
         """Initialize the Reddit adapter.
 
@@ -86,6 +123,13 @@ class RedditAdapter(ProviderAdapter):
             client_secret: Reddit app client secret.
             user_agent: User-Agent string for API requests.
             on_token_refresh: Optional callback when token is refreshed.
+            http2: Use HTTP/2 if the optional h2 package is installed.
+            max_connections: Upper bound on open connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept alive.
+            timeout: Default request timeout in seconds.
+            rate_limiter: Optional shared limiter enforced on every API call.
+            rate_limit_wait: Max seconds to wait for the rate limiter.
         """
         self.access_token = access_token
         self.refresh_token = refresh_token
@@ -94,11 +138,89 @@ class RedditAdapter(ProviderAdapter):
         self.user_agent = user_agent
         self.on_token_refresh = on_token_refresh
 
+        self._http2 = http2 and _h2_available()
+        if http2 and not self._http2:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rate_limiter = rate_limiter
+        self._rate_limit_wait = rate_limit_wait
+
+    async def __aenter__(self) -> "RedditAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     @property
     def provider_id(self) -> str:
         """Return the provider identifier."""
         return "reddit"
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop.
+
+        httpx connections are bound to the loop that opened them, so a new
+        client is created when the adapter is used from a different loop
+        (e.g. successive asyncio.run() calls in a Celery task).
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            if self._client is not None and self._client_loop is not loop:
+                logger.debug("Event loop changed; opening a new Reddit connection pool")
+                self._discard_client(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=self._timeout,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one is open."""
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.is_closed:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is running:
+            await client.aclose()
+        else:
+            self._discard_client(client, loop)
+
+    @staticmethod
+    def _discard_client(
+        client: httpx.AsyncClient,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        """Close a client owned by another event loop.
+
+        The close is scheduled on the owning loop if it is still running;
+        a client whose loop has stopped cannot be closed cleanly and is
+        dropped with a log message (its sockets close on collection).
+        """
+        if client.is_closed:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        logger.info("Discarding Reddit HTTP client whose event loop is no longer running")
+
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests."""
         return {
@@ -106,18 +228,70 @@ class RedditAdapter(ProviderAdapter):
             "User-Agent": self.user_agent,
         }
 
+    async def _acquire_rate_limit(self) -> Optional[str]:
+        """Wait for a token and concurrency lease from the shared limiter.
+
+        Returns:
+            Lease holder ID, or None if no limiter is configured or Redis
+            is unavailable (requests are not blocked on limiter failures).
+
+        Raises:
+            RedditAPIError: If the budget is not available within
+                rate_limit_wait seconds.
+        """
+        if self._rate_limiter is None:
+            return None
+
+        try:
+            holder = await self._rate_limiter.acquire_lease(
+                wait=True, timeout=self._rate_limit_wait
+            )
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, continuing without it: {e}")
+            return None
+
+        if holder is None:
+            raise RedditAPIError("Timed out waiting for Reddit rate limit budget", 429)
+        return holder
+
+    async def _release_rate_limit(self, holder: Optional[str]) -> None:
+        """Release a lease taken by _acquire_rate_limit."""
+        if holder is None or self._rate_limiter is None:
+            return
+        try:
+            await self._rate_limiter.release_lease(holder)
+        except Exception as e:
+            logger.warning(f"Failed to release rate limit lease: {e}")
+
+    async def _observe_rate_limit_headers(self, response: httpx.Response) -> None:
+        """Adapt the shared limiter to Reddit's X-Ratelimit-* headers."""
+        if self._rate_limiter is None:
+            return
+
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        try:
+            await self._rate_limiter.update_from_headers(float(remaining), float(reset))
+        except ValueError:
+            return
+        except Exception as e:
+            logger.warning(f"Failed to update rate limit from headers: {e}")
+
     async def _refresh_access_token(self) -> None:
         """Refresh the access token using the refresh token."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token,
-                },
-                auth=(self.client_id, self.client_secret),
-                headers={"User-Agent": self.user_agent},
-            )
+        client = self._get_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+            },
+            auth=(self.client_id, self.client_secret),
+            headers={"User-Agent": self.user_agent},
+        )
 
         if response.status_code != 200:
             raise RedditAPIError("Failed to refresh token", response.status_code)
@@ -149,7 +323,9 @@ class RedditAdapter(ProviderAdapter):
         """
         url = f"{self.BASE_URL}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        lease = await self._acquire_rate_limit()
+        try:
+            client = self._get_client()
             if method == "GET":
                 response = await client.get(
                     url, headers=self._get_headers(), params=params
@@ -158,6 +334,10 @@ class RedditAdapter(ProviderAdapter):
                 response = await client.request(
                     method, url, headers=self._get_headers(), params=params
                 )
+        finally:
+            await self._release_rate_limit(lease)
+
+        await self._observe_rate_limit_headers(response)
 
         # Handle 401 by refreshing token and retrying
         if response.status_code == 401 and retry_on_401:
@@ -438,6 +618,78 @@ class RedditAdapter(ProviderAdapter):
             metadata={"request_url": request_url, "browser_url": browser_url, "posts_returned": len(posts)},
         )
 
+    async def browse_location_since(
+        self,
+        location: str,
+        since: Optional[datetime],
+        limit: int = 100,
+        page_size: int = 25,
+        sort: str = "new",
+        time_filter: Optional[str] = None,
+        query: Optional[str] = None,
+    ) -> PaginatedResult[ProviderPost]:
+        """Browse a newest-first listing, stopping at posts already seen.
+
+        Pages of page_size are requested until a post created before since
+        is reached, so a watch that runs often usually needs one small
+        request. Posts created exactly at since are kept; callers dedupe
+        them. Only meaningful for 'new' sorted listings.
+
+        Args:
+            location: Subreddit name (with or without r/ prefix).
+            since: High-water mark; None fetches a single page of limit posts.
+            limit: Maximum posts to return.
+            page_size: Posts requested per page while paging towards since.
+            sort: Sort order (see browse_location).
+            time_filter: Time period (see browse_location).
+            query: Search query string (see browse_location).
+
+        Returns:
+            Posts newer than since, with the first page's metadata.
+        """
+        if since is None:
+            return await self.browse_location(
+                location=location, limit=limit, sort=sort, time_filter=time_filter, query=query,
+            )
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        posts: list[ProviderPost] = []
+        metadata: Optional[dict[str, Any]] = None
+        cursor: Optional[str] = None
+
+        while len(posts) < limit:
+            result = await self.browse_location(
+                location=location,
+                cursor=cursor,
+                limit=min(page_size, limit - len(posts)),
+                sort=sort,
+                time_filter=time_filter,
+                query=query,
+            )
+            if metadata is None:
+                metadata = result.metadata
+
+            # Stickied posts can sit at the top regardless of age
+            reached_since = False
+            for post in result.items:
+                if post.created_at is not None and post.created_at < since:
+                    if not (post.raw_data or {}).get("stickied"):
+                        reached_since = True
+                    continue
+                posts.append(post)
+            if reached_since or not result.has_more or not result.next_cursor:
+                break
+
+            cursor = result.next_cursor
+
+        return PaginatedResult(
+            items=posts[:limit],
+            next_cursor=None,
+            has_more=False,
+            metadata=metadata,
+        )
+
     async def fetch_post(self, post_id: str) -> Optional[ProviderPost]:
         """Fetch a single post by ID."""
         # Remove t3_ prefix if present
@@ -546,6 +798,7 @@ class RedditAdapter(ProviderAdapter):
         self,
         user_id: str,
         limit: int = MAX_PROFILE_POSTS,
+        since: Optional[datetime] = None,
     ) -> list[ProviderProfileItem]:
         """Fetch a user's posts with automatic pagination up to a limit.
 
@@ -555,39 +808,21 @@ class RedditAdapter(ProviderAdapter):
         Args:
             user_id: Username.
             limit: Maximum number of posts to fetch (default: 20).
+            since: Only fetch posts created after this time; paging stops at
+                the first older post.
 
         Returns:
             List of ProviderProfileItem objects (posts only).
         """
-        all_items: list[ProviderProfileItem] = []
-        cursor: Optional[str] = None
-        per_page = min(limit, 100)  # Reddit max is 100 per page
-
-        while len(all_items) < limit:
-            remaining = limit - len(all_items)
-            fetch_count = min(remaining, per_page)
-
-            result = await self.fetch_profile_items(
-                user_id=user_id,
-                item_type=ProfileItemType.POST,
-                cursor=cursor,
-                limit=fetch_count,
-            )
-
-            all_items.extend(result.items)
-
-            if not result.has_more or not result.next_cursor:
-                break
-
-            cursor = result.next_cursor
-
-        logger.info(f"Fetched {len(all_items)} posts for user {user_id} (limit: {limit})")
-        return all_items[:limit]  # Ensure we don't exceed limit
+        items = await self._fetch_user_items(user_id, ProfileItemType.POST, limit, since)
+        logger.info(f"Fetched {len(items)} posts for user {user_id} (limit: {limit}, since: {since})")
+        return items
 
     async def fetch_user_comments(
         self,
         user_id: str,
         limit: int = MAX_PROFILE_COMMENTS,
+        since: Optional[datetime] = None,
     ) -> list[ProviderProfileItem]:
         """Fetch a user's comments with automatic pagination up to a limit.
 
@@ -597,10 +832,27 @@ class RedditAdapter(ProviderAdapter):
         Args:
             user_id: Username.
             limit: Maximum number of comments to fetch (default: 100).
+            since: Only fetch comments created after this time; paging stops
+                at the first older comment.
 
         Returns:
             List of ProviderProfileItem objects (comments only).
         """
+        items = await self._fetch_user_items(user_id, ProfileItemType.COMMENT, limit, since)
+        logger.info(f"Fetched {len(items)} comments for user {user_id} (limit: {limit}, since: {since})")
+        return items
+
+    async def _fetch_user_items(
+        self,
+        user_id: str,
+        item_type: ProfileItemType,
+        limit: int,
+        since: Optional[datetime],
+    ) -> list[ProviderProfileItem]:
+        """Page through a user's newest-first listing, stopping at since."""
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
         all_items: list[ProviderProfileItem] = []
         cursor: Optional[str] = None
         per_page = min(limit, 100)  # Reddit max is 100 per page
@@ -611,19 +863,32 @@ class RedditAdapter(ProviderAdapter):
 
             result = await self.fetch_profile_items(
                 user_id=user_id,
-                item_type=ProfileItemType.COMMENT,
+                item_type=item_type,
                 cursor=cursor,
                 limit=fetch_count,
             )
 
-            all_items.extend(result.items)
+            if since is None:
+                all_items.extend(result.items)
+            else:
+                # Listings are newest first, so the first older item means
+                # everything after it was already seen. Stickied posts are
+                # exempt: they can sit at the top regardless of age.
+                reached_since = False
+                for item in result.items:
+                    if item.created_at is not None and item.created_at <= since:
+                        if not (item.raw_data or {}).get("stickied"):
+                            reached_since = True
+                        continue
+                    all_items.append(item)
+                if reached_since:
+                    break
 
             if not result.has_more or not result.next_cursor:
                 break
 
             cursor = result.next_cursor
 
-        logger.info(f"Fetched {len(all_items)} comments for user {user_id} (limit: {limit})")
         return all_items[:limit]  # Ensure we don't exceed limit
 
     async def fetch_profile_items_with_limit(
@@ -688,7 +953,9 @@ class RedditAdapter(ProviderAdapter):
             SendMessageResult with success status and message ID if available.
         """
         try:
-            async with httpx.AsyncClient() as client:
+            lease = await self._acquire_rate_limit()
+            try:
+                client = self._get_client()
                 response = await client.post(
                     f"{self.BASE_URL}/api/compose",
                     headers=self._get_headers(),
@@ -699,6 +966,10 @@ class RedditAdapter(ProviderAdapter):
                         "text": body,
                     },
                 )
+            finally:
+                await self._release_rate_limit(lease)
+
+            await self._observe_rate_limit_headers(response)
 
             # Check for timeout or connection errors
             if response.status_code == 0:
@@ -741,6 +1012,16 @@ class RedditAdapter(ProviderAdapter):
                 success=True,
             )
 
+        except RedditAPIError as e:
+            # Raised before the request was sent (rate limit budget exhausted)
+            return SendMessageResult(
+                external_message_id="",
+                sent_at=datetime.now(timezone.utc),
+                success=False,
+                error_message=str(e),
+                is_ambiguous=False,
+            )
+
         except httpx.TimeoutException:
             # Timeout - ambiguous, don't know if message was sent
             return SendMessageResult(
@@ -5,6 +5,8 @@ Tests the agent runner harness which provides:
 2. Structured outputs - validate outputs against Pydantic models
 3. Model info recording - capture model metadata for auditing
 4. Voice config injection - inject identity voice into system prompt
+5. Prompt cache hints - context-first layout and slot pinning
+6. Early stop - streaming ends at the first complete structured output
 """
 
 from dataclasses import dataclass
@@ -460,6 +462,43 @@ class TestAgentRun:
         assert result.success
         assert "Hello" in result.output or "help" in result.output
 
+    @pytest.mark.asyncio
+    async def test_run_context_first_shares_prefix(self, mock_inference_client):
+        """Context-first agents should send the input ahead of their instructions."""
+        mock_inference_client.chat.return_value = ChatResponse(
+            content="Done",
+            model_info=ModelInfo(
+                model_name="test-model",
+                provider="test",
+                temperature=0.7,
+                max_tokens=1024,
+                input_tokens=10,
+                output_tokens=20,
+                latency_ms=100,
+            ),
+            finish_reason="stop",
+        )
+
+        for name in ("first", "second"):
+            config = AgentConfig(
+                name=name,
+                system_prompt=f"Run the {name} analysis.",
+                context_first=True,
+                cache_prompt=True,
+                slot_id=1,
+            )
+            harness = AgentHarness(config=config, inference_client=mock_inference_client)
+            await harness.run("Shared profile content")
+
+        calls = mock_inference_client.chat.call_args_list
+        for call, name in zip(calls, ("first", "second")):
+            [message] = call.args[0]
+            assert message.role == "user"
+            assert message.content.startswith("Shared profile content")
+            assert message.content.endswith(f"Run the {name} analysis.")
+            assert call.kwargs["cache_prompt"] is True
+            assert call.kwargs["slot_id"] == 1
+
     @pytest.mark.asyncio
     async def test_run_returns_model_info(self, mock_inference_client, basic_agent_config):
         """Agent run should return model info for auditing."""
@@ -592,6 +631,61 @@ class TestStructuredOutput:
         # Should indicate validation failure
         assert not result.success or result.error is not None
 
+    @pytest.mark.asyncio
+    async def test_stream_json_stops_at_valid_output(self, mock_inference_client):
+        """With stream_json, chat should get a check for a complete valid answer."""
+        config = AgentConfig(
+            name="scoring_agent",
+            output_schema=LeadScoreOutput,
+            stream_json=True,
+        )
+        content = '{"score": 85, "reasons": [], "recommended_action": "contact"}'
+        mock_inference_client.chat.return_value = ChatResponse(
+            content=content,
+            model_info=ModelInfo(
+                model_name="test",
+                provider="test",
+                temperature=0.7,
+                max_tokens=1024,
+                input_tokens=10,
+                output_tokens=20,
+                latency_ms=100,
+            ),
+            finish_reason="stop",
+        )
+
+        harness = AgentHarness(config=config, inference_client=mock_inference_client)
+        result = await harness.run("Score this lead")
+
+        assert result.success
+        stop_when = mock_inference_client.chat.call_args.kwargs["stop_when"]
+        assert not stop_when('{"score": 85, "reasons": ["a}')
+        assert not stop_when('{"invalid": "output"}')
+        assert stop_when(content + "\n\nThe score reflects")
+
+    @pytest.mark.asyncio
+    async def test_no_stream_json_without_schema(self, mock_inference_client, basic_agent_config):
+        """Free-text agents should never be cut short."""
+        basic_agent_config.stream_json = True
+        mock_inference_client.chat.return_value = ChatResponse(
+            content="Hello",
+            model_info=ModelInfo(
+                model_name="test",
+                provider="test",
+                temperature=0.7,
+                max_tokens=1024,
+                input_tokens=1,
+                output_tokens=1,
+                latency_ms=1,
+            ),
+            finish_reason="stop",
+        )
+
+        harness = AgentHarness(config=basic_agent_config, inference_client=mock_inference_client)
+        await harness.run("Hi")
+
+        assert "stop_when" not in mock_inference_client.chat.call_args.kwargs
+
 
 # =============================================================================
 # AGENT RESULT TESTS
@@ -5,6 +5,7 @@ Tests cover:
 1. POST /attachments/upload - multipart file upload
 2. GET /attachments/{id} - streaming download with auth
 3. GET /attachments/{id}/meta - metadata retrieval
+4. DELETE /attachments/{id} - soft delete
 """
 
 import tempfile
@@ -195,3 +196,35 @@ class TestMetadataEndpoint:
 
         # Should return 401, 403, or 404
         assert response.status_code in (401, 403, 404)
+
+
+# =============================================================================
+# DELETE ENDPOINT TESTS
+# =============================================================================
+
+
+class TestDeleteEndpoint:
+    """Tests for DELETE /attachments/{id} endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_delete_returns_404_for_missing(
+        self, client
+    ):
+        """Deleting a non-existent attachment should return 404."""
+        response = await client.delete("/attachments/99999")
+
+        # May require auth first
+        if response.status_code in (401, 403):
+            pytest.skip("Endpoint requires authentication")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delete_requires_authentication(
+        self, client
+    ):
+        """Delete should require authentication."""
+        response = await client.delete("/attachments/1")
+
+        # Should return 401, 403, or 404
+        assert response.status_code in (401, 403, 404)
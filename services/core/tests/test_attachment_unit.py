@@ -129,10 +129,10 @@ class TestAttachmentUpload:
         assert file_path.exists()
         assert file_path.read_bytes() == sample_text_bytes
 
-    def test_upload_generates_unique_storage_key(
+    def test_upload_same_content_shares_storage_key(
         self, attachment_service, sample_text_bytes
     ):
-        """Each upload should have a unique storage key."""
+        """Uploads of the same content share one stored file."""
         result1 = attachment_service.upload(
             file_data=sample_text_bytes,
             filename="test1.txt",
@@ -146,9 +146,14 @@ class TestAttachmentUpload:
             content_type="text/plain",
         )
 
-        # Storage keys should be different (even for same content)
-        # unless we implement deduplication
-        assert result1.storage_key != result2.storage_key
+        other = attachment_service.upload(
+            file_data=b"other content",
+            filename="test1.txt",
+            content_type="text/plain",
+        )
+
+        assert result1.storage_key == result2.storage_key
+        assert other.storage_key != result1.storage_key
 
     def test_upload_stores_original_filename(
         self, db_session, attachment_service, sample_text_bytes
@@ -404,21 +409,18 @@ class TestAttachmentRetrieval:
 class TestStorageKeyGeneration:
     """Tests for storage key generation."""
 
-    def test_storage_key_includes_date_prefix(
+    def test_storage_key_is_content_addressed(
         self, attachment_service, sample_text_bytes
     ):
-        """Storage key should include date-based directory structure."""
+        """Storage key should be derived from the content hash."""
         result = attachment_service.upload(
             file_data=sample_text_bytes,
             filename="test.txt",
             content_type="text/plain",
         )
 
-        # Expect format like: YYYY/MM/DD/uuid.ext
-        parts = result.storage_key.split("/")
-        assert len(parts) >= 3  # At least year/month/filename
-        # First part should be a year
-        assert parts[0].isdigit() and len(parts[0]) == 4
+        sha = result.sha256
+        assert result.storage_key == f"blobs/{sha[:2]}/{sha[2:4]}/{sha}.txt"
 
     def test_storage_key_preserves_extension(
         self, attachment_service, sample_text_bytes
@@ -538,3 +540,149 @@ class TestDeduplication:
         assert result1.attachment_id != result2.attachment_id
         # But same SHA256
         assert result1.sha256 == result2.sha256
+
+
+# =============================================================================
+# STREAMING AND SHARED BLOB TESTS
+# =============================================================================
+
+
+class TestStreamingUpload:
+    """Tests for streamed uploads into shared blobs."""
+
+    def test_upload_stream_from_file_object(
+        self, attachment_service, temp_storage_path, sample_text_bytes
+    ):
+        """File objects are streamed in chunks and hashed on the way."""
+        with patch("rediska_core.domain.services.attachment.STREAM_CHUNK_BYTES", 8):
+            result = attachment_service.upload_stream(
+                source=io.BytesIO(sample_text_bytes),
+                filename="streamed.txt",
+                content_type="text/plain",
+            )
+
+        assert result.sha256 == hashlib.sha256(sample_text_bytes).hexdigest()
+        assert result.size_bytes == len(sample_text_bytes)
+        assert (Path(temp_storage_path) / result.storage_key).read_bytes() == sample_text_bytes
+        assert not list((Path(temp_storage_path) / ".tmp").iterdir())
+
+    def test_upload_stream_too_large_leaves_nothing(
+        self, db_session, temp_storage_path
+    ):
+        """Oversized streams stop early and leave no temporary file."""
+        service = AttachmentService(db=db_session, storage_path=temp_storage_path, max_size_bytes=10)
+        chunks_read = []
+
+        def chunks():
+            for chunk in (b"12345", b"67890", b"abcde", b"fghij"):
+                chunks_read.append(chunk)
+                yield chunk
+
+        with pytest.raises(FileTooLargeError):
+            service.upload_stream(chunks(), filename="big.txt", content_type="text/plain")
+
+        assert len(chunks_read) == 3
+        assert not list((Path(temp_storage_path) / ".tmp").iterdir())
+
+    def test_invalid_mime_type_rejected_before_reading(self, attachment_service):
+        """MIME validation happens before the stream is consumed."""
+        source = MagicMock()
+
+        with pytest.raises(InvalidMimeTypeError):
+            attachment_service.upload_stream(
+                source, filename="x.exe", content_type="application/x-msdownload"
+            )
+
+        source.read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_astage_then_upload_staged(
+        self, attachment_service, sample_image_bytes
+    ):
+        """Async downloads are staged to disk, then stored."""
+        async def chunks():
+            yield sample_image_bytes[:20]
+            yield sample_image_bytes[20:]
+
+        staged = await attachment_service.astage(chunks())
+        result = attachment_service.upload_staged(
+            staged, filename="image.png", content_type="image/png"
+        )
+
+        assert result.sha256 == hashlib.sha256(sample_image_bytes).hexdigest()
+        assert not staged.path.exists()
+        assert (result.width_px, result.height_px) == (1, 1)
+
+    def test_duplicate_image_reuses_metadata(
+        self, attachment_service, sample_image_bytes
+    ):
+        """A known image's dimensions are copied instead of re-read."""
+        first = attachment_service.upload(
+            file_data=sample_image_bytes, filename="a.png", content_type="image/png"
+        )
+
+        with patch.object(attachment_service, "_extract_image_dimensions") as extract:
+            second = attachment_service.upload(
+                file_data=sample_image_bytes, filename="b.png", content_type="image/png"
+            )
+
+        extract.assert_not_called()
+        assert (second.width_px, second.height_px) == (first.width_px, first.height_px)
+
+    def test_duplicate_image_fills_missing_phash(
+        self, attachment_service, sample_image_bytes
+    ):
+        """A known image without a perceptual hash gets one on the next upload."""
+        with patch.object(attachment_service, "_compute_perceptual_hash", return_value=None):
+            attachment_service.upload(
+                file_data=sample_image_bytes, filename="a.png", content_type="image/png"
+            )
+
+        with patch.object(attachment_service, "_extract_image_dimensions") as extract:
+            with patch.object(attachment_service, "_compute_perceptual_hash", return_value=42):
+                second = attachment_service.upload(
+                    file_data=sample_image_bytes, filename="b.png", content_type="image/png"
+                )
+
+        extract.assert_not_called()
+        assert attachment_service.get_by_id(second.attachment_id).phash == 42
+
+    def test_delete_keeps_shared_blob_until_last_reference(
+        self, attachment_service, temp_storage_path, sample_text_bytes
+    ):
+        """The blob is removed only when its last attachment is deleted."""
+        first = attachment_service.upload(
+            file_data=sample_text_bytes, filename="a.txt", content_type="text/plain"
+        )
+        second = attachment_service.upload(
+            file_data=sample_text_bytes, filename="b.txt", content_type="text/plain"
+        )
+        blob = Path(temp_storage_path) / first.storage_key
+
+        assert attachment_service.delete(first.attachment_id) is False
+        assert blob.exists()
+
+        assert attachment_service.delete(second.attachment_id) is True
+        assert not blob.exists()
+        assert attachment_service.get_by_id(second.attachment_id).deleted_at is not None
+
+    def test_delete_keeps_blob_while_a_row_is_locked(
+        self, attachment_service, temp_storage_path, sample_text_bytes
+    ):
+        """A reference held by an open transaction keeps the blob."""
+        from sqlalchemy.exc import OperationalError
+
+        result = attachment_service.upload(
+            file_data=sample_text_bytes, filename="a.txt", content_type="text/plain"
+        )
+        blob = Path(temp_storage_path) / result.storage_key
+
+        with patch.object(
+            attachment_service,
+            "count_blob_references",
+            side_effect=OperationalError("SELECT", {}, Exception("lock NOWAIT")),
+        ):
+            assert attachment_service.delete(result.attachment_id) is False
+
+        assert blob.exists()
+        assert attachment_service.get_by_id(result.attachment_id).deleted_at is not None
@@ -0,0 +1,194 @@
+"""Unit tests for the author profile cache.
+
+Tests cover:
+1. Profile serialization and item merging
+2. Freshness and high-water marks from stored items
+3. Incremental listing fetches in the Reddit adapter
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from rediska_core.domain.models import ProfileItem
+from rediska_core.domain.services.author_profile_cache import (
+    AuthorProfileCache,
+    merge_items,
+    profile_from_json,
+    profile_to_json,
+)
+from rediska_core.providers.base import (
+    PaginatedResult,
+    ProfileItemType,
+    ProviderProfile,
+    ProviderProfileItem,
+)
+from rediska_core.providers.reddit.adapter import RedditAdapter
+from tests.factories import create_external_account
+
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_item(external_id: str, hours_ago: float, **kwargs) -> ProviderProfileItem:
+    return ProviderProfileItem(
+        external_id=external_id,
+        item_type=ProfileItemType.POST,
+        author_id="t2_x",
+        created_at=NOW - timedelta(hours=hours_ago),
+        **kwargs,
+    )
+
+
+def add_stored_item(db, account, external_id: str, hours_ago: float, item_type: str = "post"):
+    db.add(ProfileItem(
+        account_id=account.id,
+        item_type=item_type,
+        external_item_id=external_id,
+        item_created_at=(NOW - timedelta(hours=hours_ago)).replace(tzinfo=None),
+        text_content=f"text {external_id}",
+        remote_visibility="visible",
+    ))
+    db.flush()
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+class TestConversions:
+    """Tests for serialization and merging."""
+
+    def test_profile_round_trip(self):
+        """A stored profile should come back unchanged, without raw data."""
+        profile = ProviderProfile(
+            external_id="abc",
+            username="poster",
+            bio="hello",
+            created_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+            karma=42,
+            is_verified=True,
+            raw_data={"big": "payload"},
+        )
+
+        data = profile_to_json(profile)
+        restored = profile_from_json(data)
+
+        assert "raw_data" not in data
+        assert restored.created_at == profile.created_at
+        assert (restored.username, restored.bio, restored.karma) == ("poster", "hello", 42)
+
+    def test_merge_prefers_new_and_sorts(self):
+        """Fetched copies win, and the result is newest first within the limit."""
+        cached = [make_item("a", 5, body_text="old"), make_item("b", 10)]
+        new = [make_item("a", 5, body_text="edited"), make_item("c", 1)]
+
+        merged = merge_items(new, cached, limit=2)
+
+        assert [item.external_id for item in merged] == ["c", "a"]
+        assert merged[1].body_text == "edited"
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+class TestLookup:
+    """Tests for serving authors from storage."""
+
+    def test_unknown_author(self, db_session):
+        """An author with no account needs a full fetch."""
+        cached = AuthorProfileCache(db_session).lookup("reddit", "nobody", 20, 100, now=NOW)
+
+        assert not cached.is_fresh
+        assert cached.posts_since is None
+
+    def test_fresh_author_served_from_storage(self, db_session):
+        """A recently fetched author is fresh, with stored items newest first."""
+        account = create_external_account(db_session, external_username="poster")
+        cache = AuthorProfileCache(db_session, max_age_seconds=3600)
+        cache.mark_fetched(account, ProviderProfile(external_id="x", username="poster"),
+                           fetched_at=NOW - timedelta(minutes=30))
+        add_stored_item(db_session, account, "p1", hours_ago=3)
+        add_stored_item(db_session, account, "p2", hours_ago=1)
+        add_stored_item(db_session, account, "c1", hours_ago=2, item_type="comment")
+
+        cached = cache.lookup("reddit", "poster", 20, 100, now=NOW)
+
+        assert cached.is_fresh
+        assert cached.profile.username == "poster"
+        assert [item.external_id for item in cached.posts] == ["p2", "p1"]
+        assert [item.external_id for item in cached.comments] == ["c1"]
+        assert cached.posts_since == NOW - timedelta(hours=1)
+
+    def test_stale_author_refreshes_incrementally(self, db_session):
+        """After the window, only items newer than the high-water mark are needed."""
+        account = create_external_account(db_session, external_username="poster")
+        cache = AuthorProfileCache(db_session, max_age_seconds=3600)
+        cache.mark_fetched(account, None, fetched_at=NOW - timedelta(hours=5))
+        add_stored_item(db_session, account, "p1", hours_ago=8)
+        # Stored after the fetch (e.g. a discovery post): does not move the mark
+        add_stored_item(db_session, account, "p2", hours_ago=2)
+
+        cached = cache.lookup("reddit", "poster", 20, 100, now=NOW)
+
+        assert not cached.is_fresh
+        assert cached.posts_since == NOW - timedelta(hours=5)
+        assert cached.comments_since == NOW - timedelta(hours=5)
+
+    def test_never_fetched_needs_full_fetch(self, db_session):
+        """Stored items alone don't make a complete history."""
+        account = create_external_account(db_session, external_username="poster")
+        add_stored_item(db_session, account, "p1", hours_ago=1)
+
+        cached = AuthorProfileCache(db_session).lookup("reddit", "poster", 20, 100, now=NOW)
+
+        assert not cached.is_fresh
+        assert cached.posts_since is None
+        assert len(cached.posts) == 1
+
+
+# =============================================================================
+# ADAPTER
+# =============================================================================
+
+
+class TestIncrementalFetch:
+    """Tests for fetching only items newer than a high-water mark."""
+
+    @pytest.mark.asyncio
+    async def test_stops_at_first_older_item(self):
+        """Paging stops once the listing reaches already-seen items."""
+        adapter = RedditAdapter(
+            access_token="token",
+            refresh_token="refresh",
+            client_id="client",
+            client_secret="secret",
+            user_agent="Rediska/1.0 test",
+        )
+        pages = [
+            PaginatedResult(
+                items=[
+                    make_item("pinned", 100, raw_data={"stickied": True}),
+                    make_item("new1", 1),
+                    make_item("new2", 2),
+                ],
+                next_cursor="t3_new2",
+                has_more=True,
+            ),
+            PaginatedResult(
+                items=[make_item("new3", 3), make_item("seen", 6), make_item("older", 7)],
+                next_cursor="t3_older",
+                has_more=True,
+            ),
+        ]
+
+        with patch.object(adapter, "fetch_profile_items", AsyncMock(side_effect=pages)) as fetch:
+            items = await adapter.fetch_user_posts(
+                "poster", limit=20, since=(NOW - timedelta(hours=6)).replace(tzinfo=None)
+            )
+
+        assert [item.external_id for item in items] == ["new1", "new2", "new3"]
+        assert fetch.await_count == 2
@@ -0,0 +1,205 @@
+"""Unit tests for token-budgeted agent context.
+
+Tests cover:
+1. Token estimation and word-boundary truncation
+2. Near-duplicate removal
+3. Ranking by pin, recency and relevance
+4. Sharing a budget between posts and comments
+5. Per-agent budgets derived from the prompt
+"""
+
+from datetime import datetime
+
+import pytest
+
+from rediska_core.domain.models import AgentPrompt
+from rediska_core.domain.services.context_budget import (
+    ContextBudgetBuilder,
+    ContextItem,
+    dedupe_items,
+    estimate_tokens,
+    rank_items,
+    split_budget,
+    truncate_to_tokens,
+)
+
+
+def words(count: int, word: str = "word") -> str:
+    return " ".join(f"{word}{i}" for i in range(count))
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def make_prompt(system_prompt: str = "", max_tokens: int = 100) -> AgentPrompt:
+    return AgentPrompt(
+        agent_dimension="demographics",
+        version=1,
+        system_prompt=system_prompt,
+        output_schema_json={},
+        temperature=0.7,
+        max_tokens=max_tokens,
+        is_active=True,
+    )
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+class TestTokens:
+    """Tests for counting and truncating."""
+
+    def test_estimate_rounds_up(self):
+        """Estimates should never undercount partial tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd", chars_per_token=4) == 1
+        assert estimate_tokens("abcde", chars_per_token=4) == 2
+
+    def test_truncate_at_word_boundary(self):
+        """Truncated text should end on a whole word."""
+        text = words(20)
+
+        result = truncate_to_tokens(text, 6, count_words)
+
+        assert result == "word0 word1 word2 word3 word4 …"
+        assert truncate_to_tokens(text, 50, count_words) == text
+
+
+class TestDedupe:
+    """Tests for near-duplicate removal."""
+
+    def test_reposts_collapse_to_first(self):
+        """Items differing only in case and punctuation should be kept once."""
+        items = [
+            ContextItem(text="Looking for friends in Boston area!", position=0),
+            ContextItem(text="Something else entirely here", position=1),
+            ContextItem(text="looking for friends in boston area", position=2),
+        ]
+
+        assert [item.position for item in dedupe_items(items)] == [0, 1]
+
+    def test_pinned_copy_wins(self):
+        """A pinned item should survive over an earlier duplicate."""
+        items = [
+            ContextItem(text="Same text in both posts", position=0),
+            ContextItem(text="Same text in both posts", pinned=True, position=1),
+        ]
+
+        assert [item.pinned for item in dedupe_items(items)] == [True]
+
+
+class TestRank:
+    """Tests for ranking items."""
+
+    def test_pinned_then_newest(self):
+        """Pinned items come first, then newer items, undated last."""
+        items = [
+            ContextItem(text="a", created_at=datetime(2024, 1, 1), position=0),
+            ContextItem(text="b", created_at=None, position=1),
+            ContextItem(text="c", created_at=datetime(2024, 6, 1), position=2),
+            ContextItem(text="d", created_at=datetime(2023, 1, 1), pinned=True, position=3),
+        ]
+
+        assert [item.text for item in rank_items(items)] == ["d", "c", "a", "b"]
+
+    def test_relevance_reorders(self):
+        """A much more relevant older item should outrank a newer one."""
+        items = [
+            ContextItem(text="old", created_at=datetime(2024, 1, 1), position=0),
+            ContextItem(text="new", created_at=datetime(2024, 6, 1), position=1),
+        ]
+
+        ranked = rank_items(items, relevance=[1.0, 0.0], relevance_weight=0.8)
+
+        assert [item.text for item in ranked] == ["old", "new"]
+
+
+class TestSplitBudget:
+    """Tests for sharing a budget between sections."""
+
+    @pytest.mark.parametrize(
+        "budget,needs,expected",
+        [
+            (100, [10, 500], [10, 90]),
+            (100, [500, 500], [50, 50]),
+            (100, [20, 30], [20, 30]),
+            (100, [0, 500], [0, 100]),
+        ],
+    )
+    def test_unused_share_moves_over(self, budget, needs, expected):
+        """Space a section does not need should go to the other."""
+        assert split_budget(budget, needs) == expected
+
+
+# =============================================================================
+# BUILDER
+# =============================================================================
+
+
+class TestBuilder:
+    """Tests for assembling budgeted context."""
+
+    def test_profile_texts_fit_budget(self):
+        """Assembled text should stay within the budget and be deterministic."""
+        builder = ContextBudgetBuilder(max_profile_tokens=40, count_tokens=count_words)
+        items_by_type = {
+            "post": [{"text": words(10, f"p{i}_")} for i in range(10)],
+            "comment": [{"text": words(5, f"c{i}_")} for i in range(2)],
+        }
+
+        texts = builder.profile_texts(items_by_type)
+
+        assert count_words(texts["comment_text"]) == 10
+        assert count_words(texts["post_text"]) <= 30
+        assert builder.profile_texts(items_by_type) == texts
+
+    def test_agent_budget_subtracts_prompt_and_output(self):
+        """The budget should be what is left of the window."""
+        builder = ContextBudgetBuilder(
+            context_window=1000, max_profile_tokens=5000, count_tokens=count_words
+        )
+        context = {"lead": {"title": words(10), "body": words(40)}, "profile": {}}
+
+        budget = builder.agent_budget(context, make_prompt(words(100), max_tokens=300))
+
+        assert budget == 1000 - 300 - 150 - 128
+
+    @pytest.mark.asyncio
+    async def test_build_agent_context_keeps_pinned_post(self):
+        """The pinned post should survive even when the budget is tight."""
+        builder = ContextBudgetBuilder(
+            context_window=400, max_profile_tokens=5000, count_tokens=count_words
+        )
+        context = {
+            "lead": {"title": "t"},
+            "profile": {"summary": "s", "post_text": "everything"},
+            "items_by_type": {
+                "post": [{"text": words(100, f"p{i}_")} for i in range(5)]
+                + [{"text": "the discovery post", "pinned": True}],
+                "comment": [],
+            },
+        }
+
+        result = await builder.build_agent_context(context, make_prompt(max_tokens=100))
+
+        assert result["profile"]["post_text"].startswith("the discovery post")
+        assert count_words(result["profile"]["post_text"]) <= 400 - 100 - 2 - 128
+        assert result["profile"]["summary"] == "s"
+        assert context["profile"]["post_text"] == "everything"
+
+    @pytest.mark.asyncio
+    async def test_relevance_failure_falls_back_to_recency(self):
+        """A failing relevance scorer should not fail the agent."""
+
+        async def failing_scorer(query, texts):
+            raise RuntimeError("embeddings down")
+
+        builder = ContextBudgetBuilder(count_tokens=count_words, relevance_scorer=failing_scorer)
+        context = {"items_by_type": {"post": [{"text": "hello there"}], "comment": []}}
+
+        result = await builder.build_agent_context(context, make_prompt("system"))
+
+        assert result["profile"]["post_text"] == "hello there"
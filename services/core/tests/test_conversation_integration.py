@@ -311,3 +311,77 @@ class TestConversationValidation:
         # Should not fail due to empty attachment_ids
         # May fail for other reasons (auth, not found)
         assert response.status_code != 422 or "attachment" not in response.text.lower()
+
+
+class TestListConversationsPreview:
+    """Tests for last-message previews in GET /conversations."""
+
+    @pytest.fixture
+    async def auth_client(self, client, db_session):
+        """Async client logged in as a local user."""
+        from rediska_core.domain.services.auth import hash_password
+        from tests.factories import create_local_user
+
+        create_local_user(
+            db_session,
+            username="preview_user",
+            password_hash=hash_password("preview-password"),
+        )
+        db_session.commit()
+
+        response = await client.post(
+            "/auth/login",
+            json={"username": "preview_user", "password": "preview-password"},
+        )
+        client.cookies.set("session", response.cookies.get("session"))
+        return client
+
+    @pytest.fixture
+    def conversations_with_messages(self, db_session):
+        """Create two conversations with several messages each."""
+        from datetime import datetime, timedelta
+
+        from tests.factories import create_conversation, create_identity, create_message
+
+        identity = create_identity(db_session, is_active=True)
+        base = datetime(2024, 1, 1, 12, 0, 0)
+
+        older = create_conversation(db_session, identity=identity)
+        for i, text in enumerate(["first", "second", "older latest"]):
+            msg = create_message(
+                db_session, conversation=older, body_text=text, external_message_id=f"o{i}"
+            )
+            msg.sent_at = base + timedelta(minutes=i)
+
+        newer = create_conversation(db_session, identity=identity)
+        for i, text in enumerate(["hello", "newer latest"]):
+            msg = create_message(
+                db_session, conversation=newer, body_text=text, external_message_id=f"n{i}"
+            )
+            msg.sent_at = base + timedelta(hours=1, minutes=i)
+
+        # A newer but deleted message must not become the preview
+        deleted = create_message(
+            db_session, conversation=newer, body_text="deleted", external_message_id="n_del"
+        )
+        deleted.sent_at = base + timedelta(hours=2)
+        deleted.deleted_at = base + timedelta(hours=2)
+
+        db_session.commit()
+        return {"older": older, "newer": newer}
+
+    @pytest.mark.asyncio
+    async def test_previews_use_latest_non_deleted_message(
+        self, auth_client, conversations_with_messages
+    ):
+        """Each conversation should preview its latest non-deleted message."""
+        response = await auth_client.get("/conversations")
+
+        assert response.status_code == 200
+        data = response.json()
+        previews = {c["id"]: c["last_message_preview"] for c in data["conversations"]}
+
+        assert previews[conversations_with_messages["newer"].id] == "newer latest"
+        assert previews[conversations_with_messages["older"].id] == "older latest"
+        # Ordered by latest message time
+        assert data["conversations"][0]["id"] == conversations_with_messages["newer"].id
@@ -414,6 +414,102 @@ class TestDirectoryCounts:
         assert count_other == 0
 
 
+    def test_count_all_matches_individual_counts(self, db_session, setup_accounts):
+        """count_all should return every tab count in one call."""
+        service = DirectoryService(db=db_session)
+
+        counts = service.count_all()
+
+        assert counts == {
+            "analyzed": service.count_analyzed(),
+            "contacted": service.count_contacted(),
+            "engaged": service.count_engaged(),
+            "starred": service.count_starred(),
+        }
+
+    def test_count_all_with_filters(self, db_session, setup_accounts):
+        """count_all should honour provider and search filters."""
+        service = DirectoryService(db=db_session)
+
+        assert service.count_all(provider_id="twitter") == {
+            "analyzed": 0,
+            "contacted": 0,
+            "engaged": 0,
+            "starred": 0,
+        }
+        assert service.count_all(search="engaged")["analyzed"] == 1
+
+
+# =============================================================================
+# BATCHED ENTRY LOADING TESTS
+# =============================================================================
+
+
+class TestDirectoryEntryBatching:
+    """Tests for page-level loading of summaries and lead counts."""
+
+    def test_latest_summary_is_newest_snapshot(self, db_session, setup_accounts):
+        """Entries should use the most recently fetched snapshot."""
+        account = setup_accounts[0]
+        for day, text in [(1, "old summary"), (3, "new summary"), (2, "middle summary")]:
+            db_session.add(
+                ProfileSnapshot(
+                    account_id=account.id,
+                    fetched_at=datetime(2024, 2, day, tzinfo=timezone.utc),
+                    summary_text=text,
+                )
+            )
+        db_session.flush()
+
+        service = DirectoryService(db=db_session)
+        entries = {e.id: e for e in service.list_analyzed()}
+
+        assert entries[account.id].latest_summary == "new summary"
+        assert entries[setup_accounts[1].id].latest_summary is None
+
+    def test_lead_counts_per_account(self, db_session, setup_accounts, setup_lead_posts):
+        """Entries should carry the number of lead posts per author."""
+        extra = LeadPost(
+            provider_id="reddit",
+            source_location="r/test",
+            external_post_id="post_extra",
+            post_url="https://reddit.com/r/test/comments/extra",
+            author_account_id=setup_accounts[0].id,
+            title="Another post",
+            status="saved",
+        )
+        db_session.add(extra)
+        db_session.flush()
+
+        service = DirectoryService(db=db_session)
+        entries = {e.id: e for e in service.list_analyzed()}
+
+        assert entries[setup_accounts[0].id].lead_count == 2
+        assert entries[setup_accounts[1].id].lead_count == 1
+
+    def test_query_count_independent_of_page_size(
+        self, db_session, setup_accounts, setup_profile_snapshots, setup_lead_posts
+    ):
+        """Listing a page should not issue per-account queries."""
+        from sqlalchemy import event
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            result = DirectoryService(db=db_session).list_analyzed()
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert len(result) == 3
+        # accounts page + latest summaries + lead counts
+        assert len(statements) == 3
+
+
 # =============================================================================
 # SORTING TESTS
 # =============================================================================
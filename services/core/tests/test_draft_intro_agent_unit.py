@@ -5,6 +5,7 @@ Tests the agent that generates personalized intro messages:
 2. Personalizes based on target profile
 3. Returns draft without sending
 4. Provides alternative versions
+5. Streams the draft as it is generated
 """
 
 from datetime import datetime, timezone
@@ -595,6 +596,47 @@ class TestDraftIntroAgentErrors:
         assert result.error is not None
 
 
+# =============================================================================
+# STREAMING TESTS
+# =============================================================================
+
+
+class TestDraftIntroStream:
+    """Tests for streaming drafts."""
+
+    @staticmethod
+    def stream_of(*chunks):
+        async def stream_chat(messages, **kwargs):
+            for chunk in chunks:
+                yield chunk
+
+        return stream_chat
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_then_draft(self, mock_inference_client):
+        """Text chunks should be forwarded before the validated draft."""
+        mock_inference_client.stream_chat = self.stream_of(
+            '{"primary_draft": {"body": "Hi ',
+            'there"}, "reasoning": "short"}',
+        )
+        agent = DraftIntroAgent(inference_client=mock_inference_client)
+
+        events = [e async for e in agent.draft_stream(DraftIntroInput(target_profile={"username": "a"}))]
+
+        assert [e["type"] for e in events] == ["delta", "delta", "draft"]
+        assert events[-1]["output"]["primary_draft"]["body"] == "Hi there"
+
+    @pytest.mark.asyncio
+    async def test_stream_reports_invalid_json(self, mock_inference_client):
+        """An unparseable draft should end the stream with an error event."""
+        mock_inference_client.stream_chat = self.stream_of("not json")
+        agent = DraftIntroAgent(inference_client=mock_inference_client)
+
+        events = [e async for e in agent.draft_stream(DraftIntroInput(target_profile={"username": "a"}))]
+
+        assert events[-1]["type"] == "error"
+
+
 # =============================================================================
 # SYSTEM PROMPT TESTS
 # =============================================================================
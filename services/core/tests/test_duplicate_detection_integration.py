@@ -21,6 +21,7 @@ from rediska_core.domain.services.duplicate_detection import (
     DuplicateDetectionConfig,
     DuplicateDetectionService,
 )
+from rediska_core.domain.services.perceptual_hash import to_db_value
 
 
 # =============================================================================
@@ -315,6 +316,23 @@ class TestScanAllDuplicates:
             assert pair not in seen_pairs, f"Duplicate pair found: {pair}"
             seen_pairs.add(pair)
 
+    @pytest.mark.asyncio
+    async def test_scan_all_finds_shared_image_pairs(
+        self, db_session, setup_accounts_with_images
+    ):
+        """Scan should pair accounts that share an image hash."""
+        service = DuplicateDetectionService(db=db_session)
+
+        suggestions = await service.scan_all_duplicates(provider_id="reddit")
+
+        pairs = {
+            tuple(sorted([s.source_account_id, s.candidate_account_id]))
+            for s in suggestions
+        }
+        account1, account2, account3 = setup_accounts_with_images
+        assert tuple(sorted([account1.id, account2.id])) in pairs
+        assert all(account3.id not in pair for pair in pairs)
+
     @pytest.mark.asyncio
     async def test_scan_respects_provider_filter(self, db_session, setup_provider):
         """Scan should only include accounts from specified provider."""
@@ -350,6 +368,83 @@ class TestScanAllDuplicates:
             assert source.provider_id == candidate.provider_id == "reddit"
 
 
+class TestSimilarImageAccounts:
+    """Tests for perceptual hash lookups across accounts."""
+
+    @pytest.mark.asyncio
+    async def test_finds_accounts_with_near_perceptual_hash(
+        self, db_session, setup_accounts_with_images
+    ):
+        """Accounts whose images differ by a few bits should be found."""
+        account1, account2, account3 = setup_accounts_with_images
+        hashes = {
+            "unique1hash": 0b1111_0000,
+            "unique2hash": 0b1111_0001,
+            "unique3hash": (1 << 63) | 0xFFFF_FFFF,
+        }
+        for attachment in db_session.query(Attachment).all():
+            attachment.phash = to_db_value(hashes.get(attachment.sha256, 1 << 40))
+        db_session.flush()
+
+        service = DuplicateDetectionService(db=db_session)
+
+        matches = service.find_similar_image_accounts(account1.id, max_distance=2)
+
+        assert matches == {account2.id: 0}
+        assert account3.id not in matches
+
+    @pytest.mark.asyncio
+    async def test_scan_pairs_accounts_with_near_perceptual_hash(
+        self, db_session, setup_provider
+    ):
+        """The full scan should suggest accounts whose images are near copies."""
+        accounts = [
+            ExternalAccount(
+                provider_id="reddit",
+                external_username=username,
+                external_user_id=f"t2_{username}",
+                analysis_state="analyzed",
+            )
+            for username in ("sunset_lover", "mountain_guy", "quiet_reader")
+        ]
+        db_session.add_all(accounts)
+        db_session.flush()
+
+        hashes = [0xABCD_0000_1234_5678, 0xABCD_0000_1234_5679, 0x1111_2222_3333_4444]
+        for idx, (account, phash) in enumerate(zip(accounts, hashes)):
+            attachment = Attachment(
+                storage_backend="fs",
+                storage_key=f"/data/attachments/near{idx}.jpg",
+                sha256=f"near{idx}hash",
+                mime_type="image/jpeg",
+                size_bytes=1000,
+                phash=to_db_value(phash),
+            )
+            db_session.add(attachment)
+            db_session.flush()
+            db_session.add(
+                ProfileItem(
+                    account_id=account.id,
+                    item_type="image",
+                    external_item_id=f"img_near{idx}",
+                    attachment_id=attachment.id,
+                )
+            )
+        db_session.flush()
+
+        service = DuplicateDetectionService(db=db_session)
+
+        suggestions = await service.scan_all_duplicates(provider_id="reddit")
+
+        pairs = {
+            frozenset((s.source_account_id, s.candidate_account_id)): s for s in suggestions
+        }
+        near_pair = frozenset((accounts[0].id, accounts[1].id))
+        assert near_pair in pairs
+        assert pairs[near_pair].reasons[0].type == "perceptual_image"
+        assert all(accounts[2].id not in pair for pair in pairs)
+
+
 # =============================================================================
 # CONFIGURATION TESTS
 # =============================================================================
@@ -5,12 +5,14 @@ Tests the heuristics for detecting possible duplicate accounts:
 2. Image hash overlap detection
 3. Confidence scoring
 4. Suggestion generation
+5. Candidate pair blocking
 """
 
 import pytest
 
 from rediska_core.domain.services.duplicate_detection import (
     DuplicateCandidate,
+    DuplicateCandidateIndex,
     DuplicateDetectionConfig,
     DuplicateDetectionService,
     DuplicateSuggestion,
@@ -210,6 +212,30 @@ class TestImageHashMatcher:
         # Should match if within threshold
         assert result.is_match or result.confidence > 0
 
+    def test_perceptual_hex_hashes_need_hex_format(self):
+        """Hex hashes should be compared as 4 bits per digit."""
+        matcher = ImageHashMatcher(perceptual_threshold=0.9, hash_format="hex")
+
+        # "0000" and "0001" differ by 1 of 16 bits as hex, 1 of 4 as binary
+        result = matcher.compare_perceptual(["0000"], ["0001"])
+
+        assert result.is_match
+        assert result.confidence == pytest.approx(1 - 1 / 16)
+
+        binary = ImageHashMatcher(perceptual_threshold=0.9).compare_perceptual(
+            ["0000"], ["0001"]
+        )
+        assert not binary.is_match
+
+    def test_perceptual_integer_hashes(self):
+        """Integer hashes should be compared over 64 bits."""
+        matcher = ImageHashMatcher(perceptual_threshold=0.9)
+
+        result = matcher.compare_perceptual([0b1111], [0b0111, 1 << 40 | 0xFFFF])
+
+        assert result.is_match
+        assert result.matching_hashes == [0b1111]
+
 
 # =============================================================================
 # DUPLICATE SUGGESTION OUTPUT TESTS
@@ -509,3 +535,106 @@ class TestConfidenceCalculations:
         mixed = service.combine_confidences([0.9, 0.5])
         assert mixed > 0.5  # Better than weak
         assert mixed <= 0.99  # Capped
+
+
+# =============================================================================
+# CANDIDATE BLOCKING TESTS
+# =============================================================================
+
+
+class TestBoundedLevenshtein:
+    """Tests for edit distance with an early cutoff."""
+
+    def test_within_bound_returns_exact_distance(self):
+        """Distances within the bound should be exact."""
+        matcher = UsernameMatcher()
+        assert matcher.levenshtein_distance("kitten", "sitting", max_distance=3) == 3
+
+    def test_beyond_bound_returns_bound_plus_one(self):
+        """Distances beyond the bound should be reported as bound + 1."""
+        matcher = UsernameMatcher()
+        assert matcher.levenshtein_distance("kitten", "sitting", max_distance=1) == 2
+        assert matcher.levenshtein_distance("abc", "abcdefgh", max_distance=2) == 3
+
+    def test_max_fuzzy_distance_matches_similarity_threshold(self):
+        """The fuzzy bound should be the largest distance that still matches."""
+        matcher = UsernameMatcher()
+        for length in range(1, 30):
+            k = matcher.max_fuzzy_distance(length)
+            assert 1 - k / length >= matcher.FUZZY_MIN_SIMILARITY
+            assert k == length or 1 - (k + 1) / length < matcher.FUZZY_MIN_SIMILARITY
+
+
+class TestDuplicateCandidateIndex:
+    """Tests for candidate pair generation."""
+
+    def _candidates(self, usernames, provider_id="reddit", hashes=None):
+        hashes = hashes or {}
+        return [
+            DuplicateCandidate(
+                account_id=i + 1,
+                username=name,
+                provider_id=provider_id,
+                image_hashes=hashes.get(i, []),
+            )
+            for i, name in enumerate(usernames)
+        ]
+
+    def test_pairs_username_variations(self):
+        """Variation, prefix and fuzzy matches should be paired."""
+        candidates = self._candidates(
+            ["john_doe", "John-Doe", "john_doe_alt", "johndoe", "jon_doe", "zzzz_qqqq"]
+        )
+
+        pairs = set(DuplicateCandidateIndex().candidate_pairs(candidates))
+
+        assert (0, 1) in pairs
+        assert (0, 2) in pairs
+        assert (0, 3) in pairs
+        assert (0, 4) in pairs
+        assert not any(5 in pair for pair in pairs)
+
+    def test_pairs_shared_image_hashes(self):
+        """Accounts sharing an image should be paired regardless of username."""
+        candidates = self._candidates(
+            ["alpha_user", "totally_other", "third_person"],
+            hashes={0: ["h1"], 1: ["h2", "h1"], 2: ["h3"]},
+        )
+
+        pairs = DuplicateCandidateIndex(use_usernames=False).candidate_pairs(candidates)
+
+        assert pairs == [(0, 1)]
+
+    def test_never_pairs_across_providers(self):
+        """Accounts from different providers should not be paired."""
+        candidates = self._candidates(["same_name"]) + [
+            DuplicateCandidate(account_id=2, username="same_name", provider_id="twitter")
+        ]
+
+        assert DuplicateCandidateIndex().candidate_pairs(candidates) == []
+
+    def test_no_matches_lost_compared_to_exhaustive_scan(self):
+        """Blocked pairs should contain every pair the exhaustive scan matches."""
+        service = DuplicateDetectionService(db=None)
+        usernames = [
+            "john_doe", "johndoe123", "john_doe_alt", "jane_doe", "janedoe2020",
+            "j_doe", "doe_john", "johnny_d", "jonh_doe", "alice", "alice_smith",
+            "alicesmith", "al1ce_smith", "bob", "bobby_tables", "bobby-tables99",
+            "robert_tables", "xx_gamer_xx", "xxgamerxx", "gamer",
+        ]
+        candidates = self._candidates(usernames)
+
+        exhaustive = {
+            (i, j)
+            for i in range(len(candidates))
+            for j in range(i + 1, len(candidates))
+            if service.compare_candidates(candidates[i], candidates[j])
+        }
+        blocked = {
+            (i, j)
+            for i, j in DuplicateCandidateIndex().candidate_pairs(candidates)
+            if service.compare_candidates(candidates[i], candidates[j])
+        }
+
+        assert exhaustive
+        assert blocked == exhaustive
@@ -468,3 +468,133 @@ class TestSearch:
             call_args = mock_instance.search.call_args
             assert call_args[1]["from_"] == 10
             assert call_args[1]["size"] == 20
+
+
+# =============================================================================
+# VERSIONED INDEX TESTS
+# =============================================================================
+
+
+class TestVersionedIndices:
+    """Tests for the content alias and streaming bulk loads."""
+
+    def test_ensure_index_creates_first_version_with_alias(self, test_settings):
+        """A fresh cluster should get rediska_content_docs_v1 behind the alias."""
+        from rediska_core.infrastructure.elasticsearch import (
+            CONTENT_DOCS_ALIAS,
+            ElasticsearchClient,
+        )
+
+        with patch(ES_PATCH_PATH) as mock_es:
+            mock_instance = MagicMock()
+            mock_instance.indices.exists.return_value = False
+            mock_es.return_value = mock_instance
+
+            client = ElasticsearchClient(url=test_settings.elastic_url)
+            assert client.ensure_index() is True
+
+            call_kwargs = mock_instance.indices.create.call_args[1]
+            assert call_kwargs["index"] == "rediska_content_docs_v1"
+            assert call_kwargs["body"]["aliases"] == {
+                CONTENT_DOCS_ALIAS: {"is_write_index": True}
+            }
+
+    def test_ensure_index_adopts_legacy_index(self, test_settings):
+        """An existing v1 index without the alias should be aliased, not recreated."""
+        from rediska_core.infrastructure.elasticsearch import (
+            CONTENT_DOCS_ALIAS,
+            ElasticsearchClient,
+        )
+
+        with patch(ES_PATCH_PATH) as mock_es:
+            mock_instance = MagicMock()
+            mock_instance.indices.exists.side_effect = (
+                lambda index: index == "rediska_content_docs_v1"
+            )
+            mock_instance.indices.get_alias.return_value = {}
+            mock_es.return_value = mock_instance
+
+            client = ElasticsearchClient(url=test_settings.elastic_url)
+            assert client.ensure_index() is True
+
+            mock_instance.indices.create.assert_not_called()
+            actions = mock_instance.indices.update_aliases.call_args[1]["actions"]
+            assert actions == [{
+                "add": {
+                    "index": "rediska_content_docs_v1",
+                    "alias": CONTENT_DOCS_ALIAS,
+                    "is_write_index": True,
+                }
+            }]
+
+    def test_swap_alias_is_one_update(self, test_settings):
+        """Moving the alias should remove and add in a single request."""
+        from rediska_core.infrastructure.elasticsearch import ElasticsearchClient
+
+        with patch(ES_PATCH_PATH) as mock_es:
+            mock_instance = MagicMock()
+            mock_instance.indices.get_alias.return_value = {"rediska_content_docs_v1": {}}
+            mock_es.return_value = mock_instance
+
+            client = ElasticsearchClient(url=test_settings.elastic_url)
+            assert client.swap_alias("rediska_content_docs", "rediska_content_docs_v2")
+
+            mock_instance.indices.update_aliases.assert_called_once()
+            actions = mock_instance.indices.update_aliases.call_args[1]["actions"]
+            assert actions[0] == {
+                "remove": {"index": "rediska_content_docs_v1", "alias": "rediska_content_docs"}
+            }
+            assert actions[1]["add"]["index"] == "rediska_content_docs_v2"
+
+    def test_mapping_uses_embedding_dims(self):
+        """The mapping builder should set the vector size."""
+        from rediska_core.infrastructure.elasticsearch import (
+            CONTENT_DOCS_MAPPING,
+            build_content_docs_mapping,
+        )
+
+        mapping = build_content_docs_mapping(1024)
+
+        assert mapping["mappings"]["properties"]["embedding"]["dims"] == 1024
+        assert CONTENT_DOCS_MAPPING["mappings"]["properties"]["embedding"]["dims"] == 768
+
+    def test_stream_bulk_counts_results(self, test_settings):
+        """Per-document failures should be counted without raising."""
+        from rediska_core.infrastructure.elasticsearch import ElasticsearchClient
+
+        results = [
+            (True, {"index": {"_id": "message:1"}}),
+            (False, {"index": {"_id": "message:2", "error": {"type": "mapper_parsing_exception"}}}),
+            (True, {"index": {"_id": "message:3"}}),
+        ]
+
+        with patch(ES_PATCH_PATH):
+            with patch(
+                "rediska_core.infrastructure.elasticsearch.streaming_bulk",
+                return_value=iter(results),
+            ) as mock_bulk:
+                client = ElasticsearchClient(url=test_settings.elastic_url)
+                result = client.stream_bulk(iter([]), chunk_size=100, max_chunk_bytes=1024)
+
+                assert mock_bulk.call_args[1]["max_chunk_bytes"] == 1024
+
+        assert result["indexed"] == 2
+        assert result["error_count"] == 1
+        assert result["errors"][0]["id"] == "message:2"
+        assert result["success"] is False
+
+    def test_stream_bulk_uses_parallel_senders(self, test_settings):
+        """thread_count > 1 should use parallel_bulk."""
+        from rediska_core.infrastructure.elasticsearch import ElasticsearchClient
+
+        with patch(ES_PATCH_PATH):
+            with patch(
+                "rediska_core.infrastructure.elasticsearch.parallel_bulk",
+                return_value=iter([(True, {"index": {"_id": "a"}})]),
+            ) as mock_bulk:
+                client = ElasticsearchClient(url=test_settings.elastic_url)
+                result = client.stream_bulk(iter([]), thread_count=4)
+
+                assert mock_bulk.call_args[1]["thread_count"] == 4
+
+        assert result == {"success": True, "indexed": 1, "error_count": 0, "errors": []}
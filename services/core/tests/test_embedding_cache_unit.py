@@ -0,0 +1,281 @@
+"""Unit tests for the content-hash embedding cache.
+
+Tests cover:
+1. Text normalization and cache keys
+2. Local LRU/TTL backend
+3. Redis backend and fail-open behaviour
+4. Hit/miss metrics
+5. EmbeddingService skipping the model on cache hits
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rediska_core.infrastructure.embedding_cache import (
+    EmbeddingCache,
+    LocalEmbeddingCache,
+    RedisEmbeddingCache,
+    content_hash,
+    normalize_text,
+)
+from rediska_core.observability.metrics import get_collector
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start each test with empty metrics."""
+    get_collector().reset()
+    yield
+    get_collector().reset()
+
+
+class FakePipeline:
+    """Records SET commands and applies them on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+
+    def execute(self):
+        for key, value, ex in self.commands:
+            self.redis.data[key] = value
+            self.redis.ttls[key] = ex
+
+
+class FakeRedis:
+    """Minimal Redis supporting MGET and pipelined SET."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+# =============================================================================
+# KEY TESTS
+# =============================================================================
+
+
+class TestCacheKeys:
+    """Tests for normalization and hashing."""
+
+    def test_whitespace_differences_share_a_key(self):
+        """Texts differing only in whitespace should hash the same."""
+        assert normalize_text("  hello \n\t world ") == "hello world"
+        assert content_hash("m", "hello world") == content_hash("m", " hello   world\n")
+
+    def test_model_is_part_of_the_key(self):
+        """The same text embedded by different models should not collide."""
+        assert content_hash("model-a", "hello") != content_hash("model-b", "hello")
+
+    def test_unicode_forms_share_a_key(self):
+        """Composed and decomposed characters should hash the same."""
+        assert content_hash("m", "caf\u00e9") == content_hash("m", "cafe\u0301")
+
+
+# =============================================================================
+# BACKEND TESTS
+# =============================================================================
+
+
+class TestEmbeddingCacheInterface:
+    """Tests for the cache base class."""
+
+    def test_base_class_is_abstract(self):
+        """The base class should not be instantiable without a backend."""
+        with pytest.raises(TypeError):
+            EmbeddingCache()
+
+
+class TestLocalEmbeddingCache:
+    """Tests for the in-process LRU backend."""
+
+    def test_round_trip(self):
+        """Stored vectors should be returned at float32 precision."""
+        cache = LocalEmbeddingCache()
+        cache.set_many("m", ["a"], [[0.5, -1.25]])
+
+        assert cache.get_many("m", ["a", "b"]) == [[0.5, -1.25], None]
+
+    def test_evicts_least_recently_used(self):
+        """The entry not read most recently should be evicted first."""
+        cache = LocalEmbeddingCache(max_entries=2)
+        cache.set_many("m", ["a", "b"], [[1.0], [2.0]])
+        cache.get_many("m", ["a"])
+        cache.set_many("m", ["c"], [[3.0]])
+
+        assert cache.get_many("m", ["a", "b", "c"]) == [[1.0], None, [3.0]]
+        assert len(cache) == 2
+
+    def test_expired_entries_are_misses(self):
+        """Entries past their TTL should not be returned."""
+        cache = LocalEmbeddingCache(ttl_seconds=10)
+        with patch("rediska_core.infrastructure.embedding_cache.time.monotonic", return_value=0):
+            cache.set_many("m", ["a"], [[1.0]])
+        with patch("rediska_core.infrastructure.embedding_cache.time.monotonic", return_value=11):
+            assert cache.get_many("m", ["a"]) == [None]
+
+
+class TestRedisEmbeddingCache:
+    """Tests for the Redis backend."""
+
+    def test_round_trip_with_ttl(self):
+        """Vectors should be stored packed with the configured TTL."""
+        redis = FakeRedis()
+        cache = RedisEmbeddingCache(redis_client=redis, ttl_seconds=60)
+        cache.set_many("m", ["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+
+        assert cache.get_many("m", ["b", "a", "c"]) == [[3.0, 4.0], [1.0, 2.0], None]
+        assert set(redis.ttls.values()) == {60}
+        assert all(len(value) == 8 for value in redis.data.values())
+
+    def test_redis_errors_are_misses(self):
+        """A failing Redis should not raise."""
+        redis = MagicMock()
+        redis.mget.side_effect = ConnectionError("down")
+        redis.pipeline.side_effect = ConnectionError("down")
+        cache = RedisEmbeddingCache(redis_client=redis)
+
+        cache.set_many("m", ["a"], [[1.0]])
+        assert cache.get_many("m", ["a"]) == [None]
+
+
+class TestCacheMetrics:
+    """Tests for hit/miss counters."""
+
+    def test_hits_and_misses_are_counted(self):
+        """Each lookup should count its hits and misses."""
+        cache = LocalEmbeddingCache()
+        cache.set_many("m", ["a"], [[1.0]])
+        cache.get_many("m", ["a", "b", "c"])
+
+        collector = get_collector()
+        assert collector.get("embedding_cache_hits") == 1
+        assert collector.get("embedding_cache_misses") == 2
+
+
+# =============================================================================
+# SERVICE INTEGRATION TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def service_mocks():
+    """Patch the embeddings and ES clients used by EmbeddingService."""
+    with patch("rediska_core.domain.services.embedding.EmbeddingsClient") as mock_embed:
+        with patch("rediska_core.domain.services.embedding.ElasticsearchClient") as mock_es:
+            embed_client = MagicMock()
+            embed_client.embed_batch.side_effect = lambda texts: [
+                [float(len(text))] for text in texts
+            ]
+            embed_client.embed.side_effect = lambda text: [float(len(text))]
+            mock_embed.return_value = embed_client
+
+            es_client = MagicMock()
+            es_client.bulk_index.side_effect = lambda index, documents: {
+                "success": True,
+                "indexed": len(documents),
+                "error_count": 0,
+            }
+            es_client.update_document.return_value = True
+            mock_es.return_value = es_client
+
+            yield embed_client, es_client
+
+
+def make_service(cache):
+    from rediska_core.domain.services.embedding import EmbeddingService
+
+    return EmbeddingService(
+        db=MagicMock(),
+        embeddings_url="http://localhost:8080",
+        embeddings_model="nomic-embed-text",
+        es_url="http://localhost:9200",
+        cache=cache,
+    )
+
+
+class TestServiceCaching:
+    """Tests for EmbeddingService consulting the cache."""
+
+    def test_batch_only_embeds_misses(self, service_mocks):
+        """Cached texts should be skipped and new vectors stored."""
+        embed_client, es_client = service_mocks
+        cache = LocalEmbeddingCache()
+        cache.set_many("nomic-embed-text", ["cached text"], [[99.0]])
+
+        result = make_service(cache).generate_embeddings_batch([
+            {"doc_type": "message", "entity_id": 1, "text": "cached text"},
+            {"doc_type": "message", "entity_id": 2, "text": "new"},
+        ])
+
+        assert result["success"] is True
+        assert result["processed"] == 2
+        embed_client.embed_batch.assert_called_once_with(["new"])
+        documents = es_client.bulk_index.call_args.kwargs["documents"]
+        assert documents == [
+            {"_id": "message:1", "embedding": [99.0]},
+            {"_id": "message:2", "embedding": [3.0]},
+        ]
+        assert cache.get_many("nomic-embed-text", ["new"]) == [[3.0]]
+
+    def test_reindex_makes_no_model_calls(self, service_mocks):
+        """Embedding the same batch twice should hit the model once."""
+        embed_client, _ = service_mocks
+        service = make_service(LocalEmbeddingCache())
+        items = [
+            {"doc_type": "message", "entity_id": i, "text": f"message {i}"}
+            for i in range(5)
+        ]
+
+        service.generate_embeddings_batch(items)
+        service.generate_embeddings_batch(items)
+
+        assert embed_client.embed_batch.call_count == 1
+
+    def test_single_embedding_uses_cache(self, service_mocks):
+        """generate_embedding should reuse a cached vector."""
+        embed_client, es_client = service_mocks
+        service = make_service(LocalEmbeddingCache())
+
+        service.generate_embedding(doc_type="message", entity_id=1, text="hello")
+        result = service.generate_embedding(doc_type="message", entity_id=2, text="hello ")
+
+        assert result["status"] == "embedded"
+        assert embed_client.embed.call_count == 1
+        assert es_client.update_document.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_batch_only_embeds_misses(self, service_mocks):
+        """The async batch path should consult the cache too."""
+        cache = LocalEmbeddingCache()
+        cache.set_many("nomic-embed-text", ["cached"], [[1.0]])
+        service = make_service(cache)
+
+        async_client = MagicMock()
+
+        async def embed_batch(texts):
+            return [[float(len(text))] for text in texts]
+
+        async_client.embed_batch = MagicMock(side_effect=embed_batch)
+
+        with patch(
+            "rediska_core.domain.services.embedding.get_async_embeddings_client",
+            return_value=async_client,
+        ):
+            result = await service.generate_embeddings_batch_async([
+                {"doc_type": "message", "entity_id": 1, "text": "cached"},
+                {"doc_type": "message", "entity_id": 2, "text": "fresh"},
+            ])
+
+        assert result["processed"] == 2
+        async_client.embed_batch.assert_called_once_with(["fresh"])
@@ -7,12 +7,37 @@ Tests cover:
 4. Handling API errors
 5. Handling connection failures
 6. Dimension validation
+7. Connection pooling and request chunking
+8. Micro-batching of concurrent calls from threads
 """
 
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from rediska_core.infrastructure.embeddings import close_http_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_http_pool():
+    """Drop pooled HTTP clients so each test sees its own httpx mock."""
+    close_http_clients()
+    yield
+    close_http_clients()
+
+
+def embeddings_response(texts):
+    """Build a /v1/embeddings response with one vector per text."""
+    return {
+        "data": [
+            {"index": i, "embedding": [float(len(text)), float(i)]}
+            for i, text in enumerate(texts)
+        ],
+    }
+
 
 # =============================================================================
 # CLIENT INITIALIZATION TESTS
@@ -80,7 +105,7 @@ class TestSingleEmbedding:
                 "usage": {"prompt_tokens": 5, "total_tokens": 5},
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -106,7 +131,7 @@ class TestSingleEmbedding:
                 "data": [{"embedding": [0.1, 0.2, 0.3]}],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -133,7 +158,7 @@ class TestSingleEmbedding:
                 "data": [{"embedding": [0.1, 0.2, 0.3]}],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -198,7 +223,7 @@ class TestBatchEmbedding:
                 ],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -239,7 +264,7 @@ class TestBatchEmbedding:
                 ],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -272,7 +297,7 @@ class TestErrorHandling:
             mock_response.text = "Internal Server Error"
             mock_response.raise_for_status.side_effect = Exception("500 Error")
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -291,7 +316,7 @@ class TestErrorHandling:
         with patch("httpx.Client") as mock_http:
             mock_client = MagicMock()
             mock_client.post.side_effect = ConnectionError("Connection refused")
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -311,7 +336,7 @@ class TestErrorHandling:
         with patch("httpx.Client") as mock_http:
             mock_client = MagicMock()
             mock_client.post.side_effect = httpx.TimeoutException("Request timed out")
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -333,7 +358,7 @@ class TestErrorHandling:
             mock_response.status_code = 200
             mock_response.json.return_value = {"invalid": "response"}
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -369,7 +394,7 @@ class TestEmbeddingDimensions:
                 "data": [{"embedding": embedding_768}],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -393,7 +418,7 @@ class TestEmbeddingDimensions:
                 "data": [{"embedding": [0.1] * 768}],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -425,7 +450,7 @@ class TestClientUtilities:
                 "data": [{"embedding": [0.1, 0.2, 0.3]}],
             }
             mock_client.post.return_value = mock_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -443,7 +468,7 @@ class TestClientUtilities:
         with patch("httpx.Client") as mock_http:
             mock_client = MagicMock()
             mock_client.post.side_effect = ConnectionError("Connection refused")
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value = mock_client
 
             client = EmbeddingsClient(
                 url="http://localhost:8080",
@@ -467,3 +492,237 @@ class TestClientUtilities:
         truncated = client.truncate_text(long_text, max_chars=1000)
 
         assert len(truncated) <= 1000
+
+
+# =============================================================================
+# CONNECTION POOL TESTS
+# =============================================================================
+
+
+def fake_sync_http():
+    """Mock pooled client that answers with one vector per input."""
+    mock_client = MagicMock()
+
+    def post(url, headers=None, json=None):
+        texts = json["input"] if isinstance(json["input"], list) else [json["input"]]
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = embeddings_response(texts)
+        return response
+
+    mock_client.post.side_effect = post
+    return mock_client
+
+
+class TestConnectionPool:
+    """Tests for the shared HTTP client and request chunking."""
+
+    def test_clients_share_one_http_client(self, test_settings):
+        """Calls from separate client instances should reuse one pool."""
+        from rediska_core.infrastructure.embeddings import EmbeddingsClient
+
+        with patch("httpx.Client") as mock_http:
+            mock_http.return_value = fake_sync_http()
+
+            for _ in range(3):
+                client = EmbeddingsClient(url="http://localhost:8080", model="m")
+                client.embed("Hello")
+                client.embed_batch(["a", "b"])
+
+            assert mock_http.call_count == 1
+            assert mock_http.return_value.post.call_count == 6
+
+    def test_embed_batch_splits_into_requests(self, test_settings):
+        """Large batches should be sent in batch_size chunks, in order."""
+        from rediska_core.infrastructure.embeddings import EmbeddingsClient
+
+        with patch("httpx.Client") as mock_http:
+            mock_http.return_value = fake_sync_http()
+
+            client = EmbeddingsClient(
+                url="http://localhost:8080", model="m", batch_size=2, max_concurrency=3
+            )
+            texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+            result = client.embed_batch(texts)
+
+            assert mock_http.return_value.post.call_count == 3
+            assert [vector[0] for vector in result] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_embed_batch_orders_by_index(self, test_settings):
+        """Vectors should follow the response's index field."""
+        from rediska_core.infrastructure.embeddings import EmbeddingsClient
+
+        with patch("httpx.Client") as mock_http:
+            mock_client = MagicMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {
+                "data": [
+                    {"index": 1, "embedding": [2.0]},
+                    {"index": 0, "embedding": [1.0]},
+                ],
+            }
+            mock_client.post.return_value = mock_response
+            mock_http.return_value = mock_client
+
+            client = EmbeddingsClient(url="http://localhost:8080", model="m")
+
+            assert client.embed_batch(["a", "b"]) == [[1.0], [2.0]]
+
+    def test_embed_batch_rejects_count_mismatch(self, test_settings):
+        """A response with the wrong number of vectors should raise."""
+        from rediska_core.infrastructure.embeddings import EmbeddingsClient, EmbeddingsError
+
+        with patch("httpx.Client") as mock_http:
+            mock_client = MagicMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"data": [{"embedding": [1.0]}]}
+            mock_client.post.return_value = mock_response
+            mock_http.return_value = mock_client
+
+            client = EmbeddingsClient(url="http://localhost:8080", model="m")
+
+            with pytest.raises(EmbeddingsError):
+                client.embed_batch(["a", "b"])
+
+
+# =============================================================================
+# MICRO-BATCHER TESTS
+# =============================================================================
+
+
+class TestEmbeddingBatcher:
+    """Tests for coalescing concurrent embed() calls from threads."""
+
+    def test_concurrent_calls_share_a_request(self, test_settings):
+        """Calls arriving within the latency budget should be one batch."""
+        from rediska_core.infrastructure.embeddings import EmbeddingBatcher, EmbeddingsClient
+
+        with patch("httpx.Client") as mock_http:
+            mock_http.return_value = fake_sync_http()
+
+            client = EmbeddingsClient(url="http://localhost:8080", model="m")
+            batcher = EmbeddingBatcher(client, max_batch_size=4, max_latency=0.5)
+
+            texts = ["a", "bb", "ccc", "dddd"]
+            results = {}
+            barrier = threading.Barrier(len(texts))
+
+            def worker(text):
+                barrier.wait()
+                results[text] = batcher.embed(text, timeout=5)
+
+            threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            batcher.close()
+
+            assert mock_http.return_value.post.call_count == 1
+            assert {text: vector[0] for text, vector in results.items()} == {
+                "a": 1.0, "bb": 2.0, "ccc": 3.0, "dddd": 4.0,
+            }
+
+    def test_empty_text_resolves_immediately(self, test_settings):
+        """Empty text should return None without a request."""
+        from rediska_core.infrastructure.embeddings import EmbeddingBatcher
+
+        client = MagicMock()
+        batcher = EmbeddingBatcher(client)
+
+        assert batcher.embed("   ") is None
+        client.embed_batch.assert_not_called()
+
+    def test_errors_reach_every_caller(self, test_settings):
+        """A failed batch should raise EmbeddingsError for its callers."""
+        from rediska_core.infrastructure.embeddings import EmbeddingBatcher, EmbeddingsError
+
+        client = MagicMock()
+        client.embed_batch.side_effect = EmbeddingsError("API error: 500")
+        batcher = EmbeddingBatcher(client, max_latency=0)
+
+        with pytest.raises(EmbeddingsError):
+            batcher.embed("Hello", timeout=5)
+        batcher.close()
+
+    def test_closed_batcher_rejects_calls(self, test_settings):
+        """submit() after close() should raise."""
+        from rediska_core.infrastructure.embeddings import EmbeddingBatcher, EmbeddingsError
+
+        batcher = EmbeddingBatcher(MagicMock())
+        batcher.close()
+
+        with pytest.raises(EmbeddingsError):
+            batcher.submit("Hello")
+
+    def test_shared_batcher_is_reused(self, test_settings):
+        """get_embedding_batcher() should return one batcher per endpoint."""
+        from rediska_core.infrastructure.embeddings import get_embedding_batcher
+
+        first = get_embedding_batcher(url="http://localhost:8080", model="shared-m")
+        second = get_embedding_batcher(url="http://localhost:8080", model="shared-m")
+        other = get_embedding_batcher(url="http://localhost:8080", model="other-m")
+
+        assert first is second
+        assert other is not first
+
+
+# =============================================================================
+# ASYNC CLIENT TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def async_requests():
+    """Route AsyncEmbeddingsClient through a mock transport.
+
+    Yields the list of input batches the fake server received.
+    """
+    received = []
+    real_async_client = httpx.AsyncClient
+
+    def handler(request):
+        texts = json.loads(request.content)["input"]
+        received.append(texts)
+        return httpx.Response(200, json=embeddings_response(texts))
+
+    def make_client(**kwargs):
+        return real_async_client(transport=httpx.MockTransport(handler))
+
+    with patch("httpx.AsyncClient", side_effect=make_client):
+        yield received
+
+
+class TestAsyncEmbeddingsClient:
+    """Tests for the asyncio embeddings client."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_sends_chunks(self, async_requests):
+        """embed_batch() should split into batch_size requests and keep order."""
+        from rediska_core.infrastructure.embeddings import AsyncEmbeddingsClient
+
+        client = AsyncEmbeddingsClient(url="http://localhost:8080", model="m", batch_size=2)
+        result = await client.embed_batch(["a", "", "bb", "ccc"])
+        await client.aclose()
+
+        assert sorted(async_requests) == [["a", "bb"], ["ccc"]]
+        assert [vector[0] for vector in result] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_api_errors_raise(self):
+        """Non-200 responses should raise EmbeddingsError."""
+        from rediska_core.infrastructure.embeddings import AsyncEmbeddingsClient, EmbeddingsError
+
+        real_async_client = httpx.AsyncClient
+        transport = httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
+
+        with patch(
+            "httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_async_client(transport=transport),
+        ):
+            client = AsyncEmbeddingsClient(url="http://localhost:8080", model="m")
+            with pytest.raises(EmbeddingsError, match="500"):
+                await client.embed_batch(["a", "b"])
+            await client.aclose()
@@ -0,0 +1,228 @@
+"""Unit tests for the index outbox.
+
+Tests cover:
+1. Recording index updates in the caller's transaction
+2. Collapsing repeated updates into one bulk action per document
+3. Deleting documents whose entity no longer exists
+4. Retrying and dropping failed updates
+5. Draining the outbox in windows
+"""
+
+import pytest
+
+from rediska_core.domain.models import IndexOutbox
+from rediska_core.domain.services.index_outbox import (
+    IndexOutboxConsumer,
+    enqueue_index_update,
+    enqueue_index_updates,
+)
+from rediska_core.domain.services.leads import LeadsService
+from tests.factories import create_conversation_with_messages, create_provider
+
+
+class FakeES:
+    """Records bulk actions and fails the configured document IDs."""
+
+    def __init__(self, fail_ids=(), fail_request=False):
+        self.fail_ids = set(fail_ids)
+        self.fail_request = fail_request
+        self.requests = []
+
+    def stream_bulk(self, actions, **kwargs):
+        actions = list(actions)
+        self.requests.append(actions)
+        if self.fail_request:
+            return {
+                "success": False,
+                "indexed": 0,
+                "error_count": 1,
+                "errors": [{"error": "Connection refused"}],
+            }
+
+        errors = [
+            {"id": action["_id"], "error": "mapper_parsing_exception"}
+            for action in actions
+            if action["_id"] in self.fail_ids
+        ]
+        return {
+            "success": not errors,
+            "indexed": len(actions) - len(errors),
+            "error_count": len(errors),
+            "errors": errors,
+        }
+
+
+@pytest.fixture
+def content(db_session):
+    """A conversation with three messages and an empty outbox."""
+    conversation, messages = create_conversation_with_messages(db_session, message_count=3)
+    db_session.query(IndexOutbox).delete()
+    db_session.commit()
+    return conversation, messages
+
+
+def make_consumer(db_session, es, **kwargs):
+    consumer = IndexOutboxConsumer(db=db_session, **kwargs)
+    consumer._es_client = es
+    return consumer
+
+
+def pending(db_session):
+    rows = db_session.query(IndexOutbox).order_by(IndexOutbox.id)
+    return [(row.doc_type, row.entity_id) for row in rows]
+
+
+# =============================================================================
+# PRODUCER TESTS
+# =============================================================================
+
+
+class TestEnqueue:
+    """Tests for recording index updates."""
+
+    def test_rows_commit_with_the_caller(self, db_session, content):
+        """Updates should only be visible once the caller commits."""
+        _, messages = content
+
+        ids = [messages[0].id, messages[0].id, messages[1].id]
+
+        enqueue_index_updates(db_session, "message", ids)
+        db_session.rollback()
+        assert pending(db_session) == []
+
+        enqueue_index_updates(db_session, "message", ids)
+        db_session.commit()
+        assert pending(db_session) == [("message", messages[0].id), ("message", messages[1].id)]
+
+    def test_unknown_doc_type_raises(self, db_session):
+        """Unsupported types should be rejected."""
+        with pytest.raises(ValueError):
+            enqueue_index_update(db_session, "nope", 1)
+
+    def test_saving_a_lead_records_an_update(self, db_session):
+        """Services that change indexed content should write to the outbox."""
+        create_provider(db_session)
+        lead = LeadsService(db_session).save_lead(
+            provider_id="reddit",
+            source_location="r/test",
+            external_post_id="abc123",
+            post_url="https://reddit.com/r/test/abc123",
+            title="Title",
+            body_text="Body",
+        )
+        db_session.commit()
+
+        assert ("lead_post", lead.id) in pending(db_session)
+
+
+# =============================================================================
+# CONSUMER TESTS
+# =============================================================================
+
+
+class TestDrainBatch:
+    """Tests for indexing one window of updates."""
+
+    def test_repeated_updates_become_one_action(self, db_session, content):
+        """Several updates to a document should be indexed once."""
+        conversation, messages = content
+        for _ in range(3):
+            enqueue_index_update(db_session, "message", messages[0].id)
+        enqueue_index_update(db_session, "conversation", conversation.id)
+        db_session.commit()
+        es = FakeES()
+
+        result = make_consumer(db_session, es).drain_batch()
+
+        assert result["claimed"] == 4
+        assert result["documents"] == 2
+        assert result["indexed"] == 2
+        assert len(es.requests) == 1
+        ids = [action["_id"] for action in es.requests[0]]
+        assert sorted(ids) == sorted(
+            [f"message:{messages[0].id}", f"conversation:{conversation.id}"]
+        )
+        assert es.requests[0][1]["_source"]["content"] == "Test message 1"
+        assert pending(db_session) == []
+
+    def test_missing_entity_is_deleted(self, db_session, content):
+        """An update for a removed entity should delete its document."""
+        enqueue_index_update(db_session, "message", 99999)
+        db_session.commit()
+        es = FakeES()
+
+        result = make_consumer(db_session, es).drain_batch()
+
+        assert result["deleted"] == 1
+        assert es.requests[0] == [
+            {"_op_type": "delete", "_index": "rediska_content_docs", "_id": "message:99999"}
+        ]
+        assert pending(db_session) == []
+
+    def test_failed_documents_are_retried(self, db_session, content):
+        """Failed updates should stay in the outbox with an attempt counted."""
+        _, messages = content
+        enqueue_index_updates(db_session, "message", [m.id for m in messages])
+        db_session.commit()
+        es = FakeES(fail_ids={f"message:{messages[1].id}"})
+
+        result = make_consumer(db_session, es).drain_batch()
+
+        assert result["indexed"] == 2
+        assert result["failed"] == 1
+        row = db_session.query(IndexOutbox).one()
+        assert (row.entity_id, row.attempts) == (messages[1].id, 1)
+
+    def test_failed_documents_are_dropped_after_max_attempts(self, db_session, content):
+        """An update failing max_attempts times should be dropped."""
+        _, messages = content
+        enqueue_index_update(db_session, "message", messages[0].id)
+        db_session.commit()
+        consumer = make_consumer(
+            db_session, FakeES(fail_ids={f"message:{messages[0].id}"}), max_attempts=2
+        )
+
+        assert consumer.drain_batch()["dropped"] == 0
+        assert consumer.drain_batch()["dropped"] == 1
+        assert pending(db_session) == []
+
+    def test_request_failure_keeps_every_update(self, db_session, content):
+        """A failed bulk request should leave the whole window for a retry."""
+        _, messages = content
+        enqueue_index_updates(db_session, "message", [m.id for m in messages])
+        db_session.commit()
+
+        result = make_consumer(db_session, FakeES(fail_request=True)).drain_batch()
+
+        assert result["failed"] == 3
+        assert len(pending(db_session)) == 3
+
+
+class TestDrain:
+    """Tests for draining the whole outbox."""
+
+    def test_drains_in_windows(self, db_session, content):
+        """Each window should be one bulk request."""
+        _, messages = content
+        enqueue_index_updates(db_session, "message", [m.id for m in messages])
+        db_session.commit()
+        es = FakeES()
+
+        result = make_consumer(db_session, es).drain(batch_size=2)
+
+        assert result["batches"] == 2
+        assert result["indexed"] == 3
+        assert [len(request) for request in es.requests] == [2, 1]
+        assert pending(db_session) == []
+
+    def test_stops_when_elasticsearch_is_down(self, db_session, content):
+        """A fully failed window should end the run instead of spinning."""
+        _, messages = content
+        enqueue_index_updates(db_session, "message", [m.id for m in messages])
+        db_session.commit()
+        es = FakeES(fail_request=True)
+
+        result = make_consumer(db_session, es).drain(batch_size=2)
+
+        assert result["batches"] == 1
+        assert len(es.requests) == 1
@@ -1,21 +1,28 @@
 """Unit tests for the inference client.
 
-Tests the LLM inference wrapper for chat/completion operations.
+Tests the LLM inference wrapper for chat/completion operations and the
+client-side scheduler that balances requests over inference backends.
 """
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from rediska_core.domain.services.inference import (
     ChatMessage,
     ChatResponse,
+    ConnectionInferenceError,
     InferenceClient,
     InferenceConfig,
+    InferenceScheduler,
     ModelInfo,
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
 )
 
 
@@ -333,6 +340,35 @@ class TestInferenceClient:
             call_args = mock_request.call_args
             assert call_args[1]["max_tokens"] == 512
 
+    @pytest.mark.asyncio
+    async def test_chat_sends_prompt_cache_hints(self, inference_config):
+        """chat() should pass cache_prompt and the slot as llama.cpp fields."""
+        client = InferenceClient(config=inference_config)
+        http_client = MagicMock()
+        http_client.post = AsyncMock(
+            return_value=MagicMock(
+                json=MagicMock(
+                    return_value={
+                        "choices": [{"message": {"content": "Response"}, "finish_reason": "stop"}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+                    }
+                )
+            )
+        )
+
+        with patch.object(client, "_get_http_client", AsyncMock(return_value=http_client)):
+            messages = [ChatMessage(role="user", content="Hi!")]
+
+            await client.chat(messages, cache_prompt=True, slot_id=3)
+            payload = http_client.post.call_args[1]["json"]
+            assert payload["cache_prompt"] is True
+            assert payload["id_slot"] == 3
+
+            await client.chat(messages)
+            payload = http_client.post.call_args[1]["json"]
+            assert "cache_prompt" not in payload
+            assert "id_slot" not in payload
+
     @pytest.mark.asyncio
     async def test_chat_tracks_latency(self, inference_config):
         """chat() should track request latency."""
@@ -452,3 +488,163 @@ class TestInferenceClientCompletion:
 
             assert response.model_info.input_tokens == 5
             assert response.model_info.output_tokens == 10
+
+
+# =============================================================================
+# STREAMING TESTS
+# =============================================================================
+
+
+def sse_events(*chunks: str, usage: Optional[dict] = None):
+    """Build a fake _stream_request yielding one event per text chunk."""
+    closed = []
+
+    async def stream(messages, temperature, max_tokens, server_options=None):
+        try:
+            for chunk in chunks:
+                yield {"choices": [{"delta": {"content": chunk}, "finish_reason": None}]}
+            yield {"choices": [{"delta": {}, "finish_reason": "stop"}]}
+            if usage:
+                yield {"choices": [], "usage": usage}
+        finally:
+            closed.append(True)
+
+    return stream, closed
+
+
+class TestInferenceClientStreaming:
+    """Tests for streamed chat responses."""
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_yields_text(self, inference_config):
+        """stream_chat() should yield each generated chunk."""
+        client = InferenceClient(config=inference_config)
+        stream, _ = sse_events("Hel", "lo", "!")
+
+        with patch.object(client, "_stream_request", stream):
+            chunks = [c async for c in client.stream_chat([ChatMessage(role="user", content="Hi")])]
+
+        assert chunks == ["Hel", "lo", "!"]
+
+    @pytest.mark.asyncio
+    async def test_chat_stops_when_answer_complete(self, inference_config):
+        """chat(stop_when=...) should stop reading once the check passes."""
+        client = InferenceClient(config=inference_config)
+        stream, closed = sse_events('{"a": ', "1}", " trailing", " rambling")
+        checked = []
+
+        def stop_when(text):
+            checked.append(text)
+            return text.rstrip().endswith("}")
+
+        with patch.object(client, "_stream_request", stream):
+            response = await client.chat(
+                [ChatMessage(role="user", content="Hi")], stop_when=stop_when
+            )
+
+        assert response.content == '{"a": 1}'
+        assert response.finish_reason == "stop"
+        assert response.model_info.extra == {"streamed": True, "stopped_early": True}
+        assert checked == ['{"a": 1}']
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_chat_streams_to_end_without_stop(self, inference_config):
+        """A stream that never satisfies stop_when should be read to the end."""
+        client = InferenceClient(config=inference_config)
+        stream, _ = sse_events(
+            "not ", "json", usage={"prompt_tokens": 7, "completion_tokens": 2}
+        )
+
+        with patch.object(client, "_stream_request", stream):
+            response = await client.chat(
+                [ChatMessage(role="user", content="Hi")], stop_when=lambda text: False
+            )
+
+        assert response.content == "not json"
+        assert response.model_info.input_tokens == 7
+        assert response.model_info.output_tokens == 2
+        assert response.model_info.extra["stopped_early"] is False
+
+
+# =============================================================================
+# SCHEDULER TESTS
+# =============================================================================
+
+
+class TestInferenceScheduler:
+    """Tests for the client-side inference scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_balances_by_outstanding_requests(self):
+        """Requests should go to the backend with the fewest in flight."""
+        scheduler = InferenceScheduler(["http://a", "http://b"], max_concurrency=2)
+
+        urls = [await scheduler.acquire() for _ in range(3)]
+        assert sorted(urls) == ["http://a", "http://a", "http://b"]
+
+        scheduler.release("http://a")
+        assert await scheduler.acquire(affinity=1) == "http://b"
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_skip_queued_background(self):
+        """A freed slot should go to the waiting interactive request first."""
+        scheduler = InferenceScheduler(["http://a"], max_concurrency=1)
+        url = await scheduler.acquire()
+        order = []
+
+        async def wait(priority, name):
+            await scheduler.acquire(priority)
+            order.append(name)
+
+        background = asyncio.create_task(wait(PRIORITY_BACKGROUND, "background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(wait(PRIORITY_INTERACTIVE, "interactive"))
+        await asyncio.sleep(0)
+
+        scheduler.release(url)
+        await interactive
+        assert order == ["interactive"]
+
+        scheduler.release(url)
+        await background
+        assert order == ["interactive", "background"]
+
+    @pytest.mark.asyncio
+    async def test_background_leaves_reserved_slots(self):
+        """Background requests should not take the interactive reserve."""
+        scheduler = InferenceScheduler(["http://a"], max_concurrency=2, interactive_reserve=1)
+        await scheduler.acquire(PRIORITY_BACKGROUND)
+
+        waiting = asyncio.create_task(scheduler.acquire(PRIORITY_BACKGROUND))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        assert await scheduler.acquire(PRIORITY_INTERACTIVE) == "http://a"
+        waiting.cancel()
+
+    @pytest.mark.asyncio
+    async def test_failing_backend_is_ejected(self):
+        """A backend failing repeatedly should be skipped."""
+        scheduler = InferenceScheduler(["http://a", "http://b"], eject_after=2)
+        for _ in range(2):
+            scheduler.report("http://a", ok=False)
+
+        assert [await scheduler.acquire() for _ in range(2)] == ["http://b", "http://b"]
+        assert scheduler.get_stats()[0]["healthy"] is False
+
+    @pytest.mark.asyncio
+    async def test_client_sends_to_scheduled_backend(self, inference_config):
+        """A scheduled client should post to the chosen backend and free the slot."""
+        scheduler = InferenceScheduler(["http://b:8080"])
+        client = InferenceClient(config=inference_config, scheduler=scheduler)
+        http_client = MagicMock()
+        http_client.post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+        with patch.object(client, "_get_http_client", AsyncMock(return_value=http_client)):
+            with pytest.raises(ConnectionInferenceError):
+                await client.chat([ChatMessage(role="user", content="Hi!")])
+
+        assert http_client.post.call_args[0][0] == "http://b:8080/v1/chat/completions"
+        assert scheduler.backends[0].outstanding == 0
+        assert scheduler.backends[0].failures == 1
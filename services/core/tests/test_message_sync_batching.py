@@ -0,0 +1,287 @@
+"""Tests for page-at-a-time message sync storage.
+
+Tests cover:
+1. New messages, conversations and accounts created from a page
+2. Matching pending outgoing messages instead of duplicating them
+3. Early exit after consecutive existing messages
+4. Engagement state updates for contacted accounts
+5. A bounded number of SQL statements per page
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+
+from rediska_core.domain.models import Conversation, ExternalAccount, Message
+from rediska_core.domain.services.message_sync import (
+    EARLY_EXIT_THRESHOLD,
+    MessageSyncResult,
+    MessageSyncService,
+)
+from rediska_core.infrastructure.crypto import CryptoService
+from rediska_core.providers.base import PaginatedResult
+from tests.factories import (
+    create_conversation,
+    create_external_account,
+    create_identity,
+    create_message,
+)
+
+
+BASE_TS = datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp()
+
+
+class FakeInboxAdapter:
+    """Serves fixed pages for fetch_inbox_messages."""
+
+    def __init__(self, pages: list[list[dict]]):
+        self.pages = pages
+
+    async def fetch_inbox_messages(self, cursor=None, limit=100, endpoint="/message/inbox"):
+        index = int(cursor or 0)
+        if endpoint != "/message/inbox" or index >= len(self.pages):
+            return PaginatedResult(items=[], next_cursor=None, has_more=False)
+        has_more = index + 1 < len(self.pages)
+        return PaginatedResult(
+            items=self.pages[index],
+            next_cursor=str(index + 1) if has_more else None,
+            has_more=has_more,
+        )
+
+
+def raw_message(msg_id, author, dest, body="hello", offset=0):
+    """Build a raw Reddit message dict."""
+    return {
+        "id": msg_id,
+        "name": f"t4_{msg_id}",
+        "author": author,
+        "dest": dest,
+        "body": body,
+        "created_utc": BASE_TS - offset,
+    }
+
+
+@pytest.fixture
+def sync_service(db_session, monkeypatch):
+    """MessageSyncService with a valid encryption key."""
+    from rediska_core.config import get_settings
+
+    monkeypatch.setenv("ENCRYPTION_KEY", CryptoService.generate_key())
+    get_settings.cache_clear()
+    service = MessageSyncService(db=db_session)
+    yield service
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def identity(db_session):
+    """Our Reddit identity."""
+    return create_identity(db_session, external_username="me")
+
+
+async def run_sync(service, identity, pages):
+    result = MessageSyncResult()
+    return await service._sync_endpoints(
+        FakeInboxAdapter(pages), identity, result, inbox_only=True
+    )
+
+
+class TestPageStorage:
+    """Tests for storing new messages from a page."""
+
+    @pytest.mark.asyncio
+    async def test_creates_messages_conversations_and_accounts(
+        self, db_session, sync_service, identity
+    ):
+        """New messages should create their conversations and counterparts."""
+        page = [
+            raw_message("m3", "alice", "me", offset=0),
+            raw_message("m2", "me", "alice", offset=60),
+            raw_message("m1", "bob", "me", offset=120),
+        ]
+
+        result = await run_sync(sync_service, identity, [page])
+
+        assert result.errors == []
+        assert result.new_messages == 3
+        assert result.messages_synced == 3
+        assert result.new_conversations == 2
+        assert result.conversations_synced == 2
+
+        messages = {m.external_message_id: m for m in db_session.query(Message).all()}
+        assert set(messages) == {"m1", "m2", "m3"}
+        assert messages["m2"].direction == "out"
+        assert messages["m2"].identity_id == identity.id
+        assert messages["m3"].identity_id is None
+
+        usernames = {a.external_username for a in db_session.query(ExternalAccount).all()}
+        assert usernames == {"alice", "bob"}
+
+        alice_conv = (
+            db_session.query(Conversation)
+            .filter_by(external_conversation_id="reddit:pair:alice:me")
+            .one()
+        )
+        assert alice_conv.last_activity_at == datetime.fromtimestamp(BASE_TS)
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_messages(self, db_session, sync_service, identity):
+        """Messages already stored should not be inserted again."""
+        await run_sync(sync_service, identity, [[raw_message("m1", "alice", "me")]])
+
+        result = await run_sync(
+            sync_service,
+            identity,
+            [[raw_message("m2", "alice", "me"), raw_message("m1", "alice", "me", offset=60)]],
+        )
+
+        assert result.new_messages == 1
+        assert result.new_conversations == 0
+        assert db_session.query(Message).count() == 2
+
+    @pytest.mark.asyncio
+    async def test_reuses_account_with_different_case(self, db_session, sync_service, identity):
+        """A stored account should be reused regardless of username case."""
+        create_external_account(db_session, external_username="Alice")
+
+        await run_sync(sync_service, identity, [[raw_message("m1", "Alice", "me")]])
+
+        assert db_session.query(ExternalAccount).count() == 1
+
+
+class TestPendingOutgoing:
+    """Tests for matching locally sent messages."""
+
+    @pytest.mark.asyncio
+    async def test_pending_message_gets_external_id(self, db_session, sync_service, identity):
+        """A pending outgoing message with the same body should be updated."""
+        counterpart = create_external_account(db_session, external_username="alice")
+        conversation = create_conversation(
+            db_session,
+            identity=identity,
+            counterpart=counterpart,
+            external_conversation_id="reddit:pair:alice:me",
+        )
+        pending = create_message(
+            db_session,
+            conversation=conversation,
+            direction="out",
+            body_text="see you soon ",
+            external_message_id=None,
+            remote_visibility="unknown",
+        )
+        pending.external_message_id = None
+        db_session.flush()
+
+        result = await run_sync(
+            sync_service,
+            identity,
+            [[raw_message("m9", "me", "alice", body="see you soon")]],
+        )
+
+        assert result.new_messages == 0
+        db_session.refresh(pending)
+        assert pending.external_message_id == "m9"
+        assert pending.remote_visibility == "visible"
+        assert db_session.query(Message).count() == 1
+
+
+class TestEarlyExit:
+    """Tests for stopping after consecutive existing messages."""
+
+    @pytest.mark.asyncio
+    async def test_stops_fetching_after_threshold(self, db_session, sync_service, identity):
+        """Later pages should not be stored after the early-exit threshold."""
+        existing = [
+            raw_message(f"old{i}", "alice", "me", offset=100 + i)
+            for i in range(EARLY_EXIT_THRESHOLD)
+        ]
+        await run_sync(sync_service, identity, [existing])
+
+        pages = [
+            [raw_message("new1", "alice", "me")] + existing,
+            [raw_message("older", "bob", "me", offset=10_000)],
+        ]
+        result = await run_sync(sync_service, identity, pages)
+
+        assert result.new_messages == 1
+        assert result.messages_synced == EARLY_EXIT_THRESHOLD
+        assert db_session.query(Message).filter_by(external_message_id="older").count() == 0
+
+    @pytest.mark.asyncio
+    async def test_run_spanning_pages_exits_early(self, db_session, sync_service, identity):
+        """Consecutive existing messages split across pages should still stop the sync."""
+        existing = [
+            raw_message(f"old{i}", "alice", "me", offset=100 + i)
+            for i in range(EARLY_EXIT_THRESHOLD)
+        ]
+        await run_sync(sync_service, identity, [existing])
+
+        half = EARLY_EXIT_THRESHOLD // 2
+        pages = [
+            [raw_message("new1", "alice", "me")] + existing[:half],
+            existing[half:],
+            [raw_message("older", "bob", "me", offset=10_000)],
+        ]
+        result = await run_sync(sync_service, identity, pages)
+
+        assert result.new_messages == 1
+        assert db_session.query(Message).filter_by(external_message_id="older").count() == 0
+
+
+class TestEngagementState:
+    """Tests for engagement updates on new incoming messages."""
+
+    @pytest.mark.asyncio
+    async def test_contacted_account_becomes_engaged(self, db_session, sync_service, identity):
+        """A reply from a contacted account should mark it engaged."""
+        counterpart = create_external_account(
+            db_session,
+            external_username="alice",
+            contact_state="contacted",
+            engagement_state="not_engaged",
+        )
+
+        await run_sync(
+            sync_service,
+            identity,
+            [[raw_message("m2", "alice", "me"), raw_message("m1", "alice", "me", offset=60)]],
+        )
+
+        db_session.refresh(counterpart)
+        assert counterpart.engagement_state == "engaged"
+        assert counterpart.first_inbound_after_contact_at == datetime.fromtimestamp(BASE_TS)
+
+
+class TestQueryCount:
+    """Tests that a page costs a bounded number of statements."""
+
+    @pytest.mark.asyncio
+    async def test_page_of_new_messages_uses_few_statements(
+        self, db_session, sync_service, identity
+    ):
+        """Statement count should not grow with the number of messages."""
+        # Warm up conversations so the page only contains new messages
+        await run_sync(sync_service, identity, [[raw_message("seed", "alice", "me", offset=999)]])
+
+        page = [
+            raw_message(f"m{i}", "alice" if i % 2 else "me", "me" if i % 2 else "alice", offset=i)
+            for i in range(50)
+        ]
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            result = await run_sync(sync_service, identity, [page])
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert result.new_messages == 50
+        # Includes one multi-row insert into the index outbox
+        assert len(statements) <= 9
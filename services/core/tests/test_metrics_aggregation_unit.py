@@ -0,0 +1,213 @@
+"""Unit tests for cross-process metrics aggregation.
+
+Tests cover:
+1. Counter and histogram deltas flushed from several processes
+2. One pipeline round trip per flush
+3. Per-process gauges
+4. Retrying changes after a failed flush
+"""
+
+import fnmatch
+
+import pytest
+
+from rediska_core.observability.aggregation import (
+    RedisMetricsFlusher,
+    load_aggregated_metrics,
+)
+from rediska_core.observability.metrics import MetricsCollector
+
+
+class FakePipeline:
+    """Queues commands and runs them against FakeRedis on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        self.redis.executions += 1
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """Minimal in-memory Redis supporting the commands used by aggregation."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.executions = 0
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        target = self.hashes.setdefault(key, {})
+        for f, v in (mapping or {field: value}).items():
+            target[f] = str(v)
+
+    def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, str(value))
+
+    def hincrby(self, key, field, amount):
+        target = self.hashes.setdefault(key, {})
+        target[field] = str(int(target.get(field, 0)) + amount)
+
+    def hincrbyfloat(self, key, field, amount):
+        target = self.hashes.setdefault(key, {})
+        target[field] = str(float(target.get(field, 0)) + amount)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def scan_iter(self, match):
+        return [k for k in list(self.hashes) if fnmatch.fnmatch(k, match)]
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+def make_flusher(redis_client, process_id):
+    collector = MetricsCollector()
+    flusher = RedisMetricsFlusher(
+        collector=collector, redis_client=redis_client, process_id=process_id
+    )
+    return collector, flusher
+
+
+def bucket_lines(collector):
+    return [
+        line
+        for line in collector.to_prometheus().splitlines()
+        if line.startswith("latency_bucket")
+    ]
+
+
+class TestFlush:
+    """Tests for flushing deltas to Redis."""
+
+    def test_counters_from_processes_are_summed(self, redis_client):
+        """Counters from two processes should add up."""
+        api, api_flusher = make_flusher(redis_client, "api:1")
+        worker, worker_flusher = make_flusher(redis_client, "worker:2")
+
+        api.increment("requests", labels={"route": "/a"})
+        api.increment("requests", labels={"route": "/a"})
+        worker.increment("requests", labels={"route": "/a"})
+        api_flusher.flush()
+        worker_flusher.flush()
+        api.increment("requests", labels={"route": "/a"})
+        api_flusher.flush()
+
+        aggregated = load_aggregated_metrics(redis_client)
+        assert aggregated.get("requests", {"route": "/a"}) == 4
+
+    def test_histograms_merge_across_processes(self, redis_client):
+        """Histograms from several processes should merge exactly."""
+        first, first_flusher = make_flusher(redis_client, "p1")
+        second, second_flusher = make_flusher(redis_client, "p2")
+        reference = MetricsCollector()
+
+        for i in range(1, 201):
+            value = i / 100
+            (first if i % 2 else second).record_histogram("latency", value)
+            reference.record_histogram("latency", value)
+            if i % 50 == 0:
+                first_flusher.flush()
+                second_flusher.flush()
+
+        aggregated = load_aggregated_metrics(redis_client)
+        stats = aggregated.get_histogram_stats("latency")
+        expected = reference.get_histogram_stats("latency")
+
+        assert stats["count"] == 200
+        assert stats["avg"] == pytest.approx(expected["avg"])
+        assert stats["p95"] == expected["p95"]
+        assert stats["max"] == pytest.approx(expected["max"], rel=0.01)
+        assert bucket_lines(aggregated) == bucket_lines(reference)
+
+    def test_flush_is_one_round_trip(self, redis_client):
+        """A flush should execute a single pipeline regardless of volume."""
+        collector, flusher = make_flusher(redis_client, "p1")
+        for i in range(500):
+            collector.increment("events", labels={"kind": str(i % 5)})
+            collector.record_histogram("latency", i / 100)
+
+        flusher.flush()
+
+        assert redis_client.executions == 1
+
+    def test_nothing_to_send_skips_redis(self, redis_client):
+        """An idle flush should not contact Redis."""
+        collector, flusher = make_flusher(redis_client, "p1")
+        collector.increment("events")
+        flusher.flush()
+
+        flusher.flush()
+
+        assert redis_client.executions == 1
+
+    def test_metrics_before_flusher_are_not_sent(self, redis_client):
+        """Values inherited before the flusher was created should be skipped."""
+        collector = MetricsCollector()
+        collector.increment("events", 5)
+        flusher = RedisMetricsFlusher(collector=collector, redis_client=redis_client)
+
+        collector.increment("events")
+        flusher.flush()
+
+        assert load_aggregated_metrics(redis_client).get("events") == 1
+
+    def test_failed_flush_is_retried(self, redis_client):
+        """Changes from a failed flush should be sent with the next one."""
+        collector, flusher = make_flusher(redis_client, "p1")
+        collector.increment("events")
+        redis_client.fail = True
+
+        assert flusher.flush() is False
+
+        redis_client.fail = False
+        collector.increment("events")
+        assert flusher.flush() is True
+        assert load_aggregated_metrics(redis_client).get("events") == 2
+
+
+class TestGauges:
+    """Tests for per-process gauges."""
+
+    def test_gauges_are_labelled_by_process(self, redis_client):
+        """Each process's gauge should be exposed separately with a TTL."""
+        api, api_flusher = make_flusher(redis_client, "api:1")
+        worker, worker_flusher = make_flusher(redis_client, "worker:2")
+        api.set_gauge("db_pool_checked_out", 3, {"pool": "sync"})
+        worker.set_gauge("db_pool_checked_out", 1, {"pool": "sync"})
+
+        api_flusher.flush()
+        worker_flusher.flush()
+
+        aggregated = load_aggregated_metrics(redis_client)
+        assert aggregated.get("db_pool_checked_out", {"pool": "sync", "process": "api:1"}) == 3
+        assert aggregated.get("db_pool_checked_out", {"pool": "sync", "process": "worker:2"}) == 1
+        assert redis_client.ttls["rediska:metrics:gauges:api:1"] >= 30
@@ -40,6 +40,53 @@ class TestMetricsEndpoints:
         assert response.status_code in (401, 403, 200)
 
 
+class TestPrometheusEndpoint:
+    """Tests for /api/metrics/prometheus."""
+
+    @pytest.fixture
+    def client(self, test_app):
+        """Create test client."""
+        return TestClient(test_app)
+
+    @pytest.fixture
+    def scrape_token(self, monkeypatch):
+        """Configure a scrape token."""
+        from rediska_core.config import get_settings
+
+        monkeypatch.setenv("METRICS_SCRAPE_TOKEN", "scrape-secret")
+        get_settings.cache_clear()
+        yield "scrape-secret"
+        get_settings.cache_clear()
+
+    def test_requires_auth(self, client):
+        """Test that anonymous scrapes are rejected."""
+        response = client.get("/api/metrics/prometheus")
+
+        assert response.status_code == 401
+
+    def test_rejects_wrong_token(self, client, scrape_token):
+        """Test that a wrong bearer token is rejected."""
+        response = client.get(
+            "/api/metrics/prometheus", headers={"Authorization": "Bearer wrong"}
+        )
+
+        assert response.status_code == 401
+
+    def test_scrape_with_token(self, client, scrape_token):
+        """Test that a scrape returns request latency histograms."""
+        client.get("/api/health")
+
+        response = client.get(
+            "/api/metrics/prometheus",
+            headers={"Authorization": f"Bearer {scrape_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert 'route="/api/health"' in response.text
+
+
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
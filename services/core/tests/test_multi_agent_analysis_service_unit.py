@@ -500,3 +500,81 @@ def test_recommendation_status_needs_review():
         started_at=datetime.now(timezone.utc),
     )
     assert analysis.final_recommendation == "needs_review"
+
+
+# =============================================================================
+# TESTS: Prompt Cache
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_prompt_cache_shares_prefix_and_slot():
+    """Dimension agents should share one prompt prefix on one server slot."""
+    from rediska_core.domain.services.inference import ChatResponse, ModelInfo
+
+    started = []
+    finished = []
+
+    async def chat(messages, **kwargs):
+        started.append((messages, kwargs))
+        await asyncio.sleep(0)
+        finished.append(len(started))
+        return ChatResponse(
+            content="{}",
+            model_info=ModelInfo(
+                model_name="test",
+                provider="test",
+                temperature=0.7,
+                max_tokens=100,
+                input_tokens=0,
+                output_tokens=0,
+                latency_ms=0,
+            ),
+            finish_reason="stop",
+        )
+
+    inference_client = MagicMock()
+    inference_client.chat = chat
+    prompt_service = MagicMock()
+    prompt_service.get_active_prompt.side_effect = lambda dimension: AgentPrompt(
+        agent_dimension=dimension,
+        version=1,
+        system_prompt=f"Analyze {dimension}.",
+        output_schema_json={},
+        temperature=0.7,
+        max_tokens=100,
+        is_active=True,
+    )
+    service = MultiAgentAnalysisService(
+        db=MagicMock(),
+        inference_client=inference_client,
+        prompt_service=prompt_service,
+        prompt_cache=True,
+        inference_slots=4,
+    )
+    input_context = {
+        "lead": {"id": 42, "title": "Title", "body": "Body"},
+        "profile": {"summary": ""},
+        "items_by_type": {
+            "post": [{"text": f"post number {i}"} for i in range(3)],
+            "comment": [{"text": "a comment"}],
+        },
+    }
+
+    results = await service._run_dimension_agents(
+        analysis_id=None,
+        input_context=input_context,
+        dimensions=service.DIMENSIONS,
+    )
+
+    assert list(results) == service.DIMENSIONS
+    assert len(started) == len(service.DIMENSIONS)
+    # The first agent finishes before the others start
+    assert finished[0] == 1
+
+    contents = [messages[0].content for messages, _ in started]
+    prefix = contents[0].split("\n\nAnalyze")[0]
+    assert all(content.startswith(prefix) for content in contents)
+    assert "post number 0" in prefix
+    assert {kwargs["slot_id"] for _, kwargs in started} == {service._slot_for(input_context)}
+    assert all(kwargs["cache_prompt"] is True for _, kwargs in started)
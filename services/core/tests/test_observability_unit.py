@@ -2,6 +2,7 @@
 
 import json
 import logging
+import random
 from datetime import datetime, timezone
 from io import StringIO
 from unittest.mock import MagicMock, AsyncMock, patch
@@ -16,6 +17,7 @@ from rediska_core.observability.logging import (
     configure_logging,
 )
 from rediska_core.observability.metrics import (
+    Histogram,
     MetricsCollector,
     MetricType,
     Metric,
@@ -435,6 +437,140 @@ class TestMetricsCollector:
         assert collector.get("test_counter") == 0
         assert collector.get("test_gauge") == 0
 
+    def test_histogram_percentiles_are_configurable(self):
+        """Test requesting custom percentiles."""
+        collector = MetricsCollector(percentiles=(0.5, 0.999))
+
+        for v in range(1, 1001):
+            collector.record_histogram("latency", v)
+
+        stats = collector.get_histogram_stats("latency")
+        assert set(stats) == {"count", "min", "max", "avg", "p50", "p99.9"}
+        assert stats["p50"] == pytest.approx(500, rel=0.02)
+
+        stats = collector.get_histogram_stats("latency", percentiles=(0.9,))
+        assert stats["p90"] == pytest.approx(900, rel=0.02)
+
+    def test_prometheus_exposition(self):
+        """Test Prometheus text output for all metric types."""
+        collector = MetricsCollector(buckets=(0.1, 1.0))
+
+        collector.increment("http_requests", labels={"method": "GET"})
+        collector.set_gauge("queue_depth", 3)
+        collector.record_histogram("request_duration", 0.05, labels={"route": "/a"})
+        collector.record_histogram("request_duration", 0.5, labels={"route": "/a"})
+        collector.record_histogram("request_duration", 5, labels={"route": "/a"})
+
+        lines = collector.to_prometheus().splitlines()
+
+        assert "# TYPE http_requests counter" in lines
+        assert 'http_requests{method="GET"} 1' in lines
+        assert "queue_depth 3" in lines
+        assert "# TYPE request_duration histogram" in lines
+        assert 'request_duration_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'request_duration_bucket{route="/a",le="1"} 2' in lines
+        assert 'request_duration_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'request_duration_sum{route="/a"} 5.55' in lines
+        assert 'request_duration_count{route="/a"} 3' in lines
+
+    def test_prometheus_escapes_label_values(self):
+        """Test that quotes and newlines in label values are escaped."""
+        collector = MetricsCollector()
+
+        collector.increment("events", labels={"reason": 'bad "input"\n'})
+
+        assert 'events{reason="bad \\"input\\"\\n"} 1' in collector.to_prometheus()
+
+
+class TestHistogram:
+    """Tests for the bounded-memory histogram."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that quantile estimates stay within the configured error."""
+        rng = random.Random(11)
+        values = [rng.lognormvariate(0, 2) for _ in range(20000)]
+        histogram = Histogram(relative_accuracy=0.01)
+        for v in values:
+            histogram.record(v)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.9, 0.99):
+            expected = ordered[int(q * (len(ordered) - 1))]
+            assert histogram.quantile(q) == pytest.approx(expected, rel=0.0201)
+
+    def test_memory_does_not_grow_with_observations(self):
+        """Test that repeated values do not add sketch bins."""
+        histogram = Histogram()
+        for _ in range(10000):
+            histogram.record(0.25)
+
+        assert histogram.count == 10000
+        assert len(histogram.to_dict()["positive"]) == 1
+
+    def test_handles_zero_and_negative_values(self):
+        """Test ordering across negative, zero and positive values."""
+        histogram = Histogram()
+        for v in (-10, -1, 0, 0, 1, 10):
+            histogram.record(v)
+
+        assert histogram.quantile(0) == -10
+        assert histogram.quantile(0.5) == 0
+        assert histogram.quantile(1) == 10
+
+    def test_max_bins_collapses_lowest_bins(self):
+        """Test that the sketch is capped at max_bins."""
+        histogram = Histogram(max_bins=8)
+        for exponent in range(-6, 7):
+            histogram.record(10.0 ** exponent)
+
+        assert len(histogram.to_dict()["positive"]) == 8
+        assert histogram.quantile(1) == pytest.approx(1e6, rel=0.01)
+
+    def test_merge_matches_single_histogram(self):
+        """Test that merging partial histograms equals recording everything once."""
+        rng = random.Random(5)
+        values = [rng.uniform(0, 3) for _ in range(2000)]
+        combined, left, right = Histogram(), Histogram(), Histogram()
+        for i, v in enumerate(values):
+            combined.record(v)
+            (left if i % 2 else right).record(v)
+
+        left.merge(right)
+
+        assert left.count == combined.count
+        assert left.bucket_counts == combined.bucket_counts
+        assert left.quantile(0.95) == combined.quantile(0.95)
+        assert left.sum == pytest.approx(combined.sum)
+
+    def test_merge_rejects_incompatible(self):
+        """Test that histograms with different buckets cannot be merged."""
+        with pytest.raises(ValueError):
+            Histogram(buckets=(1.0,)).merge(Histogram(buckets=(2.0,)))
+
+    def test_dict_round_trip(self):
+        """Test serialization for transport between processes."""
+        histogram = Histogram()
+        for v in (0.01, 0.2, 3.0, -1.0, 0):
+            histogram.record(v)
+
+        restored = Histogram.from_dict(histogram.to_dict())
+
+        assert restored.summary() == histogram.summary()
+        assert restored.bucket_counts == histogram.bucket_counts
+
+    def test_collector_merge_histogram(self):
+        """Test merging a histogram from another process into a collector."""
+        remote = Histogram()
+        remote.record(2.0)
+        collector = MetricsCollector()
+        collector.record_histogram("task_duration", 1.0)
+
+        collector.merge_histogram("task_duration", remote)
+
+        stats = collector.get_histogram_stats("task_duration")
+        assert stats["count"] == 2
+        assert stats["max"] == 2.0
+
 
 class TestSystemMetrics:
     """Tests for system metrics collection."""
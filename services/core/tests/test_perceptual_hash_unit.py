@@ -0,0 +1,205 @@
+"""Unit tests for perceptual hash helpers and the BK-tree index.
+
+Tests cover:
+1. Hash parsing and signed BIGINT round trips
+2. Popcount Hamming distance (scalar and bulk paths)
+3. BK-tree range search against brute force
+4. Account-level lookups
+"""
+
+import random
+
+import pytest
+
+from rediska_core.domain.services import perceptual_hash
+from rediska_core.domain.services.perceptual_hash import (
+    BKTree,
+    PerceptualHashIndex,
+    bulk_hamming_distances,
+    compute_dhash,
+    hamming_distance,
+    hash_bit_length,
+    parse_hash,
+    to_db_value,
+)
+
+
+# =============================================================================
+# HASH HELPER TESTS
+# =============================================================================
+
+
+class TestHashHelpers:
+    """Tests for parsing and distance helpers."""
+
+    def test_parse_bit_string(self):
+        """Bit strings should parse as base 2."""
+        assert parse_hash("0101", "bin") == 5
+        assert hash_bit_length("0101", "bin") == 4
+
+    def test_parse_hex_string(self):
+        """Hex strings should parse as base 16."""
+        assert parse_hash("ff00", "hex") == 0xFF00
+        assert hash_bit_length("ff00", "hex") == 16
+
+    def test_hex_string_of_zeros_and_ones(self):
+        """A hex hash using only 0 and 1 digits should not be read as binary."""
+        assert parse_hash("0101", "hex") == 0x0101
+        assert hash_bit_length("0101", "hex") == 16
+
+    def test_string_without_format_rejected(self):
+        """String hashes should require an explicit format."""
+        with pytest.raises(ValueError):
+            parse_hash("0101")
+        with pytest.raises(ValueError):
+            hash_bit_length("ff00")
+
+    def test_wide_hashes_rejected(self):
+        """Hashes wider than 64 bits should not be truncated silently."""
+        with pytest.raises(ValueError):
+            parse_hash("f" * 17, "hex")
+        with pytest.raises(ValueError):
+            parse_hash("1" * 65, "bin")
+        with pytest.raises(ValueError):
+            parse_hash(1 << 64)
+
+    def test_signed_db_value_round_trip(self):
+        """Hashes with the top bit set should survive a signed BIGINT column."""
+        value = (1 << 63) | 12345
+        stored = to_db_value(value)
+
+        assert -(1 << 63) <= stored < 0
+        assert parse_hash(stored) == value
+
+    def test_hamming_distance_counts_bits(self):
+        """Distance should be the number of differing bits."""
+        assert hamming_distance(0b1010, 0b0101) == 4
+        assert hamming_distance(0, 0) == 0
+
+    def test_bulk_distances_match_scalar(self):
+        """Bulk distances should agree with the scalar popcount."""
+        rng = random.Random(7)
+        hashes = [rng.getrandbits(64) for _ in range(50)]
+        query = rng.getrandbits(64)
+
+        assert bulk_hamming_distances(query, hashes) == [
+            hamming_distance(query, h) for h in hashes
+        ]
+
+    def test_bulk_distances_wider_than_64_bits(self):
+        """Values outside the uint64 range should use the exact popcount path."""
+        wide = (1 << 70) | 1
+
+        assert bulk_hamming_distances(wide, [0, 1]) == [2, 1]
+
+    def test_bulk_distances_without_numpy(self, monkeypatch):
+        """The fallback path should work when NumPy is unavailable."""
+        monkeypatch.setattr(perceptual_hash, "np", None)
+
+        assert bulk_hamming_distances(0b1111, [0, 0b1110]) == [4, 1]
+
+
+# =============================================================================
+# BK-TREE TESTS
+# =============================================================================
+
+
+class TestBKTree:
+    """Tests for BK-tree range search."""
+
+    def test_empty_tree(self):
+        """Searching an empty tree should return nothing."""
+        assert BKTree().search(0, 10) == []
+
+    def test_duplicate_hashes_share_node(self):
+        """Items with identical hashes should all be returned."""
+        tree = BKTree()
+        tree.add(42, "a")
+        tree.add(42, "b")
+
+        assert sorted(item for _, item in tree.search(42, 0)) == ["a", "b"]
+        assert len(tree) == 2
+
+    def test_search_matches_brute_force(self):
+        """Range search should return exactly the brute-force matches."""
+        rng = random.Random(3)
+        base = [rng.getrandbits(64) for _ in range(20)]
+        hashes = []
+        for value in base:
+            hashes.append(value)
+            for _ in range(10):
+                flipped = value
+                for _ in range(rng.randint(1, 12)):
+                    flipped ^= 1 << rng.randrange(64)
+                hashes.append(flipped)
+
+        tree = BKTree()
+        for idx, value in enumerate(hashes):
+            tree.add(value, idx)
+
+        for query in base[:5]:
+            expected = {
+                idx for idx, value in enumerate(hashes) if hamming_distance(query, value) <= 6
+            }
+            assert {idx for _, idx in tree.search(query, 6)} == expected
+
+
+# =============================================================================
+# ACCOUNT INDEX TESTS
+# =============================================================================
+
+
+class TestPerceptualHashIndex:
+    """Tests for account-level lookups."""
+
+    def test_find_accounts_within_distance(self):
+        """Accounts with near hashes should be returned with their distance."""
+        index = PerceptualHashIndex([(0b0000, 1), (0b0011, 2), (0xFFFF, 3)])
+
+        assert index.find_accounts(0b0001, max_distance=2) == {1: 1, 2: 1}
+
+    def test_find_accounts_keeps_smallest_distance(self):
+        """An account with several images should report its closest one."""
+        index = PerceptualHashIndex([(0b0111, 1), (0b0001, 1)])
+
+        assert index.find_accounts(0, max_distance=5) == {1: 1}
+
+    def test_find_accounts_excludes_source(self):
+        """The excluded account should not appear in results."""
+        index = PerceptualHashIndex([(0, 1), (1, 2)])
+
+        assert index.find_accounts(0, max_distance=1, exclude_account_id=1) == {2: 1}
+
+    def test_accepts_signed_db_values(self):
+        """Signed values read from the database should match unsigned queries."""
+        value = (1 << 63) | 5
+        index = PerceptualHashIndex([(to_db_value(value), 9)])
+
+        assert index.find_accounts(value, max_distance=0) == {9: 0}
+
+
+class TestComputeDhash:
+    """Tests for hash computation from image bytes."""
+
+    def test_similar_images_have_close_hashes(self):
+        """A resized copy of an image should hash within a few bits."""
+        pil_image = pytest.importorskip("PIL.Image")
+        import io
+
+        image = pil_image.new("L", (64, 64))
+        image.putdata([(x * 4 + y) % 256 for y in range(64) for x in range(64)])
+
+        original = io.BytesIO()
+        image.save(original, format="PNG")
+        resized = io.BytesIO()
+        image.resize((128, 128)).save(resized, format="PNG")
+
+        hash_a = compute_dhash(original.getvalue())
+        hash_b = compute_dhash(resized.getvalue())
+
+        assert hash_a is not None
+        assert hamming_distance(hash_a, hash_b) <= 6
+
+    def test_invalid_data_returns_none(self):
+        """Undecodable data should not raise."""
+        assert compute_dhash(b"not an image") is None
@@ -0,0 +1,142 @@
+"""Unit tests for bulk profile item upserts.
+
+Tests cover:
+1. Column values for fetched posts and comments
+2. Inserting new items and refreshing existing ones in one upsert
+3. Reporting only new or changed items for reindexing
+"""
+
+from datetime import datetime
+
+from rediska_core.domain.models import ProfileItem
+from rediska_core.domain.services.profile_item_utils import (
+    profile_item_values,
+    upsert_profile_items,
+)
+from rediska_core.providers.base import ProfileItemType, ProviderProfileItem
+from tests.factories import create_external_account
+
+CREATED = datetime(2024, 6, 1, 12, 0)
+
+
+def make_post(external_id: str, title: str = "Title", body: str = "Body") -> ProviderProfileItem:
+    return ProviderProfileItem(
+        external_id=external_id,
+        item_type=ProfileItemType.POST,
+        author_id="t2_x",
+        title=title,
+        body_text=body,
+        created_at=CREATED,
+        location="r/test",
+    )
+
+
+def make_comment(external_id: str, body: str = "Nice") -> ProviderProfileItem:
+    return ProviderProfileItem(
+        external_id=external_id,
+        item_type=ProfileItemType.COMMENT,
+        author_id="t2_x",
+        title="Parent post",
+        body_text=body,
+        created_at=CREATED,
+        location="r/test",
+        raw_data={"link_id": "t3_parent"},
+    )
+
+
+def stored_items(db, account) -> dict[str, ProfileItem]:
+    db.expire_all()
+    items = db.query(ProfileItem).filter_by(account_id=account.id).all()
+    return {item.external_item_id: item for item in items}
+
+
+class TestProfileItemValues:
+    """Tests for converting fetched items to column values."""
+
+    def test_post_combines_title_and_body(self):
+        """Posts store title and body together."""
+        values = profile_item_values(make_post("p1"))
+
+        assert values["item_type"] == "post"
+        assert values["text_content"] == "Title\n\nBody"
+        assert values["link_title"] is None
+
+    def test_comment_keeps_parent_title(self):
+        """Comments keep the parent post's title and link ID."""
+        values = profile_item_values(make_comment("c1"))
+
+        assert values["item_type"] == "comment"
+        assert values["text_content"] == "Nice"
+        assert (values["link_title"], values["link_id"]) == ("Parent post", "t3_parent")
+
+
+class TestUpsertProfileItems:
+    """Tests for the bulk upsert."""
+
+    def test_inserts_new_items(self, db_session):
+        """New posts and comments are inserted and reported."""
+        account = create_external_account(db_session)
+        rows = [profile_item_values(make_post("p1")), profile_item_values(make_comment("c1"))]
+
+        changed = upsert_profile_items(db_session, account.id, rows)
+
+        items = stored_items(db_session, account)
+        assert set(items) == {"p1", "c1"}
+        assert sorted(changed) == sorted(item.id for item in items.values())
+        assert items["c1"].remote_visibility == "visible"
+
+    def test_refreshes_existing_and_reports_changes(self, db_session):
+        """Existing items are updated; only edited ones need reindexing."""
+        account = create_external_account(db_session)
+        upsert_profile_items(db_session, account.id, [
+            profile_item_values(make_post("p1")),
+            profile_item_values(make_post("p2")),
+        ])
+        before = stored_items(db_session, account)
+        before["p2"].remote_visibility = "deleted_by_author"
+        db_session.flush()
+
+        changed = upsert_profile_items(db_session, account.id, [
+            profile_item_values(make_post("p1")),
+            profile_item_values(make_post("p2", body="Edited")),
+            profile_item_values(make_post("p3")),
+        ])
+
+        items = stored_items(db_session, account)
+        assert len(items) == 3
+        assert items["p2"].text_content == "Title\n\nEdited"
+        assert items["p2"].remote_visibility == "visible"
+        assert sorted(changed) == sorted([items["p2"].id, items["p3"].id])
+
+    def test_missing_created_at_keeps_stored_value(self, db_session):
+        """A row without a creation time should not clear the stored one."""
+        account = create_external_account(db_session)
+        upsert_profile_items(db_session, account.id, [profile_item_values(make_post("p1"))])
+
+        row = profile_item_values(make_post("p1", body="Edited"))
+        row["item_created_at"] = None
+        upsert_profile_items(db_session, account.id, [row])
+
+        item = stored_items(db_session, account)["p1"]
+        assert item.text_content == "Title\n\nEdited"
+        assert item.item_created_at == CREATED
+
+    def test_first_duplicate_wins(self, db_session):
+        """Repeated keys in one call are stored once, from the first row."""
+        account = create_external_account(db_session)
+
+        upsert_profile_items(db_session, account.id, [
+            profile_item_values(make_post("p1", body="First")),
+            profile_item_values(make_post("p1", body="Second")),
+            {"item_type": "post", "external_item_id": None},
+        ])
+
+        items = stored_items(db_session, account)
+        assert list(items) == ["p1"]
+        assert items["p1"].text_content == "Title\n\nFirst"
+
+    def test_empty_rows(self, db_session):
+        """Nothing to store runs no statements."""
+        account = create_external_account(db_session)
+
+        assert upsert_profile_items(db_session, account.id, []) == []
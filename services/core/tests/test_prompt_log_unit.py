@@ -0,0 +1,191 @@
+"""Unit tests for sampled prompt capture.
+
+Tests cover:
+1. Sampling and forced capture scopes
+2. Redaction of sensitive values
+3. Compressed, rotating log files
+4. Dropping records instead of blocking
+5. InferenceClient handing exchanges to the prompt log
+"""
+
+import asyncio
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from rediska_core.domain.services.inference import (
+    ChatMessage,
+    InferenceClient,
+    InferenceConfig,
+    ResponseInferenceError,
+)
+from rediska_core.infrastructure.prompt_log import (
+    PromptLog,
+    RotatingGzipWriter,
+    add_capture_tags,
+    capture_scope,
+    redact_text,
+)
+
+
+def read_records(directory) -> list[dict]:
+    records = []
+    for path in sorted(directory.glob("prompts-*.jsonl.gz")):
+        with gzip.open(path, "rt") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+
+class TestSampling:
+    """Tests for deciding what to capture."""
+
+    def test_disabled_without_directory(self):
+        """Nothing is captured when no directory is configured."""
+        prompt_log = PromptLog(directory=None, sample_rate=1.0)
+
+        with capture_scope(force=True):
+            assert not prompt_log.record("chat", response="hi")
+
+    def test_unsampled_outside_forced_scope(self, tmp_path):
+        """A zero sample rate captures only inside forced scopes."""
+        prompt_log = PromptLog(directory=str(tmp_path), sample_rate=0.0)
+
+        assert not prompt_log.record("chat", response="skipped")
+        with capture_scope(force=True, lead_id=7):
+            with capture_scope(agent="demographics"):
+                add_capture_tags(analysis_id=3)
+                assert prompt_log.record("chat", response="kept")
+        prompt_log.close()
+
+        records = read_records(tmp_path)
+        assert len(records) == 1
+        assert records[0]["response"] == "kept"
+        assert records[0]["lead_id"] == 7
+        assert records[0]["agent"] == "demographics"
+        assert records[0]["analysis_id"] == 3
+
+    @pytest.mark.asyncio
+    async def test_scope_follows_gathered_tasks(self, tmp_path):
+        """Forced capture set around an analysis applies to its agent tasks."""
+        prompt_log = PromptLog(directory=str(tmp_path), sample_rate=0.0)
+
+        async def agent(name):
+            with capture_scope(agent=name):
+                return prompt_log.record("chat")
+
+        with capture_scope(force=True, lead_id=1):
+            results = await asyncio.gather(agent("a"), agent("b"))
+        prompt_log.close()
+
+        assert results == [True, True]
+        assert sorted(r["agent"] for r in read_records(tmp_path)) == ["a", "b"]
+
+
+# =============================================================================
+# REDACTION
+# =============================================================================
+
+
+class TestRedaction:
+    """Tests for masking sensitive values."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("mail bob.smith@example.com", "mail [email]"),
+            ("call +1 555-123-4567 now", "call [phone] now"),
+            ("api_key=sk-abc123, ok", "api_key=[redacted], ok"),
+            ("Authorization: Bearer eyJ.abc", "Authorization: Bearer [redacted]"),
+            ("https://user:pw@host/path", "https://[redacted]@host/path"),
+            ("post 1700000000000 about password reset", "post 1700000000000 about password reset"),
+        ],
+    )
+    def test_redact_text(self, text, expected):
+        """Sensitive values are masked and ordinary text is left alone."""
+        assert redact_text(text) == expected
+
+    def test_records_redacted_on_disk(self, tmp_path):
+        """Nested message content is redacted before it is written."""
+        prompt_log = PromptLog(directory=str(tmp_path))
+
+        with capture_scope(force=True):
+            prompt_log.record("chat", messages=[{"role": "user", "content": "me@example.com"}])
+        prompt_log.close()
+
+        assert read_records(tmp_path)[0]["messages"][0]["content"] == "[email]"
+
+
+# =============================================================================
+# FILES AND QUEUE
+# =============================================================================
+
+
+class TestFiles:
+    """Tests for rotating gzip files and the bounded queue."""
+
+    def test_rotates_and_prunes(self, tmp_path):
+        """Files rotate by size and only backup_count are kept."""
+        writer = RotatingGzipWriter(str(tmp_path), max_bytes=10, backup_count=2)
+
+        for i in range(5):
+            writer.write(f"line {i:08d}")
+        writer.close()
+
+        files = sorted(tmp_path.glob("prompts-*.jsonl.gz"))
+        assert len(files) == 2
+        with gzip.open(files[-1], "rt") as f:
+            assert f.read() == "line 00000004\n"
+
+    def test_full_queue_drops(self, tmp_path):
+        """Records beyond the queue size are dropped, not waited on."""
+        prompt_log = PromptLog(directory=str(tmp_path), queue_size=1)
+
+        with patch.object(prompt_log, "_ensure_writer"), capture_scope(force=True):
+            assert prompt_log.record("chat")
+            assert not prompt_log.record("chat")
+
+        assert prompt_log.dropped == 1
+
+
+# =============================================================================
+# INFERENCE CLIENT
+# =============================================================================
+
+
+class TestInferenceCapture:
+    """Tests for capture from the inference client."""
+
+    @pytest.mark.asyncio
+    async def test_chat_exchange_captured(self, tmp_path):
+        """Successful and failed chats are both captured."""
+        prompt_log = PromptLog(directory=str(tmp_path))
+        client = InferenceClient(
+            config=InferenceConfig(base_url="http://localhost:8080"),
+            prompt_log=prompt_log,
+        )
+        messages = [ChatMessage(role="user", content="Hi")]
+
+        with capture_scope(force=True), patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = {
+                "choices": [{"message": {"content": "Hello!"}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 3, "completion_tokens": 2},
+            }
+            await client.chat(messages)
+
+            mock_request.return_value = {"error": {"message": "overloaded"}}
+            with pytest.raises(ResponseInferenceError):
+                await client.chat(messages)
+        prompt_log.close()
+
+        ok, failed = read_records(tmp_path)
+        assert ok["messages"] == [{"role": "user", "content": "Hi"}]
+        assert ok["response"] == "Hello!"
+        assert ok["model_info"]["output_tokens"] == 2
+        assert "overloaded" in failed["error"]
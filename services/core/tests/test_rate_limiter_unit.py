@@ -2,10 +2,11 @@
 
 These tests follow TDD - written BEFORE implementation.
 Tests cover:
-- Token bucket rate limiting
-- Inflight concurrency limiting
+- Token bucket rate limiting (single Lua script call)
+- Inflight concurrency leases
 - Combined rate + concurrency limiting
 - Backoff strategy for 429/5xx errors
+- Refill adaptation from provider headers
 """
 
 import asyncio
@@ -16,48 +17,42 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from rediska_core.infrastructure.rate_limiter import (
+    ACQUIRE_SCRIPT,
+    ACQUIRE_SHA,
+    ADAPT_SHA,
     BackoffStrategy,
     RateLimiter,
     RateLimitConfig,
     RateLimitExceeded,
+    get_provider_rate_limiter,
 )
 
 
-class MockPipeline:
-    """Mock Redis pipeline that supports chaining and async execute."""
-
-    def set(self, key, value):
-        return self
-
-    def delete(self, *keys):
-        return self
-
-    def expire(self, key, seconds):
-        return self
-
-    async def execute(self):
-        return [True, True, True]
-
-
 @pytest.fixture
 def mock_async_redis():
-    """Create a mock async Redis client for testing."""
-    mock = MagicMock()
+    """Create a mock async Redis client for testing.
 
-    # Async methods need to be AsyncMock
-    mock.get = AsyncMock(return_value=None)
-    mock.set = AsyncMock(return_value=True)
-    mock.incr = AsyncMock(return_value=1)
-    mock.decr = AsyncMock(return_value=0)
-    mock.delete = AsyncMock(return_value=1)
-    mock.expire = AsyncMock(return_value=True)
+    evalsha returns the acquire script's reply: [1, 0] when acquired,
+    [0, retry_after_ms] when not.
+    """
+    mock = MagicMock()
 
-    # pipeline() is sync and returns a pipeline object
-    mock.pipeline = MagicMock(return_value=MockPipeline())
+    mock.evalsha = AsyncMock(return_value=[1, 0])
+    mock.eval = AsyncMock(return_value=[1, 0])
+    mock.zrem = AsyncMock(return_value=1)
+    mock.hmget = AsyncMock(return_value=[None, None, None])
+    mock.zcount = AsyncMock(return_value=0)
+    mock.delete = AsyncMock(return_value=2)
 
     return mock
 
 
+def script_args(call):
+    """Split an evalsha call into (sha, keys, args)."""
+    sha, numkeys, *rest = call.args
+    return sha, rest[:numkeys], rest[numkeys:]
+
+
 class TestRateLimitConfig:
     """Tests for rate limit configuration."""
 
@@ -90,9 +85,6 @@ class TestTokenBucket:
     @pytest.mark.asyncio
     async def test_acquire_token_success(self, mock_async_redis):
         """Test successfully acquiring a token."""
-        # Setup Redis mock to return available tokens
-        mock_async_redis.get.return_value = b"10"  # 10 tokens available
-
         config = RateLimitConfig(provider_id="reddit", requests_per_minute=60)
         limiter = RateLimiter(mock_async_redis, config)
 
@@ -103,10 +95,7 @@ class TestTokenBucket:
     @pytest.mark.asyncio
     async def test_acquire_token_empty_bucket(self, mock_async_redis):
         """Test acquiring token when bucket is empty."""
-        # Setup Redis mock to return no tokens and recent refill time
-        # (so no tokens will be added via refill)
-        now = str(time.time()).encode()
-        mock_async_redis.get.side_effect = [b"0", now]  # tokens=0, last_refill=now
+        mock_async_redis.evalsha.return_value = [0, 1000]
 
         config = RateLimitConfig(provider_id="reddit", requests_per_minute=60)
         limiter = RateLimiter(mock_async_redis, config)
@@ -116,36 +105,40 @@ class TestTokenBucket:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_acquire_token_refills_bucket(self, mock_async_redis):
-        """Test that tokens are refilled based on elapsed time."""
-        # Mock: bucket was empty but time has passed for refill
-        mock_async_redis.get.side_effect = [
-            b"0",  # Current tokens
-            str(time.time() - 60).encode(),  # Last refill was 60 seconds ago
-        ]
-
+    async def test_acquire_token_is_one_script_call(self, mock_async_redis):
+        """Test that refill and take happen in a single atomic script."""
         config = RateLimitConfig(provider_id="reddit", requests_per_minute=60)
         limiter = RateLimiter(mock_async_redis, config)
 
-        # After refill, should have tokens available
-        result = await limiter.acquire_token()
+        await limiter.acquire_token()
 
-        # The limiter should have attempted to refill
-        assert mock_async_redis.get.called
+        assert mock_async_redis.evalsha.await_count == 1
+        sha, keys, args = script_args(mock_async_redis.evalsha.call_args)
+        assert sha == ACQUIRE_SHA
+        assert args[1] == 1.0  # refill rate in tokens per second
+        assert args[6:] == [1, 0]  # take token, no lease
 
     @pytest.mark.asyncio
     async def test_token_bucket_keys(self, mock_async_redis):
         """Test that correct Redis keys are used."""
-        mock_async_redis.get.return_value = b"10"
-
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
 
         await limiter.acquire_token()
 
-        # Should use provider-specific keys
-        calls = [str(call) for call in mock_async_redis.get.call_args_list]
-        assert any("reddit" in call for call in calls)
+        _, keys, _ = script_args(mock_async_redis.evalsha.call_args)
+        assert keys == ["rate:reddit:bucket", "rate:reddit:leases"]
+
+    @pytest.mark.asyncio
+    async def test_loads_script_when_not_cached(self, mock_async_redis):
+        """Test falling back to EVAL when Redis has not cached the script."""
+        mock_async_redis.evalsha.side_effect = Exception("NOSCRIPT No matching script")
+
+        config = RateLimitConfig(provider_id="reddit")
+        limiter = RateLimiter(mock_async_redis, config)
+
+        assert await limiter.acquire_token() is True
+        assert mock_async_redis.eval.call_args.args[0] == ACQUIRE_SCRIPT
 
     @pytest.mark.asyncio
     async def test_release_token_not_needed(self, mock_async_redis):
@@ -163,19 +156,20 @@ class TestInflightConcurrency:
     @pytest.mark.asyncio
     async def test_acquire_slot_success(self, mock_async_redis):
         """Test successfully acquiring a concurrency slot."""
-        mock_async_redis.incr.return_value = 1  # First request
-
         config = RateLimitConfig(provider_id="reddit", max_concurrent=5)
         limiter = RateLimiter(mock_async_redis, config)
 
         result = await limiter.acquire_slot()
 
         assert result is True
+        _, _, args = script_args(mock_async_redis.evalsha.call_args)
+        assert args[3] == 5
+        assert args[6:] == [0, 1]  # lease only
 
     @pytest.mark.asyncio
     async def test_acquire_slot_at_limit(self, mock_async_redis):
         """Test acquiring slot when at concurrency limit."""
-        mock_async_redis.incr.return_value = 6  # Over limit of 5
+        mock_async_redis.evalsha.return_value = [0, 50]
 
         config = RateLimitConfig(provider_id="reddit", max_concurrent=5)
         limiter = RateLimiter(mock_async_redis, config)
@@ -183,31 +177,45 @@ class TestInflightConcurrency:
         result = await limiter.acquire_slot()
 
         assert result is False
-        # Should have decremented back
-        mock_async_redis.decr.assert_called()
+        # Nothing to release when the lease was not granted
+        await limiter.release_slot()
+        mock_async_redis.zrem.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_release_slot(self, mock_async_redis):
-        """Test releasing a concurrency slot."""
+        """Test releasing a concurrency slot removes its lease."""
         config = RateLimitConfig(provider_id="reddit", max_concurrent=5)
         limiter = RateLimiter(mock_async_redis, config)
 
+        await limiter.acquire_slot()
+        _, _, args = script_args(mock_async_redis.evalsha.call_args)
         await limiter.release_slot()
 
-        mock_async_redis.decr.assert_called()
+        mock_async_redis.zrem.assert_awaited_once_with("rate:reddit:leases", args[5])
 
     @pytest.mark.asyncio
-    async def test_slot_key_has_expiry(self, mock_async_redis):
-        """Test that inflight key has TTL to prevent leaks."""
-        mock_async_redis.incr.return_value = 1
-
-        config = RateLimitConfig(provider_id="reddit", max_concurrent=5)
+    async def test_slot_lease_has_expiry(self, mock_async_redis):
+        """Test that leases carry a TTL to prevent leaks from crashed holders."""
+        config = RateLimitConfig(
+            provider_id="reddit", max_concurrent=5, lease_ttl_seconds=45
+        )
         limiter = RateLimiter(mock_async_redis, config)
 
         await limiter.acquire_slot()
 
-        # Should set expiry on the key
-        mock_async_redis.expire.assert_called()
+        _, _, args = script_args(mock_async_redis.evalsha.call_args)
+        assert args[4] == 45000
+
+    @pytest.mark.asyncio
+    async def test_leases_have_distinct_holders(self, mock_async_redis):
+        """Test that each lease is tracked under its own holder ID."""
+        config = RateLimitConfig(provider_id="reddit")
+        limiter = RateLimiter(mock_async_redis, config)
+
+        first = await limiter.acquire_lease()
+        second = await limiter.acquire_lease()
+
+        assert first and second and first != second
 
 
 class TestCombinedRateLimiting:
@@ -215,10 +223,7 @@ class TestCombinedRateLimiting:
 
     @pytest.mark.asyncio
     async def test_acquire_checks_both(self, mock_async_redis):
-        """Test that acquire checks both token and slot."""
-        mock_async_redis.get.return_value = b"10"  # Tokens available
-        mock_async_redis.incr.return_value = 1  # Slot available
-
+        """Test that acquire takes a token and a lease in one script call."""
         config = RateLimitConfig(
             provider_id="reddit",
             requests_per_minute=60,
@@ -229,14 +234,14 @@ class TestCombinedRateLimiting:
         result = await limiter.acquire()
 
         assert result is True
+        assert mock_async_redis.evalsha.await_count == 1
+        _, _, args = script_args(mock_async_redis.evalsha.call_args)
+        assert args[6:] == [1, 1]
 
     @pytest.mark.asyncio
-    async def test_acquire_fails_if_no_tokens(self, mock_async_redis):
-        """Test that acquire fails if no tokens available."""
-        # No tokens and recent refill (so no tokens added)
-        now = str(time.time()).encode()
-        mock_async_redis.get.side_effect = [b"0", now]
-        mock_async_redis.incr.return_value = 1  # Slot available
+    async def test_acquire_fails_when_script_refuses(self, mock_async_redis):
+        """Test that acquire fails if no token or slot is available."""
+        mock_async_redis.evalsha.return_value = [0, 500]
 
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
@@ -246,34 +251,19 @@ class TestCombinedRateLimiting:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_acquire_fails_if_no_slots(self, mock_async_redis):
-        """Test that acquire fails if no slots available."""
-        mock_async_redis.get.return_value = b"10"  # Tokens available
-        mock_async_redis.incr.return_value = 100  # Way over slot limit
-
-        config = RateLimitConfig(provider_id="reddit", max_concurrent=5)
-        limiter = RateLimiter(mock_async_redis, config)
-
-        result = await limiter.acquire()
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_release_decrements_slot(self, mock_async_redis):
-        """Test that release decrements the slot counter."""
+    async def test_release_removes_lease(self, mock_async_redis):
+        """Test that release removes the lease taken by acquire."""
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
 
+        await limiter.acquire()
         await limiter.release()
 
-        mock_async_redis.decr.assert_called()
+        mock_async_redis.zrem.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_context_manager(self, mock_async_redis):
         """Test using rate limiter as async context manager."""
-        mock_async_redis.get.return_value = b"10"
-        mock_async_redis.incr.return_value = 1
-
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
 
@@ -282,14 +272,12 @@ class TestCombinedRateLimiting:
             pass
 
         # Should have released after exit
-        mock_async_redis.decr.assert_called()
+        mock_async_redis.zrem.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_context_manager_raises_on_failure(self, mock_async_redis):
         """Test that context manager raises if cannot acquire."""
-        # No tokens and recent refill (so no tokens added)
-        now = str(time.time()).encode()
-        mock_async_redis.get.side_effect = [b"0", now]
+        mock_async_redis.evalsha.return_value = [0, 1000]
 
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
@@ -409,9 +397,7 @@ class TestRateLimiterWait:
     @pytest.mark.asyncio
     async def test_wait_for_token(self, mock_async_redis):
         """Test waiting for a token to become available."""
-        # First call: no tokens, second call: tokens available
-        mock_async_redis.get.side_effect = [b"0", b"10"]
-        mock_async_redis.incr.return_value = 1
+        mock_async_redis.evalsha.side_effect = [[0, 10], [1, 0]]
 
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
@@ -424,50 +410,51 @@ class TestRateLimiterWait:
     @pytest.mark.asyncio
     async def test_wait_timeout(self, mock_async_redis):
         """Test that wait times out if no tokens available."""
-        # Always return no tokens with recent refill
-        now = str(time.time()).encode()
-
-        def get_side_effect(key):
-            if "tokens" in key:
-                return b"0"
-            return now  # last_refill
-
-        mock_async_redis.get.side_effect = get_side_effect
+        mock_async_redis.evalsha.return_value = [0, 10000]
 
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
 
-        # Should timeout
+        start = time.monotonic()
         result = await limiter.acquire(wait=True, timeout=0.1)
 
         assert result is False
+        # The long retry hint is capped by the remaining timeout
+        assert time.monotonic() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_wait_uses_retry_hint(self, mock_async_redis):
+        """Test that waiting sleeps for the script's retry hint."""
+        mock_async_redis.evalsha.side_effect = [[0, 200], [0, 200], [1, 0]]
+
+        config = RateLimitConfig(provider_id="reddit")
+        limiter = RateLimiter(mock_async_redis, config)
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await limiter.acquire(wait=True, timeout=5.0)
+
+        assert result is True
+        assert sleep.await_count == 2
+        assert all(0.2 <= c.args[0] <= 0.25 for c in sleep.await_args_list)
+
+
+class TestHeaderAdaptation:
+    """Tests for adapting the refill rate from provider headers."""
 
     @pytest.mark.asyncio
-    async def test_wait_with_backoff(self, mock_async_redis):
-        """Test that waiting uses backoff between retries."""
-        call_count = [0]
-        call_times = []
-        now = str(time.time()).encode()
-
-        async def mock_get(key):
-            call_times.append(time.time())
-            if "tokens" in key:
-                call_count[0] += 1
-                # Return 0 tokens for first 2 token checks, then 10
-                return b"0" if call_count[0] < 3 else b"10"
-            return now  # last_refill - always recent
-
-        mock_async_redis.get.side_effect = mock_get
-        mock_async_redis.incr.return_value = 1
+    async def test_update_from_headers_runs_adapt_script(self, mock_async_redis):
+        """Test that remaining/reset headers are passed to the adapt script."""
+        mock_async_redis.evalsha.return_value = 1
 
         config = RateLimitConfig(provider_id="reddit")
         limiter = RateLimiter(mock_async_redis, config)
 
-        await limiter.acquire(wait=True, timeout=5.0)
+        await limiter.update_from_headers(remaining=12.0, reset_seconds=30)
 
-        # Should have had some delays between retry attempts
-        # At least 3 token checks (2 failures + 1 success)
-        assert call_count[0] >= 3
+        sha, keys, args = script_args(mock_async_redis.evalsha.call_args)
+        assert sha == ADAPT_SHA
+        assert keys == ["rate:reddit:bucket"]
+        assert args[1:] == [12.0, 30000]
 
 
 class TestRateLimiterStats:
@@ -476,7 +463,9 @@ class TestRateLimiterStats:
     @pytest.mark.asyncio
     async def test_get_stats(self, mock_async_redis):
         """Test getting rate limiter statistics."""
-        mock_async_redis.get.side_effect = [b"45", b"3"]  # tokens, inflight
+        future_ms = str((time.time() + 60) * 1000).encode()
+        mock_async_redis.hmget.return_value = [b"45.5", b"0.5", future_ms]
+        mock_async_redis.zcount.return_value = 3
 
         config = RateLimitConfig(
             provider_id="reddit",
@@ -492,6 +481,7 @@ class TestRateLimiterStats:
         assert stats["inflight_count"] == 3
         assert stats["max_concurrent"] == 5
         assert stats["requests_per_minute"] == 60
+        assert stats["adapted_requests_per_minute"] == 30
 
 
 class TestMultipleProviders:
@@ -500,9 +490,6 @@ class TestMultipleProviders:
     @pytest.mark.asyncio
     async def test_separate_limits_per_provider(self, mock_async_redis):
         """Test that each provider has separate limits."""
-        mock_async_redis.get.return_value = b"10"
-        mock_async_redis.incr.return_value = 1
-
         reddit_config = RateLimitConfig(provider_id="reddit", requests_per_minute=60)
         twitter_config = RateLimitConfig(provider_id="twitter", requests_per_minute=100)
 
@@ -512,20 +499,29 @@ class TestMultipleProviders:
         await reddit_limiter.acquire()
         await twitter_limiter.acquire()
 
-        # Both should have used different keys
-        get_calls = mock_async_redis.get.call_args_list
-        keys_used = [str(call) for call in get_calls]
+        keys_used = [
+            script_args(call)[1][0] for call in mock_async_redis.evalsha.call_args_list
+        ]
+        assert keys_used == ["rate:reddit:bucket", "rate:twitter:bucket"]
+
+    def test_shared_limiter_per_client_id(self):
+        """Test that the same client ID shares one limiter and bucket."""
+        first = get_provider_rate_limiter("reddit", "client-a")
+        again = get_provider_rate_limiter("reddit", "client-a")
+        other = get_provider_rate_limiter("reddit", "client-b")
 
-        assert any("reddit" in k for k in keys_used)
-        assert any("twitter" in k for k in keys_used)
+        assert first is again
+        assert first is not other
+        assert first.config.provider_id == "reddit:client-a"
+        assert first.config.bucket_size >= first.config.requests_per_minute
 
 
 class TestRateLimiterReset:
     """Tests for resetting rate limiter state."""
 
     @pytest.mark.asyncio
-    async def test_reset_tokens(self, mock_async_redis):
-        """Test resetting token bucket to full."""
+    async def test_reset_deletes_state(self, mock_async_redis):
+        """Test resetting token bucket and leases."""
         config = RateLimitConfig(
             provider_id="reddit",
             bucket_size=100,
@@ -534,16 +530,73 @@ class TestRateLimiterReset:
 
         await limiter.reset()
 
-        # Should have used pipeline to set tokens
-        mock_async_redis.pipeline.assert_called()
+        mock_async_redis.delete.assert_awaited_once_with(
+            "rate:reddit:bucket", "rate:reddit:leases"
+        )
+
+
+class TestPerLoopRedisClients:
+    """Tests for Redis clients created per event loop from a URL."""
+
+    @staticmethod
+    def make_client(*args, **kwargs):
+        client = MagicMock()
+        client.evalsha = AsyncMock(return_value=[1, 0])
+        client.aclose = AsyncMock()
+        return client
+
+    def test_each_loop_gets_its_own_client(self):
+        """A client opened on a finished loop should never be reused."""
+        limiter = RateLimiter(
+            None, RateLimitConfig(provider_id="reddit"), redis_url="redis://test"
+        )
+
+        async def current_client():
+            return limiter._get_redis()
+
+        with patch("redis.asyncio.from_url", side_effect=self.make_client):
+            clients = [asyncio.run(current_client()) for _ in range(5)]
+
+        assert len({id(c) for c in clients}) == 5
+        assert len(limiter._loop_clients) <= 1
+
+    def test_evicts_client_of_running_loop_elsewhere(self):
+        """A client whose loop is still running should be closed on that loop."""
+        import threading
+
+        limiter = RateLimiter(
+            None, RateLimitConfig(provider_id="reddit"), redis_url="redis://test"
+        )
+        owner = asyncio.new_event_loop()
+        thread = threading.Thread(target=owner.run_forever, daemon=True)
+        thread.start()
+
+        async def current_client():
+            return limiter._get_redis()
+
+        try:
+            with patch("redis.asyncio.from_url", side_effect=self.make_client):
+                first = asyncio.run_coroutine_threadsafe(current_client(), owner).result(5)
+                asyncio.run(current_client())
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), owner).result(5)
+
+            first.aclose.assert_awaited_once()
+            assert owner not in limiter._loop_clients
+        finally:
+            owner.call_soon_threadsafe(owner.stop)
+            thread.join(timeout=5)
+            owner.close()
 
     @pytest.mark.asyncio
-    async def test_reset_inflight(self, mock_async_redis):
-        """Test resetting inflight counter."""
-        config = RateLimitConfig(provider_id="reddit")
-        limiter = RateLimiter(mock_async_redis, config)
+    async def test_aclose_closes_current_client(self):
+        """aclose should close and forget the running loop's client."""
+        limiter = RateLimiter(
+            None, RateLimitConfig(provider_id="reddit"), redis_url="redis://test"
+        )
 
-        await limiter.reset()
+        with patch("redis.asyncio.from_url", side_effect=self.make_client):
+            client = limiter._get_redis()
+            await limiter.aclose()
 
-        # Should have used pipeline to reset state
-        mock_async_redis.pipeline.assert_called()
+        client.aclose.assert_awaited_once()
+        assert len(limiter._loop_clients) == 0
@@ -81,7 +81,7 @@ class TestRedditAdapterListConversations:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.list_conversations()
 
@@ -118,7 +118,7 @@ class TestRedditAdapterListConversations:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.list_conversations()
 
@@ -159,7 +159,7 @@ class TestRedditAdapterListConversations:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.list_conversations()
 
@@ -176,7 +176,7 @@ class TestRedditAdapterListConversations:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             await reddit_adapter.list_conversations(limit=25)
 
@@ -203,7 +203,7 @@ class TestRedditAdapterListMessages:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.list_messages("conv_123")
 
@@ -238,7 +238,7 @@ class TestRedditAdapterListMessages:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             # Use full Reddit name format (t4_ prefix) matching what list_conversations returns
             result = await reddit_adapter.list_messages("t4_conv_123")
@@ -269,7 +269,7 @@ class TestRedditAdapterBrowseLocation:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.browse_location("r/programming")
 
@@ -310,7 +310,7 @@ class TestRedditAdapterBrowseLocation:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.browse_location("r/test")
 
@@ -358,7 +358,7 @@ class TestRedditAdapterBrowseLocation:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.browse_location("r/test")
 
@@ -405,7 +405,7 @@ class TestRedditAdapterFetchPost:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_post("post_123")
 
@@ -423,7 +423,7 @@ class TestRedditAdapterFetchPost:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_post("nonexistent")
 
@@ -458,7 +458,7 @@ class TestRedditAdapterFetchProfile:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_profile("testuser")
 
@@ -484,7 +484,7 @@ class TestRedditAdapterFetchProfile:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_profile("suspendeduser")
 
@@ -500,7 +500,7 @@ class TestRedditAdapterFetchProfile:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_profile("nonexistent")
 
@@ -525,7 +525,7 @@ class TestRedditAdapterFetchProfileItems:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_profile_items("testuser")
 
@@ -562,7 +562,7 @@ class TestRedditAdapterFetchProfileItems:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_profile_items("testuser")
 
@@ -602,7 +602,7 @@ class TestRedditAdapterFetchProfileItems:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await reddit_adapter.fetch_profile_items("testuser")
 
@@ -640,7 +640,7 @@ class TestRedditAdapterFetchProfileItems:
         with patch("httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             # Request only posts
             result = await reddit_adapter.fetch_profile_items(
@@ -685,9 +685,248 @@ class TestRedditAdapterTokenRefresh:
             # First get returns 401, second returns success
             mock_instance.get.side_effect = [mock_401_response, mock_success_response]
             mock_instance.post.return_value = mock_refresh_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await adapter.list_conversations()
 
         assert isinstance(result, PaginatedResult)
         assert adapter.access_token == "new_access_token"
+
+
+class TestRedditAdapterConnectionPool:
+    """Tests for the adapter's persistent HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_across_requests(self, reddit_adapter):
+        """Successive requests should share a single pooled client."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"children": [], "after": None}}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.is_closed = False
+            mock_instance.get.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            await reddit_adapter.list_conversations()
+            await reddit_adapter.list_conversations()
+            await reddit_adapter.fetch_post("abc123")
+
+        assert mock_client.call_count == 1
+        assert mock_instance.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self, reddit_adapter):
+        """aclose should close the pooled client and allow reopening."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"children": [], "after": None}}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.is_closed = False
+            mock_instance.get.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            await reddit_adapter.list_conversations()
+            await reddit_adapter.aclose()
+            await reddit_adapter.list_conversations()
+
+        mock_instance.aclose.assert_awaited_once()
+        assert mock_client.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self, reddit_adapter):
+        """Using the adapter as an async context manager should close it on exit."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"children": [], "after": None}}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.is_closed = False
+            mock_instance.get.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            async with reddit_adapter:
+                await reddit_adapter.list_conversations()
+
+        mock_instance.aclose.assert_awaited_once()
+
+    def test_new_event_loop_gets_new_client(self, reddit_adapter):
+        """A client bound to a finished loop should not be reused."""
+        import asyncio
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"children": [], "after": None}}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.is_closed = False
+            mock_instance.get.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            asyncio.run(reddit_adapter.list_conversations())
+            asyncio.run(reddit_adapter.list_conversations())
+
+        assert mock_client.call_count == 2
+
+    def test_aclose_from_other_loop_closes_on_owner_loop(self, reddit_adapter):
+        """aclose from a foreign loop should close the client on its own loop."""
+        import asyncio
+        import threading
+
+        owner = asyncio.new_event_loop()
+        thread = threading.Thread(target=owner.run_forever, daemon=True)
+        thread.start()
+        try:
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.is_closed = False
+                mock_client.return_value = mock_instance
+
+                async def open_client():
+                    return reddit_adapter._get_client()
+
+                asyncio.run_coroutine_threadsafe(open_client(), owner).result(timeout=5)
+                asyncio.run(reddit_adapter.aclose())
+
+                # Let the scheduled close run on the owner loop
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0), owner).result(timeout=5)
+
+            mock_instance.aclose.assert_awaited_once()
+            assert reddit_adapter._client is None
+        finally:
+            owner.call_soon_threadsafe(owner.stop)
+            thread.join(timeout=5)
+            owner.close()
+
+    def test_pool_limits_passed_to_client(self, adapter_config, mock_tokens):
+        """Connection limits should be applied to the pooled client."""
+        import asyncio
+
+        adapter = RedditAdapter(
+            access_token=mock_tokens["access_token"],
+            refresh_token=mock_tokens["refresh_token"],
+            max_connections=3,
+            **adapter_config,
+        )
+
+        async def open_client():
+            return adapter._get_client()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            asyncio.run(open_client())
+
+        limits = mock_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 3
+
+
+class TestRedditAdapterRateLimit:
+    """Tests for the shared rate limiter in API requests."""
+
+    @pytest.fixture
+    def limiter(self):
+        """Mock rate limiter granting leases."""
+        limiter = MagicMock()
+        limiter.acquire_lease = AsyncMock(return_value="holder-1")
+        limiter.release_lease = AsyncMock()
+        limiter.update_from_headers = AsyncMock()
+        return limiter
+
+    def make_adapter(self, adapter_config, mock_tokens, limiter):
+        return RedditAdapter(
+            access_token=mock_tokens["access_token"],
+            refresh_token=mock_tokens["refresh_token"],
+            rate_limiter=limiter,
+            **adapter_config,
+        )
+
+    def mock_response(self, headers=None):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = headers or {}
+        response.json.return_value = {"data": {"children": [], "after": None}}
+        return response
+
+    @pytest.mark.asyncio
+    async def test_request_takes_and_releases_lease(self, adapter_config, mock_tokens, limiter):
+        """Each API request should hold a lease for its duration."""
+        adapter = self.make_adapter(adapter_config, mock_tokens, limiter)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.return_value = self.mock_response()
+            mock_client.return_value = mock_instance
+
+            await adapter.list_conversations()
+
+        limiter.acquire_lease.assert_awaited_once()
+        assert limiter.acquire_lease.call_args.kwargs["wait"] is True
+        limiter.release_lease.assert_awaited_once_with("holder-1")
+
+    @pytest.mark.asyncio
+    async def test_lease_released_when_request_fails(self, adapter_config, mock_tokens, limiter):
+        """A failed request should still release its lease."""
+        adapter = self.make_adapter(adapter_config, mock_tokens, limiter)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.side_effect = RuntimeError("connection reset")
+            mock_client.return_value = mock_instance
+
+            with pytest.raises(RuntimeError):
+                await adapter._api_request("GET", "/message/inbox")
+
+        limiter.release_lease.assert_awaited_once_with("holder-1")
+
+    @pytest.mark.asyncio
+    async def test_ratelimit_headers_adapt_limiter(self, adapter_config, mock_tokens, limiter):
+        """X-Ratelimit-Remaining/Reset should be forwarded to the limiter."""
+        adapter = self.make_adapter(adapter_config, mock_tokens, limiter)
+        headers = {"x-ratelimit-remaining": "42.0", "x-ratelimit-reset": "120"}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.return_value = self.mock_response(headers)
+            mock_client.return_value = mock_instance
+
+            await adapter._api_request("GET", "/message/inbox")
+
+        limiter.update_from_headers.assert_awaited_once_with(42.0, 120.0)
+
+    @pytest.mark.asyncio
+    async def test_budget_timeout_raises(self, adapter_config, mock_tokens, limiter):
+        """Running out of budget should raise instead of calling Reddit."""
+        from rediska_core.providers.reddit.adapter import RedditAPIError
+
+        limiter.acquire_lease.return_value = None
+        adapter = self.make_adapter(adapter_config, mock_tokens, limiter)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value = mock_instance
+
+            with pytest.raises(RedditAPIError) as exc_info:
+                await adapter._api_request("GET", "/message/inbox")
+
+        assert exc_info.value.status_code == 429
+        mock_instance.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_limiter_failure_does_not_block(self, adapter_config, mock_tokens, limiter):
+        """If Redis is unavailable, requests should proceed without limiting."""
+        limiter.acquire_lease.side_effect = ConnectionError("redis down")
+        adapter = self.make_adapter(adapter_config, mock_tokens, limiter)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.return_value = self.mock_response()
+            mock_client.return_value = mock_instance
+
+            response = await adapter._api_request("GET", "/message/inbox")
+
+        assert response.status_code == 200
+        limiter.release_lease.assert_not_called()
@@ -0,0 +1,308 @@
+"""Unit tests for the streaming reindex service.
+
+Tests cover:
+1. Streaming documents of every type into bulk actions
+2. Versioned index creation with refreshes disabled during load
+3. Atomic alias swap and cleanup of previous indices
+4. Aborting the swap when the load has errors
+5. Attaching embeddings during the load
+6. Never reusing or deleting an index the alias points to
+7. Replaying documents written to the old index during the load
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from rediska_core.domain.services.reindex import ReindexService
+from rediska_core.infrastructure.elasticsearch import CONTENT_DOCS_ALIAS
+from rediska_core.infrastructure.embeddings import EmbeddingsError
+from tests.factories import create_conversation_with_messages
+
+
+class FakeES:
+    """In-memory stand-in for ElasticsearchClient index management."""
+
+    def __init__(
+        self, indices=None, alias_indices=None, fail_ids=(), list_fails=False, after_load=None
+    ):
+        self.indices = {name: {} for name in indices or []}
+        self.mappings = {}
+        self.settings = {}
+        self.alias_indices = list(alias_indices or [])
+        self.fail_ids = set(fail_ids)
+        self.list_fails = list_fails
+        self.after_load = after_load
+        self.deleted = []
+        self.refreshed = []
+
+    def list_indices(self, pattern):
+        if self.list_fails:
+            return []
+        prefix = pattern.rstrip("*")
+        return sorted(name for name in self.indices if name.startswith(prefix))
+
+    def get_alias_indices(self, alias):
+        return list(self.alias_indices)
+
+    def create_index(self, index, mapping=None, exist_ok=True):
+        if index in self.indices:
+            return exist_ok
+        self.indices[index] = {}
+        self.mappings[index] = mapping
+        return True
+
+    def delete_index(self, index):
+        self.indices.pop(index, None)
+        self.deleted.append(index)
+        return True
+
+    def update_index_settings(self, index, settings):
+        self.settings[index] = settings
+        return True
+
+    def refresh_index(self, index):
+        self.refreshed.append(index)
+        return True
+
+    def swap_alias(self, alias, index):
+        self.alias_indices = [index]
+        return True
+
+    def scan_ids(self, index, query):
+        since = query["range"]["indexed_at"]["gte"]
+        return [
+            doc_id
+            for name in index.split(",")
+            for doc_id, doc in self.indices.get(name, {}).items()
+            if doc.get("indexed_at", "") >= since
+        ]
+
+    def stream_bulk(self, actions, **kwargs):
+        indexed = 0
+        errors = []
+        for action in actions:
+            if action["_id"] in self.fail_ids:
+                errors.append({"id": action["_id"], "error": "mapper_parsing_exception"})
+                continue
+            if action.get("_op_type") == "delete":
+                self.indices[action["_index"]].pop(action["_id"], None)
+            else:
+                self.indices[action["_index"]][action["_id"]] = action["_source"]
+            indexed += 1
+        if self.after_load is not None:
+            callback, self.after_load = self.after_load, None
+            callback(self)
+        return {
+            "success": not errors,
+            "indexed": indexed,
+            "error_count": len(errors),
+            "errors": errors,
+        }
+
+
+@pytest.fixture
+def content(db_session):
+    """A conversation with three messages."""
+    conversation, messages = create_conversation_with_messages(db_session, message_count=3)
+    return conversation, messages
+
+
+def make_service(db_session, es, **kwargs):
+    service = ReindexService(db=db_session, es_url="http://localhost:9200", **kwargs)
+    service._es_client = es
+    return service
+
+
+# =============================================================================
+# LOAD TESTS
+# =============================================================================
+
+
+class TestLoad:
+    """Tests for streaming documents into an index."""
+
+    def test_streams_every_document(self, db_session, content):
+        """All rows of the requested types should become bulk actions."""
+        conversation, messages = content
+        es = FakeES(indices=["target"])
+
+        result = make_service(db_session, es).load("target", ["conversation", "message"])
+
+        assert result["indexed"] == 4
+        assert result["documents"] == {"conversation": 1, "message": 3}
+        docs = es.indices["target"]
+        assert f"conversation:{conversation.id}" in docs
+        assert docs[f"message:{messages[0].id}"]["content"] == "Test message 1"
+        assert docs[f"message:{messages[0].id}"]["counterpart_username"] is not None
+
+    def test_unknown_doc_type_raises(self, db_session):
+        """Unsupported types should be rejected before loading."""
+        with pytest.raises(ValueError):
+            make_service(db_session, FakeES()).load("target", ["nope"])
+
+    def test_attaches_embeddings(self, db_session, content):
+        """Documents with text should get an embedding vector."""
+        embedding_service = MagicMock()
+        embedding_service.embed_texts.side_effect = lambda texts: [
+            [float(len(text))] if text else None for text in texts
+        ]
+        es = FakeES(indices=["target"])
+
+        make_service(db_session, es, embedding_service=embedding_service).load(
+            "target", ["message"]
+        )
+
+        assert all(doc["embedding"] == [14.0] for doc in es.indices["target"].values())
+
+    def test_embedding_failures_still_index(self, db_session, content):
+        """A failed embedding batch should not drop its documents."""
+        embedding_service = MagicMock()
+        embedding_service.embed_texts.side_effect = EmbeddingsError("Connection error")
+        es = FakeES(indices=["target"])
+
+        result = make_service(db_session, es, embedding_service=embedding_service).load(
+            "target", ["message"]
+        )
+
+        assert result["indexed"] == 3
+        assert result["embedding_errors"] == 3
+        assert not any("embedding" in doc for doc in es.indices["target"].values())
+
+
+# =============================================================================
+# REINDEX TESTS
+# =============================================================================
+
+
+class TestReindex:
+    """Tests for building a new index version and swapping the alias."""
+
+    def test_builds_next_version_and_swaps_alias(self, db_session, content):
+        """The alias should move to a new, fully loaded index."""
+        es = FakeES(
+            indices=["rediska_content_docs_v1", "rediska_content_docs_v2"],
+            alias_indices=["rediska_content_docs_v2"],
+        )
+
+        result = make_service(db_session, es, embedding_dims=1024).reindex()
+
+        assert result["status"] == "success"
+        assert result["index"] == "rediska_content_docs_v3"
+        assert es.alias_indices == ["rediska_content_docs_v3"]
+        assert len(es.indices["rediska_content_docs_v3"]) == 4
+
+        mapping = es.mappings["rediska_content_docs_v3"]
+        assert mapping["settings"]["refresh_interval"] == "-1"
+        assert mapping["mappings"]["properties"]["embedding"]["dims"] == 1024
+        assert es.settings["rediska_content_docs_v3"] == {"refresh_interval": None}
+        assert "rediska_content_docs_v3" in es.refreshed
+
+        assert es.deleted == ["rediska_content_docs_v2"]
+
+    def test_keeps_old_index_when_requested(self, db_session, content):
+        """delete_old=False should leave the previous index in place."""
+        es = FakeES(
+            indices=["rediska_content_docs_v1"],
+            alias_indices=["rediska_content_docs_v1"],
+        )
+
+        make_service(db_session, es).reindex(delete_old=False)
+
+        assert es.deleted == []
+        assert "rediska_content_docs_v1" in es.indices
+
+    def test_errors_abort_the_swap(self, db_session, content):
+        """Bulk errors beyond max_errors should keep the current alias."""
+        conversation, _ = content
+        es = FakeES(
+            indices=["rediska_content_docs_v1"],
+            alias_indices=["rediska_content_docs_v1"],
+            fail_ids={f"conversation:{conversation.id}"},
+        )
+
+        result = make_service(db_session, es).reindex()
+
+        assert result["status"] == "aborted"
+        assert es.alias_indices == ["rediska_content_docs_v1"]
+        assert "rediska_content_docs_v2" not in es.indices
+
+    def test_errors_within_tolerance_swap(self, db_session, content):
+        """Errors up to max_errors should still complete the swap."""
+        conversation, _ = content
+        es = FakeES(fail_ids={f"conversation:{conversation.id}"})
+
+        result = make_service(db_session, es).reindex(max_errors=1)
+
+        assert result["status"] == "success"
+        assert es.alias_indices == ["rediska_content_docs_v1"]
+        assert result["error_count"] == 1
+
+    def test_refuses_to_reuse_live_index(self, db_session, content):
+        """A failed index listing should not lead to rebuilding the live index."""
+        es = FakeES(
+            indices=["rediska_content_docs_v1"],
+            alias_indices=["rediska_content_docs_v1"],
+            list_fails=True,
+        )
+
+        result = make_service(db_session, es).reindex()
+
+        assert result["status"] == "success"
+        assert result["index"] == "rediska_content_docs_v2"
+        assert es.alias_indices == ["rediska_content_docs_v2"]
+
+    def test_existing_index_is_an_error(self, db_session, content):
+        """An unlisted index with the next name should not be loaded or deleted."""
+        es = FakeES(
+            indices=["rediska_content_docs_v1", "rediska_content_docs_v2"],
+            alias_indices=["rediska_content_docs_v1"],
+            list_fails=True,
+        )
+
+        result = make_service(db_session, es).reindex()
+
+        assert result["status"] == "error"
+        assert es.indices["rediska_content_docs_v2"] == {}
+        assert es.deleted == []
+        assert es.alias_indices == ["rediska_content_docs_v1"]
+
+    def test_abort_never_deletes_live_index(self, db_session, content):
+        """Cleanup after a failed load should skip indices the alias points to."""
+        service = make_service(db_session, FakeES())
+        es = service._es_client
+        service._discard_index("rediska_content_docs_v1", ["rediska_content_docs_v1"])
+
+        assert es.deleted == []
+
+    def test_replays_updates_made_during_load(self, db_session, content):
+        """Documents written to the old index during the load should reach the new one."""
+        _, messages = content
+        doc_id = f"message:{messages[0].id}"
+
+        def concurrent_update(es):
+            messages[0].body_text = "Edited during load"
+            db_session.flush()
+            es.indices["rediska_content_docs_v1"][doc_id] = {
+                "content": "Edited during load",
+                "indexed_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+        es = FakeES(
+            indices=["rediska_content_docs_v1"],
+            alias_indices=["rediska_content_docs_v1"],
+            after_load=concurrent_update,
+        )
+
+        result = make_service(db_session, es).reindex()
+
+        assert result["status"] == "success"
+        assert result["replayed"] >= 1
+        assert es.indices["rediska_content_docs_v2"][doc_id]["content"] == "Edited during load"
+
+    def test_alias_name(self):
+        """Content reads and writes should go through the alias."""
+        from rediska_core.infrastructure.elasticsearch import CONTENT_DOCS_INDEX
+
+        assert CONTENT_DOCS_INDEX == CONTENT_DOCS_ALIAS
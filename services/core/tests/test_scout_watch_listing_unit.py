@@ -0,0 +1,302 @@
+"""Unit tests for shared scout watch listings and adaptive scheduling.
+
+Tests cover:
+1. Grouping watches that read the same listing
+2. Batched seen-post checks
+3. High-water marks for newest-first watches
+4. Incremental listing fetches in the Reddit adapter
+5. Run intervals from observed post rates, and dispatching due watches
+6. Claiming and scheduling watches per listing
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from rediska_core.domain.models import ScoutWatchRun
+from rediska_core.domain.services.scout_watch import (
+    DISPATCH_LEASE_SECONDS,
+    ScoutWatchService,
+    WatchSchedule,
+    uses_high_water_mark,
+    watch_listing_key,
+)
+from rediska_core.providers.base import PaginatedResult, ProviderPost
+from rediska_core.providers.reddit.adapter import RedditAdapter
+
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_post(external_id: str, minutes_ago: float, **kwargs) -> ProviderPost:
+    return ProviderPost(
+        external_id=external_id,
+        author_id="t2_x",
+        author_username="poster",
+        title="Title",
+        url=f"/r/test/comments/{external_id}",
+        location="r/test",
+        body_text="Body",
+        created_at=NOW - timedelta(minutes=minutes_ago),
+        **kwargs,
+    )
+
+
+# =============================================================================
+# LISTING KEYS
+# =============================================================================
+
+
+class TestListingKey:
+    """Tests for grouping watches by listing."""
+
+    def test_same_listing_different_spelling(self, db_session):
+        """Location prefix, case and query whitespace don't split a listing."""
+        service = ScoutWatchService(db_session)
+        a = service.create_watch(source_location="r/R4R", search_query="dom ")
+        b = service.create_watch(source_location="r4r", search_query="dom")
+        c = service.create_watch(source_location="r/r4r", search_query="dom", sort_by="top")
+
+        assert watch_listing_key(a) == watch_listing_key(b)
+        assert watch_listing_key(a) != watch_listing_key(c)
+        assert uses_high_water_mark(a) and not uses_high_water_mark(c)
+
+
+# =============================================================================
+# SEEN POSTS AND MARKS
+# =============================================================================
+
+
+class TestSeenPosts:
+    """Tests for the batched seen-check and high-water marks."""
+
+    def test_seen_post_ids(self, db_session):
+        """Seen posts for the watch are found in one call."""
+        service = ScoutWatchService(db_session)
+        watch = service.create_watch(source_location="r/test")
+        other = service.create_watch(source_location="r/other")
+        run = service.create_run(watch.id)
+        other_run = service.create_run(other.id)
+        service.record_post(watch.id, run.id, "t3_a")
+        service.record_post(other.id, other_run.id, "t3_b")
+
+        seen = service.seen_post_ids(watch.id, ["t3_a", "t3_b", "t3_c"])
+
+        assert seen == {"t3_a"}
+        assert service.seen_post_ids(watch.id, []) == set()
+
+    def test_mark_advances_only_forward(self, db_session):
+        """The mark moves to the newest post and never back."""
+        service = ScoutWatchService(db_session)
+        watch = service.create_watch(source_location="r/test")
+
+        service.advance_high_water_mark(watch, [make_post("a", 10), make_post("b", 5)])
+        assert watch.last_post_created_at == (NOW - timedelta(minutes=5)).replace(tzinfo=None)
+
+        service.advance_high_water_mark(watch, [make_post("c", 30)])
+        assert watch.last_post_created_at == (NOW - timedelta(minutes=5)).replace(tzinfo=None)
+
+    def test_no_mark_for_ranked_listings(self, db_session):
+        """Hot/top listings are not newest first, so they keep no mark."""
+        service = ScoutWatchService(db_session)
+        watch = service.create_watch(source_location="r/test", sort_by="hot")
+
+        service.advance_high_water_mark(watch, [make_post("a", 1)])
+
+        assert watch.last_post_created_at is None
+
+    def test_changing_listing_resets_mark(self, db_session):
+        """A new query reads a different listing, so the mark starts over."""
+        service = ScoutWatchService(db_session)
+        watch = service.create_watch(source_location="r/test")
+        service.advance_high_water_mark(watch, [make_post("a", 1)])
+
+        service.update_watch(watch.id, min_confidence=0.5)
+        assert watch.last_post_created_at is not None
+
+        service.update_watch(watch.id, search_query="new query")
+        assert watch.last_post_created_at is None
+
+
+# =============================================================================
+# ADAPTER
+# =============================================================================
+
+
+class TestBrowseSince:
+    """Tests for fetching only posts newer than a high-water mark."""
+
+    @pytest.fixture
+    def adapter(self):
+        return RedditAdapter(
+            access_token="token",
+            refresh_token="refresh",
+            client_id="client",
+            client_secret="secret",
+            user_agent="Rediska/1.0 test",
+        )
+
+    @pytest.mark.asyncio
+    async def test_pages_until_mark(self, adapter):
+        """Small pages are requested until the listing reaches the mark."""
+        pages = [
+            PaginatedResult(
+                items=[make_post("n1", 1), make_post("n2", 2)],
+                next_cursor="t3_n2",
+                has_more=True,
+                metadata={"browser_url": "https://www.reddit.com/r/test/new"},
+            ),
+            PaginatedResult(
+                items=[make_post("n3", 3), make_post("edge", 5), make_post("old", 9)],
+                next_cursor="t3_old",
+                has_more=True,
+            ),
+        ]
+
+        with patch.object(adapter, "browse_location", AsyncMock(side_effect=pages)) as browse:
+            result = await adapter.browse_location_since(
+                "r/test", since=(NOW - timedelta(minutes=5)).replace(tzinfo=None), page_size=2,
+            )
+
+        assert [post.external_id for post in result.items] == ["n1", "n2", "n3", "edge"]
+        assert result.metadata["browser_url"].endswith("/r/test/new")
+        assert browse.await_count == 2
+        assert browse.await_args_list[1].kwargs["cursor"] == "t3_n2"
+
+    @pytest.mark.asyncio
+    async def test_without_mark_fetches_one_page(self, adapter):
+        """With no mark, a single full page is requested."""
+        page = PaginatedResult(items=[make_post("a", 1)], next_cursor="t3_a", has_more=True)
+
+        with patch.object(adapter, "browse_location", AsyncMock(return_value=page)) as browse:
+            result = await adapter.browse_location_since("r/test", since=None, limit=100)
+
+        assert result is page
+        assert browse.await_args.kwargs["limit"] == 100
+
+
+# =============================================================================
+# SCHEDULING
+# =============================================================================
+
+
+SCHEDULE = WatchSchedule(
+    min_interval=60, max_interval=3600, default_interval=300, target_posts_per_run=5, jitter=0,
+)
+
+
+def add_run(db, watch, minutes_ago: float, posts_new: int, status: str = "completed"):
+    completed = (NOW - timedelta(minutes=minutes_ago)).replace(tzinfo=None)
+    db.add(ScoutWatchRun(
+        watch_id=watch.id,
+        started_at=completed,
+        completed_at=completed,
+        status=status,
+        posts_new=posts_new,
+    ))
+    db.flush()
+
+
+class TestScheduling:
+    """Tests for adaptive run intervals."""
+
+    @pytest.mark.parametrize(
+        "rate,expected",
+        [
+            (None, 300),        # no history
+            (0.0, 3600),        # quiet: max bound
+            (5 / 600, 600),     # 5 posts per 10 minutes
+            (1.0, 60),          # busy: min bound
+        ],
+    )
+    def test_interval_for_rate(self, rate, expected):
+        """Intervals target a number of posts per run within the bounds."""
+        assert SCHEDULE.interval_for_rate(rate) == pytest.approx(expected)
+
+    def test_rate_from_run_history(self, db_session):
+        """The oldest run only starts the span; failed runs are ignored."""
+        service = ScoutWatchService(db_session, schedule=SCHEDULE)
+        watch = service.create_watch(source_location="r/test")
+        add_run(db_session, watch, minutes_ago=30, posts_new=100)
+        add_run(db_session, watch, minutes_ago=20, posts_new=4)
+        add_run(db_session, watch, minutes_ago=15, posts_new=50, status="failed")
+        add_run(db_session, watch, minutes_ago=10, posts_new=6)
+
+        assert service.estimate_post_rate(watch.id, now=NOW) == pytest.approx(10 / 1200)
+
+        next_run = service.schedule_next_run(watch, now=NOW)
+        assert next_run == (NOW + timedelta(seconds=600)).replace(tzinfo=None)
+
+    def test_claim_due_watches(self, db_session):
+        """Only active, due watches are claimed, and held until their run completes."""
+        service = ScoutWatchService(db_session, schedule=SCHEDULE)
+        due = service.create_watch(source_location="r/due")
+        later = service.create_watch(source_location="r/later")
+        inactive = service.create_watch(source_location="r/inactive")
+        due.next_run_at = (NOW - timedelta(minutes=1)).replace(tzinfo=None)
+        later.next_run_at = (NOW + timedelta(minutes=5)).replace(tzinfo=None)
+        inactive.is_active = False
+        inactive.next_run_at = (NOW - timedelta(minutes=1)).replace(tzinfo=None)
+        db_session.flush()
+
+        claimed = service.claim_due_watches(now=NOW)
+
+        assert [watch.id for watch in claimed] == [due.id]
+        lease = (NOW + timedelta(seconds=DISPATCH_LEASE_SECONDS)).replace(tzinfo=None)
+        assert due.next_run_at == lease
+        assert service.claim_due_watches(now=NOW + timedelta(minutes=1)) == []
+
+        run = service.create_run(due.id)
+        service.complete_run(run, posts_fetched=0, posts_new=0, posts_analyzed=0, leads_created=0)
+        assert due.next_run_at != lease
+
+    def test_claim_takes_listing_mates_due_soon(self, db_session):
+        """Watches on a due listing are claimed with it if due within min_interval."""
+        service = ScoutWatchService(db_session, schedule=SCHEDULE)
+        due = service.create_watch(source_location="r/test", search_query="a")
+        soon = service.create_watch(source_location="test", search_query="a")
+        unscheduled = service.create_watch(source_location="r/test", search_query="a ")
+        far = service.create_watch(source_location="test", search_query="a ")
+        other = service.create_watch(source_location="r/other")
+        due.next_run_at = (NOW - timedelta(seconds=5)).replace(tzinfo=None)
+        soon.next_run_at = (NOW + timedelta(seconds=30)).replace(tzinfo=None)
+        far.next_run_at = (NOW + timedelta(minutes=10)).replace(tzinfo=None)
+        other.next_run_at = (NOW + timedelta(seconds=30)).replace(tzinfo=None)
+        db_session.flush()
+
+        claimed = service.claim_due_watches(now=NOW)
+
+        assert {watch.id for watch in claimed} == {due.id, soon.id, unscheduled.id}
+        assert far.next_run_at == (NOW + timedelta(minutes=10)).replace(tzinfo=None)
+
+    def test_first_claim_spreads_unscheduled_watches(self, db_session):
+        """New watches get a first run spread over the default interval, per listing."""
+        service = ScoutWatchService(db_session, schedule=SCHEDULE)
+        first = service.create_watch(source_location="r/one")
+        mate = service.create_watch(source_location="one")
+        other = service.create_watch(source_location="r/two")
+
+        with patch("rediska_core.domain.services.scout_watch.random.uniform", side_effect=[120, 240]):
+            assert service.claim_due_watches(now=NOW) == []
+
+        start = NOW.replace(tzinfo=None)
+        assert first.next_run_at == mate.next_run_at
+        assert {first.next_run_at, other.next_run_at} == {
+            start + timedelta(seconds=120),
+            start + timedelta(seconds=240),
+        }
+
+    def test_schedule_listing_shares_shortest_interval(self, db_session):
+        """Watches on one listing get one next run at the busiest watch's interval."""
+        service = ScoutWatchService(db_session, schedule=SCHEDULE)
+        busy = service.create_watch(source_location="r/test")
+        quiet = service.create_watch(source_location="test")
+        add_run(db_session, busy, minutes_ago=20, posts_new=0)
+        add_run(db_session, busy, minutes_ago=10, posts_new=5)
+        add_run(db_session, quiet, minutes_ago=20, posts_new=0)
+        add_run(db_session, quiet, minutes_ago=10, posts_new=0)
+
+        next_run = service.schedule_listing([busy, quiet], now=NOW)
+
+        assert next_run == (NOW + timedelta(seconds=600)).replace(tzinfo=None)
+        assert busy.next_run_at == quiet.next_run_at == next_run
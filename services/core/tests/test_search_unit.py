@@ -85,7 +85,7 @@ class TestKNNSearch:
         from rediska_core.domain.services.search import SearchService
 
         with patch("rediska_core.domain.services.search.ElasticsearchClient") as mock_es:
-            with patch("rediska_core.domain.services.search.EmbeddingsClient") as mock_embed:
+            with patch("rediska_core.domain.services.search.get_embedding_batcher") as mock_embed:
                 mock_embed_instance = MagicMock()
                 mock_embed_instance.embed.return_value = [0.1] * 768
                 mock_embed.return_value = mock_embed_instance
@@ -117,7 +117,7 @@ class TestKNNSearch:
         from rediska_core.domain.services.search import SearchService
 
         with patch("rediska_core.domain.services.search.ElasticsearchClient") as mock_es:
-            with patch("rediska_core.domain.services.search.EmbeddingsClient") as mock_embed:
+            with patch("rediska_core.domain.services.search.get_embedding_batcher") as mock_embed:
                 expected_vector = [0.5] * 768
                 mock_embed_instance = MagicMock()
                 mock_embed_instance.embed.return_value = expected_vector
@@ -161,7 +161,7 @@ class TestHybridSearch:
         from rediska_core.domain.services.search import SearchService
 
         with patch("rediska_core.domain.services.search.ElasticsearchClient") as mock_es:
-            with patch("rediska_core.domain.services.search.EmbeddingsClient") as mock_embed:
+            with patch("rediska_core.domain.services.search.get_embedding_batcher") as mock_embed:
                 mock_embed_instance = MagicMock()
                 mock_embed_instance.embed.return_value = [0.1] * 768
                 mock_embed.return_value = mock_embed_instance
@@ -203,7 +203,7 @@ class TestHybridSearch:
         from rediska_core.domain.services.search import SearchService
 
         with patch("rediska_core.domain.services.search.ElasticsearchClient") as mock_es:
-            with patch("rediska_core.domain.services.search.EmbeddingsClient") as mock_embed:
+            with patch("rediska_core.domain.services.search.get_embedding_batcher") as mock_embed:
                 mock_embed_instance = MagicMock()
                 mock_embed_instance.embed.return_value = [0.1] * 768
                 mock_embed.return_value = mock_embed_instance
@@ -424,7 +424,7 @@ class TestSearchErrorHandling:
         from rediska_core.infrastructure.embeddings import EmbeddingsError
 
         with patch("rediska_core.domain.services.search.ElasticsearchClient") as mock_es:
-            with patch("rediska_core.domain.services.search.EmbeddingsClient") as mock_embed:
+            with patch("rediska_core.domain.services.search.get_embedding_batcher") as mock_embed:
                 mock_embed_instance = MagicMock()
                 mock_embed_instance.embed.side_effect = EmbeddingsError("API error")
                 mock_embed.return_value = mock_embed_instance
@@ -4,6 +4,21 @@ import os
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import (
+    task_postrun,
+    task_prerun,
+    worker_process_init,
+    worker_process_shutdown,
+)
+
+from rediska_worker.util.db import init_worker_db, shutdown_worker_db
+from rediska_worker.util.event_loop import init_worker_loop, shutdown_worker_loop
+from rediska_worker.util.metrics import (
+    init_worker_metrics,
+    record_task_end,
+    record_task_start,
+    shutdown_worker_metrics,
+)
 
 # Celery configuration from environment
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1")
@@ -73,11 +88,19 @@ app.conf.beat_schedule = {
         "schedule": 120.0,  # 2 minutes (reduced from 10 minutes)
         "args": (),
     },
-    # Scout watches every 5 minutes
+    # Bulk index pending search updates every 5 seconds
+    "index-outbox-drain": {
+        "task": "index.drain_outbox",
+        "schedule": 5.0,
+        "args": (),
+        "options": {"expires": 30},
+    },
+    # Dispatch scout watches that are due (each watch sets its own interval)
     "scout-watches-periodic": {
         "task": "scout.run_all_watches",
-        "schedule": 300.0,  # 5 minutes
+        "schedule": 60.0,  # 1 minute
         "args": (),
+        "options": {"expires": 55},
     },
     # Daily database backup at 3 AM UTC
     "daily-database-backup": {
@@ -97,6 +120,12 @@ app.conf.beat_schedule = {
         "schedule": crontab(hour=5, minute=0, day_of_week=0),
         "args": (),
     },
+    # Daily perceptual hash backfill for duplicate detection at 1 AM UTC
+    "daily-perceptual-hash-backfill": {
+        "task": "maintenance.backfill_perceptual_hashes",
+        "schedule": crontab(hour=1, minute=0),
+        "args": (),
+    },
     # Daily scout watch history cleanup at 2 AM UTC
     "daily-scout-history-cleanup": {
         "task": "maintenance.cleanup_scout_watch_history",
@@ -105,6 +134,18 @@ app.conf.beat_schedule = {
     },
 }
 
+# One database pool and one event loop per worker process, created after fork
+worker_process_init.connect(init_worker_db, weak=False)
+worker_process_shutdown.connect(shutdown_worker_db, weak=False)
+worker_process_init.connect(init_worker_loop, weak=False)
+worker_process_shutdown.connect(shutdown_worker_loop, weak=False)
+
+# Task durations are recorded locally and flushed to Redis in batches
+worker_process_init.connect(init_worker_metrics, weak=False)
+worker_process_shutdown.connect(shutdown_worker_metrics, weak=False)
+task_prerun.connect(record_task_start, weak=False)
+task_postrun.connect(record_task_end, weak=False)
+
 
 if __name__ == "__main__":
     app.start()
@@ -7,14 +7,16 @@ and storing them in Elasticsearch for semantic search.
 from typing import Any
 
 from rediska_worker.celery_app import app
+from rediska_worker.util.event_loop import run_async
 
 
 @app.task(name="embed.generate")
 def generate(doc_type: str, entity_id: int, text: str) -> dict[str, Any]:
     """Generate embedding for text content and store in ES.
 
-    Fetches text, generates embedding via llama.cpp, and updates
-    the corresponding ES document with the embedding vector.
+    Fetches text, generates embedding via llama.cpp (or reuses the cached
+    vector for identical text), and updates the corresponding ES document
+    with the embedding vector.
 
     Args:
         doc_type: Type of document (message, conversation, profile, lead_post).
@@ -27,6 +29,7 @@ def generate(doc_type: str, entity_id: int, text: str) -> dict[str, Any]:
     # Import here to avoid circular imports
     from rediska_core.config import get_settings
     from rediska_core.domain.services.embedding import EmbeddingService
+    from rediska_core.infrastructure.embedding_cache import get_embedding_cache
     from rediska_core.infra.db import get_sync_session_factory
 
     settings = get_settings()
@@ -50,6 +53,9 @@ def generate(doc_type: str, entity_id: int, text: str) -> dict[str, Any]:
             embeddings_model=settings.embeddings_model,
             embeddings_api_key=settings.embeddings_api_key,
             es_url=settings.elastic_url,
+            batch_size=settings.embeddings_batch_size,
+            max_concurrency=settings.embeddings_max_concurrency,
+            cache=get_embedding_cache(),
         )
 
         result = service.generate_embedding(
@@ -80,7 +86,9 @@ def generate(doc_type: str, entity_id: int, text: str) -> dict[str, Any]:
 def generate_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
     """Generate embeddings for multiple items in batch.
 
-    More efficient for bulk embedding operations.
+    More efficient for bulk embedding operations. Items are sent in
+    requests of embeddings_batch_size texts with up to
+    embeddings_max_concurrency requests in flight on the worker's event loop.
 
     Args:
         items: List of dicts with doc_type, entity_id, and text.
@@ -91,6 +99,7 @@ def generate_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
     # Import here to avoid circular imports
     from rediska_core.config import get_settings
     from rediska_core.domain.services.embedding import EmbeddingService
+    from rediska_core.infrastructure.embedding_cache import get_embedding_cache
     from rediska_core.infra.db import get_sync_session_factory
 
     settings = get_settings()
@@ -113,9 +122,12 @@ def generate_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
             embeddings_model=settings.embeddings_model,
             embeddings_api_key=settings.embeddings_api_key,
             es_url=settings.elastic_url,
+            batch_size=settings.embeddings_batch_size,
+            max_concurrency=settings.embeddings_max_concurrency,
+            cache=get_embedding_cache(),
         )
 
-        result = service.generate_embeddings_batch(items)
+        result = run_async(service.generate_embeddings_batch_async(items))
 
         return {
             "status": "success" if result.get("success") else "partial",
@@ -149,6 +161,7 @@ def generate_for_entity(doc_type: str, entity_id: int) -> dict[str, Any]:
     from rediska_core.config import get_settings
     from rediska_core.domain.models import Message
     from rediska_core.domain.services.embedding import EmbeddingService
+    from rediska_core.infrastructure.embedding_cache import get_embedding_cache
     from rediska_core.infra.db import get_sync_session_factory
 
     settings = get_settings()
@@ -192,6 +205,9 @@ def generate_for_entity(doc_type: str, entity_id: int) -> dict[str, Any]:
             embeddings_model=settings.embeddings_model,
             embeddings_api_key=settings.embeddings_api_key,
             es_url=settings.elastic_url,
+            batch_size=settings.embeddings_batch_size,
+            max_concurrency=settings.embeddings_max_concurrency,
+            cache=get_embedding_cache(),
         )
 
         result = service.generate_embedding(
@@ -1,19 +1,26 @@
 """Indexing tasks for Elasticsearch.
 
 These tasks handle indexing content (messages, conversations, profiles, posts)
-to Elasticsearch for search functionality.
+to Elasticsearch for search functionality. Individual updates are written to
+the index outbox by the services that change content and drained in bulk by
+index.drain_outbox.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from rediska_worker.celery_app import app
 
 
+# Whether this process has already made sure the content index exists
+_index_ready = False
+
+
 @app.task(name="index.upsert_content")
 def upsert_content(doc_type: str, entity_id: int) -> dict[str, Any]:
-    """Index or update content in Elasticsearch.
+    """Queue content to be indexed or updated in Elasticsearch.
 
-    Fetches the entity from the database and indexes it in ES.
+    The update is recorded in the index outbox and indexed in bulk by
+    index.drain_outbox.
 
     Args:
         doc_type: Type of document (message, conversation, profile, lead_post).
@@ -23,48 +30,23 @@ def upsert_content(doc_type: str, entity_id: int) -> dict[str, Any]:
         Dictionary with status and details.
     """
     # Import here to avoid circular imports
-    from rediska_core.config import get_settings
-    from rediska_core.domain.services.indexing import IndexingService
+    from rediska_core.domain.services.index_outbox import enqueue_index_update
     from rediska_core.infra.db import get_sync_session_factory
 
-    settings = get_settings()
     session_factory = get_sync_session_factory()
     session = session_factory()
 
     try:
-        service = IndexingService(
-            db=session,
-            es_url=settings.elastic_url,
-        )
-
-        # Ensure the index exists
-        service.ensure_index()
-
-        # Upsert the content
-        success = service.upsert_content(doc_type, entity_id)
-
-        if success:
-            return {
-                "status": "success",
-                "doc_type": doc_type,
-                "entity_id": entity_id,
-            }
-        else:
-            return {
-                "status": "not_found",
-                "doc_type": doc_type,
-                "entity_id": entity_id,
-                "error": f"Entity {doc_type}:{entity_id} not found",
-            }
-
-    except ValueError as e:
+        enqueue_index_update(session, doc_type, entity_id)
+        session.commit()
         return {
-            "status": "error",
+            "status": "queued",
             "doc_type": doc_type,
             "entity_id": entity_id,
-            "error": str(e),
         }
+
     except Exception as e:
+        session.rollback()
         return {
             "status": "error",
             "doc_type": doc_type,
@@ -75,6 +57,61 @@ def upsert_content(doc_type: str, entity_id: int) -> dict[str, Any]:
         session.close()
 
 
+@app.task(name="index.drain_outbox")
+def drain_outbox(
+    batch_size: Optional[int] = None,
+    max_seconds: float = 30.0,
+) -> dict[str, Any]:
+    """Bulk index pending updates from the index outbox.
+
+    Repeated updates to the same document are collapsed, and each window of
+    updates is sent as one bulk request. Failed updates stay in the outbox
+    and are retried on the next run.
+
+    Args:
+        batch_size: Outbox rows per bulk request (defaults to settings).
+        max_seconds: Stop starting new windows after this long.
+
+    Returns:
+        Dictionary with status and drain counts.
+    """
+    global _index_ready
+
+    # Import here to avoid circular imports
+    from rediska_core.config import get_settings
+    from rediska_core.domain.services.index_outbox import IndexOutboxConsumer
+    from rediska_core.infra.db import get_sync_session_factory
+    from rediska_core.infrastructure.elasticsearch import CONTENT_DOCS_INDEX
+
+    settings = get_settings()
+    session_factory = get_sync_session_factory()
+    session = session_factory()
+
+    try:
+        consumer = IndexOutboxConsumer(
+            db=session,
+            es_url=settings.elastic_url,
+            max_attempts=settings.index_outbox_max_attempts,
+        )
+
+        if not _index_ready:
+            _index_ready = consumer.es_client.ensure_index(
+                CONTENT_DOCS_INDEX, settings.embeddings_dims
+            )
+
+        result = consumer.drain(
+            batch_size=batch_size or settings.index_outbox_batch_size,
+            max_seconds=max_seconds,
+        )
+        return {"status": "success", **result}
+
+    except Exception as e:
+        session.rollback()
+        return {"status": "error", "error": str(e)}
+    finally:
+        session.close()
+
+
 @app.task(name="index.delete_content")
 def delete_content(doc_type: str, entity_id: int) -> dict[str, Any]:
     """Delete content from Elasticsearch.
@@ -124,10 +161,11 @@ def delete_content(doc_type: str, entity_id: int) -> dict[str, Any]:
 def bulk_index_all_messages(batch_size: int = 500) -> dict[str, Any]:
     """Index all messages in the database to Elasticsearch.
 
-    Processes messages in batches to avoid memory issues.
+    Streams messages through a server-side cursor into size-capped bulk
+    requests, so memory use does not grow with the table.
 
     Args:
-        batch_size: Number of messages to process per batch.
+        batch_size: Number of messages per bulk request.
 
     Returns:
         Dictionary with indexing results.
@@ -135,76 +173,119 @@ def bulk_index_all_messages(batch_size: int = 500) -> dict[str, Any]:
     import logging
     from rediska_core.config import get_settings
     from rediska_core.domain.models import Message
-    from rediska_core.domain.services.indexing import IndexingService
+    from rediska_core.domain.services.reindex import ReindexService
     from rediska_core.infra.db import get_sync_session_factory
+    from rediska_core.infrastructure.elasticsearch import CONTENT_DOCS_INDEX
 
     logger = logging.getLogger(__name__)
     settings = get_settings()
     session_factory = get_sync_session_factory()
     session = session_factory()
 
-    total_indexed = 0
-    total_errors = 0
-
     try:
-        service = IndexingService(
+        service = ReindexService(
             db=session,
             es_url=settings.elastic_url,
+            embedding_dims=settings.embeddings_dims,
         )
 
         # Ensure the index exists
-        service.ensure_index()
+        service.es_client.ensure_index(CONTENT_DOCS_INDEX, settings.embeddings_dims)
 
-        # Get total count
         total_messages = session.query(Message.id).count()
         logger.info(f"Starting bulk index of {total_messages} messages")
 
-        # Process in batches
-        offset = 0
-        batch_num = 0
-        while True:
-            message_ids = [
-                row[0] for row in
-                session.query(Message.id)
-                .order_by(Message.id)
-                .offset(offset)
-                .limit(batch_size)
-                .all()
-            ]
-
-            if not message_ids:
-                break
-
-            batch_num += 1
-            result = service.bulk_index_messages(message_ids)
-
-            indexed = result.get("indexed", 0)
-            errors = result.get("error_count", 0)
-            total_indexed += indexed
-            total_errors += errors
-
-            if batch_num % 10 == 0:
-                logger.info(
-                    f"Indexed batch {batch_num}: {total_indexed}/{total_messages} messages"
-                )
-
-            offset += batch_size
+        result = service.load(
+            CONTENT_DOCS_INDEX,
+            ["message"],
+            chunk_size=batch_size,
+            row_batch_size=batch_size,
+        )
 
-        logger.info(f"Bulk indexing complete: {total_indexed} indexed, {total_errors} errors")
+        logger.info(
+            f"Bulk indexing complete: {result['indexed']} indexed, "
+            f"{result['error_count']} errors"
+        )
 
         return {
             "status": "success",
             "total_messages": total_messages,
-            "indexed": total_indexed,
-            "error_count": total_errors,
+            "indexed": result["indexed"],
+            "error_count": result["error_count"],
         }
 
     except Exception as e:
         logger.error(f"Bulk indexing failed: {e}")
         return {
             "status": "error",
-            "indexed": total_indexed,
-            "error_count": total_errors,
+            "indexed": 0,
+            "error_count": 0,
+            "error": str(e),
+        }
+    finally:
+        session.close()
+
+
+@app.task(name="index.reindex_all")
+def reindex_all(
+    doc_types: Optional[list[str]] = None,
+    thread_count: int = 2,
+    max_errors: int = 0,
+) -> dict[str, Any]:
+    """Rebuild the content index into a new version and swap the alias.
+
+    Searches keep using the current index until the new one is complete.
+    Embeddings are attached during the load when an embeddings endpoint is
+    configured, mostly from the embedding cache.
+
+    Args:
+        doc_types: Document types to load (defaults to all supported).
+        thread_count: Parallel bulk requests in flight.
+        max_errors: Failed documents tolerated before aborting the swap.
+
+    Returns:
+        Dictionary with reindex results.
+    """
+    from rediska_core.config import get_settings
+    from rediska_core.domain.services.embedding import EmbeddingService
+    from rediska_core.domain.services.reindex import ReindexService
+    from rediska_core.infra.db import get_sync_session_factory
+    from rediska_core.infrastructure.embedding_cache import get_embedding_cache
+
+    settings = get_settings()
+    session_factory = get_sync_session_factory()
+    session = session_factory()
+
+    try:
+        embedding_service = None
+        if settings.embeddings_url and settings.embeddings_model:
+            embedding_service = EmbeddingService(
+                db=session,
+                embeddings_url=settings.embeddings_url,
+                embeddings_model=settings.embeddings_model,
+                embeddings_api_key=settings.embeddings_api_key,
+                es_url=settings.elastic_url,
+                batch_size=settings.embeddings_batch_size,
+                max_concurrency=settings.embeddings_max_concurrency,
+                cache=get_embedding_cache(),
+            )
+
+        service = ReindexService(
+            db=session,
+            es_url=settings.elastic_url,
+            embedding_service=embedding_service,
+            embedding_dims=settings.embeddings_dims,
+        )
+
+        return service.reindex(
+            doc_types=doc_types,
+            thread_count=thread_count,
+            max_errors=max_errors,
+        )
+
+    except Exception as e:
+        return {
+            "status": "error",
             "error": str(e),
         }
     finally:
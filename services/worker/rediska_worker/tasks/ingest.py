@@ -4,6 +4,7 @@ import asyncio
 from typing import Optional
 
 from rediska_worker.celery_app import app
+from rediska_worker.util.event_loop import run_async
 
 
 @app.task(name="ingest.backfill_conversations", bind=True)
@@ -42,17 +43,9 @@ def backfill_conversations(
         sync_service = MessageSyncService(db=session)
 
         # Use the existing sync method - it already handles full pagination
-        result = asyncio.run(sync_service.sync_reddit_messages(identity_id=identity_id))
-
-        # Queue indexing if new messages were synced
-        index_task_id = None
-        if result.new_messages > 0:
-            index_task = app.send_task(
-                "index.bulk_index_all_messages",
-                kwargs={"batch_size": 500},
-                queue="celery",
-            )
-            index_task_id = index_task.id
+        result = run_async(sync_service.sync_reddit_messages(identity_id=identity_id))
+
+        # New messages were queued for indexing in the index outbox by the sync
 
         return {
             "status": "success",
@@ -63,7 +56,6 @@ def backfill_conversations(
             "new_conversations": result.new_conversations,
             "new_messages": result.new_messages,
             "errors": result.errors,
-            "index_task_id": index_task_id,
         }
 
     except SyncError as e:
@@ -135,7 +127,7 @@ def backfill_messages(
         sync_service = MessageSyncService(db=session)
 
         # Sync messages for this specific conversation's thread
-        result = asyncio.run(sync_service.sync_reddit_messages(
+        result = run_async(sync_service.sync_reddit_messages(
             identity_id=identity_id or conversation.identity_id
         ))
 
@@ -205,17 +197,9 @@ def sync_delta(self, provider_id: Optional[str] = None, identity_id: Optional[in
             }
 
         # Run the async sync function
-        result = asyncio.run(sync_service.sync_reddit_messages(identity_id=identity_id))
-
-        # Queue indexing if new messages were synced
-        index_task_id = None
-        if result.new_messages > 0:
-            index_task = app.send_task(
-                "index.bulk_index_all_messages",
-                kwargs={"batch_size": 500},
-                queue="celery",
-            )
-            index_task_id = index_task.id
+        result = run_async(sync_service.sync_reddit_messages(identity_id=identity_id))
+
+        # New messages were queued for indexing in the index outbox by the sync
 
         return {
             "status": "success",
@@ -225,7 +209,6 @@ def sync_delta(self, provider_id: Optional[str] = None, identity_id: Optional[in
             "new_conversations": result.new_conversations,
             "new_messages": result.new_messages,
             "errors": result.errors,
-            "index_task_id": index_task_id,
         }
 
     except SyncError as e:
@@ -269,17 +252,9 @@ def sync_inbox_fast(self, identity_id: Optional[int] = None) -> dict:
         sync_service = MessageSyncService(db=session)
 
         # Run the async inbox-only sync
-        result = asyncio.run(sync_service.sync_inbox_only(identity_id=identity_id))
-
-        # Queue indexing if new messages were synced
-        index_task_id = None
-        if result.new_messages > 0:
-            index_task = app.send_task(
-                "index.bulk_index_all_messages",
-                kwargs={"batch_size": 500},
-                queue="celery",
-            )
-            index_task_id = index_task.id
+        result = run_async(sync_service.sync_inbox_only(identity_id=identity_id))
+
+        # New messages were queued for indexing in the index outbox by the sync
 
         return {
             "status": "success",
@@ -290,7 +265,6 @@ def sync_inbox_fast(self, identity_id: Optional[int] = None) -> dict:
             "new_conversations": result.new_conversations,
             "new_messages": result.new_messages,
             "errors": result.errors,
-            "index_task_id": index_task_id,
         }
 
     except SyncError as e:
@@ -429,19 +403,29 @@ def analyze_reddit_user(
             user_agent=settings.provider_reddit_user_agent,
         )
 
-        # Fetch profile data
+        # Fetch profile, posts and comments concurrently (the adapter's
+        # shared rate limiter still paces the underlying requests)
         async def fetch_all():
-            profile = await adapter.fetch_profile(username)
-            posts = await adapter.fetch_user_posts(username, limit=MAX_POSTS)
-            comments = await adapter.fetch_user_comments(username, limit=MAX_COMMENTS)
-            return profile, posts, comments
+            try:
+                return await asyncio.gather(
+                    adapter.fetch_profile(username),
+                    adapter.fetch_user_posts(username, limit=MAX_POSTS),
+                    adapter.fetch_user_comments(username, limit=MAX_COMMENTS),
+                )
+            finally:
+                await adapter.aclose()
 
-        profile, posts, comments = asyncio.run(fetch_all())
+        profile, posts, comments = run_async(fetch_all())
 
         logger.info(f"Fetched profile for u/{username}: posts={len(posts)}, comments={len(comments)}")
 
         # Store ExternalAccount and ProfileItems
         from rediska_core.domain.models import ExternalAccount, ProfileItem, ProfileSnapshot
+        from rediska_core.domain.services.index_outbox import enqueue_index_updates
+        from rediska_core.domain.services.profile_item_utils import (
+            profile_item_values,
+            upsert_profile_items,
+        )
         import re
         import httpx
 
@@ -464,52 +448,15 @@ def analyze_reddit_user(
             account.external_user_id = profile.external_id
             session.flush()
 
-        # Store ProfileItems for posts
-        posts_stored = 0
-        for p in posts:
-            existing = (
-                session.query(ProfileItem)
-                .filter_by(account_id=account.id, item_type="post", external_item_id=p.external_id)
-                .first()
-            )
-            if not existing:
-                item = ProfileItem(
-                    account_id=account.id,
-                    item_type="post",
-                    external_item_id=p.external_id,
-                    item_created_at=p.created_at,
-                    text_content=f"{p.title or ''}\n\n{p.body_text or ''}".strip() if (p.title or p.body_text) else None,
-                    subreddit=p.location,
-                    remote_visibility="visible",
-                )
-                session.add(item)
-                posts_stored += 1
-
-        # Store ProfileItems for comments
-        comments_stored = 0
-        for c in comments:
-            existing = (
-                session.query(ProfileItem)
-                .filter_by(account_id=account.id, item_type="comment", external_item_id=c.external_id)
-                .first()
-            )
-            if not existing:
-                item = ProfileItem(
-                    account_id=account.id,
-                    item_type="comment",
-                    external_item_id=c.external_id,
-                    item_created_at=c.created_at,
-                    text_content=c.body_text,
-                    subreddit=c.location,
-                    link_title=c.title,
-                    link_id=c.raw_data.get("link_id") if c.raw_data else None,
-                    remote_visibility="visible",
-                )
-                session.add(item)
-                comments_stored += 1
-
+        # Store posts and comments as ProfileItems in one upsert
+        rows = [profile_item_values(item) for item in [*posts, *comments]]
+        changed_ids = upsert_profile_items(session, account.id, rows)
+        enqueue_index_updates(session, "profile_item", changed_ids)
         session.flush()
-        logger.info(f"Stored {posts_stored} posts, {comments_stored} comments for u/{username}")
+        logger.info(
+            f"Stored {len(rows)} profile items for u/{username} "
+            f"({len(changed_ids)} new or changed)"
+        )
 
         # Extract and download images from posts
         IMAGE_PATTERNS = [
@@ -565,26 +512,27 @@ def analyze_reddit_user(
                             continue
 
                         try:
-                            resp = await client.get(url, headers={'User-Agent': settings.provider_reddit_user_agent})
-                            if resp.status_code != 200:
-                                continue
-                            ct = resp.headers.get('Content-Type', '').split(';')[0].strip()
-                            if ct not in ALLOWED_IMAGE_TYPES:
-                                continue
-                            if len(resp.content) > 10 * 1024 * 1024:
-                                continue
+                            # Stream to a staged file (over 10MB is rejected while reading)
+                            async with client.stream(
+                                "GET", url, headers={'User-Agent': settings.provider_reddit_user_agent}
+                            ) as resp:
+                                if resp.status_code != 200:
+                                    continue
+                                ct = resp.headers.get('Content-Type', '').split(';')[0].strip()
+                                if ct not in ALLOWED_IMAGE_TYPES:
+                                    continue
+                                staged = await att_service.astage(resp.aiter_bytes())
 
                             # Generate filename
                             url_path = url.split('?')[0].split('/')[-1]
                             if '.' not in url_path:
                                 url_path = f"image.{ct.split('/')[-1]}"
 
-                            upload_result = att_service.upload(
-                                file_data=resp.content,
+                            upload_result = att_service.upload_staged(
+                                staged,
                                 filename=url_path,
                                 content_type=ct,
                                 message_id=None,
-                                username=username,
                             )
 
                             pi = ProfileItem(
@@ -614,7 +562,7 @@ def analyze_reddit_user(
                     if post_item and not post_item.attachment_id:
                         post_item.attachment_id = att_id
 
-            asyncio.run(download_images())
+            run_async(download_images())
             logger.info(f"Downloaded {images_stored} images for u/{username}")
 
         # Build profile data for response
@@ -635,7 +583,7 @@ def analyze_reddit_user(
         from rediska_core.domain.services.character_summary import CharacterSummaryService
 
         async def generate_summaries():
-            inference_client = get_inference_client()
+            inference_client = get_inference_client(priority="background")
 
             try:
                 interests_service = InterestsSummaryService(
@@ -719,7 +667,7 @@ def analyze_reddit_user(
             finally:
                 await inference_client.close()
 
-        interests_result, character_result = asyncio.run(generate_summaries())
+        interests_result, character_result = run_async(generate_summaries())
 
         logger.info(
             f"Generated summaries for u/{username}: "
@@ -750,7 +698,10 @@ def analyze_reddit_user(
         account.analysis_state = "analyzed"
         if not account.first_analyzed_at:
             account.first_analyzed_at = datetime.now(timezone.utc)
-        account.last_fetched_at = datetime.now(timezone.utc)
+        # Also warms the author profile cache used by scout analysis
+        from rediska_core.domain.services.author_profile_cache import AuthorProfileCache
+
+        AuthorProfileCache(session).mark_fetched(account, profile)
 
         session.commit()
         logger.info(f"Stored ProfileSnapshot for u/{username}, account state -> analyzed")
@@ -896,7 +847,7 @@ def analyze_lead_profile(
         )
 
         # Run analysis
-        result = asyncio.run(analysis_service.analyze_lead(lead_id))
+        result = run_async(analysis_service.analyze_lead(lead_id))
 
         if not result.success:
             logger.error(f"Profile analysis failed for lead {lead_id}: {result.error}")
@@ -978,7 +929,7 @@ def redownload_attachments(
         sync_service = MessageSyncService(db=session)
 
         # Run the async redownload function
-        result = asyncio.run(
+        result = run_async(
             sync_service.redownload_missing_attachments(
                 conversation_id=conversation_id,
                 limit=limit,
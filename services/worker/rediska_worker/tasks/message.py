@@ -4,10 +4,10 @@ These tasks handle sending messages through provider adapters
 with at-most-once delivery semantics.
 """
 
-import asyncio
 from typing import Any
 
 from rediska_worker.celery_app import app
+from rediska_worker.util.event_loop import run_async
 
 
 @app.task(
@@ -43,6 +43,7 @@ def send_manual(self, payload: dict[str, Any]) -> dict:
     from rediska_core.domain.services.send_message import SendMessageService
     from rediska_core.infra.db import get_sync_session_factory
     from rediska_core.infrastructure.crypto import CryptoService
+    from rediska_core.infrastructure.rate_limiter import get_provider_rate_limiter
     from rediska_core.providers.reddit.adapter import RedditAdapter
 
     message_id = payload.get("message_id")
@@ -175,6 +176,9 @@ def send_manual(self, payload: dict[str, Any]) -> dict:
                 client_id=settings.provider_reddit_client_id,
                 client_secret=settings.provider_reddit_client_secret,
                 user_agent="Rediska/1.0",
+                http2=settings.provider_reddit_http2,
+                max_connections=settings.provider_reddit_max_connections,
+                rate_limiter=get_provider_rate_limiter("reddit", settings.provider_reddit_client_id),
             )
         else:
             return {
@@ -185,11 +189,15 @@ def send_manual(self, payload: dict[str, Any]) -> dict:
 
         # Send the message
         # Note: Reddit API requires non-empty subject; use single space as minimal subject
-        result = asyncio.run(adapter.send_message(
-            recipient_username=counterpart.external_username,
-            subject=" ",  # Minimal subject (Reddit requires non-empty)
-            body=body_text,
-        ))
+        async def _send() -> Any:
+            async with adapter:
+                return await adapter.send_message(
+                    recipient_username=counterpart.external_username,
+                    subject=" ",  # Minimal subject (Reddit requires non-empty)
+                    body=body_text,
+                )
+
+        result = run_async(_send())
 
         if result.success:
             # Mark message as sent
@@ -20,20 +20,14 @@ def _now_utc() -> datetime:
 
 
 def _get_db_session() -> Any:
-    """Get database session for task execution."""
+    """Get database session for task execution.
+
+    Sessions come from the worker-process pool created on worker_process_init.
+    """
     try:
-        from rediska_core.infra.db import get_db
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        import os
-
-        database_url = os.getenv("MYSQL_URL")
-        if not database_url:
-            raise RuntimeError("MYSQL_URL not configured")
-
-        engine = create_engine(database_url)
-        SessionLocal = sessionmaker(bind=engine)
-        return SessionLocal()
+        from rediska_worker.util.db import get_session
+
+        return get_session()
     except Exception as e:
         logger.error(f"Failed to create database session: {e}")
         raise
@@ -89,7 +83,7 @@ def _update_job_status(
     max_retries=3,
     default_retry_delay=300,  # 5 minutes
 )
-def analyze_lead_task(self, lead_id: int) -> dict:
+def analyze_lead_task(self, lead_id: int, capture_prompts: bool = False) -> dict:
     """
     Analyze a lead using multi-agent pipeline.
 
@@ -102,6 +96,7 @@ def analyze_lead_task(self, lead_id: int) -> dict:
 
     Args:
         lead_id: ID of lead to analyze
+        capture_prompts: Write every prompt and response to the prompt log
 
     Returns:
         dict: Task result with analysis_id, recommendation, confidence
@@ -145,7 +140,7 @@ def analyze_lead_task(self, lead_id: int) -> dict:
             return {"status": "error", "error": error_msg, "job_id": job.id}
 
         # Get inference client using shared factory
-        inference_client = get_inference_client()
+        inference_client = get_inference_client(priority="background")
 
         # Create services
         prompt_service = AgentPromptService(db)
@@ -157,7 +152,9 @@ def analyze_lead_task(self, lead_id: int) -> dict:
 
         # Run analysis (async operation)
         logger.info(f"Starting analysis for lead {lead_id}")
-        analysis = asyncio.run(analysis_service.analyze_lead(lead_id))
+        analysis = asyncio.run(
+            analysis_service.analyze_lead(lead_id, capture_prompts=capture_prompts)
+        )
 
         # Mark job as done
         _update_job_status(db, job.id, "done")
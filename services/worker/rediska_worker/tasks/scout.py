@@ -2,7 +2,7 @@
 
 Provides background processing for:
 1. Running all active watches periodically
-2. Running a single watch (fetch, dedupe, queue analysis)
+2. Running watches that share a listing (one fetch, dedupe, queue analysis)
 3. Analyzing posts with full pipeline (profile fetch, summaries, 6-agent analysis)
 """
 
@@ -12,6 +12,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 
 from rediska_worker.celery_app import app
+from rediska_worker.util.event_loop import get_process_semaphore, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,10 @@ logger = logging.getLogger(__name__)
 MAX_PROFILE_POSTS = 20
 MAX_PROFILE_COMMENTS = 100
 
+# Listings claimed on one scheduler tick are started at random points
+# within the tick, so they do not all hit the provider at once
+DISPATCH_SPREAD_SECONDS = 55
+
 
 # =============================================================================
 # HELPERS
@@ -35,19 +40,14 @@ def _now_utc() -> datetime:
 
 
 def _get_db_session() -> Any:
-    """Get database session for task execution."""
-    try:
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        import os
+    """Get database session for task execution.
 
-        database_url = os.getenv("MYSQL_URL")
-        if not database_url:
-            raise RuntimeError("MYSQL_URL not configured")
+    Sessions come from the worker-process pool created on worker_process_init.
+    """
+    try:
+        from rediska_worker.util.db import get_session
 
-        engine = create_engine(database_url)
-        SessionLocal = sessionmaker(bind=engine)
-        return SessionLocal()
+        return get_session()
     except Exception as e:
         logger.error(f"Failed to create database session: {e}")
         raise
@@ -65,6 +65,7 @@ def _get_reddit_adapter(db: Any, identity_id: Optional[int] = None) -> Any:
     """
     import json
     from rediska_core.domain.models import Identity
+    from rediska_core.infrastructure.rate_limiter import get_provider_rate_limiter
     from rediska_core.providers.reddit.adapter import RedditAdapter
     from rediska_core.config import get_settings
     from rediska_core.domain.services.credentials import CredentialsService
@@ -105,9 +106,57 @@ def _get_reddit_adapter(db: Any, identity_id: Optional[int] = None) -> Any:
         client_id=settings.provider_reddit_client_id,
         client_secret=settings.provider_reddit_client_secret,
         user_agent=settings.provider_reddit_user_agent,
+        http2=settings.provider_reddit_http2,
+        max_connections=settings.provider_reddit_max_connections,
+        rate_limiter=get_provider_rate_limiter("reddit", settings.provider_reddit_client_id),
     )
 
 
+def _run_adapter_call(adapter: Any, coro: Any) -> Any:
+    """Run an adapter coroutine on the worker-process loop, then release its connections.
+
+    Adapters are created per task, so their connection pool is closed as
+    soon as the call completes.
+    """
+    async def _runner() -> Any:
+        try:
+            return await coro
+        finally:
+            await adapter.aclose()
+
+    return run_async(_runner())
+
+
+async def _limited(slots: asyncio.Semaphore, coro: Any) -> Any:
+    """Await a coroutine while holding a semaphore slot."""
+    async with slots:
+        return await coro
+
+
+class _ConcurrencyLimitedInference:
+    """Inference client wrapper that bounds concurrent LLM requests.
+
+    Pipeline stages (and concurrent tasks in the worker process) share one
+    semaphore so summaries and dimension agents never exceed the configured
+    number of in-flight requests.
+    """
+
+    def __init__(self, client: Any, slots: asyncio.Semaphore):
+        self._client = client
+        self._slots = slots
+
+    async def chat(self, *args: Any, **kwargs: Any) -> Any:
+        async with self._slots:
+            return await self._client.chat(*args, **kwargs)
+
+    async def complete(self, *args: Any, **kwargs: Any) -> Any:
+        async with self._slots:
+            return await self._client.complete(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
 # =============================================================================
 # TASKS
 # =============================================================================
@@ -120,10 +169,14 @@ def _get_reddit_adapter(db: Any, identity_id: Optional[int] = None) -> Any:
     default_retry_delay=60,
 )
 def run_all_watches(self) -> dict:
-    """Run all active scout watches.
+    """Dispatch the scout watches that are due.
 
-    This is the periodic task that runs every 5 minutes.
-    It queues individual watch runs for each active watch.
+    This is the periodic scheduler task that runs every minute. Each watch
+    has its own next_run_at, set from its observed new-post rate after every
+    run, so busy subreddits run often and quiet ones rarely. Watches reading
+    the same listing (location, sort, query, time filter) are claimed
+    together, and one run_watch_group task is queued per listing so each
+    listing is fetched once. Groups start at random points within the tick.
 
     Returns:
         dict: Summary with queued watch count and task IDs.
@@ -133,36 +186,51 @@ def run_all_watches(self) -> dict:
     try:
         db = _get_db_session()
 
-        from rediska_core.domain.services.scout_watch import ScoutWatchService
+        from rediska_core.domain.services.scout_watch import (
+            ScoutWatchService,
+            watch_listing_key,
+        )
 
         service = ScoutWatchService(db)
-        watches = service.list_watches(is_active=True)
+        watches = service.claim_due_watches()
+        db.commit()
 
         if not watches:
-            logger.info("No active watches to run")
+            logger.debug("No scout watches due")
             return {
                 "status": "success",
-                "message": "No active watches",
+                "message": "No watches due",
                 "queued": 0,
             }
 
-        logger.info(f"Running {len(watches)} active watches")
+        groups: dict[tuple, list] = {}
+        for watch in watches:
+            groups.setdefault(watch_listing_key(watch), []).append(watch)
+
+        logger.info(f"Running {len(watches)} due watches over {len(groups)} listings")
 
         import random
         task_ids = []
-        for watch in watches:
-            delay = random.uniform(0, 270)  # Spread across 4.5 minutes
-            task = run_single_watch.apply_async(args=[], kwargs={"watch_id": watch.id}, countdown=delay)
+        for group in groups.values():
+            watch_ids = [watch.id for watch in group]
+            delay = random.uniform(0, DISPATCH_SPREAD_SECONDS)
+            task = run_watch_group.apply_async(
+                args=[], kwargs={"watch_ids": watch_ids}, countdown=delay
+            )
             task_ids.append({
-                "watch_id": watch.id,
+                "watch_ids": watch_ids,
                 "task_id": task.id,
-                "source_location": watch.source_location,
+                "source_location": group[0].source_location,
             })
-            logger.debug(f"Queued watch {watch.id} ({watch.source_location}): {task.id} (delay={delay:.0f}s)")
+            logger.debug(
+                f"Queued watches {watch_ids} ({group[0].source_location}): {task.id} "
+                f"(delay={delay:.0f}s)"
+            )
 
         return {
             "status": "success",
-            "queued": len(task_ids),
+            "queued": len(watches),
+            "listings": len(task_ids),
             "tasks": task_ids,
         }
 
@@ -182,6 +250,28 @@ def run_all_watches(self) -> dict:
             db.close()
 
 
+@app.task(
+    bind=True,
+    name="scout.run_watch_group",
+    max_retries=3,
+    default_retry_delay=120,
+)
+def run_watch_group(self, watch_ids: list[int]) -> dict:
+    """Run watches that read the same listing, fetching it once.
+
+    Args:
+        watch_ids: IDs of watches sharing a listing.
+
+    Returns:
+        dict: Per-watch run results.
+    """
+    results = _run_watches(self, watch_ids)
+    return {
+        "status": "success" if all(r["status"] != "error" for r in results) else "error",
+        "watches": results,
+    }
+
+
 @app.task(
     bind=True,
     name="scout.run_single_watch",
@@ -202,248 +292,342 @@ def run_single_watch(self, watch_id: int) -> dict:
     Returns:
         dict: Task result with run stats.
     """
+    return _run_watches(self, [watch_id])[0]
+
+
+def _listing_since(watches: list) -> Optional[datetime]:
+    """High-water mark to fetch a shared listing from.
+
+    The oldest mark in the group, so every watch gets the posts it needs;
+    None (a full page) if any watch has no mark yet.
+    """
+    from rediska_core.domain.services.scout_watch import uses_high_water_mark
+
+    if not all(uses_high_water_mark(watch) and watch.last_post_created_at for watch in watches):
+        return None
+    return min(watch.last_post_created_at for watch in watches)
+
+
+def _run_watches(task: Any, watch_ids: list[int]) -> list[dict]:
+    """Fetch one listing and run every watch in watch_ids against it.
+
+    Watches in watch_ids must share a listing key. The listing is fetched
+    with the first watch's identity.
+
+    Args:
+        task: The bound Celery task (for retries).
+        watch_ids: IDs of watches sharing a listing.
+
+    Returns:
+        list[dict]: One run result per watch ID, in order.
+    """
     db = None
-    run = None
+    runs: dict[int, Any] = {}
 
     try:
         db = _get_db_session()
 
-        from rediska_core.domain.services.scout_watch import (
-            ScoutWatchService,
-            ScoutWatchNotFoundError,
-        )
+        from rediska_core.domain.services.scout_watch import ScoutWatchService
 
         service = ScoutWatchService(db)
 
-        # Get watch
-        try:
-            watch = service.get_watch_or_raise(watch_id)
-        except ScoutWatchNotFoundError:
-            logger.error(f"Watch not found: {watch_id}")
-            return {
-                "status": "error",
-                "error": f"Watch not found: {watch_id}",
-                "watch_id": watch_id,
-            }
+        results: dict[int, dict] = {}
+        watches = []
+        for watch_id in watch_ids:
+            watch = service.get_watch(watch_id)
+            if watch is None:
+                logger.error(f"Watch not found: {watch_id}")
+                results[watch_id] = {
+                    "status": "error",
+                    "error": f"Watch not found: {watch_id}",
+                    "watch_id": watch_id,
+                }
+            elif not watch.is_active:
+                logger.info(f"Watch {watch_id} is not active, skipping")
+                results[watch_id] = {
+                    "status": "skipped",
+                    "reason": "Watch not active",
+                    "watch_id": watch_id,
+                }
+            else:
+                watches.append(watch)
 
-        if not watch.is_active:
-            logger.info(f"Watch {watch_id} is not active, skipping")
-            return {
-                "status": "skipped",
-                "reason": "Watch not active",
-                "watch_id": watch_id,
-            }
+        if not watches:
+            return [results[watch_id] for watch_id in watch_ids]
 
-        # Create run record
-        run = service.create_run(watch_id)
+        # Create run records
+        for watch in watches:
+            runs[watch.id] = service.create_run(watch.id)
         db.commit()
 
+        lead = watches[0]
         logger.info(
-            f"Starting watch run {run.id} for watch {watch_id} "
-            f"({watch.source_location})"
+            f"Starting watch runs {[run.id for run in runs.values()]} for watches "
+            f"{[watch.id for watch in watches]} ({lead.source_location})"
         )
 
+        def fail_all(message: str) -> None:
+            for watch in watches:
+                run = runs.pop(watch.id)
+                service.complete_run(
+                    run=run,
+                    posts_fetched=0,
+                    posts_new=0,
+                    posts_analyzed=0,
+                    leads_created=0,
+                    error_message=message,
+                )
+                results[watch.id] = {
+                    "status": "error",
+                    "error": message,
+                    "watch_id": watch.id,
+                    "run_id": run.id,
+                }
+            schedule_group()
+            db.commit()
+
+        def schedule_group() -> None:
+            # Keep the group on one schedule so the listing stays shared
+            if len(watches) > 1:
+                service.schedule_listing(watches)
+
         # Get Reddit adapter
         try:
-            adapter = _get_reddit_adapter(db, watch.identity_id)
+            adapter = _get_reddit_adapter(db, lead.identity_id)
         except Exception as e:
             logger.error(f"Failed to get Reddit adapter: {e}")
-            service.complete_run(
-                run=run,
-                posts_fetched=0,
-                posts_new=0,
-                posts_analyzed=0,
-                leads_created=0,
-                error_message=f"Failed to get Reddit adapter: {e}",
-            )
-            db.commit()
-            return {
-                "status": "error",
-                "error": str(e),
-                "watch_id": watch_id,
-                "run_id": run.id,
-            }
-
-        # Fetch posts
-        posts_fetched = 0
-        posts_new = 0
-        analysis_tasks_queued = 0
-        search_url = None
+            fail_all(f"Failed to get Reddit adapter: {e}")
+            return [results[watch_id] for watch_id in watch_ids]
 
+        # Fetch the listing once for the whole group, only back to the
+        # oldest high-water mark when every watch has one
         try:
-            result = asyncio.run(
-                adapter.browse_location(
-                    location=watch.source_location,
-                    sort=watch.sort_by,
-                    time_filter=watch.time_filter,
-                    query=watch.search_query,
+            since = _listing_since(watches)
+            result = _run_adapter_call(
+                adapter,
+                adapter.browse_location_since(
+                    location=lead.source_location,
+                    since=since,
+                    sort=lead.sort_by,
+                    time_filter=lead.time_filter,
+                    query=lead.search_query,
                     limit=100,  # Fetch more posts to find new ones
-                )
+                ),
             )
 
             posts = result.items
-            posts_fetched = len(posts)
 
-            # Extract and store the browser-friendly search URL for debugging
+            # Extract the browser-friendly search URL for debugging
+            search_url = None
             if result.metadata:
                 search_url = result.metadata.get("browser_url") or result.metadata.get("request_url")
-                service.update_run_search_url(run, search_url)
-                db.commit()
 
-            logger.info(f"Fetched {posts_fetched} posts from {watch.source_location} (URL: {search_url})")
+            logger.info(
+                f"Fetched {len(posts)} posts from {lead.source_location} "
+                f"(since={since}, URL: {search_url})"
+            )
 
         except Exception as e:
             logger.error(f"Failed to fetch posts: {e}")
-            service.complete_run(
-                run=run,
-                posts_fetched=0,
-                posts_new=0,
-                posts_analyzed=0,
-                leads_created=0,
-                error_message=f"Failed to fetch posts: {e}",
-            )
-            db.commit()
-            return {
-                "status": "error",
-                "error": str(e),
-                "watch_id": watch_id,
-                "run_id": run.id,
-            }
+            fail_all(f"Failed to fetch posts: {e}")
+            return [results[watch_id] for watch_id in watch_ids]
 
-        # Process each post
-        posts_skipped_empty = 0
-        for post in posts:
-            external_post_id = post.external_id
-
-            # Check if already seen
-            if service.is_post_seen(watch_id, external_post_id):
-                continue
-
-            # Skip posts with empty body (user may have hidden content)
-            if not post.body_text or not post.body_text.strip():
-                posts_skipped_empty += 1
-                logger.debug(f"Skipping post {external_post_id} - empty body (content hidden)")
-                continue
-
-            posts_new += 1
-
-            # Record post with title and author for audit
-            scout_post = service.record_post(
-                watch_id=watch_id,
-                run_id=run.id,
-                external_post_id=external_post_id,
-                post_title=post.title,
-                post_body=post.body_text,
-                post_author=post.author_username,
+        for watch in watches:
+            results[watch.id] = _process_watch_posts(
+                db, service, watch, runs[watch.id], posts, search_url
             )
-            db.commit()
-
-            # Queue full analysis pipeline if auto_analyze is enabled
-            if watch.auto_analyze:
-                try:
-                    # Prepare post data for the analysis task
-                    post_data = {
-                        "provider_id": "reddit",
-                        "source_location": watch.source_location,
-                        "external_post_id": external_post_id,
-                        "post_url": f"https://reddit.com{post.url}" if post.url and not post.url.startswith("http") else post.url,
-                        "title": post.title,
-                        "body_text": post.body_text,
-                        "author_username": post.author_username,
-                        "author_external_id": post.author_id,
-                        "post_created_at": post.created_at.isoformat() if post.created_at else None,
-                    }
-
-                    # Queue the full analysis pipeline
-                    task = analyze_and_decide.delay(
-                        watch_id=watch_id,
-                        scout_post_id=scout_post.id,
-                        post_data=post_data,
-                    )
-                    analysis_tasks_queued += 1
+            del runs[watch.id]
 
-                    logger.debug(
-                        f"Queued analyze_and_decide for post {external_post_id}: task_id={task.id}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Failed to queue analysis for {external_post_id}: {e}")
-                    # Mark as failed
-                    service.update_post_analysis(
-                        watch_id=watch_id,
-                        external_post_id=external_post_id,
-                        recommendation=None,
-                        confidence=None,
-                        lead_id=None,
-                        status="failed",
-                        reasoning=f"Failed to queue analysis: {e}",
-                    )
-                    db.commit()
-
-        # Complete run (posts_analyzed and leads_created will be updated by analyze_and_decide tasks)
-        service.complete_run(
-            run=run,
-            posts_fetched=posts_fetched,
-            posts_new=posts_new,
-            posts_analyzed=0,  # Will be updated by child tasks
-            leads_created=0,   # Will be updated by child tasks
-            error_message=None,
-        )
+        schedule_group()
         db.commit()
 
-        logger.info(
-            f"Completed watch run {run.id}: "
-            f"fetched={posts_fetched}, new={posts_new}, "
-            f"skipped_empty={posts_skipped_empty}, "
-            f"analysis_tasks_queued={analysis_tasks_queued}"
-        )
-
-        return {
-            "status": "success",
-            "watch_id": watch_id,
-            "run_id": run.id,
-            "search_url": search_url,
-            "posts_fetched": posts_fetched,
-            "posts_new": posts_new,
-            "posts_skipped_empty": posts_skipped_empty,
-            "analysis_tasks_queued": analysis_tasks_queued,
-        }
+        return [results[watch_id] for watch_id in watch_ids]
 
     except Exception as exc:
         logger.error(f"Watch run failed: {str(exc)}", exc_info=True)
 
-        # Try to complete run with error
-        if run and db:
+        # Try to complete unfinished runs with error
+        if runs and db:
             try:
                 from rediska_core.domain.services.scout_watch import ScoutWatchService
                 service = ScoutWatchService(db)
-                service.complete_run(
-                    run=run,
-                    posts_fetched=0,
-                    posts_new=0,
-                    posts_analyzed=0,
-                    leads_created=0,
-                    error_message=str(exc),
-                )
+                for run in runs.values():
+                    service.complete_run(
+                        run=run,
+                        posts_fetched=0,
+                        posts_new=0,
+                        posts_analyzed=0,
+                        leads_created=0,
+                        error_message=str(exc),
+                    )
                 db.commit()
             except Exception:
                 pass
 
-        if self.request.retries < self.max_retries:
-            raise self.retry(exc=exc, countdown=120 * (2 ** self.request.retries))
+        if task.request.retries < task.max_retries:
+            raise task.retry(exc=exc, countdown=120 * (2 ** task.request.retries))
         else:
-            return {
-                "status": "failed",
-                "error": str(exc),
-                "watch_id": watch_id,
-                "run_id": run.id if run else None,
-            }
+            return [
+                {
+                    "status": "failed",
+                    "error": str(exc),
+                    "watch_id": watch_id,
+                    "run_id": runs[watch_id].id if watch_id in runs else None,
+                }
+                for watch_id in watch_ids
+            ]
 
     finally:
         if db:
             db.close()
 
 
+def _process_watch_posts(
+    db: Any,
+    service: Any,
+    watch: Any,
+    run: Any,
+    posts: list,
+    search_url: Optional[str],
+) -> dict:
+    """Record a watch's unseen posts from a fetched listing and queue analysis.
+
+    Args:
+        db: Database session.
+        service: ScoutWatchService.
+        watch: The watch.
+        run: The watch's run record (completed here).
+        posts: Posts from the shared listing.
+        search_url: Listing URL, stored on the run for debugging.
+
+    Returns:
+        dict: Run result with stats.
+    """
+    from rediska_core.domain.services.scout_watch import uses_high_water_mark
+
+    watch_id = watch.id
+    posts_fetched = len(posts)
+    posts_new = 0
+    analysis_tasks_queued = 0
+
+    if search_url:
+        service.update_run_search_url(run, search_url)
+        db.commit()
+
+    # The shared listing may reach back past this watch's own mark
+    mark = watch.last_post_created_at if uses_high_water_mark(watch) else None
+    if mark is not None:
+        mark = mark.replace(tzinfo=timezone.utc)
+        posts = [
+            post for post in posts
+            if post.created_at is None or post.created_at >= mark
+        ]
+
+    # Check which posts were already seen in one query
+    seen = service.seen_post_ids(watch_id, [post.external_id for post in posts])
+
+    # Process each post
+    posts_skipped_empty = 0
+    for post in posts:
+        external_post_id = post.external_id
+
+        # Check if already seen
+        if external_post_id in seen:
+            continue
+        seen.add(external_post_id)
+
+        # Skip posts with empty body (user may have hidden content)
+        if not post.body_text or not post.body_text.strip():
+            posts_skipped_empty += 1
+            logger.debug(f"Skipping post {external_post_id} - empty body (content hidden)")
+            continue
+
+        posts_new += 1
+
+        # Record post with title and author for audit
+        scout_post = service.record_post(
+            watch_id=watch_id,
+            run_id=run.id,
+            external_post_id=external_post_id,
+            post_title=post.title,
+            post_body=post.body_text,
+            post_author=post.author_username,
+        )
+        db.commit()
+
+        # Queue full analysis pipeline if auto_analyze is enabled
+        if watch.auto_analyze:
+            try:
+                # Prepare post data for the analysis task
+                post_data = {
+                    "provider_id": "reddit",
+                    "source_location": watch.source_location,
+                    "external_post_id": external_post_id,
+                    "post_url": f"https://reddit.com{post.url}" if post.url and not post.url.startswith("http") else post.url,
+                    "title": post.title,
+                    "body_text": post.body_text,
+                    "author_username": post.author_username,
+                    "author_external_id": post.author_id,
+                    "post_created_at": post.created_at.isoformat() if post.created_at else None,
+                }
+
+                # Queue the full analysis pipeline
+                task = analyze_and_decide.delay(
+                    watch_id=watch_id,
+                    scout_post_id=scout_post.id,
+                    post_data=post_data,
+                )
+                analysis_tasks_queued += 1
+
+                logger.debug(
+                    f"Queued analyze_and_decide for post {external_post_id}: task_id={task.id}"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to queue analysis for {external_post_id}: {e}")
+                # Mark as failed
+                service.update_post_analysis(
+                    watch_id=watch_id,
+                    external_post_id=external_post_id,
+                    recommendation=None,
+                    confidence=None,
+                    lead_id=None,
+                    status="failed",
+                    reasoning=f"Failed to queue analysis: {e}",
+                )
+                db.commit()
+
+    # Complete run (posts_analyzed and leads_created will be updated by analyze_and_decide tasks)
+    service.advance_high_water_mark(watch, posts)
+    service.complete_run(
+        run=run,
+        posts_fetched=posts_fetched,
+        posts_new=posts_new,
+        posts_analyzed=0,  # Will be updated by child tasks
+        leads_created=0,   # Will be updated by child tasks
+        error_message=None,
+    )
+    db.commit()
+
+    logger.info(
+        f"Completed watch run {run.id}: "
+        f"fetched={posts_fetched}, new={posts_new}, "
+        f"skipped_empty={posts_skipped_empty}, "
+        f"analysis_tasks_queued={analysis_tasks_queued}"
+    )
+
+    return {
+        "status": "success",
+        "watch_id": watch_id,
+        "run_id": run.id,
+        "search_url": search_url,
+        "posts_fetched": posts_fetched,
+        "posts_new": posts_new,
+        "posts_skipped_empty": posts_skipped_empty,
+        "analysis_tasks_queued": analysis_tasks_queued,
+    }
+
+
 @app.task(
     bind=True,
     name="scout.analyze_and_decide",
@@ -468,6 +652,15 @@ def analyze_and_decide(
     7. If suitable + confident: create lead
     8. Update scout_watch_posts with results
 
+    Steps 1-6 run as one async pipeline on the worker-process event loop:
+    the three fetches run concurrently, summaries overlap with storing the
+    fetched items, and Reddit/LLM calls are bounded by semaphores shared by
+    every task in the worker process.
+
+    Authors fetched within PROVIDER_PROFILE_CACHE_SECONDS are served from
+    stored profile items without any Reddit calls; after that, only posts
+    and comments newer than the stored ones are fetched.
+
     The multi-agent analysis DECIDES whether to create a lead.
     This is the only place where leads are created for scout watches.
 
@@ -484,12 +677,18 @@ def analyze_and_decide(
     try:
         db = _get_db_session()
 
+        from rediska_core.config import get_settings
         from rediska_core.domain.services.scout_watch import ScoutWatchService
+        from rediska_core.domain.services.author_profile_cache import (
+            AuthorProfileCache,
+            merge_items,
+        )
         from rediska_core.domain.services.inference import get_inference_client
         from rediska_core.domain.services.interests_summary import InterestsSummaryService
         from rediska_core.domain.services.character_summary import CharacterSummaryService
         from rediska_core.domain.models import ScoutWatchPost, ScoutWatch
 
+        settings = get_settings()
         service = ScoutWatchService(db)
 
         # Get watch and scout_post records
@@ -524,70 +723,114 @@ def analyze_and_decide(
         # =================================================================
         # STEP 2: Fetch profile data
         # =================================================================
-        async def fetch_profile_data():
-            """Fetch profile, posts, and comments in parallel."""
-            profile = await adapter.fetch_profile(author_username)
-
-            # Fetch posts and comments with limits
-            posts = await adapter.fetch_user_posts(author_username, limit=MAX_PROFILE_POSTS)
-            comments = await adapter.fetch_user_comments(author_username, limit=MAX_PROFILE_COMMENTS)
-
-            return profile, posts, comments
+        profile_cache = AuthorProfileCache(
+            db, max_age_seconds=settings.provider_profile_cache_seconds
+        )
 
-        try:
-            profile, user_posts, user_comments = asyncio.run(fetch_profile_data())
-            scout_post.profile_fetched_at = _now_utc()
-            db.commit()
+        async def fetch_profile_data(reddit_slots: asyncio.Semaphore):
+            """Serve the author from the cache, fetching only what is missing.
 
-            logger.info(
-                f"Fetched profile for u/{author_username}: "
-                f"posts={len(user_posts)}, comments={len(user_comments)}"
+            Returns:
+                (profile, posts, comments, fetched) where fetched is False
+                when the cache was fresh and Reddit was not called.
+            """
+            try:
+                cached = profile_cache.lookup(
+                    "reddit",
+                    author_username,
+                    max_posts=MAX_PROFILE_POSTS,
+                    max_comments=MAX_PROFILE_COMMENTS,
+                )
+                if cached.is_fresh:
+                    logger.info(
+                        f"Using cached profile for u/{author_username} "
+                        f"(fetched {cached.fetched_at.isoformat()})"
+                    )
+                    return cached.profile, cached.posts, cached.comments, False
+
+                # Let every request finish before the client is closed
+                results = await asyncio.gather(
+                    _limited(reddit_slots, adapter.fetch_profile(author_username)),
+                    _limited(
+                        reddit_slots,
+                        adapter.fetch_user_posts(
+                            author_username, limit=MAX_PROFILE_POSTS, since=cached.posts_since
+                        ),
+                    ),
+                    _limited(
+                        reddit_slots,
+                        adapter.fetch_user_comments(
+                            author_username,
+                            limit=MAX_PROFILE_COMMENTS,
+                            since=cached.comments_since,
+                        ),
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                await adapter.aclose()
+
+            for fetched in results:
+                if isinstance(fetched, BaseException):
+                    raise fetched
+
+            profile, new_posts, new_comments = results
+            return (
+                profile,
+                merge_items(new_posts, cached.posts, MAX_PROFILE_POSTS),
+                merge_items(new_comments, cached.comments, MAX_PROFILE_COMMENTS),
+                True,
             )
 
-        except Exception as e:
-            logger.error(f"Failed to fetch profile for u/{author_username}: {e}")
-            scout_post.analysis_status = "failed"
-            scout_post.analysis_reasoning = f"Failed to fetch profile: {e}"
-            db.commit()
-            return {
-                "status": "failed",
-                "error": f"Profile fetch failed: {e}",
-                "watch_id": watch_id,
-                "scout_post_id": scout_post_id,
-            }
-
         # =================================================================
         # STEP 2b: Store discovery post and fetched content as ProfileItems
         # =================================================================
         # This ensures the Content section always has data, even if the
         # separate analyze_reddit_user task fails or the Reddit API returns
         # nothing for the user's post history.
-        from rediska_core.domain.models import ExternalAccount, ProfileItem
+        def store_profile_items(profile, user_posts, user_comments, fetched) -> None:
+            """Persist the discovery post and fetched posts/comments.
 
-        account = db.query(ExternalAccount).filter_by(
-            provider_id="reddit",
-            external_username=author_username,
-        ).first()
+            Runs in a worker thread while the summaries run on the loop, so
+            it uses its own session rather than the task's.
+            """
+            store_db = _get_db_session()
+            try:
+                _store_profile_items(store_db, profile, user_posts, user_comments, fetched)
+            except BaseException:
+                store_db.rollback()
+                raise
+            finally:
+                store_db.close()
+
+        def _store_profile_items(db, profile, user_posts, user_comments, fetched) -> None:
+            """Store profile items on the given session and commit."""
+            from rediska_core.domain.models import ExternalAccount
+            from rediska_core.domain.services.index_outbox import enqueue_index_updates
+            from rediska_core.domain.services.profile_item_utils import (
+                profile_item_values,
+                upsert_profile_items,
+            )
 
-        if not account:
-            account = ExternalAccount(
+            account = db.query(ExternalAccount).filter_by(
                 provider_id="reddit",
                 external_username=author_username,
-                external_user_id=post_data.get("author_external_id"),
-                remote_status="active",
-            )
-            db.add(account)
-            db.flush()
-
-        # Always store the discovery post — the post where the contact was found
-        discovery_ext_id = post_data.get("external_post_id")
-        if discovery_ext_id:
-            existing_discovery = db.query(ProfileItem).filter_by(
-                account_id=account.id,
-                item_type="post",
-                external_item_id=discovery_ext_id,
             ).first()
-            if not existing_discovery:
+
+            if not account:
+                account = ExternalAccount(
+                    provider_id="reddit",
+                    external_username=author_username,
+                    external_user_id=post_data.get("author_external_id"),
+                    remote_status="active",
+                )
+                db.add(account)
+                db.flush()
+
+            # Always store the discovery post — the post where the contact was found
+            rows = []
+            discovery_ext_id = post_data.get("external_post_id")
+            if discovery_ext_id:
                 disc_created_at = post_data.get("post_created_at")
                 if isinstance(disc_created_at, str):
                     disc_created_at = datetime.fromisoformat(
@@ -595,77 +838,37 @@ def analyze_and_decide(
                     )
 
                 disc_text = f"{post_data.get('title', '')}\n\n{post_data.get('body_text', '')}".strip()
-                db.add(ProfileItem(
-                    account_id=account.id,
-                    item_type="post",
-                    external_item_id=discovery_ext_id,
-                    item_created_at=disc_created_at,
-                    text_content=disc_text or None,
-                    subreddit=post_data.get("source_location"),
-                    remote_visibility="visible",
-                ))
-
-        # Store fetched posts as ProfileItems
-        for p in user_posts:
-            if not p.external_id:
-                continue
-            existing = db.query(ProfileItem).filter_by(
-                account_id=account.id,
-                item_type="post",
-                external_item_id=p.external_id,
-            ).first()
-            if not existing:
-                db.add(ProfileItem(
-                    account_id=account.id,
-                    item_type="post",
-                    external_item_id=p.external_id,
-                    item_created_at=p.created_at,
-                    text_content=f"{p.title or ''}\n\n{p.body_text or ''}".strip() or None,
-                    subreddit=p.location,
-                    remote_visibility="visible",
-                ))
-
-        # Store fetched comments as ProfileItems
-        for c in user_comments:
-            if not c.external_id:
-                continue
-            existing = db.query(ProfileItem).filter_by(
-                account_id=account.id,
-                item_type="comment",
-                external_item_id=c.external_id,
-            ).first()
-            if not existing:
-                db.add(ProfileItem(
-                    account_id=account.id,
-                    item_type="comment",
-                    external_item_id=c.external_id,
-                    item_created_at=c.created_at,
-                    text_content=c.body_text,
-                    subreddit=c.location,
-                    link_title=c.title,
-                    link_id=c.raw_data.get("link_id") if c.raw_data else None,
-                    remote_visibility="visible",
-                ))
-
-        db.flush()
-        db.commit()
-
-        logger.info(
-            f"Stored profile items for u/{author_username}: account_id={account.id}"
-        )
+                rows.append({
+                    "item_type": "post",
+                    "external_item_id": discovery_ext_id,
+                    "item_created_at": disc_created_at,
+                    "text_content": disc_text or None,
+                    "subreddit": post_data.get("source_location"),
+                    "link_title": None,
+                    "link_id": None,
+                    "remote_visibility": "visible",
+                })
+
+            # Fetched posts and comments, stored in one upsert
+            rows.extend(profile_item_values(item) for item in [*user_posts, *user_comments])
+            changed_ids = upsert_profile_items(db, account.id, rows)
+            enqueue_index_updates(db, "profile_item", changed_ids)
+            if fetched:
+                profile_cache.mark_fetched(account, profile)
+            db.commit()
 
-        # =================================================================
-        # STEP 3: Update status to summarizing
-        # =================================================================
-        scout_post.analysis_status = "summarizing"
-        db.commit()
+            logger.info(
+                f"Stored profile items for u/{author_username}: account_id={account.id}"
+            )
 
         # =================================================================
-        # STEP 4: Generate summaries
+        # STEP 3: Generate summaries
         # =================================================================
-        async def generate_summaries():
+        async def generate_summaries(user_posts, user_comments, llm_slots):
             """Generate interests and character summaries."""
-            inference_client = get_inference_client()
+            inference_client = _ConcurrencyLimitedInference(
+                get_inference_client(priority="background"), llm_slots
+            )
 
             try:
                 # Create summary services
@@ -709,42 +912,17 @@ def analyze_and_decide(
             finally:
                 await inference_client.close()
 
-        try:
-            interests_result, character_result = asyncio.run(generate_summaries())
-
-            # Store summaries
-            scout_post.user_interests = interests_result.summary if interests_result.success else ""
-            scout_post.user_character = character_result.summary if character_result.success else ""
-            db.commit()
-
-            logger.info(
-                f"Generated summaries for u/{author_username}: "
-                f"interests_success={interests_result.success}, "
-                f"character_success={character_result.success}"
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to generate summaries for u/{author_username}: {e}")
-            # Continue anyway - summaries are helpful but not required
-            scout_post.user_interests = ""
-            scout_post.user_character = ""
-            db.commit()
-
-        # =================================================================
-        # STEP 5: Update status to analyzing
         # =================================================================
-        scout_post.analysis_status = "analyzing"
-        db.commit()
-
+        # STEP 4: Run 6-agent multi-agent analysis
         # =================================================================
-        # STEP 6: Run 6-agent multi-agent analysis
-        # =================================================================
-        async def run_multi_agent_analysis():
+        async def run_multi_agent_analysis(profile, user_posts, user_comments, llm_slots):
             """Run the 6-agent analysis pipeline."""
             from rediska_core.domain.services.multi_agent_analysis import MultiAgentAnalysisService
             from rediska_core.domain.services.agent_prompt import AgentPromptService
 
-            inference_client = get_inference_client()
+            inference_client = _ConcurrencyLimitedInference(
+                get_inference_client(priority="background"), llm_slots
+            )
 
             try:
                 prompt_service = AgentPromptService(db)
@@ -766,6 +944,7 @@ def analyze_and_decide(
                         {
                             "text": p.body_text or p.title or "",
                             "created_at": p.created_at.isoformat() if p.created_at else None,
+                            "pinned": p.external_id == discovery_post_id,
                         }
                         for p in user_posts
                         if p.body_text or p.title
@@ -782,13 +961,15 @@ def analyze_and_decide(
 
                 # Always include the discovery post in analysis input —
                 # this is the post where the contact was found and may not
-                # appear in the user's recent post history
+                # appear in the user's recent post history. It is pinned so
+                # the token budget never trims it away
                 if not discovery_in_fetched:
                     disc_text = f"{post_data.get('title', '')}\n\n{post_data.get('body_text', '')}".strip()
                     if disc_text:
                         items_by_type["post"].insert(0, {
                             "text": disc_text,
                             "created_at": post_data.get("post_created_at"),
+                            "pinned": True,
                         })
 
                 input_context = {
@@ -805,12 +986,7 @@ def analyze_and_decide(
                         "karma": profile.karma if profile else 0,
                         "created_at": profile.created_at.isoformat() if profile and profile.created_at else None,
                         "is_verified": profile.is_verified if profile else False,
-                        "post_text": " ".join([
-                            item.get("text", "") for item in items_by_type.get("post", [])
-                        ]),
-                        "comment_text": " ".join([
-                            item.get("text", "") for item in items_by_type.get("comment", [])
-                        ]),
+                        **analysis_service.context_builder.profile_texts(items_by_type),
                     },
                     "summaries": {
                         "user_interests": scout_post.user_interests or "",
@@ -841,32 +1017,133 @@ def analyze_and_decide(
             finally:
                 await inference_client.close()
 
-        try:
-            dimension_results, meta_result, meta_output, normalized = asyncio.run(run_multi_agent_analysis())
+        # =================================================================
+        # STEP 5: Run the pipeline on the worker-process event loop
+        # =================================================================
+        async def analysis_pipeline() -> dict:
+            """Fetch, summarize and analyze, overlapping stages where possible.
+
+            Summaries start as soon as the profile data arrives and run while
+            the fetched items are stored; dimension agents need the summaries.
+            Reddit calls and LLM calls are bounded by their own semaphores.
+            """
+            reddit_slots = get_process_semaphore(
+                "reddit", settings.provider_rate_concurrency_default
+            )
+            llm_slots = get_process_semaphore("inference", settings.inference_max_concurrency)
 
-            recommendation = normalized.get("recommendation", "needs_review")
-            confidence = normalized.get("confidence", 0.5)
-            reasoning = normalized.get("reasoning", "")
+            try:
+                profile, user_posts, user_comments, fetched = await fetch_profile_data(
+                    reddit_slots
+                )
+                scout_post.profile_fetched_at = _now_utc()
+                db.commit()
 
-            logger.info(
-                f"Multi-agent analysis for u/{author_username}: "
-                f"recommendation={recommendation}, confidence={confidence:.2f}"
+                logger.info(
+                    f"Fetched profile for u/{author_username}: "
+                    f"posts={len(user_posts)}, comments={len(user_comments)}"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to fetch profile for u/{author_username}: {e}")
+                scout_post.analysis_status = "failed"
+                scout_post.analysis_reasoning = f"Failed to fetch profile: {e}"
+                db.commit()
+                return {
+                    "status": "failed",
+                    "error": f"Profile fetch failed: {e}",
+                    "watch_id": watch_id,
+                    "scout_post_id": scout_post_id,
+                }
+
+            summaries_task = asyncio.create_task(
+                generate_summaries(user_posts, user_comments, llm_slots)
             )
 
-        except Exception as e:
-            logger.error(f"Multi-agent analysis failed for u/{author_username}: {e}")
-            scout_post.analysis_status = "failed"
-            scout_post.analysis_reasoning = f"Multi-agent analysis failed: {e}"
+            # Store items off the loop (on a separate session) so the summary
+            # requests proceed meanwhile
+            try:
+                await asyncio.to_thread(
+                    store_profile_items, profile, user_posts, user_comments, fetched
+                )
+            except BaseException:
+                # Don't leave the task pending on the long-lived worker loop
+                summaries_task.cancel()
+                await asyncio.gather(summaries_task, return_exceptions=True)
+                raise
+
+            scout_post.analysis_status = "summarizing"
             db.commit()
+
+            try:
+                interests_result, character_result = await summaries_task
+
+                # Store summaries
+                scout_post.user_interests = interests_result.summary if interests_result.success else ""
+                scout_post.user_character = character_result.summary if character_result.success else ""
+                db.commit()
+
+                logger.info(
+                    f"Generated summaries for u/{author_username}: "
+                    f"interests_success={interests_result.success}, "
+                    f"character_success={character_result.success}"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to generate summaries for u/{author_username}: {e}")
+                # Continue anyway - summaries are helpful but not required
+                scout_post.user_interests = ""
+                scout_post.user_character = ""
+                db.commit()
+
+            scout_post.analysis_status = "analyzing"
+            db.commit()
+
+            try:
+                dimension_results, meta_result, meta_output, normalized = (
+                    await run_multi_agent_analysis(profile, user_posts, user_comments, llm_slots)
+                )
+
+            except Exception as e:
+                logger.error(f"Multi-agent analysis failed for u/{author_username}: {e}")
+                scout_post.analysis_status = "failed"
+                scout_post.analysis_reasoning = f"Multi-agent analysis failed: {e}"
+                db.commit()
+                return {
+                    "status": "failed",
+                    "error": f"Analysis failed: {e}",
+                    "watch_id": watch_id,
+                    "scout_post_id": scout_post_id,
+                }
+
             return {
-                "status": "failed",
-                "error": f"Analysis failed: {e}",
-                "watch_id": watch_id,
-                "scout_post_id": scout_post_id,
+                "status": "analyzed",
+                "dimension_results": dimension_results,
+                "meta_result": meta_result,
+                "meta_output": meta_output,
+                "normalized": normalized,
             }
 
+        pipeline_result = run_async(analysis_pipeline())
+        if pipeline_result["status"] == "failed":
+            return pipeline_result
+
+        dimension_results = pipeline_result["dimension_results"]
+        meta_result = pipeline_result["meta_result"]
+        meta_output = pipeline_result["meta_output"]
+        normalized = pipeline_result["normalized"]
+
+        recommendation = normalized.get("recommendation", "needs_review")
+        confidence = normalized.get("confidence", 0.5)
+        reasoning = normalized.get("reasoning", "")
+
+        logger.info(
+            f"Multi-agent analysis for u/{author_username}: "
+            f"recommendation={recommendation}, confidence={confidence:.2f}"
+        )
+
         # =================================================================
-        # STEP 7: Store dimension results for ALL posts (for auditing)
+        # STEP 6: Store dimension results for ALL posts (for auditing)
         # =================================================================
         # Build dimension results dict for storage
         all_dimension_results = {}
@@ -881,7 +1158,7 @@ def analyze_and_decide(
         scout_post.dimension_results_json = all_dimension_results
 
         # =================================================================
-        # STEP 8: Decide - Create lead or not
+        # STEP 7: Decide - Create lead or not
         # =================================================================
         lead_id = None
         analysis_id = None
@@ -989,7 +1266,7 @@ def analyze_and_decide(
             )
 
         # =================================================================
-        # STEP 9: Update scout_watch_posts with results
+        # STEP 8: Update scout_watch_posts with results
         # =================================================================
         scout_post.analysis_status = "analyzed"
         scout_post.analysis_recommendation = recommendation
@@ -1003,7 +1280,7 @@ def analyze_and_decide(
         db.commit()
 
         # =================================================================
-        # STEP 10: Queue profile items fetch for the author
+        # STEP 9: Queue profile items fetch for the author
         # =================================================================
         if author_username:
             try:
@@ -1116,7 +1393,7 @@ def reanalyze_post(
 
         # Fetch the post from Reddit
         try:
-            post_result = asyncio.run(adapter.fetch_post(external_post_id))
+            post_result = _run_adapter_call(adapter, adapter.fetch_post(external_post_id))
             if not post_result:
                 scout_post.analysis_status = "failed"
                 scout_post.analysis_reasoning = "Post not found on Reddit (may have been deleted)"
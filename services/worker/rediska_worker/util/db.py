@@ -0,0 +1,49 @@
+"""Worker-process database engine lifecycle.
+
+Each Celery prefork child owns exactly one SQLAlchemy engine (and therefore
+one connection pool), created after fork by the worker_process_init signal.
+Tasks obtain sessions from that shared factory instead of building a new
+engine per invocation.
+
+Pool sizing is configured through the core settings (DB_POOL_SIZE,
+DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING).
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker_db(**_kwargs: Any) -> None:
+    """Create a fresh engine for the current worker process.
+
+    Connected to celery.signals.worker_process_init. Any engine inherited
+    from the parent process is discarded without closing its sockets.
+    """
+    from rediska_core.infra.db import dispose_sync_engine, get_sync_session_factory
+
+    dispose_sync_engine(close=False)
+    get_sync_session_factory()
+    logger.info("Initialized worker database pool")
+
+
+def shutdown_worker_db(**_kwargs: Any) -> None:
+    """Close all pooled connections for the current worker process.
+
+    Connected to celery.signals.worker_process_shutdown.
+    """
+    from rediska_core.infra.db import dispose_sync_engine
+
+    dispose_sync_engine(close=True)
+
+
+def get_session() -> Any:
+    """Get a session bound to the worker-process engine.
+
+    Returns:
+        A new SQLAlchemy Session. The caller is responsible for closing it.
+    """
+    from rediska_core.infra.db import get_sync_session_factory
+
+    return get_sync_session_factory()()
@@ -0,0 +1,104 @@
+"""Worker-process asyncio event loop.
+
+Each Celery prefork child keeps one event loop for its lifetime instead of
+creating and tearing down a loop with asyncio.run() for every async step of
+every task. The loop is created lazily, replaced after fork, and closed by
+the worker_process_shutdown signal.
+
+Named semaphores returned by get_process_semaphore are shared by every task
+running on the loop, so provider limits hold across tasks in the process.
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from typing import Any, Awaitable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+
+# Semaphores are bound to the loop they are first used on
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]"
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop owned by the current worker process.
+
+    Returns:
+        An open event loop created in this process.
+    """
+    global _loop, _loop_pid
+
+    if _loop is None or _loop.is_closed() or _loop_pid != os.getpid():
+        _loop = asyncio.new_event_loop()
+        _loop_pid = os.getpid()
+
+    return _loop
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine to completion on the worker-process loop.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return get_worker_loop().run_until_complete(coro)
+
+
+def get_process_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """Get a named semaphore shared by all coroutines on the running loop.
+
+    The first caller for a name fixes its limit for the life of the loop.
+
+    Args:
+        name: Resource the semaphore guards (e.g. "reddit", "inference").
+        limit: Maximum concurrent holders.
+
+    Returns:
+        The semaphore for this name on the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    by_name = _semaphores.setdefault(loop, {})
+    semaphore = by_name.get(name)
+    if semaphore is None:
+        semaphore = by_name[name] = asyncio.Semaphore(max(1, limit))
+    return semaphore
+
+
+def init_worker_loop(**_kwargs: Any) -> None:
+    """Drop any loop inherited from the parent process.
+
+    Connected to celery.signals.worker_process_init.
+    """
+    global _loop, _loop_pid
+
+    _loop = None
+    _loop_pid = None
+    _semaphores.clear()
+
+
+def shutdown_worker_loop(**_kwargs: Any) -> None:
+    """Close the worker-process loop.
+
+    Connected to celery.signals.worker_process_shutdown.
+    """
+    global _loop, _loop_pid
+
+    if _loop is not None and not _loop.is_closed() and _loop_pid == os.getpid():
+        try:
+            _loop.run_until_complete(_loop.shutdown_asyncgens())
+        except Exception as e:
+            logger.warning(f"Error shutting down async generators: {e}")
+        _loop.close()
+
+    _loop = None
+    _loop_pid = None
@@ -0,0 +1,74 @@
+"""Worker-process metrics.
+
+Records a duration histogram for every Celery task in the process-wide
+collector and flushes it to Redis in batches, so task timings from all
+worker children appear in the API's Prometheus scrape.
+"""
+
+import logging
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+TASK_DURATION_METRIC = "celery_task_duration_seconds"
+
+# Start times of running tasks, keyed by task ID
+_task_starts: dict[str, float] = {}
+
+
+def init_worker_metrics(**_kwargs: Any) -> None:
+    """Start the metrics flusher for the current worker process.
+
+    Connected to celery.signals.worker_process_init.
+    """
+    from rediska_core.observability.aggregation import start_metrics_flusher
+
+    _task_starts.clear()
+    if start_metrics_flusher() is not None:
+        logger.info("Started worker metrics flusher")
+
+
+def shutdown_worker_metrics(**_kwargs: Any) -> None:
+    """Flush remaining metrics and stop the flusher.
+
+    Connected to celery.signals.worker_process_shutdown.
+    """
+    from rediska_core.observability.aggregation import stop_metrics_flusher
+
+    stop_metrics_flusher()
+
+
+def record_task_start(task_id: Optional[str] = None, **_kwargs: Any) -> None:
+    """Remember when a task started.
+
+    Connected to celery.signals.task_prerun.
+    """
+    if task_id:
+        _task_starts[task_id] = time.perf_counter()
+
+
+def record_task_end(
+    task_id: Optional[str] = None,
+    task: Any = None,
+    state: Optional[str] = None,
+    **_kwargs: Any,
+) -> None:
+    """Record a task's duration.
+
+    Connected to celery.signals.task_postrun.
+    """
+    start = _task_starts.pop(task_id, None) if task_id else None
+    if start is None:
+        return
+
+    from rediska_core.observability.metrics import get_collector
+
+    get_collector().record_histogram(
+        TASK_DURATION_METRIC,
+        time.perf_counter() - start,
+        labels={
+            "task": getattr(task, "name", None) or "unknown",
+            "state": state or "UNKNOWN",
+        },
+    )
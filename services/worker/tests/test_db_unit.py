@@ -0,0 +1,127 @@
+"""Unit tests for the worker-process database pool.
+
+Tests cover:
+- Engine creation after fork via worker_process_init
+- Session reuse of a single engine per process
+- Pool checkout metrics
+- Signal wiring in the Celery app
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def sqlite_settings(monkeypatch, tmp_path):
+    """Point core settings at a throwaway SQLite database."""
+    from rediska_core.config import get_settings
+    from rediska_core.infra import db as core_db
+
+    monkeypatch.setenv("MYSQL_URL", f"sqlite:///{tmp_path / 'worker.db'}")
+    get_settings.cache_clear()
+    core_db.dispose_sync_engine()
+    yield
+    core_db.dispose_sync_engine()
+    get_settings.cache_clear()
+
+
+class TestWorkerDbLifecycle:
+    """Tests for init/shutdown of the per-process engine."""
+
+    def test_init_creates_engine(self, sqlite_settings):
+        """Test that init_worker_db builds the session factory."""
+        from rediska_core.infra import db as core_db
+        from rediska_worker.util.db import init_worker_db
+
+        init_worker_db()
+
+        assert core_db._sync_engine is not None
+        assert core_db._sync_session_factory is not None
+
+    def test_init_discards_inherited_engine(self, sqlite_settings):
+        """Test that an engine inherited from the parent is replaced."""
+        from rediska_core.infra import db as core_db
+        from rediska_worker.util.db import init_worker_db
+
+        core_db.get_sync_session_factory()
+        parent_engine = core_db._sync_engine
+
+        with patch.object(parent_engine, "dispose") as dispose:
+            init_worker_db()
+
+        dispose.assert_called_once_with(close=False)
+        assert core_db._sync_engine is not parent_engine
+
+    def test_sessions_share_one_engine(self, sqlite_settings):
+        """Test that repeated get_session calls reuse the process engine."""
+        from rediska_worker.util.db import get_session, init_worker_db
+
+        init_worker_db()
+        first = get_session()
+        second = get_session()
+        try:
+            assert first.get_bind() is second.get_bind()
+        finally:
+            first.close()
+            second.close()
+
+    def test_shutdown_drops_engine(self, sqlite_settings):
+        """Test that shutdown_worker_db disposes the engine."""
+        from rediska_core.infra import db as core_db
+        from rediska_worker.util.db import init_worker_db, shutdown_worker_db
+
+        init_worker_db()
+        shutdown_worker_db()
+
+        assert core_db._sync_engine is None
+        assert core_db._sync_session_factory is None
+
+
+class TestWorkerDbMetrics:
+    """Tests for pool metrics recorded by the shared engine."""
+
+    def test_checkout_increments_counter(self, sqlite_settings):
+        """Test that session queries record pool checkouts."""
+        from rediska_core.observability.metrics import get_collector
+        from rediska_worker.util.db import get_session, init_worker_db
+
+        init_worker_db()
+        labels = {"pool": "sync"}
+        before = get_collector().get("db_pool_checkouts", labels)
+
+        session = get_session()
+        try:
+            session.execute(text("SELECT 1"))
+        finally:
+            session.close()
+
+        assert get_collector().get("db_pool_checkouts", labels) == before + 1
+
+
+class TestWorkerDbSignals:
+    """Tests for Celery signal wiring."""
+
+    def test_process_init_builds_engine(self, sqlite_settings):
+        """Test that worker_process_init creates the process engine."""
+        from celery.signals import worker_process_init
+
+        import rediska_worker.celery_app  # noqa: F401
+        from rediska_core.infra import db as core_db
+
+        worker_process_init.send(sender=None)
+
+        assert core_db._sync_engine is not None
+
+    def test_process_shutdown_disposes_engine(self, sqlite_settings):
+        """Test that worker_process_shutdown drops the process engine."""
+        from celery.signals import worker_process_init, worker_process_shutdown
+
+        import rediska_worker.celery_app  # noqa: F401
+        from rediska_core.infra import db as core_db
+
+        worker_process_init.send(sender=None)
+        worker_process_shutdown.send(sender=None, pid=0, exitcode=0)
+
+        assert core_db._sync_engine is None
@@ -0,0 +1,124 @@
+"""Unit tests for the worker-process event loop.
+
+Tests cover:
+- Reuse of one loop across run_async calls
+- Replacement of an inherited loop on worker_process_init
+- Closing the loop on worker_process_shutdown
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def fresh_loop():
+    """Start and finish each test without a worker loop."""
+    from rediska_worker.util.event_loop import shutdown_worker_loop
+
+    shutdown_worker_loop()
+    yield
+    shutdown_worker_loop()
+
+
+class TestWorkerLoop:
+    """Tests for the per-process loop lifecycle."""
+
+    def test_run_async_reuses_loop(self, fresh_loop):
+        """Test that consecutive calls run on the same loop."""
+        from rediska_worker.util.event_loop import run_async
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_async(current_loop()) is run_async(current_loop())
+
+    def test_run_async_returns_result(self, fresh_loop):
+        """Test that the coroutine result is returned."""
+        from rediska_worker.util.event_loop import run_async
+
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert run_async(add(2, 3)) == 5
+
+    def test_init_replaces_inherited_loop(self, fresh_loop):
+        """Test that worker_process_init drops the parent's loop."""
+        from rediska_worker.util.event_loop import get_worker_loop, init_worker_loop
+
+        parent_loop = get_worker_loop()
+        init_worker_loop()
+
+        assert get_worker_loop() is not parent_loop
+        parent_loop.close()
+
+    def test_shutdown_closes_loop(self, fresh_loop):
+        """Test that worker_process_shutdown closes the loop."""
+        from rediska_worker.util.event_loop import get_worker_loop, shutdown_worker_loop
+
+        loop = get_worker_loop()
+        shutdown_worker_loop()
+
+        assert loop.is_closed()
+        assert get_worker_loop() is not loop
+
+
+class TestProcessSemaphore:
+    """Tests for loop-wide named semaphores."""
+
+    def test_shared_across_run_async_calls(self, fresh_loop):
+        """Test that separate tasks on the worker loop get the same semaphore."""
+        from rediska_worker.util.event_loop import get_process_semaphore, run_async
+
+        async def get(name, limit):
+            return get_process_semaphore(name, limit)
+
+        first = run_async(get("reddit", 2))
+
+        assert run_async(get("reddit", 5)) is first
+        assert run_async(get("inference", 2)) is not first
+
+    def test_new_loop_gets_new_semaphore(self, fresh_loop):
+        """Test that a semaphore is not reused on a different loop."""
+        from rediska_worker.util.event_loop import get_process_semaphore, run_async
+
+        async def get():
+            return get_process_semaphore("reddit", 2)
+
+        assert asyncio.run(get()) is not run_async(get())
+
+
+class TestConcurrencyLimitedInference:
+    """Tests for the scout pipeline LLM limiter."""
+
+    def test_caps_in_flight_requests(self, fresh_loop):
+        """Test that no more than the semaphore size run at once."""
+        from rediska_worker.tasks.scout import _ConcurrencyLimitedInference
+        from rediska_worker.util.event_loop import run_async
+
+        class FakeClient:
+            def __init__(self):
+                self.in_flight = 0
+                self.peak = 0
+
+            async def chat(self, messages):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                return messages
+
+            async def close(self):
+                return None
+
+        fake = FakeClient()
+
+        async def run():
+            client = _ConcurrencyLimitedInference(fake, asyncio.Semaphore(2))
+            results = await asyncio.gather(*(client.chat(i) for i in range(6)))
+            await client.close()
+            return results
+
+        assert run_async(run()) == list(range(6))
+        assert fake.peak == 2
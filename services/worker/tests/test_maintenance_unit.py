@@ -365,6 +365,74 @@ class TestRestoreTestLocal:
             maint.BACKUPS_PATH = orig_backups
 
 
+class TestBackfillPerceptualHashes:
+    """Tests for backfill_perceptual_hashes task."""
+
+    def test_task_is_registered(self, mock_celery_app):
+        """Task should be registered with correct name."""
+        from rediska_worker.tasks.maintenance import backfill_perceptual_hashes
+
+        assert backfill_perceptual_hashes.name == "maintenance.backfill_perceptual_hashes"
+
+    def test_walks_batches_until_exhausted(self, mock_celery_app):
+        """Batches should continue from the last ID and commit each one."""
+        import rediska_worker.tasks.maintenance as maint
+        from rediska_core.domain.services.attachment import PerceptualHashBackfillResult
+
+        session = MagicMock()
+        session.__enter__.return_value = session
+        service = MagicMock()
+        service.backfill_perceptual_hashes.side_effect = [
+            PerceptualHashBackfillResult(scanned=2, updated=1, last_id=7),
+            PerceptualHashBackfillResult(scanned=1, updated=1, last_id=9),
+        ]
+
+        with patch("rediska_worker.util.db.get_session", return_value=session), patch(
+            "rediska_core.domain.services.attachment.AttachmentService",
+            return_value=service,
+        ), patch.object(maint, "_get_phash_backfill_cursor", return_value=0), patch.object(
+            maint, "_set_phash_backfill_cursor"
+        ) as set_cursor:
+            result = maint.backfill_perceptual_hashes.apply(
+                kwargs={"batch_size": 2}
+            ).get()
+
+        assert result["status"] == "success"
+        assert result["scanned"] == 3
+        assert result["updated"] == 2
+        calls = service.backfill_perceptual_hashes.call_args_list
+        assert [c.kwargs["after_id"] for c in calls] == [0, 7]
+        assert session.commit.call_count == 2
+        # The end of the table was reached, so the next run starts over
+        set_cursor.assert_called_with(0)
+
+    def test_resumes_from_stored_cursor(self, mock_celery_app):
+        """A run should continue where the previous one stopped."""
+        import rediska_worker.tasks.maintenance as maint
+        from rediska_core.domain.services.attachment import PerceptualHashBackfillResult
+
+        session = MagicMock()
+        session.__enter__.return_value = session
+        service = MagicMock()
+        service.backfill_perceptual_hashes.return_value = PerceptualHashBackfillResult(
+            scanned=2, updated=0, last_id=60
+        )
+
+        with patch("rediska_worker.util.db.get_session", return_value=session), patch(
+            "rediska_core.domain.services.attachment.AttachmentService",
+            return_value=service,
+        ), patch.object(maint, "_get_phash_backfill_cursor", return_value=50), patch.object(
+            maint, "_set_phash_backfill_cursor"
+        ) as set_cursor:
+            result = maint.backfill_perceptual_hashes.apply(
+                kwargs={"batch_size": 2, "max_batches": 1}
+            ).get()
+
+        assert service.backfill_perceptual_hashes.call_args.kwargs["after_id"] == 50
+        assert result["next_id"] == 60
+        set_cursor.assert_called_with(60)
+
+
 class TestMaintenanceTaskRouting:
     """Tests for maintenance task routing configuration."""
 
@@ -0,0 +1,89 @@
+"""Unit tests for worker-process metrics.
+
+Tests cover:
+- Task duration histograms from prerun/postrun signals
+- Flusher start/stop on worker process init/shutdown
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def collector():
+    """Reset the global collector around each test."""
+    from rediska_core.observability.metrics import get_collector
+
+    get_collector().reset()
+    yield get_collector()
+    get_collector().reset()
+
+
+class TestTaskDurations:
+    """Tests for task duration recording."""
+
+    def test_records_duration_by_task_and_state(self, collector):
+        """Test that a finished task records one histogram observation."""
+        from rediska_worker.util.metrics import (
+            TASK_DURATION_METRIC,
+            record_task_end,
+            record_task_start,
+        )
+
+        task = MagicMock()
+        task.name = "ingest.sync_delta"
+
+        record_task_start(task_id="abc")
+        record_task_end(task_id="abc", task=task, state="SUCCESS")
+
+        stats = collector.get_histogram_stats(
+            TASK_DURATION_METRIC, {"task": "ingest.sync_delta", "state": "SUCCESS"}
+        )
+        assert stats["count"] == 1
+        assert stats["min"] >= 0
+
+    def test_end_without_start_is_ignored(self, collector):
+        """Test that a postrun without a matching prerun records nothing."""
+        from rediska_worker.util.metrics import record_task_end
+
+        record_task_end(task_id="missing", task=None, state="SUCCESS")
+
+        assert collector.get_all()["histograms"] == {}
+
+
+class TestFlusherLifecycle:
+    """Tests for flusher wiring in worker processes."""
+
+    def test_init_and_shutdown_start_and_stop_flusher(self):
+        """Test that process signals start and stop the Redis flusher."""
+        from rediska_worker.util.metrics import init_worker_metrics, shutdown_worker_metrics
+
+        with patch(
+            "rediska_core.observability.aggregation.start_metrics_flusher"
+        ) as start, patch(
+            "rediska_core.observability.aggregation.stop_metrics_flusher"
+        ) as stop:
+            init_worker_metrics()
+            shutdown_worker_metrics()
+
+        start.assert_called_once_with()
+        stop.assert_called_once_with()
+
+    def test_task_signals_record_duration(self, collector):
+        """Test that task_prerun/task_postrun are wired in the Celery app."""
+        from celery.signals import task_postrun, task_prerun
+
+        import rediska_worker.celery_app  # noqa: F401
+        from rediska_worker.util.metrics import TASK_DURATION_METRIC
+
+        task = MagicMock()
+        task.name = "scout.run_watch"
+
+        task_prerun.send(sender=task, task_id="t1", task=task)
+        task_postrun.send(sender=task, task_id="t1", task=task, state="FAILURE")
+
+        stats = collector.get_histogram_stats(
+            TASK_DURATION_METRIC, {"task": "scout.run_watch", "state": "FAILURE"}
+        )
+        assert stats["count"] == 1
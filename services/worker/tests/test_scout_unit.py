@@ -0,0 +1,184 @@
+"""Unit tests for scout watch tasks.
+
+Tests cover:
+- Dispatching claimed watches as one group task per listing
+- Running a group when the adapter or the listing fetch fails
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+
+def make_watch(watch_id, location="r/test", query=None, **kwargs):
+    """A watch-like object with the fields the tasks read."""
+    values = {
+        "id": watch_id,
+        "provider_id": "reddit",
+        "source_location": location,
+        "sort_by": "new",
+        "search_query": query,
+        "time_filter": "day",
+        "is_active": True,
+        "identity_id": None,
+        "last_post_created_at": None,
+    }
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+class TestRunAllWatches:
+    """Tests for the scout scheduler tick."""
+
+    def test_task_is_registered(self, mock_celery_app):
+        """Task should be registered with correct name."""
+        from rediska_worker.tasks.scout import run_all_watches
+
+        assert run_all_watches.name == "scout.run_all_watches"
+
+    def test_queues_one_group_per_listing(self, mock_celery_app):
+        """Claimed watches on the same listing should share one group task."""
+        import rediska_worker.tasks.scout as scout
+
+        watches = [
+            make_watch(1, "r/test"),
+            make_watch(2, "test"),
+            make_watch(3, "r/other"),
+        ]
+        db = MagicMock()
+        service = MagicMock()
+        service.claim_due_watches.return_value = watches
+
+        with patch.object(scout, "_get_db_session", return_value=db), patch(
+            "rediska_core.domain.services.scout_watch.ScoutWatchService",
+            return_value=service,
+        ), patch.object(scout.run_watch_group, "apply_async") as apply_async:
+            apply_async.return_value = MagicMock(id="task")
+            result = scout.run_all_watches.apply().get()
+
+        assert result["status"] == "success"
+        assert result["queued"] == 3
+        assert result["listings"] == 2
+        groups = sorted(call.kwargs["kwargs"]["watch_ids"] for call in apply_async.call_args_list)
+        assert groups == [[1, 2], [3]]
+        assert all(
+            0 <= call.kwargs["countdown"] <= scout.DISPATCH_SPREAD_SECONDS
+            for call in apply_async.call_args_list
+        )
+        db.commit.assert_called_once()
+
+    def test_nothing_due(self, mock_celery_app):
+        """A tick with nothing due should queue nothing."""
+        import rediska_worker.tasks.scout as scout
+
+        service = MagicMock()
+        service.claim_due_watches.return_value = []
+
+        with patch.object(scout, "_get_db_session", return_value=MagicMock()), patch(
+            "rediska_core.domain.services.scout_watch.ScoutWatchService",
+            return_value=service,
+        ), patch.object(scout.run_watch_group, "apply_async") as apply_async:
+            result = scout.run_all_watches.apply().get()
+
+        assert result["queued"] == 0
+        apply_async.assert_not_called()
+
+
+class TestRunWatchGroup:
+    """Tests for running watches that share a listing."""
+
+    def _run(self, scout, service, **patches):
+        with patch.object(scout, "_get_db_session", return_value=MagicMock()), patch(
+            "rediska_core.domain.services.scout_watch.ScoutWatchService",
+            return_value=service,
+        ), patch.multiple(scout, **patches):
+            return scout.run_watch_group.apply(kwargs={"watch_ids": [1, 2, 99]}).get()
+
+    def _service(self):
+        watches = {1: make_watch(1), 2: make_watch(2, "test")}
+        service = MagicMock()
+        service.get_watch.side_effect = watches.get
+        service.create_run.side_effect = lambda watch_id: SimpleNamespace(id=watch_id * 10)
+        return service, watches
+
+    def test_adapter_failure_fails_every_run(self, mock_celery_app):
+        """Without an adapter every run should complete with the error."""
+        import rediska_worker.tasks.scout as scout
+
+        service, watches = self._service()
+
+        result = self._run(
+            scout, service, _get_reddit_adapter=MagicMock(side_effect=RuntimeError("no creds"))
+        )
+
+        assert result["status"] == "error"
+        statuses = {r["watch_id"]: r["status"] for r in result["watches"]}
+        assert statuses == {1: "error", 2: "error", 99: "error"}
+        assert service.complete_run.call_count == 2
+        assert all(
+            "no creds" in call.kwargs["error_message"]
+            for call in service.complete_run.call_args_list
+        )
+        service.schedule_listing.assert_called_once_with([watches[1], watches[2]])
+
+    def test_fetch_failure_fails_every_run(self, mock_celery_app):
+        """A failed listing fetch should complete all runs without processing posts."""
+        import rediska_worker.tasks.scout as scout
+
+        service, _ = self._service()
+        process = MagicMock()
+
+        result = self._run(
+            scout,
+            service,
+            _get_reddit_adapter=MagicMock(return_value=MagicMock()),
+            _run_adapter_call=MagicMock(side_effect=RuntimeError("503")),
+            _process_watch_posts=process,
+        )
+
+        assert [r["status"] for r in result["watches"]] == ["error", "error", "error"]
+        assert service.complete_run.call_count == 2
+        process.assert_not_called()
+
+    def test_listing_fetched_once_for_group(self, mock_celery_app):
+        """One fetch should serve every watch, then the group shares a schedule."""
+        import rediska_worker.tasks.scout as scout
+
+        service, watches = self._service()
+        fetch = MagicMock(return_value=SimpleNamespace(items=["post"], metadata=None))
+        process = MagicMock(
+            side_effect=lambda db, svc, watch, run, posts, url: {
+                "status": "success",
+                "watch_id": watch.id,
+                "posts": posts,
+            }
+        )
+
+        result = self._run(
+            scout,
+            service,
+            _get_reddit_adapter=MagicMock(return_value=MagicMock()),
+            _run_adapter_call=fetch,
+            _process_watch_posts=process,
+        )
+
+        fetch.assert_called_once()
+        assert process.call_count == 2
+        assert [r["status"] for r in result["watches"]] == ["success", "success", "error"]
+        service.schedule_listing.assert_called_once_with([watches[1], watches[2]])
+
+    def test_single_watch_keeps_own_schedule(self, mock_celery_app):
+        """A lone watch is scheduled by its completed run, not as a listing."""
+        import rediska_worker.tasks.scout as scout
+
+        service, _ = self._service()
+
+        with patch.object(scout, "_get_db_session", return_value=MagicMock()), patch(
+            "rediska_core.domain.services.scout_watch.ScoutWatchService",
+            return_value=service,
+        ), patch.object(
+            scout, "_get_reddit_adapter", side_effect=RuntimeError("no creds")
+        ):
+            result = scout.run_single_watch.apply(kwargs={"watch_id": 1}).get()
+
+        assert result["status"] == "error"
+        service.schedule_listing.assert_not_called()